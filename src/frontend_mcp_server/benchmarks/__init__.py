@@ -0,0 +1,9 @@
+"""
+Layout benchmarks: synthetic graph generators, the server's layered engine
+next to reference layouts, and a runner recording time, peak memory and edge
+crossings per graph shape and size. The layered engine is compared against
+`layered_reference`, a plain-Python Sugiyama layout; the force layout is
+numpy-vectorized rather than a pure-Python reference.
+
+Run with ``python -m frontend_mcp_server.benchmarks --help``.
+"""
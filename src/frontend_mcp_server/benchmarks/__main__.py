@@ -0,0 +1,35 @@
+"""
+Command line entry point: python -m frontend_mcp_server.benchmarks
+"""
+
+import argparse
+import json
+
+from .generators import BENCHMARK_SIZES, GENERATORS
+from .layouts import LAYOUTS
+from .runner import format_report, run_benchmarks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark layout baselines on synthetic flows.")
+    parser.add_argument("--shapes", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(BENCHMARK_SIZES))
+    parser.add_argument("--layouts", nargs="+", choices=list(LAYOUTS), default=list(LAYOUTS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=60.0,
+                        help="Skip larger sizes of a shape once a layout takes longer than this (seconds)")
+    parser.add_argument("--time-budget", type=float, default=1.0,
+                        help="Interactive budget used for the per-shape recommendation (seconds)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the traced run measuring peak memory")
+    parser.add_argument("--json", help="Also write the raw records to this file")
+    args = parser.parse_args()
+
+    records = run_benchmarks(args.shapes, args.sizes, args.layouts, args.seed, args.time_limit, not args.no_memory)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(records, handle, indent=2)
+    print(format_report(records, args.time_budget))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Synthetic flow generators for layout benchmarks.
+
+Each generator returns a React Flow document ({"nodes": [...], "edges": [...]})
+with ids n0..n{count-1}, zero positions and default node sizes, built from
+an explicit seed so every benchmark run sees the same graphs. The shapes
+follow the use cases react_flow_layouting_expert distinguishes: trees for
+d3-hierarchy, chains and DAGs for dagre/elkjs, scale-free and grid graphs
+for d3-force.
+"""
+
+import math
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+BENCHMARK_SIZES = (10, 100, 1_000, 10_000, 100_000)
+
+Edge = Tuple[int, int]
+
+
+def flow_document(count: int, edges: List[Edge]) -> Dict[str, Any]:
+    """Flow document for node indices and (source, target) index pairs."""
+    return {
+        "nodes": [{"id": f"n{i}", "position": {"x": 0, "y": 0}} for i in range(count)],
+        "edges": [{"id": f"e{k}", "source": f"n{a}", "target": f"n{b}"} for k, (a, b) in enumerate(edges)],
+    }
+
+
+def balanced_tree(count: int, seed: int = 0, branching: int = 3) -> Dict[str, Any]:
+    """Complete tree in breadth-first order; node i's parent is (i - 1) // branching."""
+    return flow_document(count, [((i - 1) // branching, i) for i in range(1, count)])
+
+
+def deep_chain(count: int, seed: int = 0, branch_every: int = 50) -> Dict[str, Any]:
+    """A long chain with a short side branch every branch_every nodes."""
+    edges = []
+    spine = 0
+    for i in range(1, count):
+        edges.append((spine, i))
+        if not branch_every or i % branch_every:
+            spine = i  # otherwise i is a leaf hanging off the spine
+    return flow_document(count, edges)
+
+
+def random_dag(count: int, seed: int = 0, edge_factor: float = 1.5, locality: int = 50) -> Dict[str, Any]:
+    """Sparse DAG: a random spanning tree plus forward edges to nearby nodes."""
+    rng = random.Random(seed)
+    edges = {(rng.randrange(max(i - locality, 0), i), i) for i in range(1, count)}
+    capacity = sum(min(locality, count - 1 - a) for a in range(count - 1))
+    extra = min(int(count * (edge_factor - 1)), capacity - len(edges))
+    while extra > 0 and count > 1:
+        a = rng.randrange(count - 1)
+        b = rng.randrange(a + 1, min(a + locality, count - 1) + 1)
+        if (a, b) not in edges:
+            edges.add((a, b))
+            extra -= 1
+    return flow_document(count, sorted(edges))
+
+
+def dense_dag(count: int, seed: int = 0) -> Dict[str, Any]:
+    """DAG with about five edges per node."""
+    return random_dag(count, seed, edge_factor=5.0, locality=20)
+
+
+def scale_free(count: int, seed: int = 0, attachments: int = 2) -> Dict[str, Any]:
+    """Barabasi-Albert preferential attachment; edges point from new to older nodes."""
+    rng = random.Random(seed)
+    edges = []
+    endpoints: List[int] = []  # each node repeated once per incident edge
+    for i in range(1, count):
+        targets = set()
+        for _ in range(min(attachments, i)):
+            targets.add(rng.choice(endpoints) if endpoints else rng.randrange(i))
+        for target in sorted(targets):
+            edges.append((i, target))
+            endpoints.extend((i, target))
+    return flow_document(count, edges)
+
+
+def grid(count: int, seed: int = 0) -> Dict[str, Any]:
+    """Near-square grid with right and down edges."""
+    columns = max(int(math.sqrt(count)), 1)
+    edges = []
+    for i in range(count):
+        if (i + 1) % columns and i + 1 < count:
+            edges.append((i, i + 1))
+        if i + columns < count:
+            edges.append((i, i + columns))
+    return flow_document(count, edges)
+
+
+GENERATORS: Dict[str, Callable[..., Dict[str, Any]]] = {
+    "balanced_tree": balanced_tree,
+    "deep_chain": deep_chain,
+    "random_dag": random_dag,
+    "dense_dag": dense_dag,
+    "scale_free": scale_free,
+    "grid": grid,
+}
+
+
+def generate(shape: str, count: int, seed: int = 0) -> Dict[str, Any]:
+    """Generate a benchmark flow of the given shape and node count."""
+    if shape not in GENERATORS:
+        raise ValueError(f"Unknown graph shape '{shape}'. Available: {', '.join(GENERATORS)}")
+    return GENERATORS[shape](count, seed)
@@ -0,0 +1,296 @@
+"""
+Layouts the benchmarks run.
+
+Each layout takes a FlowGraph and a seed and returns the top-left (x, y)
+of every node row, mirroring the three families react_flow_layouting_expert
+covers: layered (dagre/elkjs), tree (d3-hierarchy) and force (d3-force).
+
+`layered` is the server's engine, the subject of the benchmarks. The
+plain-list Sugiyama layout `layered_reference` is the baseline it is
+measured against; `tree` is pure Python as well, while `force` is
+vectorized with numpy so large graphs finish at all.
+"""
+
+import math
+import random
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from ..tools.flow_layout import LayeredLayout, layout_options
+from ..tools.flow_loader import FlowGraph
+
+Positions = Tuple[List[float], List[float]]
+
+NODE_SPACING = 50.0
+LAYER_SPACING = 80.0
+FORCE_ITERATIONS = 50
+REFERENCE_SWEEPS = 4
+
+
+def layered_layout(graph: FlowGraph, seed: int = 0) -> Positions:
+    """The server's layered engine (flow_layout) with default options."""
+    layout = LayeredLayout(graph, layout_options({"seed": seed})).run()
+    positions = layout.positions()
+    ids = graph.nodes.ids
+    return [positions[ids[row]]["x"] for row in range(len(ids))], [positions[ids[row]]["y"] for row in range(len(ids))]
+
+
+def reference_layered_layout(graph: FlowGraph, seed: int = 0, sweeps: int = REFERENCE_SWEEPS) -> Positions:
+    """
+    Textbook Sugiyama layout on plain lists, the baseline for the engine.
+
+    DFS back edges are dropped, layers are longest paths from the sources,
+    and each layer is ordered by the mean order of its neighbours in
+    earlier (then later) layers for a fixed number of sweeps; nodes with
+    no neighbours on the swept side keep their slot. Nodes are
+    then packed side by side and centred. There are no dummy vertices,
+    restarts or coordinate refinement.
+    """
+    nodes = graph.nodes
+    count = len(nodes)
+    successors: List[List[int]] = [[] for _ in range(count)]
+    for source, target in zip(graph.edges.source, graph.edges.target):
+        if source >= 0 and target >= 0 and source != target:
+            successors[source].append(target)
+
+    # Cycle removal: keep the edges that are not DFS back edges
+    state = bytearray(count)  # 0 new, 1 on stack, 2 done
+    forward: List[List[int]] = [[] for _ in range(count)]
+    for start in range(count):
+        if state[start]:
+            continue
+        state[start] = 1
+        stack = [(start, iter(successors[start]))]
+        while stack:
+            row, targets = stack[-1]
+            for target in targets:
+                if state[target] == 1:
+                    continue
+                forward[row].append(target)
+                if not state[target]:
+                    state[target] = 1
+                    stack.append((target, iter(successors[target])))
+                    break
+            else:
+                state[row] = 2
+                stack.pop()
+
+    # Longest-path layering in topological order
+    incoming = [0] * count
+    for targets in forward:
+        for target in targets:
+            incoming[target] += 1
+    layer = [0] * count
+    queue = deque(row for row in range(count) if not incoming[row])
+    while queue:
+        row = queue.popleft()
+        for target in forward[row]:
+            layer[target] = max(layer[target], layer[row] + 1)
+            incoming[target] -= 1
+            if not incoming[target]:
+                queue.append(target)
+    layers: List[List[int]] = [[] for _ in range(max(layer, default=-1) + 1)]
+    for row in range(count):
+        layers[layer[row]].append(row)
+
+    # Barycenter sweeps
+    above: List[List[int]] = [[] for _ in range(count)]
+    below: List[List[int]] = [[] for _ in range(count)]
+    for row, targets in enumerate(forward):
+        for target in targets:
+            below[row].append(target)
+            above[target].append(row)
+    order = [0] * count
+    for members in layers:
+        for index, row in enumerate(members):
+            order[row] = index
+    for sweep in range(sweeps):
+        downward = sweep % 2 == 0
+        neighbours = above if downward else below
+        for members in (layers if downward else reversed(layers)):
+            # nodes without neighbours on that side keep their slot; the rest are sorted into the others
+            linked = sorted((row for row in members if neighbours[row]), key=lambda row: (
+                sum(order[other] for other in neighbours[row]) / len(neighbours[row]), order[row]))
+            placed = iter(linked)
+            members[:] = [next(placed) if neighbours[row] else row for row in members]
+            for index, row in enumerate(members):
+                order[row] = index
+
+    xs = [0.0] * count
+    ys = [0.0] * count
+    top = 0.0
+    for members in layers:
+        width = sum(nodes.width[row] for row in members) + NODE_SPACING * (len(members) - 1)
+        cursor = -width / 2
+        for row in members:
+            xs[row] = cursor
+            ys[row] = top
+            cursor += nodes.width[row] + NODE_SPACING
+        top += max(nodes.height[row] for row in members) + LAYER_SPACING
+    return xs, ys
+
+
+def _spanning_forest(graph: FlowGraph) -> Tuple[List[int], List[List[int]]]:
+    """Roots and children of a BFS spanning forest, starting from nodes without incoming edges."""
+    count = len(graph.nodes)
+    successors: List[List[int]] = [[] for _ in range(count)]
+    has_parent = bytearray(count)
+    for source, target in zip(graph.edges.source, graph.edges.target):
+        if source >= 0 and target >= 0 and source != target:
+            successors[source].append(target)
+            has_parent[target] = 1
+
+    children: List[List[int]] = [[] for _ in range(count)]
+    visited = bytearray(count)
+    roots = []
+    starts = [row for row in range(count) if not has_parent[row]] + list(range(count))
+    for start in starts:
+        if visited[start]:
+            continue
+        roots.append(start)
+        visited[start] = 1
+        queue = deque([start])
+        while queue:
+            row = queue.popleft()
+            for target in successors[row]:
+                if not visited[target]:
+                    visited[target] = 1
+                    children[row].append(target)
+                    queue.append(target)
+    return roots, children
+
+
+def tree_layout(graph: FlowGraph, seed: int = 0) -> Positions:
+    """
+    Tidy top-down tree layout over a BFS spanning forest.
+
+    Each subtree is as wide as its children side by side (or the node
+    itself, if wider) and parents are centred over their children. Edges
+    outside the spanning forest are ignored, as d3-hierarchy would.
+    """
+    nodes = graph.nodes
+    count = len(nodes)
+    roots, children = _spanning_forest(graph)
+    row_height = max(nodes.height, default=0.0) + LAYER_SPACING
+
+    span = [0.0] * count
+    order = []
+    for root in roots:
+        stack = [root]
+        while stack:
+            row = stack.pop()
+            order.append(row)
+            stack.extend(children[row])
+    for row in reversed(order):  # children before parents
+        kids = children[row]
+        packed = sum(span[kid] for kid in kids) + NODE_SPACING * (len(kids) - 1) if kids else 0.0
+        span[row] = max(nodes.width[row], packed)
+
+    xs = [0.0] * count
+    ys = [0.0] * count
+    cursor = 0.0
+    for root in roots:
+        stack = [(root, cursor, 0)]
+        while stack:
+            row, left, depth = stack.pop()
+            xs[row] = left + (span[row] - nodes.width[row]) / 2
+            ys[row] = depth * row_height
+            kids = children[row]
+            packed = sum(span[kid] for kid in kids) + NODE_SPACING * (len(kids) - 1)
+            child_left = left + (span[row] - packed) / 2
+            for kid in kids:
+                stack.append((kid, child_left, depth + 1))
+                child_left += span[kid] + NODE_SPACING
+        cursor += span[root] + NODE_SPACING
+    return xs, ys
+
+
+def force_layout(graph: FlowGraph, seed: int = 0, iterations: int = FORCE_ITERATIONS) -> Positions:
+    """
+    Fruchterman-Reingold force layout with grid-bucketed repulsion.
+
+    Repulsion only acts between nodes in neighbouring cells of a grid
+    whose cells are twice the ideal edge length, so each iteration stays
+    close to linear in the node count. Pairs are expanded with numpy from
+    the cell-sorted node order. Starting positions come from the seed.
+    """
+    nodes = graph.nodes
+    count = len(nodes)
+    if not count:
+        return [], []
+    widths = np.asarray(nodes.width, dtype=float)
+    heights = np.asarray(nodes.height, dtype=float)
+    ideal = max(widths.max(), heights.max()) + NODE_SPACING
+    side = ideal * math.sqrt(count)
+    rng = random.Random(seed)
+    xs = np.array([rng.uniform(0, side) for _ in range(count)])
+    ys = np.array([rng.uniform(0, side) for _ in range(count)])
+    source = np.asarray(graph.edges.source, dtype=np.int64)
+    target = np.asarray(graph.edges.target, dtype=np.int64)
+    keep = (source >= 0) & (target >= 0) & (source != target)
+    source, target = source[keep], target[keep]
+    cell = 2 * ideal
+    squared_ideal = ideal * ideal
+    rows = np.arange(count)
+
+    for iteration in range(iterations):
+        temperature = side / 10 * (1 - iteration / iterations)
+        cx = np.floor(xs / cell).astype(np.int64)
+        cy = np.floor(ys / cell).astype(np.int64)
+        cx -= cx.min() - 1
+        cy -= cy.min() - 1
+        stride = int(cy.max()) + 2
+        keys = cx * stride + cy
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        dx = np.zeros(count)
+        dy = np.zeros(count)
+        for ox in (-1, 0, 1):
+            for oy in (-1, 0, 1):
+                wanted = (cx + ox) * stride + (cy + oy)
+                low = np.searchsorted(sorted_keys, wanted, "left")
+                sizes = np.searchsorted(sorted_keys, wanted, "right") - low
+                total = int(sizes.sum())
+                if not total:
+                    continue
+                first = np.repeat(rows, sizes)
+                offsets = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+                other = order[np.repeat(low, sizes) + offsets]
+                distinct = first != other
+                first, other = first[distinct], other[distinct]
+                ddx = xs[first] - xs[other]
+                ddy = ys[first] - ys[other]
+                distance_sq = ddx * ddx + ddy * ddy
+                coincident = distance_sq < 1e-9  # push apart along x by row order
+                ddx[coincident] = np.where(first[coincident] > other[coincident], 1.0, -1.0)
+                ddy[coincident] = 0.0
+                distance_sq[coincident] = 1.0
+                push = np.where(distance_sq < cell * cell, squared_ideal / distance_sq, 0.0)
+                dx += np.bincount(first, ddx * push, minlength=count)
+                dy += np.bincount(first, ddy * push, minlength=count)
+
+        ddx = xs[source] - xs[target]
+        ddy = ys[source] - ys[target]
+        pull = np.sqrt(ddx * ddx + ddy * ddy) / ideal
+        dx += np.bincount(target, ddx * pull, minlength=count) - np.bincount(source, ddx * pull, minlength=count)
+        dy += np.bincount(target, ddy * pull, minlength=count) - np.bincount(source, ddy * pull, minlength=count)
+
+        length = np.sqrt(dx * dx + dy * dy)
+        moving = length > 1e-9
+        step = np.zeros(count)
+        step[moving] = np.minimum(length[moving], temperature) / length[moving]
+        xs += dx * step
+        ys += dy * step
+
+    return (xs - widths / 2).tolist(), (ys - heights / 2).tolist()
+
+
+LAYOUTS: Dict[str, Callable[[FlowGraph, int], Positions]] = {
+    "layered": layered_layout,
+    "layered_reference": reference_layered_layout,
+    "tree": tree_layout,
+    "force": force_layout,
+}
@@ -0,0 +1,178 @@
+"""
+Benchmark runner: lays out every generated graph with every baseline and
+records wall time, peak traced memory and straight-line edge crossings.
+"""
+
+import time
+import tracemalloc
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..tools.flow_loader import FlowGraph, build_flow
+from .generators import BENCHMARK_SIZES, GENERATORS, generate
+from .layouts import LAYOUTS, Positions
+
+EXACT_CROSSING_EDGES = 4000  # above this, crossings are estimated from sampled edges
+CROSSING_SAMPLE = 1000
+CROSSING_BLOCK_CELLS = 4_000_000
+
+
+def edge_segments(graph: FlowGraph, positions: Positions) -> Tuple[np.ndarray, np.ndarray]:
+    """Straight center-to-center segments (edges, 4) and their endpoint rows (edges, 2)."""
+    nodes = graph.nodes
+    xs = np.asarray(positions[0]) + np.asarray(nodes.width) / 2
+    ys = np.asarray(positions[1]) + np.asarray(nodes.height) / 2
+    source = np.asarray(graph.edges.source, dtype=np.int64)
+    target = np.asarray(graph.edges.target, dtype=np.int64)
+    keep = (source >= 0) & (target >= 0) & (source != target)
+    source, target = source[keep], target[keep]
+    segments = np.column_stack((xs[source], ys[source], xs[target], ys[target]))
+    return segments, np.column_stack((source, target))
+
+
+def _crossings_against(first: np.ndarray, first_ends: np.ndarray,
+                       second: np.ndarray, second_ends: np.ndarray) -> np.ndarray:
+    """Proper crossings of each segment in first against all of second (shared endpoints excluded)."""
+
+    def orientation(ax, ay, bx, by, cx, cy):
+        return np.sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+    p = [first[:, k, None] for k in range(4)]
+    q = [second[None, :, k] for k in range(4)]
+    o1 = orientation(p[0], p[1], p[2], p[3], q[0], q[1])
+    o2 = orientation(p[0], p[1], p[2], p[3], q[2], q[3])
+    o3 = orientation(q[0], q[1], q[2], q[3], p[0], p[1])
+    o4 = orientation(q[0], q[1], q[2], q[3], p[2], p[3])
+    shared = ((first_ends[:, 0, None] == second_ends[None, :, 0]) | (first_ends[:, 0, None] == second_ends[None, :, 1])
+              | (first_ends[:, 1, None] == second_ends[None, :, 0]) | (first_ends[:, 1, None] == second_ends[None, :, 1]))
+    return ((o1 * o2 < 0) & (o3 * o4 < 0) & ~shared).sum(axis=1)
+
+
+def count_edge_crossings(graph: FlowGraph, positions: Positions, seed: int = 0) -> Tuple[int, bool]:
+    """
+    Crossings of the straight-line drawing, and whether the count is estimated.
+
+    Up to EXACT_CROSSING_EDGES edges every pair is tested in blocks; beyond
+    that the crossings of CROSSING_SAMPLE random edges are scaled up.
+    """
+    segments, ends = edge_segments(graph, positions)
+    count = len(segments)
+    if count < 2:
+        return 0, False
+    exact = count <= EXACT_CROSSING_EDGES
+    if exact:
+        rows = np.arange(count)
+    else:
+        rows = np.random.default_rng(seed).choice(count, size=CROSSING_SAMPLE, replace=False)
+
+    block = max(1, CROSSING_BLOCK_CELLS // count)
+    total = 0
+    for low in range(0, len(rows), block):
+        chunk = rows[low:low + block]
+        total += int(_crossings_against(segments[chunk], ends[chunk], segments, ends).sum())
+    if exact:
+        return total // 2, False
+    return int(round(total * count / (2 * len(rows)))), True
+
+
+def measure_layout(graph: FlowGraph, layout: str, seed: int = 0,
+                   measure_memory: bool = True) -> Tuple[Positions, float, Optional[int]]:
+    """Run one layout; returns positions, seconds and peak traced bytes (a second, traced run)."""
+    function = LAYOUTS[layout]
+    started = time.perf_counter()
+    positions = function(graph, seed)
+    elapsed = time.perf_counter() - started
+
+    peak = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            function(graph, seed)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return positions, elapsed, peak
+
+
+def run_benchmarks(shapes: Iterable[str] = tuple(GENERATORS), sizes: Iterable[int] = BENCHMARK_SIZES,
+                   layouts: Iterable[str] = tuple(LAYOUTS), seed: int = 0, time_limit: float = 60.0,
+                   measure_memory: bool = True) -> List[Dict[str, Any]]:
+    """
+    Benchmark every (shape, size, layout) combination.
+
+    Sizes run in increasing order; once a layout exceeds time_limit on a
+    shape, its larger sizes for that shape are recorded as skipped.
+    """
+    layouts = list(layouts)
+    for layout in layouts:
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown layout '{layout}'. Available: {', '.join(LAYOUTS)}")
+    records = []
+    for shape in shapes:
+        over_limit = set()
+        for size in sorted(sizes):
+            graph = build_flow(generate(shape, size, seed), keep_data=False)
+            for layout in layouts:
+                record = {"shape": shape, "nodes": size, "edges": len(graph.edges), "layout": layout}
+                if layout in over_limit:
+                    record["status"] = "skipped"
+                    records.append(record)
+                    continue
+                positions, elapsed, peak = measure_layout(graph, layout, seed, measure_memory)
+                crossings, estimated = count_edge_crossings(graph, positions, seed)
+                record.update({
+                    "status": "ok",
+                    "seconds": round(elapsed, 4),
+                    "peak_bytes": peak,
+                    "crossings": crossings,
+                    "crossings_estimated": estimated,
+                })
+                records.append(record)
+                if elapsed > time_limit:
+                    over_limit.add(layout)
+    return records
+
+
+def recommend(records: Sequence[Dict[str, Any]], time_budget: float = 1.0) -> Dict[str, Dict[int, str]]:
+    """
+    Per shape and size, the layout with the fewest crossings among those
+    finishing within time_budget seconds (the fastest if none do).
+    """
+    grouped: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+    for record in records:
+        if record["status"] == "ok":
+            grouped.setdefault((record["shape"], record["nodes"]), []).append(record)
+    choices: Dict[str, Dict[int, str]] = {}
+    for (shape, size), candidates in sorted(grouped.items()):
+        in_budget = [record for record in candidates if record["seconds"] <= time_budget]
+        if in_budget:
+            best = min(in_budget, key=lambda record: (record["crossings"], record["seconds"]))
+        else:
+            best = min(candidates, key=lambda record: record["seconds"])
+        choices.setdefault(shape, {})[size] = best["layout"]
+    return choices
+
+
+def format_report(records: Sequence[Dict[str, Any]], time_budget: float = 1.0) -> str:
+    """Markdown table of the results followed by per-shape recommendations."""
+    lines = [
+        "| Shape | Nodes | Edges | Layout | Time (s) | Peak memory (MB) | Crossings |",
+        "|---|---:|---:|---|---:|---:|---:|",
+    ]
+    for record in records:
+        if record["status"] != "ok":
+            lines.append(f"| {record['shape']} | {record['nodes']} | {record['edges']} | {record['layout']} | skipped | | |")
+            continue
+        memory = f"{record['peak_bytes'] / 1e6:.1f}" if record["peak_bytes"] is not None else ""
+        crossings = f"~{record['crossings']}" if record["crossings_estimated"] else str(record["crossings"])
+        lines.append(
+            f"| {record['shape']} | {record['nodes']} | {record['edges']} | {record['layout']} "
+            f"| {record['seconds']:.4f} | {memory} | {crossings} |"
+        )
+
+    lines.append("")
+    lines.append(f"## Recommended layout (fewest crossings within {time_budget:g} s)")
+    for shape, choices in recommend(records, time_budget).items():
+        lines.append(f"- **{shape}**: " + ", ".join(f"{size}: {layout}" for size, layout in choices.items()))
+    return "\n".join(lines)
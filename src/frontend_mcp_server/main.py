@@ -14,6 +14,13 @@ from .tools import react_flow_tools
 from .tools import react_flow_api_tools
 from .tools import react_flow_learning_tools
 from .tools import connection_positioning_tools
+from .tools import flow_graph_tools
+from .tools import flow_viewport_tools
+from .tools import flow_geometry_tools
+from .tools import flow_layout_tools
+from .tools import performance_trace_tools
+from .tools import tailwind_tools
+from .tools import tailwind_project_tools
 
 app = Server("frontend-mcp-server")
 
@@ -25,6 +32,13 @@ async def handle_list_tools() -> list[types.Tool]:
     react_flow_api_tool_list = react_flow_api_tools.get_tools()
     react_flow_learning_tool_list = react_flow_learning_tools.get_tools()
     connection_positioning_tool_list = connection_positioning_tools.get_tools()
+    flow_graph_tool_list = flow_graph_tools.get_tools()
+    flow_viewport_tool_list = flow_viewport_tools.get_tools()
+    flow_geometry_tool_list = flow_geometry_tools.get_tools()
+    flow_layout_tool_list = flow_layout_tools.get_tools()
+    performance_trace_tool_list = performance_trace_tools.get_tools()
+    tailwind_project_tool_list = tailwind_project_tools.get_tools()
+    tailwind_tool_list = [tool for tool in tailwind_tools.get_tools() if tool.name in ["tailwind_optimizer", "tailwind_color_palette"]]
     
     return [
         types.Tool(
@@ -79,6 +93,10 @@ async def handle_list_tools() -> list[types.Tool]:
                         "type": "boolean",
                         "description": "Whether to include responsive variants",
                         "default": True
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "Partial class to complete from the full Tailwind catalog, e.g. `md:hover:bg-bl` or an abbreviation like `jus-be`"
                     }
                 },
                 "required": ["design_description", "element_type"]
@@ -122,7 +140,23 @@ async def handle_list_tools() -> list[types.Tool]:
                 "required": ["hook_name", "functionality"]
             }
         )
-    ] + react_flow_tool_list + react_flow_api_tool_list + react_flow_learning_tool_list + connection_positioning_tool_list  # Add all React Flow tools
+    ] + react_flow_tool_list + react_flow_api_tool_list + react_flow_learning_tool_list + connection_positioning_tool_list + flow_graph_tool_list + flow_viewport_tool_list + flow_geometry_tool_list + flow_layout_tool_list + performance_trace_tool_list + tailwind_project_tool_list + tailwind_tool_list  # Add all React Flow tools
+
+def progress_reporter():
+    """Progress callback for the current request, or None when the client sent no progressToken."""
+    try:
+        context = app.request_context
+    except LookupError:
+        return None
+    token = context.meta.progressToken if context.meta else None
+    if token is None:
+        return None
+
+    async def report(progress: float, total: float | None, message: str | None) -> None:
+        await context.session.send_progress_notification(
+            token, progress, total, message, related_request_id=str(context.request_id)
+        )
+    return report
 
 @app.call_tool()
 async def handle_call_tool(name: str, arguments: dict | None) -> list[types.TextContent]:
@@ -180,94 +214,7 @@ export default {component_name};
         return [types.TextContent(type="text", text=component_code.strip())]
     
     elif name == "tailwind_class_suggester":
-        description = arguments.get("design_description", "").lower()
-        element_type = arguments.get("element_type", "general")
-        responsive = arguments.get("responsive", True)
-        
-        suggestions = []
-        
-        # Analyze description for design intent
-        if "center" in description or "centered" in description:
-            suggestions.extend(["flex", "items-center", "justify-center"])
-        
-        if "shadow" in description or "elevated" in description:
-            suggestions.extend(["shadow-md", "shadow-lg"])
-        
-        if "rounded" in description or "circle" in description:
-            suggestions.extend(["rounded", "rounded-lg"])
-        
-        # Color suggestions
-        if "blue" in description:
-            suggestions.extend(["bg-blue-500", "text-blue-600", "border-blue-500"])
-        elif "red" in description:
-            suggestions.extend(["bg-red-500", "text-red-600", "border-red-500"])
-        elif "green" in description:
-            suggestions.extend(["bg-green-500", "text-green-600", "border-green-500"])
-        
-        # Size suggestions
-        if "large" in description or "big" in description:
-            suggestions.extend(["text-lg", "p-6"])
-        elif "small" in description:
-            suggestions.extend(["text-sm", "p-2"])
-        else:
-            suggestions.extend(["text-base", "p-4"])
-        
-        # Element-specific suggestions
-        if element_type == "button":
-            suggestions.extend([
-                "inline-flex", "items-center", "px-4", "py-2",
-                "border", "border-transparent", "font-medium",
-                "rounded-md", "focus:outline-none", "focus:ring-2"
-            ])
-        elif element_type == "card":
-            suggestions.extend([
-                "bg-white", "overflow-hidden", "shadow", "rounded-lg",
-                "border", "border-gray-200", "p-6"
-            ])
-        elif element_type == "form":
-            suggestions.extend([
-                "space-y-4", "p-6", "bg-white", "rounded-lg", "shadow"
-            ])
-        
-        # Remove duplicates
-        unique_suggestions = list(dict.fromkeys(suggestions))
-        
-        # Add responsive variants if requested
-        responsive_examples = []
-        if responsive and unique_suggestions:
-            for suggestion in unique_suggestions[:3]:
-                responsive_examples.extend([f"sm:{suggestion}", f"md:{suggestion}"])
-        
-        result = f"""
-# Tailwind CSS Class Suggestions
-
-**Design Description:** {description}
-**Element Type:** {element_type}
-
-## Core Classes
-```css
-{" ".join(unique_suggestions[:10])}
-```
-
-## Complete Class List
-{chr(10).join(f"- `{cls}`" for cls in unique_suggestions)}
-
-## Responsive Examples
-{chr(10).join(f"- `{cls}`" for cls in responsive_examples[:6]) if responsive_examples else "Add responsive prefixes: sm:, md:, lg:, xl:"}
-
-## Usage Example
-```html
-<{element_type} class="{" ".join(unique_suggestions[:8])}">
-  Content here
-</{element_type}>
-```
-
-## Alternative Combinations
-- **Minimal**: {" ".join(unique_suggestions[:4])}
-- **Enhanced**: {" ".join(unique_suggestions[:8])}
-"""
-        
-        return [types.TextContent(type="text", text=result)]
+        return await tailwind_tools.suggest_classes(arguments)
     
     elif name == "package_analyzer":
         package_json_str = arguments.get("package_json", "{}")
@@ -431,6 +378,34 @@ export const {hook_name} = () => {{
                   "whiteboard_layout_optimizer"]:
         return await connection_positioning_tools.handle_call(name, arguments or {})
     
+    # Handle Flow Graph analysis tools
+    elif name in ["react_flow_graph_validator", "react_flow_graph_diff"]:
+        return await flow_graph_tools.handle_call(name, arguments or {})
+    
+    # Handle Flow Viewport tools
+    elif name in ["react_flow_viewport_query", "react_flow_minimap_generator"]:
+        return await flow_viewport_tools.handle_call(name, arguments or {})
+    
+    # Handle Flow Geometry tools
+    elif name in ["react_flow_handle_assigner", "react_flow_canvas_packer", "react_flow_edge_bundler"]:
+        return await flow_geometry_tools.handle_call(name, arguments or {})
+    
+    # Handle Flow Layout tools (progress is streamed when the client sent a progressToken)
+    elif name in ["react_flow_server_layout", "react_flow_elk_parity"]:
+        return await flow_layout_tools.handle_call(name, arguments or {}, progress_reporter())
+    
+    # Handle Performance Trace tools
+    elif name in ["react_flow_trace_analyzer"]:
+        return await performance_trace_tools.handle_call(name, arguments or {})
+    
+    # Handle Tailwind project tools
+    elif name in ["tailwind_project_scanner", "tailwind_purge_analyzer", "tailwind_color_tokens"]:
+        return await tailwind_project_tools.handle_call(name, arguments or {})
+    
+    # Handle Tailwind tools
+    elif name in ["tailwind_optimizer", "tailwind_color_palette"]:
+        return await tailwind_tools.handle_call(name, arguments or {})
+    
     
     else:
         return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -209,9 +209,15 @@ const generateConnectedNode = (
   // Calculate optimal position
   const position = getConnectionAwarePosition(sourceNode, sourceHandleSide);
   
+  // Deterministic id (no Date.now()/Math.random()) so server layouts can be cached and diffed
+  let childIndex = edges.filter(e => e.source === sourceNodeId).length;
+  while (nodes.some(n => n.id === `${{sourceNodeId}}-{connection_side}-${{childIndex}}`)) {{
+    childIndex += 1;
+  }}
+
   // Create new node
   const newNode: Node = {{
-    id: `node-${{Date.now()}}-${{Math.random().toString(36).substr(2, 9)}}`,
+    id: `${{sourceNodeId}}-{connection_side}-${{childIndex}}`,
     type: 'default',
     position,
     data: nodeData,
@@ -395,6 +401,7 @@ def dagre_configuration_optimizer(arguments: Dict[str, Any]) -> List[types.TextC
 ### Performance Considerations:
 - Node count range affects layout calculation time
 - Dense connections may require larger spacing
+- Bundle edges of dense graphs with react_flow_edge_bundler to cut path segments
 - Consider viewport culling for large graphs
 - Use React.memo for node components in large layouts
 
@@ -463,6 +470,7 @@ def whiteboard_layout_optimizer(arguments: Dict[str, Any]) -> List[types.TextCon
 - Consider touch device interaction for handle positioning
 - Implement smart zoom-to-fit for different content types
 - Use minimap for navigation on large whiteboards
+- Pack disconnected clusters with react_flow_canvas_packer instead of letting them sprawl
 
 ### Performance Optimization:
 - Implement viewport culling for large whiteboards
@@ -557,13 +565,9 @@ g.setGraph(dagreConfig);
 
 def generate_performance_config(node_count: str) -> str:
     """Generate performance-specific configuration."""
-    if "xlarge" in node_count:
-        return """// Large graph optimizations
-  acyclicer: 'greedy',
-  ranker: 'tight-tree'"""
-    else:
-        return """// Standard performance settings
-  acyclicer: undefined,
+    return """// No size-based switch: when layout must fit an interactive deadline, run it
+  // with react_flow_server_layout and deadline_ms instead - crossing minimization
+  // and refinement stop early and the best layout found so far is returned.
   ranker: 'network-simplex'"""
 
 def generate_handle_guide(node_type: str, pattern: str, style: str) -> str:
@@ -596,16 +600,16 @@ def generate_handle_jsx(node_type: str, pattern: str, style: str) -> str:
     else:
         return f"\n      {{/* Handles for {pattern} pattern */}}"
 
+WHITEBOARD_DIMENSIONS = {
+    "compact_800x600": {"width": 800, "height": 600},
+    "standard_1200x800": {"width": 1200, "height": 800},
+    "large_1600x1200": {"width": 1600, "height": 1200},
+    "xlarge_2000x1500": {"width": 2000, "height": 1500}
+}
+
 def generate_whiteboard_config(size: str, content_type: str, collaboration: bool) -> str:
     """Generate whiteboard-specific configuration."""
-    dimensions = {
-        "compact_800x600": {"width": 800, "height": 600},
-        "standard_1200x800": {"width": 1200, "height": 800}, 
-        "large_1600x1200": {"width": 1600, "height": 1200},
-        "xlarge_2000x1500": {"width": 2000, "height": 1500}
-    }
-    
-    dims = dimensions.get(size, {"width": 1200, "height": 800})
+    dims = WHITEBOARD_DIMENSIONS.get(size, {"width": 1200, "height": 800})
     
     return f"""```typescript
 // Whiteboard Configuration for {content_type.replace('_', ' ').title()}
@@ -654,7 +658,8 @@ def generate_collaboration_config(collaboration: bool) -> str:
     if collaboration:
         return """realTimeSync: true,
   cursorSharing: true,
-  conflictResolution: 'last-write-wins',"""
+  conflictResolution: 'last-write-wins',
+  syncPayload: 'patch', // broadcast react_flow_graph_diff patches, not full snapshots"""
     else:
         return """realTimeSync: false,
   localStoragePersistence: true,"""
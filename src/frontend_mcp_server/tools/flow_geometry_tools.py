@@ -0,0 +1,964 @@
+"""
+Flow Geometry Tools - bulk geometric post-processing of laid-out React Flow
+documents. These complement the pattern-based handle and whiteboard guides in
+connection_positioning_tools by computing results from the actual node
+positions, vectorized over every node and edge at once.
+"""
+
+import json
+import math
+import string
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from mcp import types
+
+from .connection_positioning_tools import WHITEBOARD_DIMENSIONS, get_content_spacing
+from .flow_loader import FlowGraph, FlowLoadError, flow_input_properties, load_flow
+from .flow_viewport_tools import node_boxes
+
+# Side codes; the opposite side is (code + 2) % 4, mirroring get_opposite_side()
+SIDES = ("right", "bottom", "left", "top")
+MAXRECTS_ITEM_LIMIT = 200  # above this "auto" packing switches to the linear-time skyline packer
+PACKING_MAX_ZOOM = 2.0  # React Flow's default maxZoom
+BUNDLING_MAX_EDGES = 5000  # the compatibility pass is quadratic in the edge count
+BUNDLING_BLOCK_CELLS = 2_000_000  # compatibility matrix cells evaluated per block
+HANDLE_ID_FIELDS = ("type", "side", "slot")
+
+
+def get_tools() -> List[types.Tool]:
+    """Get flow geometry tools."""
+    return [
+        types.Tool(
+            name="react_flow_handle_assigner",
+            description="Compute the best source/target handle sides and slot offsets for every edge of a laid-out flow, spreading edges that share a side",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **flow_input_properties(),
+                    "axis": {
+                        "type": "string",
+                        "enum": ["auto", "horizontal", "vertical"],
+                        "description": "auto picks the dominant axis per edge; horizontal/vertical force LR or TB style handles",
+                        "default": "auto"
+                    },
+                    "slot_mode": {
+                        "type": "string",
+                        "enum": ["spread", "single"],
+                        "description": "spread: one handle slot per edge on a side; single: one handle per side",
+                        "default": "spread"
+                    },
+                    "handle_id_format": {
+                        "type": "string",
+                        "description": "Handle id template ({type}, {side}, {slot}); the default gives `source-right-0`. Use `{type}-{side}` with slot_mode=single to match generateConnectedNode's `source-right` ids",
+                        "default": "{type}-{side}-{slot}"
+                    }
+                },
+                "required": []
+            }
+        ),
+        types.Tool(
+            name="react_flow_canvas_packer",
+            description="Pack nodes or disconnected clusters of a flow into whiteboard dimensions with MaxRects or skyline bin packing",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **flow_input_properties(),
+                    "whiteboard_size": {
+                        "type": "string",
+                        "enum": list(WHITEBOARD_DIMENSIONS),
+                        "description": "Target whiteboard dimensions",
+                        "default": "standard_1200x800"
+                    },
+                    "content_type": {
+                        "type": "string",
+                        "enum": ["brainstorming", "process_mapping", "system_design", "workflow_creation"],
+                        "description": "Content type; sets the gap between packed items unless spacing is given"
+                    },
+                    "spacing": {
+                        "type": "number",
+                        "description": "Gap between packed items in flow units"
+                    },
+                    "mode": {
+                        "type": "string",
+                        "enum": ["components", "nodes"],
+                        "description": "components keeps each connected cluster's internal layout; nodes packs every top-level node",
+                        "default": "components"
+                    },
+                    "algorithm": {
+                        "type": "string",
+                        "enum": ["auto", "maxrects", "skyline"],
+                        "description": f"auto uses MaxRects up to {MAXRECTS_ITEM_LIMIT} items and skyline beyond",
+                        "default": "auto"
+                    }
+                },
+                "required": []
+            }
+        ),
+        types.Tool(
+            name="react_flow_edge_bundler",
+            description="Force-directed edge bundling for dense flows: merges compatible edges into shared bundles and returns simplified SVG paths",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **flow_input_properties(),
+                    "anchors": {
+                        "type": "string",
+                        "enum": ["handles", "center"],
+                        "description": "handles starts edges at react_flow_handle_assigner slots; center uses node centers",
+                        "default": "handles"
+                    },
+                    "compatibility_threshold": {
+                        "type": "number",
+                        "description": "Minimum angle/scale/position/visibility compatibility for two edges to attract",
+                        "default": 0.6
+                    },
+                    "max_neighbors": {
+                        "type": "integer",
+                        "description": "Most compatible edges each edge is attracted to",
+                        "default": 32
+                    },
+                    "cycles": {
+                        "type": "integer",
+                        "description": "Subdivision cycles; each doubles the control points per edge",
+                        "default": 4
+                    },
+                    "iterations": {
+                        "type": "integer",
+                        "description": "Force iterations in the first cycle (reduced by a third per cycle)",
+                        "default": 40
+                    },
+                    "stiffness": {
+                        "type": "number",
+                        "description": "Spring constant keeping edges straight",
+                        "default": 0.1
+                    },
+                    "merge_distance": {
+                        "type": "number",
+                        "description": "Mean control-point distance under which bundled edges share one trunk path (default 5% of mean edge length)"
+                    },
+                    "tolerance": {
+                        "type": "number",
+                        "description": "Path simplification tolerance in flow units",
+                        "default": 2
+                    },
+                    "outputs": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["bundles", "edge_paths", "svg"]},
+                        "default": ["bundles", "svg"]
+                    }
+                },
+                "required": []
+            }
+        )
+    ]
+
+
+def react_flow_handle_assigner(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Assign handle sides and slots for all edges of a flow."""
+    axis = arguments.get("axis", "auto")
+    slot_mode = arguments.get("slot_mode", "spread")
+    id_format = arguments.get("handle_id_format", "{type}-{side}-{slot}")
+
+    try:
+        if axis not in ("auto", "horizontal", "vertical"):
+            raise ValueError(f"Unknown axis '{axis}'")
+        if slot_mode not in ("spread", "single"):
+            raise ValueError(f"Unknown slot_mode '{slot_mode}' (expected spread or single)")
+        started = time.perf_counter()
+        graph = load_flow(arguments, keep_data=False)
+        assignment = assign_handles(graph, axis, slot_mode == "spread")
+        elapsed = time.perf_counter() - started
+        updates, node_handles = format_handle_assignment(graph, assignment, id_format)
+    except (FlowLoadError, ValueError, KeyError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    side_counts = np.bincount(assignment["source_side"][assignment["valid"]], minlength=4)
+    patch = {"edges": {"changed": {
+        update["id"]: {"set": {"sourceHandle": update["sourceHandle"], "targetHandle": update["targetHandle"]}}
+        for update in updates
+    }}} if updates else {}
+
+    return [types.TextContent(type="text", text=f"""# React Flow Handle Assignment
+
+- **Edges assigned**: {len(updates)} of {len(graph.edges)} (dangling edges skipped)
+- **Nodes with handles**: {len(node_handles)}
+- **Axis**: {axis}, **Slots**: {slot_mode}
+- **Source sides**: {', '.join(f"{side} {int(count)}" for side, count in zip(SIDES, side_counts))}
+- **Time**: {elapsed * 1000:.2f} ms
+
+Edges sharing a node side are ordered by the position of their other endpoint, so
+slots follow the geometry and parallel edges do not cross at the node.
+
+## Rendering the Handles
+```typescript
+import {{ Handle, Position }} from 'reactflow';
+
+// data.handles comes from `node_handles` below
+const SlottedHandles = ({{ handles }}) => handles.map((handle) => (
+  <Handle
+    key={{handle.id}}
+    id={{handle.id}}
+    type={{handle.type}}
+    position={{Position[handle.position]}}
+    style={{handle.position === 'Left' || handle.position === 'Right'
+      ? {{ top: `${{handle.offset * 100}}%` }}
+      : {{ left: `${{handle.offset * 100}}%` }}}}
+  />
+));
+```
+
+## Edge Updates (react_flow_graph_diff patch format)
+```json
+{json.dumps(patch, separators=(',', ':'))}
+```
+
+## Node Handles
+```json
+{json.dumps(node_handles, separators=(',', ':'))}
+```
+
+## Edge Slot Offsets
+```json
+{json.dumps(updates, separators=(',', ':'))}
+```
+""")]
+
+
+def react_flow_canvas_packer(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Pack a flow's clusters or nodes into the whiteboard."""
+    size = arguments.get("whiteboard_size", "standard_1200x800")
+    mode = arguments.get("mode", "components")
+    algorithm = arguments.get("algorithm", "auto")
+    spacing = arguments.get("spacing")
+
+    try:
+        if spacing is None:
+            spacing = get_content_spacing(arguments["content_type"]) / 4 if arguments.get("content_type") else 40
+        if size not in WHITEBOARD_DIMENSIONS:
+            raise ValueError(f"Unknown whiteboard size '{size}'")
+        if mode not in ("components", "nodes") or algorithm not in ("auto", "maxrects", "skyline"):
+            raise ValueError(f"Unknown mode '{mode}' or algorithm '{algorithm}'")
+        dims = WHITEBOARD_DIMENSIONS[size]
+        started = time.perf_counter()
+        graph = load_flow(arguments, keep_data=False)
+        result = pack_flow(graph, dims["width"], dims["height"], float(spacing), mode, algorithm)
+        elapsed = time.perf_counter() - started
+    except (FlowLoadError, ValueError, KeyError, TypeError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    patch = {"nodes": {"moved": result["positions"]}} if result["positions"] else {}
+    packed = result["packed"]
+    original = result["original"]
+    reduction = 1 - (packed["width"] * packed["height"]) / max(original["width"] * original["height"], 1e-9)
+
+    return [types.TextContent(type="text", text=f"""# React Flow Canvas Packing
+
+- **Whiteboard**: {dims['width']}x{dims['height']}
+- **Items packed**: {result['items']} {'clusters' if mode == 'components' else 'nodes'} ({result['algorithm']})
+- **Original extent**: {original['width']:.0f}x{original['height']:.0f}
+- **Packed extent**: {packed['width']:.0f}x{packed['height']:.0f} ({max(reduction, 0) * 100:.1f}% less area)
+- **Utilization**: {result['utilization'] * 100:.1f}%
+- **Fitted zoom**: {result['zoom']:.3f}
+- **Time**: {elapsed * 1000:.2f} ms
+
+```typescript
+// Apply with the react_flow_graph_diff patch below, then frame the packed canvas
+reactFlowInstance.setViewport({{ x: 0, y: 0, zoom: {result['zoom']:.3f} }});
+```
+
+## Node Positions (react_flow_graph_diff patch format)
+```json
+{json.dumps(patch, separators=(',', ':'))}
+```
+""")]
+
+
+def react_flow_edge_bundler(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Bundle the edges of a flow and return simplified paths."""
+    outputs = arguments.get("outputs") or ["bundles", "svg"]
+
+    try:
+        graph = load_flow(arguments, keep_data=False)
+        if len(graph.edges) > BUNDLING_MAX_EDGES:
+            raise ValueError(
+                f"{len(graph.edges)} edges exceeds the bundling limit of {BUNDLING_MAX_EDGES}; "
+                "bundle the visible region from react_flow_viewport_query instead"
+            )
+        started = time.perf_counter()
+        rows, start, end = edge_anchor_points(graph, arguments.get("anchors", "handles"))
+        pairs = edge_compatibility(
+            start, end,
+            float(arguments.get("compatibility_threshold", 0.6)),
+            int(arguments.get("max_neighbors", 32)),
+        )
+        polylines = bundle_edges(
+            start, end, pairs,
+            cycles=int(arguments.get("cycles", 4)),
+            iterations=int(arguments.get("iterations", 40)),
+            stiffness=float(arguments.get("stiffness", 0.1)),
+        )
+        bundles = merge_bundles(polylines, pairs, arguments.get("merge_distance"))
+        result = bundle_paths(graph, rows, polylines, bundles, float(arguments.get("tolerance", 2)))
+        elapsed = time.perf_counter() - started
+    except (FlowLoadError, ValueError, KeyError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    payload = {}
+    if "bundles" in outputs:
+        payload["bundles"] = result["bundles"]
+    if "edge_paths" in outputs:
+        payload["edge_paths"] = result["edge_paths"]
+    if "svg" in outputs:
+        payload["svg"] = result["svg"]
+    shared = sum(1 for bundle in result["bundles"] if len(bundle["edges"]) > 1)
+
+    return [types.TextContent(type="text", text=f"""# React Flow Edge Bundling
+
+- **Edges bundled**: {len(rows)} of {len(graph.edges)} (self-loops and dangling edges skipped)
+- **Compatible pairs**: {len(pairs[0])}
+- **Control points per edge**: {polylines.shape[1]}
+- **Bundles**: {len(result['bundles'])} ({shared} shared trunks)
+- **Path segments**: {result['segments']} (vs {len(rows) * (polylines.shape[1] - 1)} unsimplified)
+- **Time**: {elapsed * 1000:.2f} ms
+
+Draw each bundle's trunk once with its stroke width, plus the short stubs
+connecting member endpoints to the trunk.
+
+```json
+{json.dumps(payload, separators=(',', ':'))}
+```
+""")]
+
+
+# Handle assignment engine
+def assign_handles(graph: FlowGraph, axis: str = "auto", spread: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Pick handle sides and slot offsets for all edges at once.
+
+    The source side faces the target along the dominant axis (distance
+    normalised by the combined half extents of both boxes, so wide nodes
+    prefer vertical exits less eagerly); the target side is the opposite.
+    Edges meeting a node on the same side are ranked by the other
+    endpoint's coordinate along that side and spread evenly over it.
+    """
+    boxes = node_boxes(graph)
+    source = np.asarray(graph.edges.source, dtype=np.int64)
+    target = np.asarray(graph.edges.target, dtype=np.int64)
+    valid = (source >= 0) & (target >= 0)
+    edge_count = len(source)
+
+    centers = np.column_stack(((boxes[:, 0] + boxes[:, 2]) / 2, (boxes[:, 1] + boxes[:, 3]) / 2))
+    half = np.column_stack(((boxes[:, 2] - boxes[:, 0]) / 2, (boxes[:, 3] - boxes[:, 1]) / 2))
+    src = np.where(valid, source, 0)
+    tgt = np.where(valid, target, 0)
+
+    delta = centers[tgt] - centers[src] if len(boxes) else np.zeros((edge_count, 2))
+    reach = np.maximum(half[src] + half[tgt], 1e-9) if len(boxes) else np.ones((edge_count, 2))
+    normalized = np.abs(delta) / reach
+    if axis == "horizontal":
+        horizontal = np.ones(edge_count, dtype=bool)
+    elif axis == "vertical":
+        horizontal = np.zeros(edge_count, dtype=bool)
+    else:
+        horizontal = normalized[:, 0] >= normalized[:, 1]
+
+    source_side = np.where(horizontal, np.where(delta[:, 0] >= 0, 0, 2), np.where(delta[:, 1] >= 0, 1, 3))
+    target_side = (source_side + 2) % 4
+    self_loops = valid & (source == target)
+    source_side[self_loops] = 0  # leave right, come back in from the top
+    target_side[self_loops] = 3
+
+    source_offset = np.full(edge_count, 0.5)
+    target_offset = np.full(edge_count, 0.5)
+    source_slot = np.zeros(edge_count, dtype=np.int64)
+    target_slot = np.zeros(edge_count, dtype=np.int64)
+
+    rows = np.nonzero(valid)[0]
+    if spread and len(rows):
+        # One entry per edge endpoint: (node, side, other endpoint's coordinate along the side)
+        node = np.concatenate((source[rows], target[rows]))
+        side = np.concatenate((source_side[rows], target_side[rows]))
+        other = np.concatenate((centers[target[rows]], centers[source[rows]]))
+        along = np.where(side % 2 == 0, other[:, 1], other[:, 0])  # left/right sides run along y
+        order = np.lexsort((along, side, node))
+        group_key = node[order] * 4 + side[order]
+        starts = np.r_[0, np.nonzero(np.diff(group_key))[0] + 1]
+        counts = np.diff(np.r_[starts, len(order)])
+        group = np.repeat(np.arange(len(starts)), counts)
+        rank = np.arange(len(order)) - starts[group]
+
+        slots = np.empty(len(order), dtype=np.int64)
+        slots[order] = rank
+        offsets = np.empty(len(order))
+        offsets[order] = (rank + 1) / (counts[group] + 1)
+
+        half_count = len(rows)
+        source_slot[rows], target_slot[rows] = slots[:half_count], slots[half_count:]
+        source_offset[rows], target_offset[rows] = offsets[:half_count], offsets[half_count:]
+
+    return {
+        "valid": valid,
+        "source_side": source_side,
+        "target_side": target_side,
+        "source_slot": source_slot,
+        "target_slot": target_slot,
+        "source_offset": source_offset,
+        "target_offset": target_offset,
+    }
+
+
+def check_id_format(id_format: Any) -> None:
+    """Raise ValueError unless the template only uses the {type}, {side} and {slot} fields."""
+    if not isinstance(id_format, str):
+        raise ValueError("handle_id_format must be a string")
+    try:
+        fields = [field for _, field, _, _ in string.Formatter().parse(id_format) if field is not None]
+    except ValueError as exc:
+        raise ValueError(f"Invalid handle_id_format {id_format!r}: {exc}") from exc
+    unknown = [field for field in fields if field not in HANDLE_ID_FIELDS]
+    if unknown or not fields:
+        raise ValueError(f"handle_id_format may only use {{type}}, {{side}} and {{slot}}, got {id_format!r}")
+    try:
+        id_format.format(type="source", side=SIDES[0], slot=0)
+    except (ValueError, IndexError, KeyError, AttributeError) as exc:
+        raise ValueError(f"Invalid handle_id_format {id_format!r}: {exc}") from exc
+
+
+def format_handle_assignment(graph: FlowGraph, assignment: Dict[str, np.ndarray], id_format: str):
+    """Edge updates and per-node handle lists from an assignment."""
+    check_id_format(id_format)
+    edges, nodes = graph.edges, graph.nodes
+    updates = []
+    node_handles: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    columns = [assignment[key].tolist() for key in (
+        "source_side", "target_side", "source_slot", "target_slot", "source_offset", "target_offset")]
+
+    for row in np.nonzero(assignment["valid"])[0].tolist():
+        source_side, target_side, source_slot, target_slot, source_offset, target_offset = (
+            column[row] for column in columns)
+        source_id = id_format.format(type="source", side=SIDES[source_side], slot=source_slot)
+        target_id = id_format.format(type="target", side=SIDES[target_side], slot=target_slot)
+        updates.append({
+            "id": edges.ids[row],
+            "sourceHandle": source_id,
+            "targetHandle": target_id,
+            "sourceOffset": round(source_offset, 4),
+            "targetOffset": round(target_offset, 4),
+        })
+        for node_row, handle_id, kind, side, offset in (
+            (edges.source[row], source_id, "source", source_side, source_offset),
+            (edges.target[row], target_id, "target", target_side, target_offset),
+        ):
+            node_handles.setdefault(nodes.ids[node_row], {})[handle_id] = {
+                "id": handle_id,
+                "type": kind,
+                "position": SIDES[side].title(),
+                "offset": round(offset, 4),
+            }
+
+    return updates, {node_id: list(handles.values()) for node_id, handles in node_handles.items()}
+
+
+# Rectangle packing engine
+def connected_groups(graph: FlowGraph, roots: Sequence[int]) -> List[List[int]]:
+    """Connected components over top-level nodes; edges into children join their ancestors."""
+    leader = list(range(len(roots)))
+
+    def find(row: int) -> int:
+        while leader[row] != row:
+            leader[row] = leader[leader[row]]
+            row = leader[row]
+        return row
+
+    for source, target in zip(graph.edges.source, graph.edges.target):
+        if source >= 0 and target >= 0:
+            a, b = find(roots[source]), find(roots[target])
+            if a != b:
+                leader[max(a, b)] = min(a, b)
+
+    groups: Dict[int, List[int]] = {}
+    for row, root in enumerate(roots):
+        if root == row:
+            groups.setdefault(find(row), []).append(row)
+    return list(groups.values())
+
+
+def pack_skyline(sizes: Sequence[Tuple[float, float]], width: float, height: float) -> Optional[List[Tuple[float, float]]]:
+    """Bottom-left skyline packing; None when the items do not fit."""
+    skyline = [[0.0, 0.0, width]]  # segments of [x, y, width] left to right
+    placements: List[Optional[Tuple[float, float]]] = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0], i))
+
+    for item in order:
+        w, h = sizes[item]
+        best_y, best_x, best_start = math.inf, 0.0, -1
+        for start in range(len(skyline)):
+            x = skyline[start][0]
+            end = x + w
+            if end > width + 1e-9:
+                break
+            y = 0.0
+            index = start
+            while index < len(skyline) and skyline[index][0] < end - 1e-9:
+                if skyline[index][1] > y:
+                    y = skyline[index][1]
+                    if y >= best_y:
+                        break  # an earlier start already sits at least this high
+                index += 1
+            if y < best_y and y + h <= height + 1e-9:
+                best_y, best_x, best_start = y, x, start
+        if best_start < 0:
+            return None
+
+        x, y, start = best_x, best_y, best_start
+        placements[item] = (x, y)
+        # Replace the covered segments with the new top edge and trim the partial remainder
+        end = x + w
+        index = start
+        while index < len(skyline) and skyline[index][0] + skyline[index][2] <= end + 1e-9:
+            index += 1
+        tail = []
+        if index < len(skyline) and skyline[index][0] < end:
+            segment = skyline[index]
+            tail = [[end, segment[1], segment[0] + segment[2] - end]]
+            index += 1
+        skyline[start:index] = [[x, y + h, w]] + tail
+        # Only the new segment's neighbours can have the same height
+        if start + 1 < len(skyline) and abs(skyline[start + 1][1] - skyline[start][1]) < 1e-9:
+            skyline[start][2] += skyline.pop(start + 1)[2]
+        if start > 0 and abs(skyline[start - 1][1] - skyline[start][1]) < 1e-9:
+            skyline[start - 1][2] += skyline.pop(start)[2]
+    return placements
+
+
+def pack_maxrects(sizes: Sequence[Tuple[float, float]], width: float, height: float) -> Optional[List[Tuple[float, float]]]:
+    """MaxRects packing with the best-short-side-fit heuristic; None when the items do not fit."""
+    free = [(0.0, 0.0, width, height)]
+    placements: List[Optional[Tuple[float, float]]] = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-max(sizes[i]), -sizes[i][0] * sizes[i][1], i))
+
+    for item in order:
+        w, h = sizes[item]
+        best = None
+        for fx, fy, fw, fh in free:
+            if fw + 1e-9 >= w and fh + 1e-9 >= h:
+                score = (min(fw - w, fh - h), max(fw - w, fh - h), fy, fx)
+                if best is None or score < best[0]:
+                    best = (score, fx, fy)
+        if best is None:
+            return None
+
+        _, x, y = best
+        placements[item] = (x, y)
+        split = []
+        for fx, fy, fw, fh in free:
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                split.append((fx, fy, fw, fh))
+                continue
+            if x > fx:
+                split.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                split.append((x + w, fy, fx + fw - x - w, fh))
+            if y > fy:
+                split.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                split.append((fx, y + h, fw, fy + fh - y - h))
+        # Drop free rectangles contained in another one
+        split.sort(key=lambda rect: -rect[2] * rect[3])
+        free = []
+        for rect in split:
+            if not any(rect[0] >= other[0] and rect[1] >= other[1]
+                       and rect[0] + rect[2] <= other[0] + other[2]
+                       and rect[1] + rect[3] <= other[1] + other[3] for other in free):
+                free.append(rect)
+    return placements
+
+
+def pack_rectangles(sizes: Sequence[Tuple[float, float]], aspect: float,
+                    algorithm: str = "auto") -> Tuple[List[Tuple[float, float]], str]:
+    """
+    Pack rectangles into the smallest bin of the given aspect ratio found.
+
+    The bin starts at the total item area (assuming 90% utilization);
+    MaxRects grows it by 10% until every rectangle fits, while the skyline
+    packer keeps the width and lets the height run. Either way the result
+    can be zoomed to fill the whiteboard.
+    """
+    if algorithm == "auto":
+        algorithm = "maxrects" if len(sizes) <= MAXRECTS_ITEM_LIMIT else "skyline"
+    if not sizes:
+        return [], algorithm
+    packer = pack_maxrects if algorithm == "maxrects" else pack_skyline
+
+    area = sum(w * h for w, h in sizes) / 0.9
+    bin_width = max(math.sqrt(area * aspect), max(w for w, _ in sizes))
+    bin_height = max(area / bin_width, max(h for _, h in sizes))
+    if algorithm == "skyline":
+        # The skyline only ever grows downwards, so one pass with an open bottom suffices
+        return pack_skyline(sizes, bin_width, math.inf), algorithm
+    while True:
+        placements = packer(sizes, bin_width, bin_height)
+        if placements is not None:
+            return placements, algorithm
+        bin_width *= 1.1
+        bin_height *= 1.1
+
+
+def pack_flow(graph: FlowGraph, width: float, height: float, spacing: float = 40.0,
+              mode: str = "components", algorithm: str = "auto") -> Dict[str, Any]:
+    """Pack clusters (or top-level nodes) and return their new positions."""
+    boxes = node_boxes(graph)
+    roots = graph.top_level_rows()
+    if mode == "components":
+        groups = connected_groups(graph, roots)
+    else:
+        groups = [[row] for row, root in enumerate(roots) if root == row]
+
+    # Item bounds include every descendant of the grouped top-level nodes
+    members: Dict[int, int] = {}
+    for index, group in enumerate(groups):
+        for row in group:
+            members[row] = index
+    item_of = np.array([members[root] for root in roots], dtype=np.int64)
+    item_count = len(groups)
+    bounds = np.empty((item_count, 4))
+    if item_count:
+        bounds[:, :2] = np.inf
+        bounds[:, 2:] = -np.inf
+        np.minimum.at(bounds[:, 0], item_of, boxes[:, 0])
+        np.minimum.at(bounds[:, 1], item_of, boxes[:, 1])
+        np.maximum.at(bounds[:, 2], item_of, boxes[:, 2])
+        np.maximum.at(bounds[:, 3], item_of, boxes[:, 3])
+
+    extents = bounds[:, 2:] - bounds[:, :2]
+    sizes = [(w + spacing, h + spacing) for w, h in extents.tolist()]
+    placements, used = pack_rectangles(sizes, width / height, algorithm)
+
+    positions = {}
+    packed_width = packed_height = 0.0
+    for index, group in enumerate(groups):
+        x, y = placements[index]
+        left, top = bounds[index, :2].tolist()
+        packed_width = max(packed_width, x + sizes[index][0] - spacing)
+        packed_height = max(packed_height, y + sizes[index][1] - spacing)
+        dx, dy = x - left, y - top
+        for row in group:
+            positions[graph.nodes.ids[row]] = {
+                "x": round(graph.nodes.x[row] + dx, 2),
+                "y": round(graph.nodes.y[row] + dy, 2),
+            }
+
+    original = (boxes[:, 2:].max(axis=0) - boxes[:, :2].min(axis=0)).tolist() if len(boxes) else [0.0, 0.0]
+    packed_area = packed_width * packed_height
+    zoom = min(width / packed_width, height / packed_height, PACKING_MAX_ZOOM) if packed_area else 1.0
+    return {
+        "positions": positions,
+        "items": item_count,
+        "algorithm": used,
+        "original": {"width": original[0], "height": original[1]},
+        "packed": {"width": packed_width, "height": packed_height},
+        "utilization": float(np.prod(extents, axis=1).sum()) / packed_area if packed_area else 0.0,
+        "zoom": zoom,
+    }
+
+
+# Edge bundling engine
+def side_points(boxes: np.ndarray, sides: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Points on box sides (SIDES codes) at fractional offsets along the side."""
+    width = boxes[:, 2] - boxes[:, 0]
+    height = boxes[:, 3] - boxes[:, 1]
+    x = np.where(sides == 0, boxes[:, 2], np.where(sides == 2, boxes[:, 0], boxes[:, 0] + offsets * width))
+    y = np.where(sides == 1, boxes[:, 3], np.where(sides == 3, boxes[:, 1], boxes[:, 1] + offsets * height))
+    return np.column_stack((x, y))
+
+
+def edge_anchor_points(graph: FlowGraph, anchors: str = "handles") -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Rows of bundleable edges with their start and end points."""
+    if anchors not in ("handles", "center"):
+        raise ValueError(f"Unknown anchors '{anchors}'")
+    boxes = node_boxes(graph)
+    assignment = assign_handles(graph)
+    source = np.asarray(graph.edges.source, dtype=np.int64)
+    target = np.asarray(graph.edges.target, dtype=np.int64)
+    rows = np.nonzero(assignment["valid"] & (source != target))[0]
+    source_boxes, target_boxes = boxes[source[rows]], boxes[target[rows]]
+
+    if anchors == "center":
+        start = (source_boxes[:, :2] + source_boxes[:, 2:]) / 2
+        end = (target_boxes[:, :2] + target_boxes[:, 2:]) / 2
+    else:
+        start = side_points(source_boxes, assignment["source_side"][rows], assignment["source_offset"][rows])
+        end = side_points(target_boxes, assignment["target_side"][rows], assignment["target_offset"][rows])
+    return rows, start, end
+
+
+def edge_compatibility(start: np.ndarray, end: np.ndarray, threshold: float = 0.6,
+                       max_neighbors: int = 32) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sparse edge compatibility (Holten & van Wijk) as parallel pair arrays.
+
+    Returns (edge, other, weight, flipped) sorted by edge, keeping each
+    edge's strongest max_neighbors partners above the threshold. The dense
+    matrix is evaluated in row blocks so memory stays bounded.
+    """
+    count = len(start)
+    vectors = end - start
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+    safe = np.maximum(lengths, 1e-9)
+    mids = (start + end) / 2
+    start_dot = np.einsum("ij,ij->i", start, vectors)
+    block = max(1, BUNDLING_BLOCK_CELLS // max(count, 1))
+    keep = min(max_neighbors, count - 1)
+
+    collected = ([], [], [], [])
+    if keep <= 0:
+        return tuple(np.array([], dtype=dtype) for dtype in (np.int64, np.int64, float, bool))
+
+    for low in range(0, count, block):
+        rows = np.arange(low, min(low + block, count))
+        dot = vectors[rows] @ vectors.T
+        longer = np.maximum(safe[rows, None], safe[None, :])
+        shorter = np.minimum(safe[rows, None], safe[None, :])
+        average = (safe[rows, None] + safe[None, :]) / 2
+        angle = np.abs(dot) / (safe[rows, None] * safe[None, :])
+        scale = 2 / (average / shorter + longer / average)
+        gap = np.hypot(mids[rows, None, 0] - mids[None, :, 0], mids[rows, None, 1] - mids[None, :, 1])
+        position = average / (average + gap)
+
+        # Visibility: project each edge's endpoints onto the other's line (parameter t along it)
+        squared = safe ** 2
+        t_start = (start @ vectors[rows].T).T - start_dot[rows, None]
+        t_end = (end @ vectors[rows].T).T - start_dot[rows, None]
+        forward = _visibility(t_start / squared[rows, None], t_end / squared[rows, None])
+        u_start = (start[rows] @ vectors.T) - start_dot[None, :]
+        u_end = (end[rows] @ vectors.T) - start_dot[None, :]
+        backward = _visibility(u_start / squared[None, :], u_end / squared[None, :])
+
+        compatibility = angle * scale * position * np.minimum(forward, backward)
+        compatibility[np.arange(len(rows)), rows] = 0
+        compatibility[lengths[rows] < 1e-9] = 0
+        compatibility[:, lengths < 1e-9] = 0
+        compatibility[compatibility < threshold] = 0
+
+        if keep < count:
+            partners = np.argpartition(-compatibility, keep - 1, axis=1)[:, :keep]
+        else:
+            partners = np.broadcast_to(np.arange(count), compatibility.shape)
+        weights = np.take_along_axis(compatibility, partners, axis=1)
+        local, slot = np.nonzero(weights > 0)
+        collected[0].append(rows[local])
+        collected[1].append(partners[local, slot])
+        collected[2].append(weights[local, slot])
+        collected[3].append(np.take_along_axis(dot, partners, axis=1)[local, slot] < 0)
+
+    edge, other, weight, flipped = (np.concatenate(parts) for parts in collected)
+    order = np.lexsort((other, edge))
+    return edge[order], other[order], weight[order], flipped[order]
+
+
+def _visibility(t_first: np.ndarray, t_second: np.ndarray) -> np.ndarray:
+    """Visibility compatibility from the projected parameters of the other edge's endpoints."""
+    span = np.abs(t_second - t_first)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        visibility = 1 - 2 * np.abs(0.5 - (t_first + t_second) / 2) / span
+    return np.clip(np.nan_to_num(visibility, nan=0.0, neginf=0.0), 0, 1)
+
+
+def _gather_partners(points: np.ndarray, other: np.ndarray, flipped: np.ndarray) -> np.ndarray:
+    """Partner control points, reversed for partners running the opposite way."""
+    gathered = points[other]
+    gathered[flipped] = gathered[flipped, ::-1]
+    return gathered
+
+
+def bundle_edges(start: np.ndarray, end: np.ndarray, pairs: Tuple[np.ndarray, ...], cycles: int = 4,
+                 iterations: int = 40, stiffness: float = 0.1, step: Optional[float] = None) -> np.ndarray:
+    """
+    Force-directed edge bundling; returns (edges, points, 2) polylines including endpoints.
+
+    Every cycle inserts a control point between each pair of existing
+    ones, then runs spring forces (keeping each edge straight) against
+    electrostatic attraction to the matching control points of compatible
+    edges. The step halves and the iteration count drops by a third per
+    cycle, as in the original FDEB schedule.
+    """
+    edge, other, weight, flipped = pairs
+    count = len(start)
+    lengths = np.maximum(np.hypot(*(end - start).T), 1e-9)
+    if step is None:
+        step = float(lengths.mean()) / 1000 if count else 0.0
+    points = ((start + end) / 2)[:, None, :]
+    owners, starts = np.unique(edge, return_index=True)
+
+    for cycle in range(max(cycles, 1)):
+        if cycle:
+            full = np.concatenate((start[:, None], points, end[:, None]), axis=1)
+            refined = np.empty((count, 2 * full.shape[1] - 1, 2))
+            refined[:, ::2] = full
+            refined[:, 1::2] = (full[:, :-1] + full[:, 1:]) / 2
+            points = refined[:, 1:-1]
+        spring = stiffness / (lengths * (points.shape[1] + 1))
+
+        for _ in range(max(int(iterations * (2 / 3) ** cycle), 1)):
+            full = np.concatenate((start[:, None], points, end[:, None]), axis=1)
+            force = spring[:, None, None] * (full[:, :-2] + full[:, 2:] - 2 * points)
+            if len(edge):
+                delta = _gather_partners(points, other, flipped) - points[edge]
+                distance = np.hypot(delta[..., 0], delta[..., 1])[..., None]
+                pull = np.divide(delta, distance, out=np.zeros_like(delta), where=distance > 1e-9)
+                force[owners] += np.add.reduceat(pull * weight[:, None, None], starts, axis=0)
+            points = points + step * force
+        step /= 2
+
+    return np.concatenate((start[:, None], points, end[:, None]), axis=1)
+
+
+def merge_bundles(polylines: np.ndarray, pairs: Tuple[np.ndarray, ...],
+                  merge_distance: Optional[float] = None) -> List[List[int]]:
+    """Group bundled edges whose inner control points ended up within merge_distance."""
+    edge, other, _, flipped = pairs
+    count = len(polylines)
+    if merge_distance is None:
+        lengths = np.hypot(*(polylines[:, -1] - polylines[:, 0]).T)
+        merge_distance = 0.05 * float(lengths.mean()) if count else 0.0
+
+    inner = polylines[:, 1:-1]
+    quarter = inner.shape[1] // 4
+    core = inner[:, quarter:inner.shape[1] - quarter]
+    leader = list(range(count))
+
+    def find(row: int) -> int:
+        while leader[row] != row:
+            leader[row] = leader[leader[row]]
+            row = leader[row]
+        return row
+
+    if len(edge):
+        delta = _gather_partners(core, other, flipped) - core[edge]
+        close = np.hypot(delta[..., 0], delta[..., 1]).mean(axis=1) <= merge_distance
+        for a, b in zip(edge[close].tolist(), other[close].tolist()):
+            a, b = find(a), find(b)
+            if a != b:
+                leader[max(a, b)] = min(a, b)
+
+    groups: Dict[int, List[int]] = {}
+    for row in range(count):
+        groups.setdefault(find(row), []).append(row)
+    return list(groups.values())
+
+
+def simplify_polyline(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker simplification, iterative over a stack of spans."""
+    if len(points) < 3:
+        return points
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        segment = points[last] - points[first]
+        offsets = points[first + 1:last] - points[first]
+        length = np.hypot(*segment)
+        if length < 1e-9:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = first + 1 + index
+            keep[split] = True
+            stack.extend(((first, split), (split, last)))
+    return points[keep]
+
+
+def svg_path(points: np.ndarray) -> str:
+    """SVG path data for a polyline."""
+    coordinates = [f"{x:.1f} {y:.1f}" for x, y in points.tolist()]
+    return "M" + " L".join(coordinates)
+
+
+def bundle_paths(graph: FlowGraph, rows: np.ndarray, polylines: np.ndarray,
+                 bundles: List[List[int]], tolerance: float = 2.0) -> Dict[str, Any]:
+    """
+    Simplified paths per bundle.
+
+    A shared bundle is drawn as one trunk (the mean of its members' inner
+    control points, aligned to the first member's direction) plus a
+    straight stub from each member's endpoints to the trunk ends.
+    """
+    edge_ids = graph.edges.ids
+    result_bundles = []
+    edge_paths = {}
+    segments = 0
+    svg_parts = []
+
+    for index, members in enumerate(bundles):
+        ids = [edge_ids[rows[member]] for member in members]
+        lines = polylines[members]
+        if len(members) == 1:
+            simplified = simplify_polyline(lines[0], tolerance)
+            path = svg_path(simplified)
+            segments += len(simplified) - 1
+            result_bundles.append({"id": f"bundle-{index}", "edges": ids, "path": path, "width": 1})
+            edge_paths[ids[0]] = path
+            svg_parts.append(f'<path d="{path}" stroke-width="1"/>')
+            continue
+
+        direction = lines[0, -1] - lines[0, 0]
+        reversed_rows = ((lines[:, -1] - lines[:, 0]) @ direction) < 0
+        aligned = lines.copy()
+        aligned[reversed_rows] = aligned[reversed_rows, ::-1]
+        inner = aligned[:, 1:-1]
+        quarter = inner.shape[1] // 4
+        trunk = simplify_polyline(inner[:, quarter:inner.shape[1] - quarter].mean(axis=0), tolerance)
+        width = round(1 + math.log2(len(members)), 2)
+        stubs = []
+        for edge_id, line, flipped in zip(ids, aligned, reversed_rows.tolist()):
+            head = svg_path(np.array([line[0], trunk[0]]))
+            tail = svg_path(np.array([trunk[-1], line[-1]]))
+            stubs.append(f"{head} {tail}")
+            ordered = np.concatenate(([line[0]], trunk, [line[-1]]))
+            edge_paths[edge_id] = svg_path(ordered[::-1] if flipped else ordered)
+        trunk_path = svg_path(trunk)
+        segments += len(trunk) - 1 + 2 * len(members)
+        result_bundles.append({
+            "id": f"bundle-{index}",
+            "edges": ids,
+            "path": trunk_path,
+            "stubs": " ".join(stubs),
+            "width": width,
+        })
+        svg_parts.append(f'<path d="{trunk_path}" stroke-width="{width}"/><path d="{" ".join(stubs)}" stroke-width="1"/>')
+
+    if len(polylines):
+        low = polylines.reshape(-1, 2).min(axis=0)
+        high = polylines.reshape(-1, 2).max(axis=0)
+    else:
+        low = high = np.zeros(2)
+    view_box = f"{low[0]:.1f} {low[1]:.1f} {max(high[0] - low[0], 1):.1f} {max(high[1] - low[1], 1):.1f}"
+    svg = (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{view_box}">'
+           f'<g fill="none" stroke="#64748b" stroke-opacity="0.6">{"".join(svg_parts)}</g></svg>')
+    return {"bundles": result_bundles, "edge_paths": edge_paths, "svg": svg, "segments": segments}
+
+
+# Tool execution handlers
+FLOW_GEOMETRY_HANDLERS = {
+    "react_flow_handle_assigner": react_flow_handle_assigner,
+    "react_flow_canvas_packer": react_flow_canvas_packer,
+    "react_flow_edge_bundler": react_flow_edge_bundler
+}
+
+
+async def handle_call(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle flow geometry tool calls."""
+    if name in FLOW_GEOMETRY_HANDLERS:
+        return FLOW_GEOMETRY_HANDLERS[name](arguments)
+
+    return [types.TextContent(
+        type="text",
+        text=f"Tool {name} not found in flow geometry tools"
+    )]
@@ -0,0 +1,675 @@
+"""
+Flow Graph Tools - structural analysis of real React Flow documents.
+Unlike the guidance tools, these load an actual flow (inline or streamed from
+disk via flow_loader) and compute results over its node and edge tables.
+"""
+
+import json
+import time
+from typing import Any, Dict, List
+
+from mcp import types
+
+from .flow_loader import FlowGraph, FlowLoadError, flow_input_properties, load_flow
+
+
+def get_tools() -> List[types.Tool]:
+    """Get flow graph analysis tools."""
+    return [
+        types.Tool(
+            name="react_flow_graph_validator",
+            description="Validate a React Flow document in one linear pass: duplicate ids, dangling edges and handles, cycles, orphaned children and self-loops",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **flow_input_properties(),
+                    "expect_dag": {
+                        "type": "boolean",
+                        "description": "Report cycles as errors (dagre/ELK layered layouts expect a DAG)",
+                        "default": True
+                    },
+                    "max_issues": {
+                        "type": "integer",
+                        "description": "Maximum number of examples listed per issue category",
+                        "default": 20
+                    }
+                },
+                "required": []
+            }
+        ),
+        types.Tool(
+            name="react_flow_graph_diff",
+            description="Diff two versions of a flow into a minimal patch (added/removed/moved nodes and edges, changed fields and data keys), or apply and compose patches for collaborative sync",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "enum": ["diff", "apply", "compose"],
+                        "description": "diff: base_flow -> flow as a patch; apply: patch onto base_flow; compose: fold patches into one",
+                        "default": "diff"
+                    },
+                    **flow_input_properties("base_flow", "previous React Flow document"),
+                    **flow_input_properties("flow", "new React Flow document"),
+                    "patch": {
+                        "type": ["object", "string"],
+                        "description": "Patch to apply (operation=apply)"
+                    },
+                    "patches": {
+                        "type": "array",
+                        "items": {"type": ["object", "string"]},
+                        "description": "Patches in the order they were produced (operation=compose)"
+                    }
+                },
+                "required": []
+            }
+        )
+    ]
+
+
+def react_flow_graph_validator(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Validate a flow document and report structural problems."""
+    expect_dag = arguments.get("expect_dag", True)
+
+    try:
+        max_issues = max(int(arguments.get("max_issues", 20)), 1)
+        started = time.perf_counter()
+        graph = load_flow(arguments, keep_data=False)
+        loaded = time.perf_counter()
+        report = validate_flow_graph(graph, expect_dag, max_issues)
+        finished = time.perf_counter()
+    except FlowLoadError as e:
+        return [types.TextContent(type="text", text=f"Error loading flow: {str(e)}")]
+    except (ValueError, TypeError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    report["timing_ms"] = {
+        "load": round((loaded - started) * 1000, 2),
+        "validate": round((finished - loaded) * 1000, 2)
+    }
+    return [types.TextContent(type="text", text=format_validation_report(graph, report))]
+
+
+def react_flow_graph_diff(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Compute, apply or compose flow patches."""
+    operation = arguments.get("operation", "diff")
+
+    try:
+        if operation == "apply":
+            base = load_flow_document(arguments, "base_flow")
+            patch = _parse_patch(arguments.get("patch"))
+            result = apply_flow_patch(base, patch)
+            return [types.TextContent(type="text", text=f"""# React Flow Patch Applied
+
+- **Nodes**: {len(base.get('nodes') or [])} → {len(result['nodes'])}
+- **Edges**: {len(base.get('edges') or [])} → {len(result['edges'])}
+
+## Patched Flow
+```json
+{json.dumps(result, indent=2)}
+```
+""")]
+
+        if operation == "compose":
+            patches = [_parse_patch(patch) for patch in arguments.get("patches") or []]
+            composed = empty_patch()
+            for patch in patches:
+                composed = compose_flow_patches(composed, patch)
+            composed = prune_patch(composed)
+            return [types.TextContent(type="text", text=f"""# React Flow Patches Composed
+
+- **Input patches**: {len(patches)}
+- **Composed operations**: {patch_operation_count(composed)}
+- **Composed size**: {len(json.dumps(composed, separators=(',', ':')))} bytes
+
+## Composed Patch
+```json
+{json.dumps(composed, indent=2)}
+```
+""")]
+
+        started = time.perf_counter()
+        base = load_flow_document(arguments, "base_flow")
+        new = load_flow_document(arguments, "flow")
+        patch = diff_flows(base, new)
+        elapsed = time.perf_counter() - started
+    except (FlowLoadError, ValueError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    patch_bytes = len(json.dumps(patch, separators=(",", ":")))
+    snapshot_bytes = len(json.dumps(new, separators=(",", ":")))
+    return [types.TextContent(type="text", text=f"""# React Flow Graph Diff
+
+## Versions
+- **Base**: {arguments.get("base_flow_path") or "inline"} ({len(base.get("nodes") or [])} nodes, {len(base.get("edges") or [])} edges)
+- **New**: {arguments.get("flow_path") or "inline"} ({len(new.get("nodes") or [])} nodes, {len(new.get("edges") or [])} edges)
+- **Diff time**: {elapsed * 1000:.2f} ms
+
+## Changes
+{chr(10).join(f"- **{kind} {section}**: {count}" for kind, section, count in patch_counts(patch)) or "No changes."}
+
+## Sync Cost
+- **Patch**: {patch_bytes} bytes
+- **Full snapshot**: {snapshot_bytes} bytes
+- **Saved**: {(1 - patch_bytes / snapshot_bytes) * 100 if snapshot_bytes else 0:.1f}%
+
+## Patch
+```json
+{json.dumps(patch, indent=2)}
+```
+
+Apply with `operation: "apply"` (order: removals, additions, then updates) or fold several
+patches with `operation: "compose"` before broadcasting to collaborators.
+""")]
+
+
+# Validation engine
+def validate_flow_graph(graph: FlowGraph, expect_dag: bool = True, max_issues: int = 20) -> Dict[str, Any]:
+    """
+    Run every structural check over the node/edge tables.
+
+    All checks are hash lookups or a single iterative DFS, so the cost is
+    O(nodes + edges) and deep graphs cannot hit the recursion limit.
+    """
+    nodes, edges = graph.nodes, graph.edges
+    issues: Dict[str, Dict[str, Any]] = {}
+
+    def record(category: str, example: Any) -> None:
+        entry = issues.setdefault(category, {"count": 0, "examples": []})
+        entry["count"] += 1
+        if len(entry["examples"]) < max_issues:
+            entry["examples"].append(example)
+
+    for row in nodes.duplicate_rows:
+        record("duplicate_node_ids", {"id": nodes.ids[row], "first_index": nodes.index[nodes.ids[row]], "index": row})
+
+    seen_edge_ids = set()
+    node_handles = nodes.handles
+    for row, (source, target) in enumerate(zip(edges.source, edges.target)):
+        edge_id = edges.ids[row]
+        if edge_id in seen_edge_ids:
+            record("duplicate_edge_ids", {"id": edge_id, "index": row})
+        else:
+            seen_edge_ids.add(edge_id)
+
+        if source < 0:
+            record("missing_source_nodes", {"edge": edge_id, "source": edges.source_ids[row]})
+        elif source in node_handles:
+            handle = edges.source_handles[row]
+            if handle is not None and handle not in node_handles[source][0]:
+                record("missing_source_handles", {"edge": edge_id, "node": nodes.ids[source], "sourceHandle": handle})
+        if target < 0:
+            record("missing_target_nodes", {"edge": edge_id, "target": edges.target_ids[row]})
+        elif target in node_handles:
+            handle = edges.target_handles[row]
+            if handle is not None and handle not in node_handles[target][1]:
+                record("missing_target_handles", {"edge": edge_id, "node": nodes.ids[target], "targetHandle": handle})
+        if source >= 0 and source == target:
+            record("self_loops", {"edge": edge_id, "node": nodes.ids[source]})
+
+    for row, (parent, parent_id) in enumerate(zip(nodes.parent, nodes.parent_ids)):
+        if parent_id is None:
+            continue
+        if parent < 0:
+            record("orphaned_children", {"node": nodes.ids[row], "parentId": parent_id})
+        elif parent > row:
+            # React Flow requires parents to precede their children in the nodes array
+            record("children_before_parent", {"node": nodes.ids[row], "parentId": parent_id})
+
+    for cycle in find_parent_cycles(nodes.parent, max_issues):
+        record("parent_cycles", [nodes.ids[row] for row in cycle])
+
+    cycle_summary = None
+    if expect_dag:
+        back_edges, cycles = find_cycles(len(nodes), edges.source, edges.target, max_issues)
+        cycle_summary = {"back_edges": back_edges}
+        if back_edges:
+            issues["cycles"] = {
+                "count": back_edges,
+                "examples": [[nodes.ids[row] for row in cycle] for cycle in cycles]
+            }
+
+    return {
+        "summary": graph.summary(),
+        "valid": not issues,
+        "issues": issues,
+        "cycle_check": cycle_summary,
+    }
+
+
+def build_adjacency(node_count: int, sources, targets):
+    """Compressed sparse row adjacency (offsets, neighbours), skipping dangling edges and self-loops."""
+    offsets = [0] * (node_count + 1)
+    for source, target in zip(sources, targets):
+        if source >= 0 and target >= 0 and source != target:
+            offsets[source + 1] += 1
+    total = 0
+    for row in range(node_count + 1):
+        total += offsets[row]
+        offsets[row] = total
+    cursor = offsets[:-1]
+    neighbours = [0] * total
+    for source, target in zip(sources, targets):
+        if source >= 0 and target >= 0 and source != target:
+            neighbours[cursor[source]] = target
+            cursor[source] += 1
+    return offsets, neighbours
+
+
+def find_cycles(node_count: int, sources, targets, limit: int = 20):
+    """
+    Iterative three-colour DFS.
+
+    Returns the number of back edges (0 means the graph is a DAG) and up to
+    `limit` cycles, each as the list of node rows along the cycle.
+    """
+    offsets, neighbours = build_adjacency(node_count, sources, targets)
+    state = bytearray(node_count)  # 0 = unvisited, 1 = on the DFS stack, 2 = finished
+    stack_position = [0] * node_count
+    back_edges = 0
+    cycles: List[List[int]] = []
+
+    for root in range(node_count):
+        if state[root]:
+            continue
+        path = [root]
+        cursors = [offsets[root]]
+        state[root] = 1
+        while path:
+            node = path[-1]
+            cursor = cursors[-1]
+            if cursor < offsets[node + 1]:
+                cursors[-1] = cursor + 1
+                child = neighbours[cursor]
+                child_state = state[child]
+                if child_state == 0:
+                    state[child] = 1
+                    stack_position[child] = len(path)
+                    path.append(child)
+                    cursors.append(offsets[child])
+                elif child_state == 1:
+                    back_edges += 1
+                    if len(cycles) < limit:
+                        cycles.append(path[stack_position[child]:])
+            else:
+                state[node] = 2
+                path.pop()
+                cursors.pop()
+    return back_edges, cycles
+
+
+def find_parent_cycles(parents, limit: int = 20) -> List[List[int]]:
+    """Detect cycles in the parentId chains (each node has at most one parent)."""
+    state = bytearray(len(parents))
+    cycles: List[List[int]] = []
+    for start in range(len(parents)):
+        if state[start] or parents[start] < 0:
+            continue
+        chain = []
+        node = start
+        while node >= 0 and state[node] == 0:
+            state[node] = 1
+            chain.append(node)
+            node = parents[node]
+        if node >= 0 and state[node] == 1 and len(cycles) < limit:
+            cycles.append(chain[chain.index(node):])
+        for visited in chain:
+            state[visited] = 2
+    return cycles
+
+
+ISSUE_DESCRIPTIONS = {
+    "duplicate_node_ids": "Duplicate node ids (React Flow keeps only one, edges attach unpredictably)",
+    "duplicate_edge_ids": "Duplicate edge ids (edges disappear or flicker on update)",
+    "missing_source_nodes": "Edges whose source node does not exist",
+    "missing_target_nodes": "Edges whose target node does not exist",
+    "missing_source_handles": "Edges referencing a sourceHandle the node does not declare",
+    "missing_target_handles": "Edges referencing a targetHandle the node does not declare",
+    "self_loops": "Self-loops (edge source equals target)",
+    "orphaned_children": "Child nodes whose parentId does not exist",
+    "children_before_parent": "Child nodes listed before their parent in the nodes array",
+    "parent_cycles": "Cycles in parentId chains",
+    "cycles": "Cycles in a flow expected to be a DAG (count = back edges)",
+}
+
+
+def format_validation_report(graph: FlowGraph, report: Dict[str, Any]) -> str:
+    """Render the validation result as the markdown report returned to the client."""
+    summary = report["summary"]
+    sections = []
+    for category, entry in report["issues"].items():
+        examples = "\n".join(f"- `{json.dumps(example)}`" for example in entry["examples"])
+        more = entry["count"] - len(entry["examples"])
+        sections.append(f"""### {ISSUE_DESCRIPTIONS.get(category, category)}
+**Count**: {entry['count']}
+
+{examples}{f"{chr(10)}- ... and {more} more" if more > 0 else ""}
+""")
+
+    cycle_check = report["cycle_check"]
+    return f"""# React Flow Graph Validation
+
+## Flow: {summary['source']}
+- **Nodes**: {summary['nodes']}
+- **Edges**: {summary['edges']}
+- **Status**: {'✅ Valid' if report['valid'] else f"❌ {len(report['issues'])} issue categories found"}
+- **DAG check**: {'skipped' if cycle_check is None else ('acyclic' if not cycle_check['back_edges'] else f"{cycle_check['back_edges']} back edges")}
+- **Timing**: load {report['timing_ms']['load']} ms, validate {report['timing_ms']['validate']} ms
+
+## Issues
+{chr(10).join(sections) if sections else "No structural problems found."}
+
+## Machine-Readable Result
+```json
+{json.dumps({"valid": report["valid"], "issues": {k: v["count"] for k, v in report["issues"].items()}}, indent=2)}
+```
+"""
+
+
+# Diff / patch engine
+#
+# Patch layout (empty sections are omitted):
+#   {"nodes": {"added": [node], "removed": [id], "moved": {id: position},
+#              "changed": {id: {"set": {field: value}, "unset": [field]}},
+#              "data": {id: {"set": {key: value}, "unset": [key]}}},
+#    "edges": {"added": [edge], "removed": [id], "changed": {...}, "data": {...}}}
+# Added elements are carried verbatim. "changed" covers every other top-level
+# field (type, parentId, style, className, measured, label, animated, source,
+# sourceHandle...), and "data" holds key-level deltas when `data` is an object
+# on both sides. Updates are applied after removals and additions, in the
+# order moved, changed, data.
+
+NODE_UPDATE_SECTIONS = ("moved", "changed", "data")
+EDGE_UPDATE_SECTIONS = ("changed", "data")
+
+
+def empty_patch() -> Dict[str, Any]:
+    """A patch with every section present and empty."""
+    return {
+        "nodes": {"added": [], "removed": [], **{key: {} for key in NODE_UPDATE_SECTIONS}},
+        "edges": {"added": [], "removed": [], **{key: {} for key in EDGE_UPDATE_SECTIONS}},
+    }
+
+
+def prune_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop empty sections so the wire format stays minimal."""
+    pruned = {}
+    for group, sections in patch.items():
+        kept = {key: value for key, value in sections.items() if value}
+        if kept:
+            pruned[group] = kept
+    return pruned
+
+
+def _data_delta(old: Any, new: Any) -> Dict[str, Any]:
+    old = old if isinstance(old, dict) else {}
+    new = new if isinstance(new, dict) else {}
+    delta: Dict[str, Any] = {}
+    changed = {key: value for key, value in new.items() if key not in old or old[key] != value}
+    removed = [key for key in old if key not in new]
+    if changed:
+        delta["set"] = changed
+    if removed:
+        delta["unset"] = removed
+    return delta
+
+
+def node_document(graph: FlowGraph, row: int) -> Dict[str, Any]:
+    """Rebuild a node document from its table row."""
+    nodes = graph.nodes
+    node: Dict[str, Any] = {"id": nodes.ids[row]}
+    if nodes.types[row] is not None:
+        node["type"] = nodes.types[row]
+    node["position"] = {"x": nodes.x[row], "y": nodes.y[row]}
+    node["width"] = nodes.width[row]
+    node["height"] = nodes.height[row]
+    if nodes.parent_ids[row] is not None:
+        node["parentId"] = nodes.parent_ids[row]
+    if nodes.data[row] is not None:
+        node["data"] = nodes.data[row]
+    return node
+
+
+def edge_document(graph: FlowGraph, row: int) -> Dict[str, Any]:
+    """Rebuild an edge document from its table row."""
+    edges = graph.edges
+    edge: Dict[str, Any] = {"id": edges.ids[row], "source": edges.source_ids[row], "target": edges.target_ids[row]}
+    if edges.source_handles[row] is not None:
+        edge["sourceHandle"] = edges.source_handles[row]
+    if edges.target_handles[row] is not None:
+        edge["targetHandle"] = edges.target_handles[row]
+    if edges.types[row] is not None:
+        edge["type"] = edges.types[row]
+    if edges.data[row] is not None:
+        edge["data"] = edges.data[row]
+    return edge
+
+
+def _copy(value: Any) -> Any:
+    return json.loads(json.dumps(value))
+
+
+def _element_index(elements: Any, kind: str) -> Dict[Any, Dict[str, Any]]:
+    """id -> element, in document order; only the first of a duplicated id is addressable."""
+    index: Dict[Any, Dict[str, Any]] = {}
+    for element in elements or []:
+        if not isinstance(element, dict):
+            raise FlowLoadError(f"Every entry in `{kind}` must be an object")
+        index.setdefault(element.get("id"), element)
+    return index
+
+
+def _diff_elements(old_elements: Any, new_elements: Any, kind: str) -> Dict[str, Any]:
+    old_index = _element_index(old_elements, kind)
+    new_index = _element_index(new_elements, kind)
+    patch = empty_patch()[kind]
+    for element_id, element in new_index.items():
+        old = old_index.get(element_id)
+        if old is None:
+            patch["added"].append(_copy(element))
+            continue
+        skipped = {"id"}
+        if "moved" in patch and "position" in old and "position" in element:
+            skipped.add("position")
+            if old["position"] != element["position"]:
+                patch["moved"][element_id] = element["position"]
+        if isinstance(old.get("data"), dict) and isinstance(element.get("data"), dict):
+            skipped.add("data")
+            if old["data"] != element["data"]:
+                patch["data"][element_id] = _data_delta(old["data"], element["data"])
+        changed = _data_delta({key: value for key, value in old.items() if key not in skipped},
+                              {key: value for key, value in element.items() if key not in skipped})
+        if changed:
+            patch["changed"][element_id] = changed
+    patch["removed"] = [element_id for element_id in old_index if element_id not in new_index]
+    return patch
+
+
+def diff_flows(base: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Minimal patch turning the `base` flow document into `new`.
+
+    Elements are matched through id hash indexes, so the diff is O(n) in
+    the total number of nodes and edges. Every top-level field of every
+    element is tracked, so applying the patch to `base` gives back `new`.
+    """
+    return prune_patch({
+        "nodes": _diff_elements(base.get("nodes"), new.get("nodes"), "nodes"),
+        "edges": _diff_elements(base.get("edges"), new.get("edges"), "edges"),
+    })
+
+
+def _apply_data(element: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    data = dict(element.get("data") or {})
+    data.update(_copy(delta.get("set") or {}))
+    for key in delta.get("unset") or []:
+        data.pop(key, None)
+    element["data"] = data
+
+
+def _apply_fields(element: Dict[str, Any], delta: Dict[str, Any]) -> None:
+    element.update(_copy(delta.get("set") or {}))
+    for key in delta.get("unset") or []:
+        element.pop(key, None)
+
+
+def _apply_group(elements: Any, group: Dict[str, Any], kind: str) -> List[Dict[str, Any]]:
+    removed = set(group.get("removed") or [])
+    result = [dict(element) for element in elements or [] if element.get("id") not in removed]
+    result.extend(_copy(element) for element in group.get("added") or [])
+    index: Dict[Any, int] = {}
+    for position, element in enumerate(result):
+        index.setdefault(element.get("id"), position)
+
+    def element_for(element_id: str) -> Dict[str, Any]:
+        if element_id not in index:
+            raise ValueError(f"Patch references unknown {kind[:-1]} '{element_id}'")
+        return result[index[element_id]]
+
+    for element_id, position in (group.get("moved") or {}).items():
+        element_for(element_id)["position"] = _copy(position)
+    for element_id, delta in (group.get("changed") or {}).items():
+        _apply_fields(element_for(element_id), delta)
+    for element_id, delta in (group.get("data") or {}).items():
+        _apply_data(element_for(element_id), delta)
+    return result
+
+
+def apply_flow_patch(document: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a patch to a flow document; top-level keys other than nodes and edges are kept."""
+    result = dict(document)
+    result["nodes"] = _apply_group(document.get("nodes"), patch.get("nodes") or {}, "nodes")
+    result["edges"] = _apply_group(document.get("edges"), patch.get("edges") or {}, "edges")
+    return result
+
+
+def _compose_data(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
+    values = dict(first.get("set") or {})
+    unset = [key for key in first.get("unset") or [] if key not in (second.get("set") or {})]
+    for key in second.get("unset") or []:
+        values.pop(key, None)
+        if key not in unset:
+            unset.append(key)
+    values.update(second.get("set") or {})
+    delta: Dict[str, Any] = {}
+    if values:
+        delta["set"] = values
+    if unset:
+        delta["unset"] = unset
+    return delta
+
+
+def _touches(delta: Dict[str, Any], field: str) -> bool:
+    return field in (delta.get("set") or {}) or field in (delta.get("unset") or [])
+
+
+def _compose_group(first: Dict[str, Any], second: Dict[str, Any], update_sections) -> Dict[str, Any]:
+    added = {element["id"]: _copy(element) for element in first.get("added") or []}
+    removed = list(first.get("removed") or [])
+    updates = {section: dict(first.get(section) or {}) for section in update_sections}
+
+    for element_id in second.get("removed") or []:
+        if element_id in added:
+            del added[element_id]
+        elif element_id not in removed:
+            removed.append(element_id)
+        for section in update_sections:
+            updates[section].pop(element_id, None)
+    for element in second.get("added") or []:
+        added[element["id"]] = _copy(element)
+
+    for section in update_sections:
+        for element_id, value in (second.get(section) or {}).items():
+            if element_id in added:
+                added[element_id] = _apply_group([added[element_id]], {section: {element_id: value}}, "elements")[0]
+            elif section == "moved":
+                changed = updates["changed"].get(element_id, {})
+                if _touches(changed, "position"):  # moved is applied before changed, which would undo it
+                    updates["changed"][element_id] = _compose_data(changed, {"set": {"position": value}})
+                else:
+                    updates["moved"][element_id] = value
+            else:
+                if section == "changed":
+                    if _touches(value, "data"):  # a replaced `data` makes earlier key deltas moot
+                        updates["data"].pop(element_id, None)
+                    if _touches(value, "position"):
+                        updates.get("moved", {}).pop(element_id, None)
+                merged = _compose_data(updates[section].get(element_id, {}), value)
+                if merged:
+                    updates[section][element_id] = merged
+
+    return {"added": list(added.values()), "removed": removed, **updates}
+
+
+def compose_flow_patches(first: Dict[str, Any], second: Dict[str, Any]) -> Dict[str, Any]:
+    """Single patch equivalent to applying `first` and then `second`."""
+    return {
+        "nodes": _compose_group(first.get("nodes") or {}, second.get("nodes") or {}, NODE_UPDATE_SECTIONS),
+        "edges": _compose_group(first.get("edges") or {}, second.get("edges") or {}, EDGE_UPDATE_SECTIONS),
+    }
+
+
+def patch_counts(patch: Dict[str, Any]):
+    """(kind, section, count) triples for report summaries."""
+    return [
+        (group.title(), section, len(entries))
+        for group, sections in patch.items()
+        for section, entries in sections.items()
+        if entries
+    ]
+
+
+def patch_operation_count(patch: Dict[str, Any]) -> int:
+    return sum(count for _, _, count in patch_counts(patch))
+
+
+def _parse_patch(patch: Any) -> Dict[str, Any]:
+    if isinstance(patch, str):
+        try:
+            patch = json.loads(patch)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid patch JSON: {exc.msg}") from exc
+    if not isinstance(patch, dict):
+        raise ValueError("A patch must be an object with `nodes` and/or `edges` sections")
+    return patch
+
+
+def load_flow_document(arguments: Dict[str, Any], key: str = "flow") -> Dict[str, Any]:
+    """Load a flow as a plain document (apply needs every field, so it is not streamed into tables)."""
+    path = arguments.get(f"{key}_path")
+    if path:
+        try:
+            with open(str(path), "r", encoding="utf-8") as handle:
+                document = json.load(handle)
+        except OSError as exc:
+            raise FlowLoadError(f"Cannot read flow file {path}: {exc}") from exc
+        except json.JSONDecodeError as exc:
+            raise FlowLoadError(f"Invalid JSON in {path}: {exc.msg}") from exc
+    else:
+        document = arguments.get(key)
+        if isinstance(document, str):
+            try:
+                document = json.loads(document)
+            except json.JSONDecodeError as exc:
+                raise FlowLoadError(f"Invalid JSON in `{key}`: {exc.msg}") from exc
+    if not isinstance(document, dict):
+        raise FlowLoadError(f"Provide either `{key}` or `{key}_path`")
+    return document
+
+
+# Tool execution handlers
+FLOW_GRAPH_HANDLERS = {
+    "react_flow_graph_validator": react_flow_graph_validator,
+    "react_flow_graph_diff": react_flow_graph_diff
+}
+
+
+async def handle_call(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle flow graph tool calls."""
+    if name in FLOW_GRAPH_HANDLERS:
+        return FLOW_GRAPH_HANDLERS[name](arguments)
+
+    return [types.TextContent(
+        type="text",
+        text=f"Tool {name} not found in flow graph tools"
+    )]
@@ -0,0 +1,595 @@
+"""
+Layered (Sugiyama-style) layout engine for flows loaded with flow_loader.
+
+The layout runs as a sequence of steps - a coarse layering first, then
+crossing-minimization sweeps and coordinate refinement passes - exposed
+through a generator so callers can stream intermediate layouts, stop early
+or abandon the run between steps.
+
+Layouts are deterministic: vertices are interned in node-id order, every
+adjacency list is sorted, ties break on that order, and the only source of
+randomness (restart shuffles) comes from an explicit seed. Identical input
+therefore gives bit-identical positions regardless of document order, run
+or process.
+"""
+
+import hashlib
+import json
+import random
+import time
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .flow_loader import FlowGraph
+
+LAYOUT_DEFAULTS = {
+    "direction": "TB",
+    "node_spacing": 50.0,  # between neighbours within a layer
+    "layer_spacing": 80.0,  # between consecutive layers
+    "sweeps": 8,  # crossing-minimization sweeps (one down and one up pass each)
+    "refinements": 8,  # coordinate refinement passes
+    "seed": 0,  # seeds the restart shuffles
+    "restarts": 0,  # extra crossing-minimization runs from shuffled layer orders
+}
+DIRECTIONS = ("TB", "BT", "LR", "RL")
+
+# ELK layered defaults, used for anything an ELK option object leaves out
+ELK_DEFAULTS = {
+    "direction": "LR",  # elk.direction UNDEFINED lays out to the right
+    "node_spacing": 20.0,
+    "layer_spacing": 20.0,
+    "sweeps": 7,  # elk.layered.thoroughness
+    "seed": 1,  # elk.randomSeed
+}
+ELK_DIRECTIONS = {"DOWN": "TB", "UP": "BT", "RIGHT": "LR", "LEFT": "RL", "UNDEFINED": "LR"}
+ELK_OPTION_KEYS = {
+    "elk.direction": "direction",
+    "elk.spacing.nodeNode": "node_spacing",
+    "elk.layered.spacing.nodeNodeBetweenLayers": "layer_spacing",
+    "elk.layered.thoroughness": "sweeps",
+    "elk.randomSeed": "seed",
+}
+
+
+def _elk_key(key: str) -> str:
+    """Normalise an ELK option id to its `elk.` form (elkjs also accepts bare suffixes)."""
+    if key.startswith("org.eclipse.elk."):
+        return "elk." + key[len("org.eclipse.elk."):]
+    return key if key.startswith("elk.") else "elk." + key
+
+
+def translate_elk_options(elk_options: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Layout options equivalent to an elkjs `layoutOptions` object.
+
+    Returns the options (ELK defaults filled in) and the keys the layered
+    engine has no counterpart for, such as edge routing or port constraints.
+    """
+    if not isinstance(elk_options, dict):
+        raise ValueError("ELK layoutOptions must be an object")
+    options = {**LAYOUT_DEFAULTS, **ELK_DEFAULTS}
+    ignored = []
+    sweeps = True
+    for raw_key, value in elk_options.items():
+        key = _elk_key(str(raw_key))
+        text = str(value).strip()
+        if key == "elk.algorithm":
+            if _elk_key(text) != "elk.layered":
+                raise ValueError(f"Only the ELK layered algorithm is supported, got '{value}'")
+        elif key == "elk.direction":
+            if text.upper() not in ELK_DIRECTIONS:
+                raise ValueError(f"Unknown elk.direction '{value}'")
+            options["direction"] = ELK_DIRECTIONS[text.upper()]
+        elif key in ELK_OPTION_KEYS:
+            options[ELK_OPTION_KEYS[key]] = float(text)
+        elif key == "elk.layered.crossingMinimization.strategy":
+            sweeps = text.upper() not in ("NONE", "INTERACTIVE")
+        elif key == "elk.layered.nodePlacement.strategy":
+            if text.upper() == "SIMPLE":
+                options["refinements"] = 0
+        else:
+            ignored.append(str(raw_key))
+    if not sweeps:
+        options["sweeps"] = 0
+    return options, ignored
+
+
+def layout_options(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Layout options from tool arguments, with defaults filled in.
+
+    An elkjs `layoutOptions` object is translated first; explicit engine
+    arguments override it.
+    """
+    values: Dict[str, Any] = {}
+    if arguments.get("layoutOptions") is not None:
+        values = translate_elk_options(arguments["layoutOptions"])[0]
+    values.update({key: arguments[key] for key in LAYOUT_DEFAULTS if key in arguments})
+    options = {key: values.get(key, default) for key, default in LAYOUT_DEFAULTS.items()}
+    if options["direction"] not in DIRECTIONS:
+        raise ValueError(f"Unknown direction '{options['direction']}'")
+    for key in ("node_spacing", "layer_spacing"):
+        options[key] = float(options[key])
+    for key in ("sweeps", "refinements", "seed", "restarts"):
+        options[key] = max(int(float(options[key])), 0)
+    return options
+
+
+def count_crossings(upper_positions: List[int], lower_positions: List[int]) -> int:
+    """
+    Crossings between two layers given each edge's (upper, lower) positions.
+
+    Edges are sorted by upper then lower position; every inversion left in
+    the lower positions is one crossing, counted with a Fenwick tree.
+    """
+    pairs = sorted(zip(upper_positions, lower_positions))
+    size = max(lower_positions, default=-1) + 2
+    tree = [0] * size
+    crossings = 0
+    seen = 0
+    for _, lower in pairs:
+        # Count already inserted edges ending strictly right of this one
+        index = lower + 1
+        not_greater = 0
+        while index > 0:
+            not_greater += tree[index]
+            index -= index & -index
+        crossings += seen - not_greater
+        index = lower + 1
+        while index < size:
+            tree[index] += 1
+            index += index & -index
+        seen += 1
+    return crossings
+
+
+def _pool_adjacent_violators(targets: List[float], gaps: List[float]) -> List[float]:
+    """
+    Closest coordinates to targets (least squares) that keep each item at
+    least gaps[k] after the previous one, via pool-adjacent-violators on
+    the gap-shifted targets.
+    """
+    offsets = []
+    total = 0.0
+    for gap in gaps:
+        total += gap
+        offsets.append(total)
+    blocks: List[List[float]] = []  # [sum, count]
+    for target, offset in zip(targets, offsets):
+        blocks.append([target - offset, 1])
+        while len(blocks) > 1 and blocks[-2][0] / blocks[-2][1] > blocks[-1][0] / blocks[-1][1]:
+            value, count = blocks.pop()
+            blocks[-1][0] += value
+            blocks[-1][1] += count
+    result = []
+    index = 0
+    for value, count in blocks:
+        mean = value / count
+        for _ in range(count):
+            result.append(mean + offsets[index])
+            index += 1
+    return result
+
+
+class LayeredLayout:
+    """
+    Layered layout of a flow's top-level nodes.
+
+    Child nodes keep their parent-relative positions, and edges touching
+    them are attributed to their top-level ancestor. Cycles are broken by
+    reversing DFS back edges, layers come from longest paths, and edges
+    spanning several layers are routed through dummy vertices.
+    """
+
+    __slots__ = (
+        "graph", "options", "node_rows", "vertex_count", "sizes", "layer_of", "layers",
+        "up", "down", "position", "coordinate", "crossings", "best_crossings", "reversed_edges",
+        "deadline", "clock", "completed", "cut_short",
+    )
+
+    def __init__(self, graph: FlowGraph, options: Dict[str, Any]):
+        self.graph = graph
+        self.options = options
+        roots = graph.top_level_rows()
+        ids = graph.nodes.ids
+        self.node_rows = sorted((row for row, root in enumerate(roots) if root == row), key=lambda row: (ids[row], row))
+        vertex_of = {row: vertex for vertex, row in enumerate(self.node_rows)}
+        self.vertex_count = len(self.node_rows)
+
+        horizontal = options["direction"] in ("LR", "RL")
+        nodes = graph.nodes
+        # (size along the layer, size across layers) per vertex
+        self.sizes = [
+            (nodes.height[row], nodes.width[row]) if horizontal else (nodes.width[row], nodes.height[row])
+            for row in self.node_rows
+        ]
+
+        successors: List[List[int]] = [[] for _ in range(self.vertex_count)]
+        seen = set()
+        for source, target in zip(graph.edges.source, graph.edges.target):
+            if source < 0 or target < 0:
+                continue
+            a, b = vertex_of[roots[source]], vertex_of[roots[target]]
+            if a != b and (a, b) not in seen:
+                seen.add((a, b))
+                successors[a].append(b)
+
+        dag = self._break_cycles([sorted(targets) for targets in successors])
+        self.layer_of = self._assign_layers(dag)
+        self._insert_dummies(dag)
+        self.crossings = -1
+        self.best_crossings = -1
+        self.deadline: Optional[float] = None  # clock() value after which phases stop early
+        self.clock = time.perf_counter
+        self.completed = {"ordering": 0, "coordinates": 0}
+        self.cut_short: List[str] = []
+
+    # Phase 1: cycle removal and layering
+    def _break_cycles(self, successors: List[List[int]]) -> List[List[int]]:
+        """Reverse DFS back edges so the graph becomes acyclic."""
+        state = bytearray(self.vertex_count)  # 0 new, 1 on stack, 2 done
+        dag: List[List[int]] = [[] for _ in range(self.vertex_count)]
+        reversed_edges = 0
+        for start in range(self.vertex_count):
+            if state[start]:
+                continue
+            state[start] = 1
+            stack = [(start, 0)]
+            while stack:
+                vertex, index = stack[-1]
+                if index < len(successors[vertex]):
+                    stack[-1] = (vertex, index + 1)
+                    target = successors[vertex][index]
+                    if state[target] == 1:
+                        dag[target].append(vertex)
+                        reversed_edges += 1
+                        continue
+                    dag[vertex].append(target)
+                    if not state[target]:
+                        state[target] = 1
+                        stack.append((target, 0))
+                else:
+                    state[vertex] = 2
+                    stack.pop()
+        self.reversed_edges = reversed_edges
+        return [sorted(set(targets)) for targets in dag]
+
+    def _assign_layers(self, dag: List[List[int]]) -> List[int]:
+        """Longest-path layering, then sources pulled down next to their first successor."""
+        indegree = [0] * self.vertex_count
+        for targets in dag:
+            for target in targets:
+                indegree[target] += 1
+        queue = deque(vertex for vertex in range(self.vertex_count) if not indegree[vertex])
+        layer = [0] * self.vertex_count
+        order = []
+        while queue:
+            vertex = queue.popleft()
+            order.append(vertex)
+            for target in dag[vertex]:
+                layer[target] = max(layer[target], layer[vertex] + 1)
+                indegree[target] -= 1
+                if not indegree[target]:
+                    queue.append(target)
+
+        has_predecessor = bytearray(self.vertex_count)
+        for targets in dag:
+            for target in targets:
+                has_predecessor[target] = 1
+        for vertex in reversed(order):
+            if not has_predecessor[vertex] and dag[vertex]:
+                layer[vertex] = min(layer[target] for target in dag[vertex]) - 1
+        return layer
+
+    def _insert_dummies(self, dag: List[List[int]]) -> None:
+        """Split long edges into unit-span chains and order each layer by DFS discovery."""
+        layer_of = self.layer_of
+        self.up: List[List[int]] = [[] for _ in range(self.vertex_count)]
+        self.down: List[List[int]] = [[] for _ in range(self.vertex_count)]
+        for source, targets in enumerate(dag):
+            for target in targets:
+                previous = source
+                for layer in range(layer_of[source] + 1, layer_of[target]):
+                    dummy = len(layer_of)
+                    layer_of.append(layer)
+                    self.sizes.append((0.0, 0.0))
+                    self.up.append([previous])
+                    self.down.append([])
+                    self.down[previous].append(dummy)
+                    previous = dummy
+                self.down[previous].append(target)
+                self.up[target].append(previous)
+
+        # Initial order: DFS discovery from sources keeps subtrees together
+        count = len(layer_of)
+        discovered = [-1] * count
+        next_index = 0
+        for start in range(count):
+            if discovered[start] >= 0 or self.up[start]:
+                continue
+            stack = [start]
+            while stack:
+                vertex = stack.pop()
+                if discovered[vertex] >= 0:
+                    continue
+                discovered[vertex] = next_index
+                next_index += 1
+                stack.extend(reversed(self.down[vertex]))
+        for vertex in range(count):
+            if discovered[vertex] < 0:  # only reachable through cycles already broken
+                discovered[vertex] = next_index
+                next_index += 1
+
+        layer_count = max(layer_of, default=-1) + 1
+        self.layers: List[List[int]] = [[] for _ in range(layer_count)]
+        for vertex in sorted(range(count), key=discovered.__getitem__):
+            self.layers[layer_of[vertex]].append(vertex)
+        self.position = [0] * count
+        self._reindex()
+        self.coordinate = [0.0] * count
+
+    # Phase 2: crossing minimization
+    def count_all_crossings(self) -> int:
+        """Total edge crossings between consecutive layers."""
+        total = 0
+        position = self.position
+        for members in self.layers[:-1]:
+            upper, lower = [], []
+            for vertex in members:
+                for target in self.down[vertex]:
+                    upper.append(position[vertex])
+                    lower.append(position[target])
+            total += count_crossings(upper, lower)
+        return total
+
+    def _sweep(self, downward: bool) -> bool:
+        """
+        Reorder every layer by the barycenter of its neighbours in the previous one.
+
+        Returns False if the deadline stopped the sweep part way; the layers
+        reordered so far keep their new order.
+        """
+        indices = range(1, len(self.layers)) if downward else range(len(self.layers) - 2, -1, -1)
+        neighbours = self.up if downward else self.down
+        position = self.position
+        for index in indices:
+            if self.expired():
+                return False
+            members = self.layers[index]
+            keys = []
+            for vertex in members:
+                adjacent = neighbours[vertex]
+                if adjacent:
+                    barycenter = sum(position[other] for other in adjacent) / len(adjacent)
+                else:
+                    barycenter = position[vertex]
+                keys.append((barycenter, position[vertex], vertex))
+            keys.sort()
+            members[:] = [vertex for _, _, vertex in keys]
+            for order, vertex in enumerate(members):
+                position[vertex] = order
+        return True
+
+    # Phase 3: coordinate assignment
+    def _pack_coordinates(self) -> None:
+        """Place each layer's vertices side by side, centred on zero."""
+        spacing = self.options["node_spacing"]
+        for members in self.layers:
+            cursor = 0.0
+            for vertex in members:
+                width = self.sizes[vertex][0]
+                self.coordinate[vertex] = cursor + width / 2
+                cursor += width + spacing
+            shift = (cursor - spacing) / 2
+            for vertex in members:
+                self.coordinate[vertex] -= shift
+
+    def _refine_coordinates(self, downward: bool) -> bool:
+        """
+        Move vertices toward the mean of their neighbours without overlapping.
+
+        Returns False if the deadline stopped the pass part way.
+        """
+        spacing = self.options["node_spacing"]
+        indices = range(1, len(self.layers)) if downward else range(len(self.layers) - 2, -1, -1)
+        neighbours = self.up if downward else self.down
+        coordinate = self.coordinate
+        for index in indices:
+            if self.expired():
+                return False
+            members = self.layers[index]
+            targets = []
+            for vertex in members:
+                adjacent = neighbours[vertex]
+                targets.append(sum(coordinate[other] for other in adjacent) / len(adjacent)
+                               if adjacent else coordinate[vertex])
+            gaps = [0.0] + [
+                (self.sizes[previous][0] + self.sizes[vertex][0]) / 2 + spacing
+                for previous, vertex in zip(members, members[1:])
+            ]
+            for vertex, value in zip(members, _pool_adjacent_violators(targets, gaps)):
+                coordinate[vertex] = value
+        return True
+
+    # Driver
+    def expired(self) -> bool:
+        """Whether the deadline, if any, has passed."""
+        return self.deadline is not None and self.clock() >= self.deadline
+
+    def steps(self) -> Iterator[Tuple[str, int]]:
+        """
+        Run the layout, yielding (phase, step) after every unit of work.
+
+        The current positions are valid at each yield, so the caller can
+        render them, stop, or simply keep iterating to the final layout.
+
+        With a deadline set, ordering and coordinate refinement are anytime:
+        once it passes they stop (mid-sweep if need be), the best ordering
+        found so far is kept and the phases that stopped early are listed
+        in cut_short. Layering always completes.
+        """
+        options = self.options
+        ordering_steps = options["sweeps"] * (options["restarts"] + 1)
+        self._pack_coordinates()
+        yield "layering", 0  # crossings are counted after the coarse layout is out
+
+        if self.expired():
+            self.cut_short = [phase for phase, planned in (("ordering", ordering_steps),
+                                                           ("coordinates", options["refinements"])) if planned]
+            return
+
+        self.crossings = self.best_crossings = self.count_all_crossings()
+        best_layers = [list(members) for members in self.layers]
+        shuffler = random.Random(options["seed"])
+        step = 0
+        for attempt in range(options["restarts"] + 1):
+            if not self.best_crossings or self.cut_short:
+                break
+            if attempt:
+                for members in self.layers:
+                    shuffler.shuffle(members)
+                self._reindex()
+            for _ in range(options["sweeps"]):
+                swept = self._sweep(downward=True) and self._sweep(downward=False)
+                self.crossings = self.count_all_crossings()
+                if self.crossings < self.best_crossings:
+                    self.best_crossings = self.crossings
+                    best_layers = [list(members) for members in self.layers]
+                self._pack_coordinates()
+                step += 1
+                self.completed["ordering"] = step
+                yield "ordering", step
+                if not self.crossings:
+                    break
+                if not swept or (step < ordering_steps and self.expired()):
+                    self.cut_short.append("ordering")
+                    break
+
+        if self.crossings != self.best_crossings:
+            self.layers = best_layers
+            self._reindex()
+            self.crossings = self.best_crossings
+            self._pack_coordinates()
+
+        for refinement in range(options["refinements"]):
+            if self.expired() or not self._refine_coordinates(downward=refinement % 2 == 0):
+                self.cut_short.append("coordinates")
+                break
+            self.completed["coordinates"] = refinement + 1
+            yield "coordinates", refinement + 1
+
+    def _reindex(self) -> None:
+        """Refresh per-vertex positions after the layer orders changed."""
+        for members in self.layers:
+            for index, vertex in enumerate(members):
+                self.position[vertex] = index
+
+    def run(self) -> "LayeredLayout":
+        """Run every step to completion."""
+        for _ in self.steps():
+            pass
+        return self
+
+    def total_steps(self) -> int:
+        """Upper bound on the number of steps yielded."""
+        options = self.options
+        return 1 + options["sweeps"] * (options["restarts"] + 1) + options["refinements"]
+
+    def positions(self) -> Dict[str, Dict[str, float]]:
+        """Top-left positions of the top-level nodes for the current state."""
+        direction = self.options["direction"]
+        spacing = self.options["layer_spacing"]
+        depths = [0.0] * len(self.layers)
+        for vertex in range(self.vertex_count):
+            layer = self.layer_of[vertex]
+            depths[layer] = max(depths[layer], self.sizes[vertex][1])
+        offsets = []
+        cursor = 0.0
+        for depth in depths:
+            offsets.append(cursor)
+            cursor += depth + spacing
+        extent = cursor - spacing
+
+        ids = self.graph.nodes.ids
+        result = {}
+        for vertex, row in enumerate(self.node_rows):
+            along, across = self.sizes[vertex]
+            layer = self.layer_of[vertex]
+            start = self.coordinate[vertex] - along / 2
+            depth = offsets[layer] + (depths[layer] - across) / 2
+            if direction in ("BT", "RL"):
+                depth = extent - depth - across
+            x, y = (depth, start) if direction in ("LR", "RL") else (start, depth)
+            result[ids[row]] = {"x": round(x, 2), "y": round(y, 2)}
+        return result
+
+    def summary(self) -> Dict[str, int]:
+        """Structural statistics of the layered graph."""
+        return {
+            "nodes": self.vertex_count,
+            "layers": len(self.layers),
+            "dummy_vertices": len(self.layer_of) - self.vertex_count,
+            "reversed_edges": self.reversed_edges,
+            "crossings": self.crossings,
+        }
+
+
+def layout_fingerprint(graph: FlowGraph, options: Dict[str, Any]) -> str:
+    """
+    Cache key for a layout: a hash of everything the layout depends on,
+    independent of node and edge order in the document.
+    """
+    nodes, edges = graph.nodes, graph.edges
+    ids = nodes.ids
+    node_entries = sorted(
+        (ids[row], nodes.width[row], nodes.height[row], ids[nodes.parent[row]] if nodes.parent[row] >= 0 else "")
+        for row in range(len(nodes))
+    )
+    edge_entries = sorted(
+        (ids[source], ids[target])
+        for source, target in zip(edges.source, edges.target) if source >= 0 and target >= 0
+    )
+    canonical = json.dumps([node_entries, edge_entries, sorted(options.items())], separators=(',', ':'))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def layered_layout(graph: FlowGraph, arguments: Dict[str, Any]) -> LayeredLayout:
+    """
+    Run a layered layout with options taken from tool arguments.
+
+    A `deadline_ms` argument bounds the run (see LayeredLayout.steps).
+    """
+    layout = LayeredLayout(graph, layout_options(arguments))
+    if arguments.get("deadline_ms") is not None:
+        layout.deadline = layout.clock() + float(arguments["deadline_ms"]) / 1000
+    return layout.run()
+
+
+def elk_graph_flow(elk_graph: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, float]]]:
+    """
+    Flow document and top-left positions from an elkjs graph (input or layout result).
+
+    Only the top level is read: `children` become nodes with their ELK
+    width/height and `edges` use either `sources`/`targets` or the older
+    `source`/`target` form.
+    """
+    if not isinstance(elk_graph, dict):
+        raise ValueError("ELK graph must be an object with `children` and `edges`")
+    nodes = []
+    positions = {}
+    for child in elk_graph.get("children") or []:
+        node_id = str(child["id"])
+        nodes.append({"id": node_id, "position": {"x": 0, "y": 0},
+                      "width": child.get("width"), "height": child.get("height")})
+        if "x" in child and "y" in child:
+            positions[node_id] = {"x": float(child["x"]), "y": float(child["y"])}
+    edges = []
+    for index, edge in enumerate(elk_graph.get("edges") or []):
+        sources = edge.get("sources") or [edge.get("source")]
+        targets = edge.get("targets") or [edge.get("target")]
+        for source in sources:
+            for target in targets:
+                if source is not None and target is not None:
+                    edges.append({"id": f"{edge.get('id', index)}:{source}:{target}",
+                                  "source": str(source), "target": str(target)})
+    return {"nodes": nodes, "edges": edges}, positions
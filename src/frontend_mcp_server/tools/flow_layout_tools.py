@@ -0,0 +1,432 @@
+"""
+Flow Layout Tools - server-side layered layout for flows too large to lay
+out comfortably in the browser. Intermediate layouts are streamed as MCP
+progress notifications so the client can render a coarse diagram while the
+layout is still being refined.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from mcp import types
+
+from .flow_layout import (
+    DIRECTIONS, LAYOUT_DEFAULTS, LayeredLayout, count_crossings, elk_graph_flow, layout_fingerprint,
+    layout_options, translate_elk_options,
+)
+from .flow_loader import FlowGraph, FlowLoadError, build_flow, flow_input_properties, load_flow
+
+# Called with (progress, total, message) for every streamed snapshot
+ProgressCallback = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
+DEFAULT_PROGRESS_INTERVAL_MS = 100
+LAYOUT_CACHE_SIZE = 16
+PARITY_RUNS = 3
+PARITY_TOLERANCE = 1.0
+
+
+def get_tools() -> List[types.Tool]:
+    """Get flow layout tools."""
+    return [
+        types.Tool(
+            name="react_flow_server_layout",
+            description="Layered server-side layout that streams a coarse layout and refinements as MCP progress notifications (send a progressToken), stops on cancellation and can be bounded by a deadline",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **flow_input_properties(),
+                    "direction": {
+                        "type": "string",
+                        "enum": list(DIRECTIONS),
+                        "default": LAYOUT_DEFAULTS["direction"]
+                    },
+                    "node_spacing": {
+                        "type": "number",
+                        "description": "Gap between nodes in the same layer",
+                        "default": LAYOUT_DEFAULTS["node_spacing"]
+                    },
+                    "layer_spacing": {
+                        "type": "number",
+                        "description": "Gap between consecutive layers",
+                        "default": LAYOUT_DEFAULTS["layer_spacing"]
+                    },
+                    "sweeps": {
+                        "type": "integer",
+                        "description": "Crossing-minimization sweeps",
+                        "default": LAYOUT_DEFAULTS["sweeps"]
+                    },
+                    "refinements": {
+                        "type": "integer",
+                        "description": "Coordinate refinement passes",
+                        "default": LAYOUT_DEFAULTS["refinements"]
+                    },
+                    "seed": {
+                        "type": "integer",
+                        "description": "Seed for restart shuffles; identical input and seed give bit-identical output",
+                        "default": LAYOUT_DEFAULTS["seed"]
+                    },
+                    "restarts": {
+                        "type": "integer",
+                        "description": "Extra crossing-minimization runs from seeded shuffled orders",
+                        "default": LAYOUT_DEFAULTS["restarts"]
+                    },
+                    "layoutOptions": {
+                        "type": "object",
+                        "description": "elkjs layoutOptions (elk.direction, elk.spacing.nodeNode, elk.layered.spacing.nodeNodeBetweenLayers, elk.layered.thoroughness, ...) translated with ELK defaults; explicit arguments above override them",
+                        "additionalProperties": True
+                    },
+                    "deadline_ms": {
+                        "type": "number",
+                        "description": "Return within this many milliseconds: crossing minimization and coordinate refinement stop early and the best layout found so far is returned, with the phases cut short reported"
+                    },
+                    "progress_interval_ms": {
+                        "type": "number",
+                        "description": "Minimum time between streamed snapshots",
+                        "default": DEFAULT_PROGRESS_INTERVAL_MS
+                    },
+                    "stream": {
+                        "type": "string",
+                        "enum": ["patch", "summary"],
+                        "description": "patch: progress messages carry react_flow_graph_diff 'moved' patches (the first one holds every node); summary: phase text only",
+                        "default": "patch"
+                    }
+                },
+                "required": []
+            }
+        ),
+        types.Tool(
+            name="react_flow_elk_parity",
+            description="Lay out stored elkjs results with the server's layered engine using their own ELK layoutOptions and report position and runtime parity",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "elk_graph": {
+                        "type": ["object", "string"],
+                        "description": "An elkjs layout result (root with layoutOptions, positioned children and edges); an optional top-level runtimeMs records the elkjs time"
+                    },
+                    "elk_graph_path": {
+                        "type": "string",
+                        "description": "A stored elkjs result (.json) or a directory of them"
+                    },
+                    "layoutOptions": {
+                        "type": "object",
+                        "description": "ELK options to use instead of each graph's own layoutOptions",
+                        "additionalProperties": True
+                    },
+                    "runs": {
+                        "type": "integer",
+                        "description": "Timed server runs per graph (the fastest is reported)",
+                        "default": PARITY_RUNS
+                    },
+                    "tolerance": {
+                        "type": "number",
+                        "description": "Distance in px under which a node counts as matching",
+                        "default": PARITY_TOLERANCE
+                    }
+                },
+                "required": []
+            }
+        )
+    ]
+
+
+def moved_since(previous: Dict[str, Dict[str, float]], current: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Positions in current that differ from previous."""
+    return {node_id: position for node_id, position in current.items() if previous.get(node_id) != position}
+
+
+async def react_flow_server_layout(arguments: Dict[str, Any],
+                                   progress: Optional[ProgressCallback] = None) -> List[types.TextContent]:
+    """Lay out a flow, streaming snapshots through the progress callback."""
+    interval = float(arguments.get("progress_interval_ms", DEFAULT_PROGRESS_INTERVAL_MS)) / 1000
+    stream = arguments.get("stream", "patch")
+
+    try:
+        started = time.perf_counter()
+        graph = load_flow(arguments, keep_data=False)
+        options = layout_options(arguments)
+        ignored = translate_elk_options(arguments["layoutOptions"])[1] if arguments.get("layoutOptions") is not None else []
+        key = layout_fingerprint(graph, options)
+    except (FlowLoadError, ValueError, KeyError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    if key in _LAYOUT_CACHE:
+        _LAYOUT_CACHE.move_to_end(key)
+        positions, summary = _LAYOUT_CACHE[key]
+        if progress is not None:
+            message = {"phase": "cached", "step": 0, "crossings": summary["crossings"],
+                       "patch": {"nodes": {"moved": positions}}}
+            await progress(1, 1, json.dumps(message, separators=(',', ':')))
+        return format_layout(positions, summary, options, key, True, 0.0, time.perf_counter() - started, 0, ignored)
+
+    layout = LayeredLayout(graph, options)
+    if arguments.get("deadline_ms") is not None:
+        layout.deadline = started + float(arguments["deadline_ms"]) / 1000
+    total = layout.total_steps()
+    sent: Dict[str, Dict[str, float]] = {}
+    last_sent = None
+    first_snapshot_ms = None
+    snapshots = 0
+    for completed, (phase, step) in enumerate(layout.steps(), start=1):
+        if first_snapshot_ms is None:
+            first_snapshot_ms = (time.perf_counter() - started) * 1000
+        now = time.perf_counter()
+        if progress is not None and (last_sent is None or now - last_sent >= interval):
+            message = {"phase": phase, "step": step, "crossings": layout.crossings if layout.crossings >= 0 else None}
+            if stream == "patch":
+                positions = layout.positions()
+                message["patch"] = {"nodes": {"moved": moved_since(sent, positions)}}
+                sent = positions
+            await progress(completed, total, json.dumps(message, separators=(',', ':')))
+            last_sent = now
+            snapshots += 1
+        # Yield to the event loop so cancellation requests are honoured between steps
+        await asyncio.sleep(0)
+
+    positions = layout.positions()
+    summary = layout.summary()
+    if not layout.cut_short:  # a deadline-bounded layout is not the layout for this key
+        _LAYOUT_CACHE[key] = (positions, summary)
+        while len(_LAYOUT_CACHE) > LAYOUT_CACHE_SIZE:
+            _LAYOUT_CACHE.popitem(last=False)
+    return format_layout(positions, summary, options, key, False, first_snapshot_ms or 0.0,
+                         time.perf_counter() - started, snapshots, ignored, layout)
+
+
+def format_layout(positions: Dict[str, Dict[str, float]], summary: Dict[str, int], options: Dict[str, Any],
+                  key: str, cached: bool, first_snapshot_ms: float, elapsed: float,
+                  snapshots: int, ignored: Sequence[str] = (),
+                  layout: Optional[LayeredLayout] = None) -> List[types.TextContent]:
+    """Render a finished layout."""
+    ignored_line = f"\n- **ELK options without effect**: {', '.join(f'`{key}`' for key in ignored)}" if ignored else ""
+    deadline_line = ""
+    if layout is not None and layout.deadline is not None:
+        planned = {"ordering": options["sweeps"] * (options["restarts"] + 1), "coordinates": options["refinements"]}
+        units = {"ordering": "sweeps", "coordinates": "refinement passes"}
+        if layout.cut_short:
+            stopped = "; ".join(f"{phase} cut short after {layout.completed[phase]}/{planned[phase]} {units[phase]}"
+                                for phase in layout.cut_short)
+            deadline_line = f"\n- **Deadline**: reached - {stopped} (best layout so far returned, not cached)"
+        else:
+            deadline_line = "\n- **Deadline**: met, every phase completed"
+    crossings = summary["crossings"] if summary["crossings"] >= 0 else "not counted (deadline reached after layering)"
+    return [types.TextContent(type="text", text=f"""# React Flow Server Layout
+
+- **Nodes laid out**: {summary['nodes']} in {summary['layers']} layers ({options['direction']})
+- **Dummy vertices**: {summary['dummy_vertices']}, **Reversed edges**: {summary['reversed_edges']}
+- **Edge crossings**: {crossings}
+- **Layout key**: `{key}` (seed {options['seed']}, {'cached' if cached else 'computed'})
+- **First layout ready**: {first_snapshot_ms:.1f} ms
+- **Total time**: {elapsed * 1000:.1f} ms ({snapshots} progress snapshots streamed){deadline_line}{ignored_line}
+
+Identical input and options always produce this key and bit-identical
+positions, so results can be cached and diffed with react_flow_graph_diff.
+
+```typescript
+// Render the first progress snapshot immediately, apply later patches as they arrive
+await client.callTool({{ name: 'react_flow_server_layout', arguments }}, undefined, {{
+  onprogress: ({{ message }}) => {{
+    const moved = JSON.parse(message).patch?.nodes.moved ?? {{}};
+    setNodes((nodes) => nodes.map((node) =>
+      moved[node.id] ? {{ ...node, position: moved[node.id] }} : node));
+  }},
+}});
+```
+
+## Node Positions (react_flow_graph_diff patch format)
+```json
+{json.dumps({"nodes": {"moved": positions}}, separators=(',', ':'))}
+```
+""")]
+
+
+def _normalised(positions: Dict[str, Dict[str, float]], ids: Sequence[str]) -> Dict[str, Tuple[float, float]]:
+    """Positions of ids relative to their bounding-box origin (ELK adds padding, the engine centres on zero)."""
+    left = min(positions[node_id]["x"] for node_id in ids)
+    top = min(positions[node_id]["y"] for node_id in ids)
+    return {node_id: (positions[node_id]["x"] - left, positions[node_id]["y"] - top) for node_id in ids}
+
+
+def _layer_index(centres: Dict[str, float]) -> Dict[str, int]:
+    """Layer of each node from its centre along the layering axis."""
+    levels = sorted({round(value, 1) for value in centres.values()})
+    rank = {value: index for index, value in enumerate(levels)}
+    return {node_id: rank[round(value, 1)] for node_id, value in centres.items()}
+
+
+def layout_parity(graph: FlowGraph, expected: Dict[str, Dict[str, float]], actual: Dict[str, Dict[str, float]],
+                  direction: str, tolerance: float = PARITY_TOLERANCE) -> Dict[str, Any]:
+    """
+    Compare two layouts of the same graph after moving both to the origin.
+
+    Layers are read from node centres along the layering axis. Order
+    agreement is the share of same-layer node pairs (per the expected
+    layout) that keep their relative order across the layer.
+    """
+    nodes = graph.nodes
+    sizes = {nodes.ids[row]: (nodes.width[row], nodes.height[row]) for row in range(len(nodes))}
+    ids = sorted(node_id for node_id in expected if node_id in actual and node_id in sizes)
+    if not ids:
+        raise ValueError("The layouts have no positioned nodes in common")
+    first, second = _normalised(expected, ids), _normalised(actual, ids)
+    main = 0 if direction in ("LR", "RL") else 1
+
+    def centres(positions, axis):
+        return {node_id: positions[node_id][axis] + sizes[node_id][axis] / 2 for node_id in ids}
+
+    expected_layers = _layer_index(centres(first, main))
+    actual_layers = _layer_index(centres(second, main))
+    expected_across, actual_across = centres(first, 1 - main), centres(second, 1 - main)
+    members: Dict[int, List[str]] = {}
+    for node_id in ids:
+        members.setdefault(expected_layers[node_id], []).append(node_id)
+    pairs = discordant = 0
+    for layer in members.values():
+        if len(layer) < 2:
+            continue
+        by_expected = sorted(layer, key=lambda node_id: (expected_across[node_id], node_id))
+        actual_rank = {node_id: rank for rank, node_id in enumerate(
+            sorted(layer, key=lambda node_id: (actual_across[node_id], node_id)))}
+        discordant += count_crossings(list(range(len(layer))), [actual_rank[node_id] for node_id in by_expected])
+        pairs += len(layer) * (len(layer) - 1) // 2
+
+    distances = [
+        ((first[node_id][0] - second[node_id][0]) ** 2 + (first[node_id][1] - second[node_id][1]) ** 2) ** 0.5
+        for node_id in ids
+    ]
+
+    def extent(positions):
+        return (max(positions[node_id][0] + sizes[node_id][0] for node_id in ids),
+                max(positions[node_id][1] + sizes[node_id][1] for node_id in ids))
+
+    return {
+        "nodes": len(ids),
+        "layer_agreement": sum(expected_layers[node_id] == actual_layers[node_id] for node_id in ids) / len(ids),
+        "order_agreement": 1 - discordant / pairs if pairs else 1.0,
+        "mean_distance": sum(distances) / len(distances),
+        "max_distance": max(distances),
+        "within_tolerance": sum(distance <= tolerance for distance in distances) / len(distances),
+        "expected_size": extent(first),
+        "actual_size": extent(second),
+    }
+
+
+def _elk_fixtures(arguments: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """(name, elkjs graph) pairs from an inline graph, a fixture file or a fixture directory."""
+    path = arguments.get("elk_graph_path")
+    if path:
+        resolved = os.path.abspath(os.path.expanduser(str(path)))
+        if os.path.isdir(resolved):
+            files = sorted(os.path.join(resolved, name) for name in os.listdir(resolved) if name.endswith(".json"))
+        elif os.path.isfile(resolved):
+            files = [resolved]
+        else:
+            raise FlowLoadError(f"ELK graph file not found: {path}")
+        fixtures = []
+        for file_path in files:
+            with open(file_path, "r", encoding="utf-8") as handle:
+                fixtures.append((os.path.basename(file_path), json.load(handle)))
+        if not fixtures:
+            raise FlowLoadError(f"No .json ELK graphs in {path}")
+        return fixtures
+    graph = arguments.get("elk_graph")
+    if isinstance(graph, str):
+        graph = json.loads(graph)
+    if graph is None:
+        raise FlowLoadError("Provide either `elk_graph` or `elk_graph_path`")
+    return [(str(graph.get("id", "elk_graph")) if isinstance(graph, dict) else "elk_graph", graph)]
+
+
+def react_flow_elk_parity(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Compare the layered engine against stored elkjs layouts."""
+    runs = max(int(arguments.get("runs", PARITY_RUNS)), 1)
+    tolerance = float(arguments.get("tolerance", PARITY_TOLERANCE))
+    try:
+        results = []
+        for name, elk_graph in _elk_fixtures(arguments):
+            elk_options = arguments.get("layoutOptions")
+            if elk_options is None:
+                elk_options = elk_graph.get("layoutOptions") or {}
+            options = layout_options({"layoutOptions": elk_options})
+            ignored = translate_elk_options(elk_options)[1]
+            document, expected = elk_graph_flow(elk_graph)
+            graph = build_flow(document, keep_data=False)
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                layout = LayeredLayout(graph, options).run()
+                timings.append((time.perf_counter() - started) * 1000)
+            parity = layout_parity(graph, expected, layout.positions(), options["direction"], tolerance)
+            elk_ms = elk_graph.get("runtimeMs")
+            results.append((name, parity, min(timings), float(elk_ms) if elk_ms is not None else None, ignored))
+    except (FlowLoadError, ValueError, KeyError, OSError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+    return format_parity(results, tolerance)
+
+
+def format_parity(results: Sequence[Tuple[str, Dict[str, Any], float, Optional[float], List[str]]],
+                  tolerance: float) -> List[types.TextContent]:
+    """Render the parity report."""
+    rows = []
+    ignored_lines = []
+    for name, parity, server_ms, elk_ms, ignored in results:
+        elk_text = f"{elk_ms:.1f}" if elk_ms is not None else "n/a"
+        ratio = f"{elk_ms / server_ms:.2f}x" if elk_ms is not None and server_ms > 0 else "n/a"
+        expected_size = " x ".join(f"{value:.0f}" for value in parity["expected_size"])
+        actual_size = " x ".join(f"{value:.0f}" for value in parity["actual_size"])
+        rows.append(
+            f"| {name} | {parity['nodes']} | {parity['layer_agreement']:.0%} | {parity['order_agreement']:.0%} "
+            f"| {parity['mean_distance']:.1f} | {parity['max_distance']:.1f} | {parity['within_tolerance']:.0%} "
+            f"| {expected_size} | {actual_size} | {server_ms:.1f} | {elk_text} | {ratio} |"
+        )
+        if ignored:
+            ignored_lines.append(f"- **{name}**: {', '.join(f'`{key}`' for key in ignored)}")
+    ignored_text = "\n".join(ignored_lines) if ignored_lines else "None - every ELK option mapped onto the layered engine."
+
+    return [types.TextContent(type="text", text=f"""# ELK Layout Parity Report
+
+Positions are compared after moving both layouts to the origin, so ELK's
+padding does not count as drift. Layer and order agreement show whether
+the server engine produces the same structure even where exact
+coordinates differ (ELK uses Brandes-Koepf placement, the engine a
+median/PAV refinement).
+
+| Graph | Nodes | Same layer | Same order | Mean drift (px) | Max drift (px) | Within {tolerance:g}px | elkjs size | Server size | Server ms | elkjs ms | Speedup |
+|---|---:|---:|---:|---:|---:|---:|---|---|---:|---:|---:|
+{chr(10).join(rows)}
+
+## ELK options without effect
+{ignored_text}
+
+Pass the same `layoutOptions` to react_flow_server_layout to move an
+elkjs worker's layout to the server unchanged.
+""")]
+
+
+# Layout results by layout_fingerprint, most recently used last
+_LAYOUT_CACHE: "OrderedDict[str, Tuple[Dict[str, Dict[str, float]], Dict[str, int]]]" = OrderedDict()
+
+
+# Tool execution handlers
+FLOW_LAYOUT_HANDLERS = {
+    "react_flow_server_layout": react_flow_server_layout,
+    "react_flow_elk_parity": react_flow_elk_parity
+}
+
+
+async def handle_call(name: str, arguments: Dict[str, Any],
+                      progress: Optional[ProgressCallback] = None) -> List[types.TextContent]:
+    """Handle flow layout tool calls."""
+    if name == "react_flow_server_layout":
+        return await react_flow_server_layout(arguments, progress)
+    if name in FLOW_LAYOUT_HANDLERS:
+        return FLOW_LAYOUT_HANDLERS[name](arguments)
+
+    return [types.TextContent(
+        type="text",
+        text=f"Tool {name} not found in flow layout tools"
+    )]
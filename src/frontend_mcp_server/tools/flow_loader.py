@@ -0,0 +1,506 @@
+"""
+Flow loading layer for graph-consuming React Flow tools.
+
+Exported whiteboard flows can reach hundreds of MB, so passing them through
+`json.loads` as a tool argument is not an option. This module streams a flow
+document from a local file with an event-based JSON parser and builds
+array-backed node and edge tables directly, one `nodes`/`edges` element at a
+time, without ever materializing the full object tree.
+"""
+
+import io
+import json
+import os
+import re
+from array import array
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, TextIO, Tuple
+
+# Default node box used by the generated layout code (see connection_positioning_tools)
+DEFAULT_NODE_WIDTH = 172.0
+DEFAULT_NODE_HEIGHT = 36.0
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB of text per read
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_LITERALS = {"true": True, "false": False, "null": None}
+_DECODER = json.JSONDecoder()
+
+
+class FlowLoadError(ValueError):
+    """Raised when a flow document cannot be read or parsed."""
+
+
+class JsonEventParser:
+    """
+    Incremental, event-based JSON parser over a text stream.
+
+    `events()` yields `(event, value)` pairs in the style of SAX/ijson:
+    `start_map`, `map_key`, `end_map`, `start_array`, `end_array`, `string`,
+    `number`, `boolean` and `null`. Only one chunk of the input is buffered at
+    a time. After a `map_key` event the caller may take over the value with
+    `read_value()`, or `begin_array()` + `iter_array_items()` to decode the
+    elements of an array one by one instead of receiving their events.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = max(int(chunk_size), 16)
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._stack: List[str] = []
+        self._expect_key = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the unconsumed buffer; False at end of input."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> bool:
+        """Advance to the next token; False when the input is exhausted."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return True
+            if not self._fill():
+                return False
+
+    def _read_string(self) -> str:
+        while True:
+            match = _STRING.match(self._buf, self._pos)
+            if match:
+                break
+            if not self._fill():
+                raise FlowLoadError("Unterminated string in JSON document")
+        token = match.group()
+        self._pos = match.end()
+        return token[1:-1] if "\\" not in token else json.loads(token)
+
+    def _read_scalar(self) -> Tuple[str, Any]:
+        while True:
+            match = _NUMBER.match(self._buf, self._pos)
+            if match and (match.end() < len(self._buf) or self._eof):
+                token = match.group()
+                self._pos = match.end()
+                if "." in token or "e" in token or "E" in token:
+                    return "number", float(token)
+                return "number", int(token)
+            if not match:
+                for literal, value in _LITERALS.items():
+                    if self._buf.startswith(literal, self._pos):
+                        self._pos += len(literal)
+                        return ("null" if value is None else "boolean"), value
+                if len(self._buf) - self._pos >= 5 or self._eof:
+                    snippet = self._buf[self._pos:self._pos + 20]
+                    raise FlowLoadError(f"Unexpected JSON token near {snippet!r}")
+            if not self._fill() and not match:
+                raise FlowLoadError("Unexpected end of JSON document")
+
+    def events(self) -> Iterator[Tuple[str, Any]]:
+        """Yield parse events until the top-level value is complete."""
+        while True:
+            if not self._skip_whitespace():
+                if self._stack:
+                    raise FlowLoadError("Unexpected end of JSON document")
+                return
+            char = self._buf[self._pos]
+            if char == ",":
+                self._pos += 1
+                self._expect_key = bool(self._stack) and self._stack[-1] == "map"
+                continue
+            if char == ":":
+                self._pos += 1
+                continue
+            if char == "{":
+                self._pos += 1
+                self._stack.append("map")
+                self._expect_key = True
+                yield "start_map", None
+            elif char == "}":
+                self._pos += 1
+                self._stack.pop()
+                self._expect_key = False
+                yield "end_map", None
+            elif char == "[":
+                self._pos += 1
+                self._stack.append("array")
+                yield "start_array", None
+            elif char == "]":
+                self._pos += 1
+                self._stack.pop()
+                yield "end_array", None
+            elif char == '"':
+                value = self._read_string()
+                if self._expect_key:
+                    self._expect_key = False
+                    if not self._skip_whitespace() or self._buf[self._pos] != ":":
+                        raise FlowLoadError(f"Expected ':' after key {value!r}")
+                    self._pos += 1
+                    yield "map_key", value
+                else:
+                    yield "string", value
+            else:
+                yield self._read_scalar()
+            if not self._stack:
+                return
+
+    def begin_array(self) -> bool:
+        """Consume the `[` of an upcoming array value; False if the value is not an array."""
+        if not self._skip_whitespace() or self._buf[self._pos] != "[":
+            return False
+        self._pos += 1
+        self._stack.append("array")
+        return True
+
+    def read_value(self) -> Any:
+        """Decode the next complete value (meant for small values such as `viewport`)."""
+        if not self._skip_whitespace():
+            raise FlowLoadError("Unexpected end of JSON document")
+        return self._decode_value()
+
+    def iter_array_items(self) -> Iterator[Any]:
+        """Decode the elements of the array opened by `begin_array()`."""
+        while True:
+            if not self._skip_whitespace():
+                raise FlowLoadError("Unexpected end of JSON document inside array")
+            char = self._buf[self._pos]
+            if char == "]":
+                self._pos += 1
+                self._stack.pop()
+                return
+            if char == ",":
+                self._pos += 1
+                continue
+            yield self._decode_value()
+
+    def _decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise FlowLoadError(f"Invalid JSON in flow document: {exc.msg}") from exc
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self._buf) and isinstance(value, (int, float)) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+class NodeTable:
+    """Column-oriented node storage; row `i` describes the i-th node in document order."""
+
+    __slots__ = (
+        "ids", "index", "types", "x", "y", "width", "height",
+        "parent_ids", "parent", "data", "handles", "duplicate_rows",
+    )
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.types: List[Optional[str]] = []
+        self.x = array("d")
+        self.y = array("d")
+        self.width = array("d")
+        self.height = array("d")
+        self.parent_ids: List[Optional[str]] = []
+        self.parent = array("l")  # row of the parent node, -1 for none or missing
+        self.data: List[Optional[Dict[str, Any]]] = []
+        # Sparse: row -> (source handle ids, target handle ids) for nodes that declare handles
+        self.handles: Dict[int, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self.duplicate_rows: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class EdgeTable:
+    """Column-oriented edge storage with endpoints resolved to node rows (-1 if missing)."""
+
+    __slots__ = (
+        "ids", "types", "source_ids", "target_ids", "source", "target",
+        "source_handles", "target_handles", "data",
+    )
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.types: List[Optional[str]] = []
+        self.source_ids: List[str] = []
+        self.target_ids: List[str] = []
+        self.source = array("l")
+        self.target = array("l")
+        self.source_handles: List[Optional[str]] = []
+        self.target_handles: List[Optional[str]] = []
+        self.data: List[Optional[Dict[str, Any]]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class FlowGraph:
+    """A loaded flow: node and edge tables plus the document viewport, if any."""
+
+    __slots__ = ("nodes", "edges", "viewport", "source")
+
+    def __init__(self, nodes: NodeTable, edges: EdgeTable,
+                 viewport: Optional[Dict[str, Any]] = None, source: str = "inline"):
+        self.nodes = nodes
+        self.edges = edges
+        self.viewport = viewport
+        self.source = source
+
+    def summary(self) -> Dict[str, Any]:
+        """Small description of the loaded flow for tool reports."""
+        return {
+            "source": self.source,
+            "nodes": len(self.nodes),
+            "edges": len(self.edges),
+            "duplicate_node_ids": len(self.nodes.duplicate_rows),
+        }
+
+    def absolute_positions(self) -> Tuple[array, array]:
+        """
+        Node positions in flow coordinates.
+
+        Child positions are stored relative to their parent, so parent
+        offsets are accumulated iteratively (cyclic parent chains are cut).
+        """
+        nodes = self.nodes
+        x = array("d", nodes.x)
+        y = array("d", nodes.y)
+        parents = nodes.parent
+        resolved = bytearray(len(nodes))
+        for start in range(len(nodes)):
+            if resolved[start]:
+                continue
+            chain = []
+            row = start
+            while row >= 0 and not resolved[row]:
+                resolved[row] = 2  # on the current chain
+                chain.append(row)
+                row = parents[row]
+            for row in reversed(chain):
+                parent = parents[row]
+                if parent >= 0 and resolved[parent] == 1:
+                    x[row] += x[parent]
+                    y[row] += y[parent]
+                resolved[row] = 1
+        return x, y
+
+    def top_level_rows(self) -> List[int]:
+        """Top-level ancestor row of every node (cyclic parent chains are cut)."""
+        parents = self.nodes.parent
+        roots = [-1] * len(parents)
+        for start in range(len(parents)):
+            chain = []
+            row = start
+            while roots[row] < 0 and parents[row] >= 0 and row not in chain:
+                chain.append(row)
+                row = parents[row]
+            root = roots[row] if roots[row] >= 0 else row
+            for member in chain:
+                roots[member] = root
+            roots[row] = root
+        return roots
+
+
+def _number(value: Any, default: float) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return default
+
+
+def _handle_ids(handles: Any) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    source, target = set(), set()
+    for handle in handles:
+        if not isinstance(handle, dict):
+            continue
+        handle_id = handle.get("id")
+        handle_id = None if handle_id is None else str(handle_id)
+        kind = handle.get("type")
+        if kind != "target" and handle_id is not None:
+            source.add(handle_id)
+        if kind != "source" and handle_id is not None:
+            target.add(handle_id)
+    return frozenset(source), frozenset(target)
+
+
+class FlowTableBuilder:
+    """Appends node/edge documents to the tables and resolves references on `finish()`."""
+
+    def __init__(self, keep_data: bool = True):
+        self.keep_data = keep_data
+        self.nodes = NodeTable()
+        self.edges = EdgeTable()
+        self.viewport: Optional[Dict[str, Any]] = None
+
+    def add_node(self, node: Any) -> None:
+        if not isinstance(node, dict):
+            raise FlowLoadError("Every entry in `nodes` must be an object")
+        table = self.nodes
+        row = len(table.ids)
+        node_id = str(node.get("id", row))
+        table.ids.append(node_id)
+        if node_id in table.index:
+            table.duplicate_rows.append(row)
+        else:
+            table.index[node_id] = row
+        table.types.append(node.get("type"))
+
+        position = node.get("position") or {}
+        table.x.append(_number(position.get("x"), 0.0))
+        table.y.append(_number(position.get("y"), 0.0))
+
+        measured = node.get("measured") or {}
+        style = node.get("style") or {}
+        table.width.append(_number(measured.get("width"), _number(
+            node.get("width"), _number(style.get("width"), DEFAULT_NODE_WIDTH))))
+        table.height.append(_number(measured.get("height"), _number(
+            node.get("height"), _number(style.get("height"), DEFAULT_NODE_HEIGHT))))
+
+        parent_id = node.get("parentId", node.get("parentNode"))
+        table.parent_ids.append(None if parent_id is None else str(parent_id))
+        table.data.append(node.get("data") if self.keep_data else None)
+
+        handles = node.get("handles")
+        if isinstance(handles, list):
+            table.handles[row] = _handle_ids(handles)
+
+    def add_edge(self, edge: Any) -> None:
+        if not isinstance(edge, dict):
+            raise FlowLoadError("Every entry in `edges` must be an object")
+        table = self.edges
+        source = str(edge.get("source", ""))
+        target = str(edge.get("target", ""))
+        source_handle = edge.get("sourceHandle")
+        target_handle = edge.get("targetHandle")
+        table.ids.append(str(edge.get("id", f"{source}->{target}")))
+        table.types.append(edge.get("type"))
+        table.source_ids.append(source)
+        table.target_ids.append(target)
+        table.source_handles.append(None if source_handle is None else str(source_handle))
+        table.target_handles.append(None if target_handle is None else str(target_handle))
+        table.data.append(edge.get("data") if self.keep_data else None)
+
+    def finish(self, source: str = "inline") -> FlowGraph:
+        """Resolve parent and edge endpoint ids to node rows."""
+        index = self.nodes.index
+        self.nodes.parent = array("l", (
+            -1 if parent_id is None else index.get(parent_id, -1)
+            for parent_id in self.nodes.parent_ids
+        ))
+        self.edges.source = array("l", (index.get(node_id, -1) for node_id in self.edges.source_ids))
+        self.edges.target = array("l", (index.get(node_id, -1) for node_id in self.edges.target_ids))
+        return FlowGraph(self.nodes, self.edges, self.viewport, source)
+
+
+def build_flow(document: Dict[str, Any], keep_data: bool = True) -> FlowGraph:
+    """Build tables from an already-parsed (small) flow document."""
+    if not isinstance(document, dict):
+        raise FlowLoadError("Flow document must be an object with `nodes` and `edges`")
+    builder = FlowTableBuilder(keep_data)
+    for node in document.get("nodes") or []:
+        builder.add_node(node)
+    for edge in document.get("edges") or []:
+        builder.add_edge(edge)
+    viewport = document.get("viewport")
+    builder.viewport = viewport if isinstance(viewport, dict) else None
+    return builder.finish()
+
+
+def stream_flow(stream: TextIO, keep_data: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                source: str = "stream") -> FlowGraph:
+    """Stream a flow document, decoding `nodes`/`edges` one element at a time."""
+    builder = FlowTableBuilder(keep_data)
+    parser = JsonEventParser(stream, chunk_size)
+    depth = 0
+    for event, value in parser.events():
+        if depth == 0 and event != "start_map":
+            raise FlowLoadError("Flow document must be an object with `nodes` and `edges`")
+        if event == "map_key":
+            if depth != 1:
+                continue
+            if value in ("nodes", "edges") and parser.begin_array():
+                add = builder.add_node if value == "nodes" else builder.add_edge
+                for item in parser.iter_array_items():
+                    add(item)
+            elif value == "viewport":
+                viewport = parser.read_value()
+                builder.viewport = viewport if isinstance(viewport, dict) else None
+        elif event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+    return builder.finish(source)
+
+
+def load_flow_file(path: str, keep_data: bool = True,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> FlowGraph:
+    """Stream a flow document from a local file path."""
+    resolved = os.path.abspath(os.path.expanduser(path))
+    if not os.path.isfile(resolved):
+        raise FlowLoadError(f"Flow file not found: {path}")
+    with open(resolved, "r", encoding="utf-8") as stream:
+        return stream_flow(stream, keep_data, chunk_size, source=resolved)
+
+
+def load_flow(arguments: Dict[str, Any], key: str = "flow", keep_data: bool = True) -> FlowGraph:
+    """
+    Load the flow passed to a tool call.
+
+    Tools accept either an inline `<key>` (object or JSON string, for small
+    flows) or `<key>_path`, a local file that is streamed from disk.
+    """
+    path = arguments.get(f"{key}_path")
+    if path:
+        return load_flow_file(str(path), keep_data)
+    document = arguments.get(key)
+    if isinstance(document, str):
+        try:
+            document = json.loads(document)
+        except json.JSONDecodeError as exc:
+            raise FlowLoadError(f"Invalid JSON in `{key}`: {exc.msg}") from exc
+    if document is None:
+        raise FlowLoadError(f"Provide either `{key}` or `{key}_path`")
+    return build_flow(document, keep_data)
+
+
+def open_json_source(arguments: Dict[str, Any], key: str) -> TextIO:
+    """
+    Text stream over a JSON input passed to a tool call: `<key>_path` (a
+    local file, streamed) or an inline `<key>` (any JSON value or a JSON string).
+    """
+    path = arguments.get(f"{key}_path")
+    if path:
+        resolved = os.path.abspath(os.path.expanduser(str(path)))
+        if not os.path.isfile(resolved):
+            raise FlowLoadError(f"{key.replace('_', ' ').capitalize()} file not found: {path}")
+        return open(resolved, "r", encoding="utf-8")
+    document = arguments.get(key)
+    if document is None:
+        raise FlowLoadError(f"Provide either `{key}` or `{key}_path`")
+    return io.StringIO(document if isinstance(document, str) else json.dumps(document))
+
+
+def flow_input_properties(key: str = "flow", label: str = "React Flow document") -> Dict[str, Any]:
+    """JSON-schema properties shared by every tool that consumes a flow."""
+    return {
+        key: {
+            "type": ["object", "string"],
+            "description": f"{label} with `nodes` and `edges` (inline; use `{key}_path` for large exports)"
+        },
+        f"{key}_path": {
+            "type": "string",
+            "description": f"Local path to the {label} JSON file, streamed from disk"
+        }
+    }
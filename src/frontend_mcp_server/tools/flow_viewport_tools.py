@@ -0,0 +1,647 @@
+"""
+Flow Viewport Tools - server-side culling and overview rendering for very large
+React Flow diagrams. A tile index is built once per laid-out flow so clients can
+fetch only the nodes and edges inside their current viewport instead of
+filtering every node on every render, and minimaps/thumbnails are decimated to
+a fixed resolution once instead of drawing every node in the browser.
+"""
+
+import base64
+import html
+import json
+import math
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from mcp import types
+
+from .flow_loader import FlowGraph, FlowLoadError, flow_input_properties, load_flow
+from .flow_graph_tools import edge_document, node_document
+
+DEFAULT_TILE_SIZE = 512.0
+DEFAULT_MINIMAP_SIZE = {"width": 200, "height": 150}  # React Flow <MiniMap /> default
+# Edges crossing more tiles than this are kept in a side list and tested per query
+MAX_EDGE_TILES = 64
+# Likewise for nodes (large groups, or a small tile_size) covering more tiles than this
+MAX_NODE_TILES = 64
+INDEX_CACHE_SIZE = 8
+# Hex, a color keyword or a color function: the SVG fill is emitted as an attribute value
+_CSS_COLOR = re.compile(r"#[0-9a-fA-F]{3,8}|[a-zA-Z]+|[a-z]+\([0-9a-zA-Z .,%/+-]*\)")
+
+
+def get_tools() -> List[types.Tool]:
+    """Get viewport culling tools."""
+    return [
+        types.Tool(
+            name="react_flow_viewport_query",
+            description="Build (and cache) a tile index over a laid-out flow and return only the nodes and edges visible in a viewport, with paging",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **flow_input_properties(),
+                    "viewport": {
+                        "type": "object",
+                        "properties": {
+                            "x": {"type": "number", "default": 0},
+                            "y": {"type": "number", "default": 0},
+                            "zoom": {"type": "number", "default": 1}
+                        },
+                        "description": "React Flow viewport transform ({x, y, zoom} as returned by getViewport())"
+                    },
+                    "screen": {
+                        "type": "object",
+                        "properties": {
+                            "width": {"type": "number", "default": 1920},
+                            "height": {"type": "number", "default": 1080}
+                        },
+                        "description": "Size of the React Flow pane in screen pixels"
+                    },
+                    "rect": {
+                        "type": "object",
+                        "properties": {
+                            "x": {"type": "number"},
+                            "y": {"type": "number"},
+                            "width": {"type": "number"},
+                            "height": {"type": "number"}
+                        },
+                        "description": "Visible rectangle in flow coordinates (overrides viewport/screen)"
+                    },
+                    "overscan": {
+                        "type": "number",
+                        "description": "Extra margin around the viewport in screen pixels, so small pans need no refetch",
+                        "default": 200
+                    },
+                    "min_node_screen_size": {
+                        "type": "number",
+                        "description": "Skip nodes smaller than this many pixels at the current zoom (level of detail)",
+                        "default": 0
+                    },
+                    "tile_size": {
+                        "type": "number",
+                        "description": "Tile edge length in flow units",
+                        "default": DEFAULT_TILE_SIZE
+                    },
+                    "tiles": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Fetch these tiles (\"tx,ty\" keys from a previous response) instead of a viewport"
+                    },
+                    "page": {"type": "integer", "description": "Result page (0-based)", "default": 0},
+                    "page_size": {"type": "integer", "description": "Nodes per page", "default": 2000},
+                    "include_data": {
+                        "type": "boolean",
+                        "description": "Include node/edge data in the returned elements",
+                        "default": True
+                    }
+                },
+                "required": []
+            }
+        ),
+        types.Tool(
+            name="react_flow_minimap_generator",
+            description="Precompute a decimated minimap or thumbnail of a laid-out flow (density grid, merged rectangles, compact SVG) at a fixed resolution",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    **flow_input_properties(),
+                    "resolution": {
+                        "type": "object",
+                        "properties": {
+                            "width": {"type": "integer", "default": DEFAULT_MINIMAP_SIZE["width"]},
+                            "height": {"type": "integer", "default": DEFAULT_MINIMAP_SIZE["height"]}
+                        },
+                        "description": "Target size in pixels; every node is decimated onto this grid"
+                    },
+                    "density_levels": {
+                        "type": "integer",
+                        "description": "Number of shading levels for overlapping nodes",
+                        "default": 4
+                    },
+                    "outputs": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["svg", "rectangles", "density_grid"]},
+                        "description": "Representations to return",
+                        "default": ["svg", "rectangles"]
+                    },
+                    "node_color": {
+                        "type": "string",
+                        "description": "Fill color for SVG output",
+                        "default": "#64748b"
+                    },
+                    "svg_path": {
+                        "type": "string",
+                        "description": "Optional local .svg path to also write the SVG (gallery thumbnails); an existing file is only replaced if it is an SVG"
+                    }
+                },
+                "required": []
+            }
+        )
+    ]
+
+
+def react_flow_viewport_query(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Return the visible window of a large flow."""
+    include_data = arguments.get("include_data", True)
+
+    try:
+        tile_size = float(arguments.get("tile_size", DEFAULT_TILE_SIZE))
+        page = max(int(arguments.get("page", 0)), 0)
+        page_size = max(int(arguments.get("page_size", 2000)), 1)
+        min_screen = float(arguments.get("min_node_screen_size", 0))
+        started = time.perf_counter()
+        index, cached = get_tile_index(arguments, tile_size, include_data)
+        built = time.perf_counter()
+
+        zoom = 1.0
+        if arguments.get("tiles"):
+            keys = [parse_tile_key(key) for key in arguments["tiles"]]
+            node_rows, edge_rows = index.query_tiles(keys)
+            window = None
+        else:
+            window, zoom = visible_rect(arguments)
+            node_rows, edge_rows = index.query(*window)
+    except (FlowLoadError, ValueError, TypeError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    if min_screen > 0:
+        nodes = index.graph.nodes
+        node_rows = [row for row in node_rows
+                     if max(nodes.width[row], nodes.height[row]) * zoom >= min_screen]
+
+    result = index.page(node_rows, edge_rows, page, page_size)
+    queried = time.perf_counter()
+
+    result["index"] = {
+        "tile_size": tile_size,
+        "tiles": len(index.node_tiles),
+        "cached": cached,
+        "bounds": index.bounds,
+        "build_ms": round((built - started) * 1000, 2),
+        "query_ms": round((queried - built) * 1000, 2),
+    }
+    if window is not None:
+        result["rect"] = {"x": window[0], "y": window[1], "width": window[2] - window[0], "height": window[3] - window[1]}
+        result["tiles"] = index.tile_counts(*window)
+
+    return [types.TextContent(type="text", text=f"""# React Flow Viewport Query
+
+## Flow: {index.graph.source}
+- **Total**: {len(index.graph.nodes)} nodes, {len(index.graph.edges)} edges
+- **Visible**: {result['visible_nodes']} nodes, {result['visible_edges']} edges
+- **Page**: {page + 1} of {result['pages']} ({len(result['nodes'])} nodes, {len(result['edges'])} edges, {len(result['anchor_nodes'])} anchor nodes)
+- **Index**: {result['index']['tiles']} tiles of {tile_size:g} units ({'cached' if cached else f"built in {result['index']['build_ms']} ms"}), query {result['index']['query_ms']} ms
+
+`anchor_nodes` are off-screen endpoints or parents that visible edges and children need to render.
+Pass `page` for the next page, or `tiles` with keys from `tiles` to fetch tile by tile.
+
+## Result
+```json
+{json.dumps(result, indent=2)}
+```
+""")]
+
+
+def react_flow_minimap_generator(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Return a cached, decimated overview of a flow."""
+    outputs = arguments.get("outputs") or ["svg", "rectangles"]
+    color = arguments.get("node_color", "#64748b")
+
+    try:
+        if not isinstance(arguments.get("resolution") or {}, dict):
+            raise ValueError("resolution must be an object with width and height")
+        resolution = {**DEFAULT_MINIMAP_SIZE, **(arguments.get("resolution") or {})}
+        width, height = int(resolution["width"]), int(resolution["height"])
+        levels = min(max(int(arguments.get("density_levels", 4)), 1), 16)
+        if width < 1 or height < 1 or width * height > 4_000_000:
+            raise ValueError("resolution must be between 1x1 and 4 megapixels")
+        if not isinstance(color, str) or not _CSS_COLOR.fullmatch(color):
+            raise ValueError(f"node_color must be a CSS color (#hex, a keyword or rgb()/hsl()), got {color!r}")
+        started = time.perf_counter()
+        params = (width, height, levels, color)
+        cache_key = file_cache_key(arguments, ("minimap",) + params)
+        minimap = _MINIMAP_CACHE.get(cache_key) if cache_key else None
+        cached = minimap is not None
+        if minimap is None:
+            graph = load_flow(arguments, keep_data=False)
+            minimap = decimate_flow(graph, width, height, levels, color)
+            if cache_key:
+                _cache_put(_MINIMAP_CACHE, cache_key, minimap)
+        elapsed = time.perf_counter() - started
+
+        if arguments.get("svg_path"):
+            write_svg(str(arguments["svg_path"]), minimap["svg"])
+    except (FlowLoadError, ValueError, TypeError, OSError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+    result = {key: minimap[key] for key in ("resolution", "transform", "nodes", "max_density")}
+    if "rectangles" in outputs:
+        result["rectangles"] = minimap["rectangles"]
+    if "density_grid" in outputs:
+        result["density_grid"] = minimap["density_grid"]
+
+    svg_section = f"""
+## SVG ({len(minimap['svg'])} bytes)
+```svg
+{minimap['svg']}
+```
+""" if "svg" in outputs else ""
+
+    return [types.TextContent(type="text", text=f"""# React Flow Minimap
+
+- **Nodes decimated**: {minimap['nodes']}
+- **Resolution**: {width}x{height} px, {levels} density levels (max {minimap['max_density']} overlapping nodes)
+- **Merged rectangles**: {len(minimap['rectangles'])}
+- **Time**: {elapsed * 1000:.2f} ms{' (cached)' if cached else ''}
+{f"- **Written to**: {arguments['svg_path']}" if arguments.get('svg_path') else ''}
+
+Map pixels back to flow coordinates with `flow = pixel / transform.scale + transform.offset`.
+Render the SVG inside a custom `<MiniMap />` or as a gallery thumbnail instead of one shape per node.
+{svg_section}
+## Data
+```json
+{json.dumps(result, separators=(',', ':'))}
+```
+""")]
+
+
+def visible_rect(arguments: Dict[str, Any]) -> Tuple[Tuple[float, float, float, float], float]:
+    """Visible flow-coordinate rectangle (left, top, right, bottom) and zoom."""
+    rect = arguments.get("rect")
+    viewport = arguments.get("viewport") or {}
+    zoom = float(viewport.get("zoom", 1) or 1)
+    if zoom <= 0:
+        raise ValueError("viewport.zoom must be positive")
+    margin = float(arguments.get("overscan", 200)) / zoom
+    if rect:
+        left, top = float(rect["x"]), float(rect["y"])
+        right, bottom = left + float(rect["width"]), top + float(rect["height"])
+    else:
+        screen = arguments.get("screen") or {}
+        # React Flow renders flow point p at screen point p * zoom + (x, y)
+        left = -float(viewport.get("x", 0)) / zoom
+        top = -float(viewport.get("y", 0)) / zoom
+        right = left + float(screen.get("width", 1920)) / zoom
+        bottom = top + float(screen.get("height", 1080)) / zoom
+    return (left - margin, top - margin, right + margin, bottom + margin), zoom
+
+
+def parse_tile_key(key: str) -> Tuple[int, int]:
+    try:
+        tile_x, tile_y = key.split(",")
+        return int(tile_x), int(tile_y)
+    except ValueError as exc:
+        raise ValueError(f"Invalid tile key '{key}', expected \"tx,ty\"") from exc
+
+
+class TileIndex:
+    """Uniform grid over absolute node boxes and edge segments of a flow."""
+
+    def __init__(self, graph: FlowGraph, tile_size: float = DEFAULT_TILE_SIZE):
+        if tile_size <= 0:
+            raise ValueError("tile_size must be positive")
+        self.graph = graph
+        self.tile_size = tile_size
+        self.x, self.y = graph.absolute_positions()
+        self.node_tiles: Dict[Tuple[int, int], List[int]] = {}
+        self.edge_tiles: Dict[Tuple[int, int], List[int]] = {}
+        self.long_edges: List[int] = []
+        self.large_nodes: List[int] = []
+        self.bounds: Optional[Dict[str, float]] = None
+        self._index_nodes()
+        self._index_edges()
+
+    def _tile(self, value: float) -> int:
+        return math.floor(value / self.tile_size)
+
+    def _index_nodes(self) -> None:
+        nodes, tiles = self.graph.nodes, self.node_tiles
+        if not len(nodes):
+            return
+        left, top = min(self.x), min(self.y)
+        right = max(x + w for x, w in zip(self.x, nodes.width))
+        bottom = max(y + h for y, h in zip(self.y, nodes.height))
+        self.bounds = {"x": left, "y": top, "width": right - left, "height": bottom - top}
+        tile = self._tile
+        for row, (x, y, width, height) in enumerate(zip(self.x, self.y, nodes.width, nodes.height)):
+            if (tile(x + width) - tile(x) + 1) * (tile(y + height) - tile(y) + 1) > MAX_NODE_TILES:
+                self.large_nodes.append(row)
+                continue
+            for tile_x in range(tile(x), tile(x + width) + 1):
+                for tile_y in range(tile(y), tile(y + height) + 1):
+                    tiles.setdefault((tile_x, tile_y), []).append(row)
+
+    def _node_hits(self, row: int, left: float, top: float, right: float, bottom: float) -> bool:
+        nodes = self.graph.nodes
+        return (self.x[row] <= right and self.x[row] + nodes.width[row] >= left
+                and self.y[row] <= bottom and self.y[row] + nodes.height[row] >= top)
+
+    def _tile_rect(self, key: Tuple[int, int]) -> Tuple[float, float, float, float]:
+        size = self.tile_size
+        return key[0] * size, key[1] * size, (key[0] + 1) * size, (key[1] + 1) * size
+
+    def _center(self, row: int) -> Tuple[float, float]:
+        nodes = self.graph.nodes
+        return self.x[row] + nodes.width[row] / 2, self.y[row] + nodes.height[row] / 2
+
+    def _index_edges(self) -> None:
+        edges, tiles = self.graph.edges, self.edge_tiles
+        size = self.tile_size
+        for row, (source, target) in enumerate(zip(edges.source, edges.target)):
+            if source < 0 or target < 0:
+                continue
+            (x0, y0), (x1, y1) = self._center(source), self._center(target)
+            span = abs(self._tile(x1) - self._tile(x0)) + abs(self._tile(y1) - self._tile(y0)) + 1
+            if span > MAX_EDGE_TILES:
+                self.long_edges.append(row)
+                continue
+            # Walk the grid cells crossed by the segment (supercover DDA)
+            steps = max(int(math.hypot(x1 - x0, y1 - y0) / (size / 2)), 1)
+            last = None
+            for step in range(steps + 1):
+                t = step / steps
+                key = (self._tile(x0 + (x1 - x0) * t), self._tile(y0 + (y1 - y0) * t))
+                if key != last:
+                    tiles.setdefault(key, []).append(row)
+                    if last is not None and key[0] != last[0] and key[1] != last[1]:
+                        # Diagonal step: also register the two corner cells it may clip
+                        tiles.setdefault((key[0], last[1]), []).append(row)
+                        tiles.setdefault((last[0], key[1]), []).append(row)
+                    last = key
+
+    def _tiles_in(self, left: float, top: float, right: float, bottom: float, tiles: Dict) -> List:
+        tile_left, tile_right = self._tile(left), self._tile(right)
+        tile_top, tile_bottom = self._tile(top), self._tile(bottom)
+        if (tile_right - tile_left + 1) * (tile_bottom - tile_top + 1) > len(tiles):
+            # Zoomed far out: scanning the occupied tiles is cheaper than the range
+            return [key for key in tiles
+                    if tile_left <= key[0] <= tile_right and tile_top <= key[1] <= tile_bottom]
+        return [(tile_x, tile_y)
+                for tile_x in range(tile_left, tile_right + 1)
+                for tile_y in range(tile_top, tile_bottom + 1)
+                if (tile_x, tile_y) in tiles]
+
+    def _segment_hits(self, row: int, left: float, top: float, right: float, bottom: float) -> bool:
+        edges = self.graph.edges
+        (x0, y0), (x1, y1) = self._center(edges.source[row]), self._center(edges.target[row])
+        # Liang-Barsky clipping of the straight segment against the rectangle
+        t0, t1 = 0.0, 1.0
+        dx, dy = x1 - x0, y1 - y0
+        for p, q in ((-dx, x0 - left), (dx, right - x0), (-dy, y0 - top), (dy, bottom - y0)):
+            if p == 0:
+                if q < 0:
+                    return False
+                continue
+            t = q / p
+            if p < 0:
+                t0 = max(t0, t)
+            else:
+                t1 = min(t1, t)
+            if t0 > t1:
+                return False
+        return True
+
+    def query(self, left: float, top: float, right: float, bottom: float) -> Tuple[List[int], List[int]]:
+        """Rows of nodes whose box and edges whose segment intersect the rectangle."""
+        node_rows = {row for row in self.large_nodes if self._node_hits(row, left, top, right, bottom)}
+        for key in self._tiles_in(left, top, right, bottom, self.node_tiles):
+            for row in self.node_tiles[key]:
+                if self._node_hits(row, left, top, right, bottom):
+                    node_rows.add(row)
+        candidates = set(self.long_edges)
+        for key in self._tiles_in(left, top, right, bottom, self.edge_tiles):
+            candidates.update(self.edge_tiles[key])
+        edge_rows = [row for row in candidates if self._segment_hits(row, left, top, right, bottom)]
+        return sorted(node_rows), sorted(edge_rows)
+
+    def query_tiles(self, keys: List[Tuple[int, int]]) -> Tuple[List[int], List[int]]:
+        """Rows registered in the given tiles."""
+        node_rows, edge_rows = set(), set()
+        for key in keys:
+            node_rows.update(self.node_tiles.get(key, ()))
+            edge_rows.update(self.edge_tiles.get(key, ()))
+            node_rows.update(row for row in self.large_nodes if self._node_hits(row, *self._tile_rect(key)))
+        return sorted(node_rows), sorted(edge_rows)
+
+    def tile_counts(self, left: float, top: float, right: float, bottom: float) -> Dict[str, int]:
+        """Node count per occupied tile overlapping the rectangle, keyed "tx,ty"."""
+        return {f"{key[0]},{key[1]}": len(self.node_tiles[key])
+                for key in sorted(self._tiles_in(left, top, right, bottom, self.node_tiles))}
+
+    def page(self, node_rows: List[int], edge_rows: List[int], page: int, page_size: int) -> Dict[str, Any]:
+        """One page of visible elements plus the off-screen anchors they depend on."""
+        graph = self.graph
+        pages = max(math.ceil(len(node_rows) / page_size), 1)
+        page_nodes = node_rows[page * page_size:(page + 1) * page_size]
+        selected = set(page_nodes)
+        # Edges ride along with the page holding their lower visible endpoint
+        visible = set(node_rows)
+        page_edges = []
+        for row in edge_rows:
+            ends = [end for end in (graph.edges.source[row], graph.edges.target[row]) if end in visible]
+            owner = min(ends) if ends else None
+            if (owner in selected) if owner is not None else page == 0:
+                page_edges.append(row)
+
+        anchors = set()
+        for row in page_edges:
+            anchors.add(graph.edges.source[row])
+            anchors.add(graph.edges.target[row])
+        pending = list(selected | anchors)
+        while pending:
+            parent = graph.nodes.parent[pending.pop()]
+            if parent >= 0 and parent not in anchors:
+                anchors.add(parent)
+                pending.append(parent)
+        anchors -= selected
+
+        return {
+            "visible_nodes": len(node_rows),
+            "visible_edges": len(edge_rows),
+            "page": page,
+            "pages": pages,
+            "next_page": page + 1 if page + 1 < pages else None,
+            "nodes": [node_document(graph, row) for row in page_nodes],
+            "edges": [edge_document(graph, row) for row in page_edges],
+            "anchor_nodes": [node_document(graph, row) for row in sorted(anchors)],
+        }
+
+
+# Minimap decimation
+def node_boxes(graph: FlowGraph) -> np.ndarray:
+    """(n, 4) array of absolute node boxes: left, top, right, bottom."""
+    x, y = graph.absolute_positions()
+    nodes = graph.nodes
+    boxes = np.empty((len(nodes), 4), dtype=np.float64)
+    boxes[:, 0] = np.frombuffer(x, dtype=np.float64)
+    boxes[:, 1] = np.frombuffer(y, dtype=np.float64)
+    boxes[:, 2] = boxes[:, 0] + np.frombuffer(nodes.width, dtype=np.float64)
+    boxes[:, 3] = boxes[:, 1] + np.frombuffer(nodes.height, dtype=np.float64)
+    return boxes
+
+
+def rasterize_density(boxes: np.ndarray, width: int, height: int) -> Tuple[np.ndarray, float, np.ndarray]:
+    """
+    Count how many node boxes cover each pixel of a width x height grid.
+
+    Boxes are scaled uniformly into the grid and every box covers at least
+    one pixel. Coverage is accumulated with a 2D difference array and two
+    cumulative sums, so the cost is O(nodes + pixels) whatever the overlap.
+    Returns (density, scale, offset) with pixel = (flow - offset) * scale.
+    """
+    density = np.zeros((height, width), dtype=np.int32)
+    if not len(boxes):
+        return density, 1.0, np.zeros(2)
+    offset = np.array([boxes[:, 0].min(), boxes[:, 1].min()])
+    extent = np.array([boxes[:, 2].max(), boxes[:, 3].max()]) - offset
+    scale = float(min(width / max(extent[0], 1e-9), height / max(extent[1], 1e-9)))
+
+    pixels = (boxes - np.tile(offset, 2)) * scale
+    left = np.clip(np.floor(pixels[:, 0]).astype(np.int64), 0, width - 1)
+    top = np.clip(np.floor(pixels[:, 1]).astype(np.int64), 0, height - 1)
+    right = np.clip(np.ceil(pixels[:, 2]).astype(np.int64), left + 1, width)
+    bottom = np.clip(np.ceil(pixels[:, 3]).astype(np.int64), top + 1, height)
+
+    diff = np.zeros((height + 1, width + 1), dtype=np.int32)
+    np.add.at(diff, (top, left), 1)
+    np.add.at(diff, (top, right), -1)
+    np.add.at(diff, (bottom, left), -1)
+    np.add.at(diff, (bottom, right), 1)
+    density = diff.cumsum(axis=0).cumsum(axis=1)[:height, :width]
+    return density, scale, offset
+
+
+def merge_rectangles(mask: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    """Cover a boolean mask with few rectangles: row runs, then identical runs merged downwards."""
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    steps = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(steps == 1)
+    _, run_ends = np.nonzero(steps == -1)
+
+    rectangles: List[List[int]] = []
+    open_runs: Dict[Tuple[int, int], int] = {}
+    for row, start, end in zip(run_rows.tolist(), run_starts.tolist(), run_ends.tolist()):
+        key = (start, end)
+        position = open_runs.get(key)
+        if position is not None and rectangles[position][1] + rectangles[position][3] == row:
+            rectangles[position][3] += 1
+        else:
+            open_runs[key] = len(rectangles)
+            rectangles.append([start, row, end - start, 1])
+    return [tuple(rectangle) for rectangle in rectangles]
+
+
+def decimate_flow(graph: FlowGraph, width: int, height: int, levels: int = 4,
+                  color: str = "#64748b") -> Dict[str, Any]:
+    """Density grid, per-level merged rectangles and a compact SVG for a flow."""
+    density, scale, offset = rasterize_density(node_boxes(graph), width, height)
+    max_density = int(density.max()) if density.size else 0
+
+    # Log-scaled shading so a few overlapping nodes stay visible next to dense clusters
+    level_grid = np.zeros(density.shape, dtype=np.int64)
+    if max_density:
+        level_grid = np.ceil(levels * np.log1p(density) / np.log1p(max_density)).astype(np.int64)
+
+    rectangles = []
+    paths = []
+    for level in range(1, levels + 1):
+        merged = merge_rectangles(level_grid == level)
+        if not merged:
+            continue
+        rectangles.extend({"x": x, "y": y, "width": w, "height": h, "level": level} for x, y, w, h in merged)
+        d = "".join(f"M{x} {y}h{w}v{h}h-{w}z" for x, y, w, h in merged)
+        paths.append(f'<path fill-opacity="{0.25 + 0.75 * level / levels:.2f}" d="{d}"/>')
+
+    svg = (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'viewBox="0 0 {width} {height}" shape-rendering="crispEdges"><g fill="{html.escape(color, quote=True)}">'
+           + "".join(paths) + "</g></svg>")
+
+    return {
+        "resolution": {"width": width, "height": height},
+        "transform": {"scale": scale, "offset": {"x": float(offset[0]), "y": float(offset[1])}},
+        "nodes": len(graph.nodes),
+        "max_density": max_density,
+        "rectangles": rectangles,
+        "density_grid": {
+            "shape": [height, width],
+            "dtype": "uint8",
+            "encoding": "base64",
+            "data": base64.b64encode(np.minimum(density, 255).astype(np.uint8).tobytes()).decode("ascii"),
+        },
+        "svg": svg,
+    }
+
+
+def write_svg(path: str, svg: str) -> None:
+    """Write a thumbnail, refusing other extensions and existing files that are not SVGs."""
+    resolved = os.path.abspath(os.path.expanduser(path))
+    if not resolved.lower().endswith(".svg"):
+        raise ValueError(f"svg_path must end in .svg: {path}")
+    if os.path.exists(resolved):
+        if not os.path.isfile(resolved):
+            raise ValueError(f"svg_path is not a file: {path}")
+        with open(resolved, "r", encoding="utf-8", errors="replace") as handle:
+            if "<svg" not in handle.read(4096):
+                raise ValueError(f"Refusing to overwrite {path}: it is not an SVG")
+    with open(resolved, "w", encoding="utf-8") as handle:
+        handle.write(svg)
+
+
+# Result caches: file-backed flows keep their index and minimaps between calls
+_INDEX_CACHE: "OrderedDict[Tuple, TileIndex]" = OrderedDict()
+_MINIMAP_CACHE: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+
+
+def file_cache_key(arguments: Dict[str, Any], params: Tuple) -> Optional[Tuple]:
+    """Cache key for a file-backed flow (path, mtime, size + params); None for inline flows."""
+    path = arguments.get("flow_path")
+    if not path:
+        return None
+    resolved = os.path.abspath(os.path.expanduser(str(path)))
+    try:
+        stat = os.stat(resolved)
+    except OSError as exc:
+        raise FlowLoadError(f"Flow file not found: {path}") from exc
+    return (resolved, stat.st_mtime_ns, stat.st_size) + params
+
+
+def _cache_put(cache: OrderedDict, key: Tuple, value: Any) -> None:
+    cache[key] = value
+    while len(cache) > INDEX_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def get_tile_index(arguments: Dict[str, Any], tile_size: float, include_data: bool) -> Tuple[TileIndex, bool]:
+    """Return the tile index for the flow in `arguments`, reusing cached file indexes."""
+    cache_key = file_cache_key(arguments, ("tiles", tile_size, include_data))
+    if cache_key is not None and cache_key in _INDEX_CACHE:
+        _INDEX_CACHE.move_to_end(cache_key)
+        return _INDEX_CACHE[cache_key], True
+
+    index = TileIndex(load_flow(arguments, keep_data=include_data), tile_size)
+    if cache_key is not None:
+        _cache_put(_INDEX_CACHE, cache_key, index)
+    return index, False
+
+
+# Tool execution handlers
+FLOW_VIEWPORT_HANDLERS = {
+    "react_flow_viewport_query": react_flow_viewport_query,
+    "react_flow_minimap_generator": react_flow_minimap_generator
+}
+
+
+async def handle_call(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle flow viewport tool calls."""
+    if name in FLOW_VIEWPORT_HANDLERS:
+        return FLOW_VIEWPORT_HANDLERS[name](arguments)
+
+    return [types.TextContent(
+        type="text",
+        text=f"Tool {name} not found in flow viewport tools"
+    )]
@@ -0,0 +1,175 @@
+"""
+Performance Trace Tools - measured findings from Chrome DevTools performance
+traces recorded while panning and zooming a React Flow canvas, to back the
+monitoring advice in react_flow_performance_mastery with numbers.
+"""
+
+from typing import Any, Dict, List
+
+from mcp import types
+
+from .flow_loader import FlowLoadError, open_json_source
+from .trace_analysis import DEFAULT_TOP_N, LONG_TASK_MS, analyze_trace
+
+TARGET_FPS = 60.0
+
+
+def get_tools() -> List[types.Tool]:
+    """Get performance trace tools."""
+    return [
+        types.Tool(
+            name="react_flow_trace_analyzer",
+            description="Stream a Chrome DevTools performance trace and report long tasks, forced reflows, GC pauses, React commit phases and frame drops during pan/zoom input",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "trace": {
+                        "type": ["object", "array", "string"],
+                        "description": "Trace Event Format JSON (small traces only; use trace_path for recordings)"
+                    },
+                    "trace_path": {
+                        "type": "string",
+                        "description": "Local path of a trace saved from the Performance panel, streamed event by event"
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "description": "Entries listed per ranking",
+                        "default": DEFAULT_TOP_N
+                    }
+                },
+                "required": []
+            }
+        )
+    ]
+
+
+def trace_findings(analysis: Dict[str, Any]) -> List[str]:
+    """React Flow specific recommendations triggered by the measured numbers."""
+    findings = []
+    frames = analysis["frames"]
+    if frames["interaction_seconds"] and frames["interaction_fps"] < TARGET_FPS * 0.9:
+        findings.append(
+            f"Pan/zoom ran at {frames['interaction_fps']:.0f} fps with {frames['interaction_dropped']} dropped frames - "
+            "enable onlyRenderVisibleElements and keep custom nodes memoized so viewport changes do not re-render them"
+        )
+    forced = analysis["forced"]
+    if forced["layout"]["count"] or forced["style recalc"]["count"]:
+        site = analysis["forced_call_sites"][0]["site"] if analysis["forced_call_sites"] else "unknown"
+        findings.append(
+            f"{forced['layout']['count'] + forced['style recalc']['count']} forced reflows "
+            f"({forced['layout']['total_ms'] + forced['style recalc']['total_ms']:.1f} ms), most costly at `{site}` - "
+            "batch DOM reads before writes and pass node width/height so React Flow does not re-measure"
+        )
+    for thread in analysis["main_threads"][:1]:
+        if thread["long_tasks"]["count"]:
+            findings.append(
+                f"{thread['long_tasks']['count']} long tasks on the main thread ({thread['blocking_ms']:.0f} ms blocking) - "
+                "move layout to a Web Worker or react_flow_server_layout and debounce onNodesChange handlers"
+            )
+    gc = analysis["gc"]
+    if gc["major"]["count"] and gc["major"]["max_ms"] > 10:
+        findings.append(
+            f"Major GC pauses up to {gc['major']['max_ms']:.1f} ms - avoid recreating node/edge arrays and style "
+            "objects on every render"
+        )
+    commit = analysis["react_phases"].get("commit")
+    if commit and commit["max_ms"] > 1000 / TARGET_FPS:
+        findings.append(
+            f"React commits up to {commit['max_ms']:.1f} ms exceed a frame - profile with react_flow_devtools_mastery "
+            "to find the components re-rendering"
+        )
+    return findings
+
+
+def format_trace_analysis(analysis: Dict[str, Any]) -> str:
+    """Render trace aggregates as markdown."""
+    def stats_row(label, stats):
+        return f"| {label} | {stats['count']} | {stats['total_ms']:.1f} | {stats['mean_ms']:.2f} | {stats['max_ms']:.1f} |"
+
+    threads = "\n".join(
+        f"| {thread['thread']} | {thread['tasks']} | {thread['busy_ms']:.0f} | {thread['long_tasks']['count']} "
+        f"| {thread['blocking_ms']:.0f} | {thread['long_tasks']['max_ms']:.1f} |"
+        for thread in analysis["main_threads"]
+    ) or "| (no task events) | | | | | |"
+    longest = ", ".join(
+        f"{task['ms']:.0f} ms at {task['at_ms']:.0f} ms" for task in analysis["main_threads"][0]["longest"]
+    ) if analysis["main_threads"] else ""
+    sites = "\n".join(f"| `{site['site']}` | {site['count']} | {site['ms']:.1f} |" for site in analysis["forced_call_sites"])
+    gc_longest = ", ".join(f"{pause['ms']:.1f} ms {pause['kind']} at {pause['at_ms']:.0f} ms" for pause in analysis["gc_longest"])
+    react_rows = [stats_row(phase, stats) for phase, stats in analysis["react_phases"].items()]
+    react_rows += [stats_row(name, stats) for name, stats in analysis["react_measures"].items()]
+    frames = analysis["frames"]
+    findings = trace_findings(analysis)
+
+    return f"""# React Flow Trace Analysis
+
+- **Events**: {analysis['events']:,} over {analysis['duration_ms'] / 1000:.1f} s
+
+## Main Thread Tasks (long = over {LONG_TASK_MS:.0f} ms)
+| Thread | Tasks | Busy (ms) | Long tasks | Blocking (ms) | Longest (ms) |
+|---|---:|---:|---:|---:|---:|
+{threads}
+
+{f"Longest tasks: {longest}" if longest else "No long tasks."}
+
+## Layout and Style
+| Kind | Count | Total (ms) | Mean (ms) | Max (ms) |
+|---|---:|---:|---:|---:|
+{stats_row("layout", analysis["layouts"]["layout"])}
+{stats_row("forced layout (reflow)", analysis["forced"]["layout"])}
+{stats_row("style recalc", analysis["layouts"]["style recalc"])}
+{stats_row("forced style recalc", analysis["forced"]["style recalc"])}
+
+{f'''### Forced Reflow Call Sites
+| Call site | Count | Total (ms) |
+|---|---:|---:|
+{sites}''' if sites else "No forced reflows."}
+
+## Garbage Collection
+| Kind | Count | Total (ms) | Mean (ms) | Max (ms) |
+|---|---:|---:|---:|---:|
+{stats_row("major GC", analysis["gc"]["major"])}
+{stats_row("minor GC", analysis["gc"]["minor"])}
+
+{f"Longest pauses: {gc_longest}" if gc_longest else "No GC pauses recorded."}
+
+## React Commit Phases
+{f'''| Phase | Count | Total (ms) | Mean (ms) | Max (ms) |
+|---|---:|---:|---:|---:|
+{chr(10).join(react_rows)}''' if react_rows else "No React scheduling marks or ⚛ measures (record with a React profiling build)."}
+
+## Frames During Pan/Zoom
+- **Frames presented / dropped (whole trace)**: {frames['presented']} / {frames['dropped']}
+- **Input**: {frames['zoom_inputs']} wheel (zoom) and {frames['pan_inputs']} pointer-move (pan/drag) events over {frames['interaction_seconds']:.1f} s
+- **During that input**: {frames['interaction_presented']} presented, {frames['interaction_dropped']} dropped, {frames['interaction_fps']:.0f} fps
+
+## Findings
+{chr(10).join(f"- {finding}" for finding in findings) if findings else "- Nothing above the thresholds - pan and zoom stay within the frame budget."}
+"""
+
+
+def react_flow_trace_analyzer(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Analyze a Chrome performance trace."""
+    try:
+        with open_json_source(arguments, "trace") as stream:
+            analysis = analyze_trace(stream, int(arguments.get("top_n", DEFAULT_TOP_N)))
+    except (FlowLoadError, ValueError, KeyError, TypeError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+    return [types.TextContent(type="text", text=format_trace_analysis(analysis))]
+
+
+# Tool execution handlers
+PERFORMANCE_TRACE_HANDLERS = {
+    "react_flow_trace_analyzer": react_flow_trace_analyzer
+}
+
+
+async def handle_call(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle performance trace tool calls."""
+    if name in PERFORMANCE_TRACE_HANDLERS:
+        return PERFORMANCE_TRACE_HANDLERS[name](arguments)
+
+    return [types.TextContent(
+        type="text",
+        text=f"Tool {name} not found in performance trace tools"
+    )]
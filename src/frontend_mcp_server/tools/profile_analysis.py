@@ -0,0 +1,287 @@
+"""
+Streaming analysis of React DevTools Profiler exports.
+
+A profile saved from the DevTools Profiler tab ("Save profile...") holds one
+entry per React root with every commit's per-fiber durations and change
+descriptions. Long sessions produce exports of hundreds of MB, so the file is
+read with flow_loader's event parser, one commit at a time, and only
+per-fiber aggregates are kept. Fiber display names arrive after the commits
+(in `snapshots` and the encoded `operations`), so they are resolved at the
+end.
+"""
+
+import heapq
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from .flow_loader import DEFAULT_CHUNK_SIZE, FlowLoadError, JsonEventParser
+
+DEFAULT_TOP_N = 10
+
+# React DevTools tree operation codes (react-devtools-shared/src/constants.js)
+TREE_OPERATION_ADD = 1
+TREE_OPERATION_REMOVE = 2
+TREE_OPERATION_REORDER_CHILDREN = 3
+TREE_OPERATION_UPDATE_TREE_BASE_DURATION = 4
+TREE_OPERATION_UPDATE_ERRORS_OR_WARNINGS = 5
+TREE_OPERATION_REMOVE_ROOT = 6
+TREE_OPERATION_SET_SUBTREE_MODE = 7
+ELEMENT_TYPE_ROOT = 11
+
+
+class FiberStats:
+    """Aggregates for one fiber across every commit it rendered in."""
+
+    __slots__ = ("renders", "total_ms", "self_ms", "max_self_ms", "causes", "commit_runs")
+
+    def __init__(self) -> None:
+        self.renders = 0
+        self.total_ms = 0.0
+        self.self_ms = 0.0
+        self.max_self_ms = 0.0
+        self.causes: Dict[str, int] = {}
+        # Commits rendered in, as flat (first, last) pairs of consecutive commit
+        # runs: a fiber rendering in every commit costs two integers in total
+        self.commit_runs = array("l")
+
+    def add_commit(self, commit: int) -> None:
+        runs = self.commit_runs
+        if runs and runs[-1] == commit - 1:
+            runs[-1] = commit
+        elif not runs or runs[-1] != commit:
+            runs.extend((commit, commit))
+
+    def runs(self) -> Iterator[Tuple[int, int]]:
+        runs = self.commit_runs
+        return zip(runs[::2], runs[1::2])
+
+
+def render_causes(description: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    "Why did this render?" causes from a DevTools change description.
+
+    A render without a mount, prop, state, hook or context change was caused
+    by its parent re-rendering.
+    """
+    if not description:
+        return ["unknown"]
+    if description.get("isFirstMount"):
+        return ["mount"]
+    causes = [f"props.{name}" for name in description.get("props") or []]
+    if description.get("state"):
+        causes.append("state")
+    if description.get("didHooksChange"):
+        hooks = description.get("hooks")
+        causes.append(f"hooks {', '.join(f'#{hook}' for hook in hooks)}" if hooks else "hooks")
+    if description.get("context"):
+        context = description["context"]
+        causes.append(f"context ({', '.join(map(str, context))})" if isinstance(context, list) else "context")
+    return causes or ["parent rendered"]
+
+
+def decode_operation_names(operations: List[int], root_add_length: int = 7) -> Dict[int, str]:
+    """
+    Display names of the fibers added by one encoded `operations` array.
+
+    Layout: [rendererID, rootID, stringTableSize, ...strings, ...ops], every
+    string stored as its length followed by its char codes. Decoding stops
+    at an unknown operation, leaving the remaining fibers unnamed.
+    """
+    names: Dict[int, str] = {}
+    if len(operations) < 3:
+        return names
+    strings: List[Optional[str]] = [None]
+    index = 3
+    end = 3 + operations[2]
+    while index < end:
+        length = operations[index]
+        strings.append("".join(map(chr, operations[index + 1:index + 1 + length])))
+        index += 1 + length
+
+    count = len(operations)
+    while index < count:
+        op = operations[index]
+        if op == TREE_OPERATION_ADD:
+            if index + 2 >= count:
+                break
+            fiber, element_type = operations[index + 1], operations[index + 2]
+            if element_type == ELEMENT_TYPE_ROOT:
+                index += root_add_length
+                continue
+            if index + 6 >= count:
+                break
+            name_id = operations[index + 5]
+            if 0 < name_id < len(strings) and strings[name_id]:
+                names[fiber] = strings[name_id]
+            index += 7
+        elif op == TREE_OPERATION_REMOVE:
+            index += 2 + operations[index + 1]
+        elif op == TREE_OPERATION_REORDER_CHILDREN:
+            index += 3 + operations[index + 2]
+        elif op in (TREE_OPERATION_UPDATE_TREE_BASE_DURATION, TREE_OPERATION_SET_SUBTREE_MODE):
+            index += 3
+        elif op == TREE_OPERATION_UPDATE_ERRORS_OR_WARNINGS:
+            index += 4
+        elif op == TREE_OPERATION_REMOVE_ROOT:
+            index += 1
+        else:
+            break
+    return names
+
+
+class ProfilerExportAnalyzer:
+    """Consumes a Profiler export stream and aggregates per fiber and per commit."""
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N):
+        self.top_n = max(int(top_n), 1)
+        self.version: Optional[int] = None
+        self.fibers: Dict[Tuple[int, int], FiberStats] = {}  # (root index, fiber id)
+        self.names: Dict[Tuple[int, int], str] = {}
+        self.roots: List[str] = []
+        self.commits = 0
+        self.commit_ms = 0.0
+        self.slowest: List[Tuple[float, int, int, float, List[Tuple[float, int]]]] = []  # min-heap
+
+    # Streaming
+    def consume(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> "ProfilerExportAnalyzer":
+        parser = JsonEventParser(stream, chunk_size)
+        depth = 0
+        section = None  # top-level key being read
+        root = -1
+        for event, value in parser.events():
+            if depth == 0 and event != "start_map":
+                raise FlowLoadError("Profiler export must be a JSON object with `dataForRoots`")
+            if event == "map_key":
+                if depth == 1:
+                    section = value
+                    if value == "version":
+                        self.version = parser.read_value()
+                elif depth == 3 and section == "dataForRoots":
+                    self._read_root_key(parser, root, value)
+            elif event in ("start_map", "start_array"):
+                depth += 1
+                if event == "start_map" and depth == 3 and section == "dataForRoots":
+                    root += 1
+                    self.roots.append(f"Root {root + 1}")
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+        if self.version is None and not self.roots:
+            raise FlowLoadError("Not a React DevTools Profiler export (no `version` or `dataForRoots`)")
+        return self
+
+    def _read_root_key(self, parser: JsonEventParser, root: int, key: str) -> None:
+        """Take over the value of one key of a `dataForRoots` entry."""
+        if key == "commitData" and parser.begin_array():
+            for commit in parser.iter_array_items():
+                self._add_commit(root, commit)
+        elif key == "snapshots" and parser.begin_array():
+            for fiber, node in parser.iter_array_items():
+                if node.get("displayName"):
+                    self.names[(root, fiber)] = node["displayName"]
+        elif key == "operations" and parser.begin_array():
+            root_add_length = 5 if (self.version or 5) < 5 else 7
+            for operations in parser.iter_array_items():
+                for fiber, name in decode_operation_names(operations, root_add_length).items():
+                    self.names.setdefault((root, fiber), name)
+        elif key == "displayName":
+            self.roots[root] = str(parser.read_value())
+
+    def _add_commit(self, root: int, commit: Dict[str, Any]) -> None:
+        index = self.commits
+        self.commits += 1
+        duration = float(commit.get("duration") or 0.0)
+        self.commit_ms += duration
+
+        self_durations = dict(commit.get("fiberSelfDurations") or [])
+        recorded = commit.get("changeDescriptions") is not None  # "Record why each component rendered"
+        descriptions = dict(commit.get("changeDescriptions") or [])
+        heaviest: List[Tuple[float, int]] = []
+        for fiber, actual in commit.get("fiberActualDurations") or []:
+            stats = self.fibers.get((root, fiber))
+            if stats is None:
+                stats = self.fibers[(root, fiber)] = FiberStats()
+            own = float(self_durations.get(fiber, 0.0))
+            stats.renders += 1
+            stats.total_ms += float(actual)
+            stats.self_ms += own
+            stats.max_self_ms = max(stats.max_self_ms, own)
+            stats.add_commit(index)
+            if recorded:
+                for cause in render_causes(descriptions.get(fiber)):
+                    stats.causes[cause] = stats.causes.get(cause, 0) + 1
+            heaviest.append((own, fiber))
+
+        entry = (duration, index, root, float(commit.get("timestamp") or 0.0), heapq.nlargest(3, heaviest))
+        if len(self.slowest) < self.top_n:
+            heapq.heappush(self.slowest, entry)
+        elif entry[:2] > self.slowest[0][:2]:
+            heapq.heapreplace(self.slowest, entry)
+
+    # Results
+    def name(self, root: int, fiber: int) -> str:
+        return self.names.get((root, fiber), f"Anonymous #{fiber}")
+
+    def components(self) -> List[Dict[str, Any]]:
+        """Per-component aggregates (fibers grouped by display name), heaviest self time first."""
+        grouped: Dict[str, Dict[str, Any]] = {}
+        for (root, fiber), stats in self.fibers.items():
+            name = self.name(root, fiber)
+            entry = grouped.get(name)
+            if entry is None:
+                entry = grouped[name] = {"component": name, "instances": 0, "renders": 0, "total_ms": 0.0,
+                                         "self_ms": 0.0, "max_self_ms": 0.0, "causes": {}, "fibers": []}
+            entry["instances"] += 1
+            entry["renders"] += stats.renders
+            entry["total_ms"] += stats.total_ms
+            entry["self_ms"] += stats.self_ms
+            entry["max_self_ms"] = max(entry["max_self_ms"], stats.max_self_ms)
+            for cause, count in stats.causes.items():
+                entry["causes"][cause] = entry["causes"].get(cause, 0) + count
+            entry["fibers"].append(stats)
+
+        results = []
+        for entry in grouped.values():
+            entry["commits"] = self._commits_covered(entry.pop("fibers"))
+            entry["causes"] = dict(sorted(entry["causes"].items(), key=lambda item: (-item[1], item[0])))
+            results.append(entry)
+        results.sort(key=lambda entry: (-entry["self_ms"], entry["component"]))
+        return results
+
+    def _commits_covered(self, fibers: List[FiberStats]) -> int:
+        """Distinct commits in which any of the fibers rendered."""
+        if len(fibers) == 1:
+            return fibers[0].renders
+        rendered = bytearray(self.commits)
+        for stats in fibers:
+            for first, last in stats.runs():
+                rendered[first:last + 1] = b"\x01" * (last - first + 1)
+        return rendered.count(1)
+
+    def slowest_commits(self) -> List[Dict[str, Any]]:
+        return [
+            {"commit": index, "root": self.roots[root] if 0 <= root < len(self.roots) else "", "duration_ms": duration,
+             "timestamp_ms": timestamp,
+             "heaviest": [{"component": self.name(root, fiber), "self_ms": own} for own, fiber in heaviest]}
+            for duration, index, root, timestamp, heaviest in sorted(self.slowest, reverse=True)
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        components = self.components()
+        return {
+            "version": self.version,
+            "roots": list(self.roots),
+            "commits": self.commits,
+            "commit_ms": self.commit_ms,
+            "fibers": len(self.fibers),
+            "components": components,
+            "top_components": components[:self.top_n],
+            "top_rerendered": sorted(components, key=lambda entry: (-entry["commits"], entry["component"]))[:self.top_n],
+            "slowest_commits": self.slowest_commits(),
+        }
+
+
+def analyze_profiler_export(stream: TextIO, top_n: int = DEFAULT_TOP_N,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """Aggregate a React DevTools Profiler export read from a text stream."""
+    return ProfilerExportAnalyzer(top_n).consume(stream, chunk_size).summary()
+
@@ -5,6 +5,9 @@ Provides comprehensive tutorials, patterns, and expert guidance
 import json
 from typing import List, Dict, Any
 
+from .flow_loader import FlowLoadError, open_json_source
+from .profile_analysis import DEFAULT_TOP_N, analyze_profiler_export
+
 # LAYOUTING MASTERY TOOLS
 def react_flow_layouting_expert(requirement: str = "dagre", use_case: str = "hierarchical tree") -> Dict[str, Any]:
     """
@@ -371,6 +374,7 @@ const LazyNodeTree = ({ nodeId, depth = 0 }) => {
         "performance_monitoring": {
             "react_devtools": "Use React DevTools Profiler to identify re-renders",
             "browser_devtools": "Monitor FPS and memory usage in Performance tab",
+            "trace_analysis": "Save the Performance recording and run react_flow_trace_analyzer on it for long tasks, forced reflows, GC pauses and pan/zoom frame drops",
             "custom_metrics": "Track node/edge update frequency"
         },
         "external_resources": [
@@ -930,7 +934,8 @@ useEffect(() => {
         "react_devtools": "Profile component re-renders and state changes",
         "browser_devtools": "Monitor network, performance, and console errors",
         "react_flow_devtools": "Official React Flow debugging extension",
-        "console_logging": "Add strategic console.log statements for data flow"
+        "console_logging": "Add strategic console.log statements for data flow",
+        "react_flow_graph_validator": "Run on an exported flow to find duplicate ids, dangling edges/handles, cycles and orphaned children"
     }
     
     return {
@@ -1814,6 +1819,19 @@ def get_tools():
                         "type": "string",
                         "description": "Specific type of issue to debug",
                         "default": "re_renders"
+                    },
+                    "profile": {
+                        "type": ["object", "string"],
+                        "description": "React DevTools Profiler export (\"Save profile\") to analyze; prefer profile_path for long sessions"
+                    },
+                    "profile_path": {
+                        "type": "string",
+                        "description": "Local path of a Profiler export JSON, streamed commit by commit"
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "description": "Number of components and commits listed per ranking",
+                        "default": DEFAULT_TOP_N
                     }
                 },
                 "required": []
@@ -2063,6 +2081,77 @@ Based on official React Flow accessibility guide: https://reactflow.dev/learn/ad
 """
     }]
 
+# Render causes from the Profiler and the fix each one usually calls for
+RENDER_CAUSE_FIXES = {
+    "parent rendered": "Wrap the component in React.memo so it skips renders its parent triggers",
+    "props.": "Keep prop identities stable with useMemo/useCallback (or memoize node data)",
+    "hooks": "A hook's state changed - select narrower slices from useStore/useNodes",
+    "context": "Split the context or move fast-changing values out of it",
+    "state": "Local state changed - batch updates or move the state down the tree",
+    "mount": "Component mounted - check for keys that change between renders",
+}
+
+
+def format_profile_analysis(analysis: Dict[str, Any]) -> str:
+    """Render Profiler export aggregates as markdown."""
+    def causes(entry):
+        renders = entry["renders"]
+        return ", ".join(f"{cause} ({count / renders:.0%})" for cause, count in list(entry["causes"].items())[:3]) or "not recorded"
+
+    top = "\n".join(
+        f"| {entry['component']} | {entry['instances']} | {entry['commits']} | {entry['renders']} "
+        f"| {entry['self_ms']:.1f} | {entry['total_ms']:.1f} | {entry['max_self_ms']:.1f} | {causes(entry)} |"
+        for entry in analysis["top_components"]
+    )
+    rerendered = "\n".join(
+        f"| {entry['component']} | {entry['commits']} | {entry['renders']} | {causes(entry)} |"
+        for entry in analysis["top_rerendered"]
+    )
+    def heaviest(commit):
+        return ", ".join(f"{item['component']} ({item['self_ms']:.1f} ms)" for item in commit["heaviest"])
+
+    slowest = "\n".join(
+        f"| {commit['commit']} | {commit['root']} | {commit['duration_ms']:.1f} | {commit['timestamp_ms']:.0f} "
+        f"| {heaviest(commit)} |"
+        for commit in analysis["slowest_commits"]
+    )
+    fixes = []
+    for entry in analysis["top_components"][:3]:
+        if not entry["causes"]:
+            continue
+        cause = next(iter(entry["causes"]))
+        for prefix, fix in RENDER_CAUSE_FIXES.items():
+            if cause.startswith(prefix):
+                fixes.append(f"- **{entry['component']}** ({cause}): {fix}")
+                break
+
+    fixes_text = "\n".join(fixes) if fixes else \
+        "- No dominant render cause (enable \"Record why each component rendered\" in the Profiler settings)"
+
+    return f"""## Profiler Export Analysis
+- **Commits**: {analysis['commits']} across {len(analysis['roots'])} root(s), {analysis['commit_ms']:.1f} ms committing
+- **Fibers profiled**: {analysis['fibers']} ({len(analysis['components'])} components)
+
+### Top Components by Self Render Time
+| Component | Instances | Commits | Renders | Self (ms) | Total (ms) | Max self (ms) | Why it rendered |
+|---|---:|---:|---:|---:|---:|---:|---|
+{top}
+
+### Most Re-rendered Components
+| Component | Commits | Renders | Why it rendered |
+|---|---:|---:|---|
+{rerendered}
+
+### Slowest Commits
+| Commit | Root | Duration (ms) | At (ms) | Heaviest components |
+|---|---|---:|---:|---|
+{slowest}
+
+### Suggested Fixes
+{fixes_text}
+"""
+
+
 def handle_react_flow_devtools_mastery(arguments: dict):
     """Handle devtools mastery tool call"""
     result = react_flow_devtools_mastery(
@@ -2071,6 +2160,15 @@ def handle_react_flow_devtools_mastery(arguments: dict):
     )
     
     strategy = result['debugging_strategy']
+
+    analysis_text = ""
+    if arguments.get("profile") is not None or arguments.get("profile_path"):
+        try:
+            with open_json_source(arguments, "profile") as stream:
+                analysis = analyze_profiler_export(stream, int(arguments.get("top_n", DEFAULT_TOP_N)))
+        except (FlowLoadError, ValueError, KeyError, TypeError) as e:
+            return [{"type": "text", "text": f"Error: {str(e)}"}]
+        analysis_text = "\n" + format_profile_analysis(analysis)
     
     return [{
         "type": "text",
@@ -2078,6 +2176,7 @@ def handle_react_flow_devtools_mastery(arguments: dict):
 
 ## Debugging Scenario: {result['debugging_scenario'].replace('_', ' ').title()}
 **Issue Type**: {result['issue_type']}
+{analysis_text}
 
 ### Implementation Examples
 
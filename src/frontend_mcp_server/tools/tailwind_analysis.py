@@ -0,0 +1,225 @@
+"""
+Single-pass Tailwind class extraction and usage statistics.
+
+One compiled pattern walks the markup once and yields every static class
+list - `class="..."`, `className="..."`, `className={'...'}` and
+`className={`...`}` (with `${...}` expressions blanked) - plus the string
+literals inside Vue `:class` bindings and `clsx(...)`/`cn(...)`-style calls,
+so extraction is linear in the input. Classes are interned to integer ids as they are seen;
+elements are kept as a flat id array plus offsets, which is all the
+frequency, variant, co-occurrence and itemset statistics need.
+"""
+
+import re
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .tailwind_catalog import CATALOG, split_variants
+
+CLASS_HELPERS = ("clsx", "cn", "cx", "classnames", "classNames", "twMerge", "twJoin")
+CLASS_ATTRIBUTE = re.compile(
+    r"""(?<![\w-])(?:(:|v-bind:)?(?:class|className)\s*=\s*"""
+    r"""(?:"([^"]*)"|'([^']*)'|\{\s*(?:"([^"]*)"|'([^']*)'|`([^`]*)`)\s*\})"""
+    r"""|(?:""" + "|".join(CLASS_HELPERS) + r""")\s*\()"""
+)
+_STRING_TOKEN = re.compile(r""""((?:[^"\\\n]|\\.)*)"|'((?:[^'\\\n]|\\.)*)'|`([^`]*)`|([()])""")
+_TEMPLATE_EXPRESSION = re.compile(r"\$\{[^}]*\}")
+CALL_SPAN = 4096  # characters searched for the closing parenthesis of a clsx/cn call
+RESPONSIVE_VARIANTS = ("sm", "md", "lg", "xl", "2xl")
+DEFAULT_TOP_N = 10
+DEFAULT_COOCCURRENCE_CLASSES = 64  # most frequent classes considered for pair counts
+
+
+def _string_literals(text: str, start: int = 0, end: Optional[int] = None, call: bool = False) -> str:
+    """Space-joined string literals in text[start:end]; a `call` stops at its closing parenthesis."""
+    literals, depth = [], 1
+    for token in _STRING_TOKEN.finditer(text, start, len(text) if end is None else end):
+        paren = token.group(4)
+        if paren:
+            if not call:
+                continue
+            depth += 1 if paren == "(" else -1
+            if not depth:
+                break
+        elif token.group(3) is not None:
+            literals.append(_TEMPLATE_EXPRESSION.sub(" ", token.group(3)))
+        else:
+            literals.append(token.group(1) if token.group(1) is not None else token.group(2))
+    return " ".join(literals)
+
+
+def extract_class_lists(text: str) -> Iterator[Tuple[int, str]]:
+    """(offset, class string) for every static class attribute, class binding and class helper call."""
+    for match in CLASS_ATTRIBUTE.finditer(text):
+        if match.group(1):  # Vue binding: an expression whose string literals are the classes
+            value = _string_literals(match.group(2) or match.group(3) or "")
+        elif match.lastindex is None:  # clsx(...) / cn(...)
+            value = _string_literals(text, match.end(), match.end() + CALL_SPAN, call=True)
+        else:
+            value = match.group(2) or match.group(3) or match.group(4) or match.group(5)
+            if value is None:
+                value = _TEMPLATE_EXPRESSION.sub(" ", match.group(6) or "")
+        yield match.start(), value
+
+
+def class_lists_with_lines(text: str) -> Iterator[Tuple[int, str]]:
+    """(line, class string) for every class list in the text."""
+    line, position = 1, 0
+    for offset, value in extract_class_lists(text):
+        line += text.count("\n", position, offset)
+        position = offset
+        yield line, value
+
+
+class ClassUsage:
+    """Interned class usage across elements; element i holds element_ids[offsets[i]:offsets[i + 1]]."""
+
+    __slots__ = ("names", "ids", "element_ids", "offsets", "element_sources", "element_lines", "sources",
+                 "repeated", "_parsed")
+
+    def __init__(self):
+        self.names: List[str] = []  # id -> class as written
+        self.ids: Dict[str, int] = {}
+        self.element_ids = array("q")
+        self.offsets = array("q", [0])
+        self.element_sources = array("q")  # element -> index into sources
+        self.element_lines = array("q")
+        self.sources: List[str] = []
+        self.repeated: List[Tuple[int, str]] = []  # (element, class) written twice on one element
+        self._parsed: Dict[str, Tuple[Tuple[int, ...], Tuple[str, ...]]] = {}  # class string -> (ids, repeats)
+
+    def intern(self, name: str) -> int:
+        class_id = self.ids.get(name)
+        if class_id is None:
+            class_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return class_id
+
+    def _parse(self, value: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """Distinct class ids of a class string in order, plus the classes it repeats."""
+        ids: Dict[int, None] = {}
+        repeats = []
+        for name in value.split():
+            class_id = self.intern(name)
+            if class_id in ids:
+                repeats.append(name)
+            ids[class_id] = None
+        parsed = self._parsed[value] = (tuple(ids), tuple(repeats))
+        return parsed
+
+    def add_element(self, value: str, source: int, line: int) -> bool:
+        """Record one element's class string (identical strings are parsed once); False if it is empty."""
+        ids, repeats = self._parsed.get(value) or self._parse(value)
+        if not ids:
+            return False
+        for name in repeats:
+            self.repeated.append((len(self.offsets) - 1, name))
+        self.element_ids.extend(ids)
+        self.offsets.append(len(self.element_ids))
+        self.element_sources.append(source)
+        self.element_lines.append(line)
+        return True
+
+    def add_lists(self, lists: Iterable[Tuple[int, str]], source: str = "<input>") -> int:
+        """Record (line, class string) pairs from one source; returns the number of elements added."""
+        source_index = len(self.sources)
+        self.sources.append(source)
+        return sum(self.add_element(value, source_index, line) for line, value in lists)
+
+    def add_text(self, text: str, source: str = "<input>") -> int:
+        """Extract every class list from markup; returns the number of elements added."""
+        return self.add_lists(class_lists_with_lines(text), source)
+
+    def counts(self) -> np.ndarray:
+        """Class id -> number of elements using it."""
+        return np.bincount(np.frombuffer(self.element_ids, dtype=np.int64), minlength=len(self.names))
+
+    @property
+    def elements(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def total(self) -> int:
+        return len(self.element_ids)
+
+    def element(self, index: int) -> List[str]:
+        return [self.names[class_id] for class_id in self.element_ids[self.offsets[index]:self.offsets[index + 1]]]
+
+    def location(self, index: int) -> str:
+        return f"{self.sources[self.element_sources[index]]}:{self.element_lines[index]}"
+
+    def first_location(self, name: str) -> Optional[str]:
+        """`source:line` of the first element using a class."""
+        class_id = self.ids.get(name)
+        if class_id is None:
+            return None
+        position = int(np.argmax(np.frombuffer(self.element_ids, dtype=np.int64) == class_id))
+        element = int(np.searchsorted(np.frombuffer(self.offsets, dtype=np.int64), position, side="right")) - 1
+        return self.location(element)
+
+    def frequencies(self) -> Counter:
+        return Counter(dict(zip(self.names, self.counts().tolist())))
+
+    def variant_breakdown(self) -> Dict[str, Tuple[int, int]]:
+        """Variant chain (`md`, `hover`, `md:hover`, `(none)`) -> (occurrences, distinct classes)."""
+        occurrences: Counter = Counter()
+        distinct: Counter = Counter()
+        for name, count in zip(self.names, self.counts().tolist()):
+            variants, _ = split_variants(name)
+            chain = ":".join(variants) or "(none)"
+            occurrences[chain] += count
+            distinct[chain] += 1
+        return {chain: (count, distinct[chain]) for chain, count in occurrences.most_common()}
+
+    def files_per_class(self) -> np.ndarray:
+        """Class id -> number of distinct sources using it."""
+        ids = np.frombuffer(self.element_ids, dtype=np.int64)
+        rows = np.repeat(np.arange(self.elements), np.diff(np.frombuffer(self.offsets, dtype=np.int64)))
+        sources = np.frombuffer(self.element_sources, dtype=np.int64)
+        pairs = np.unique(ids * max(len(self.sources), 1) + sources[rows].astype(np.int64))
+        return np.bincount(pairs // max(len(self.sources), 1), minlength=len(self.names))
+
+    def unknown_classes(self) -> List[Tuple[str, int]]:
+        """Classes the default theme does not produce (custom classes, typos, arbitrary values), by count."""
+        counts = self.counts().tolist()
+        unknown = [(name, count) for name, count in zip(self.names, counts) if not CATALOG.describe(name)]
+        return sorted(unknown, key=lambda item: -item[1])
+
+    def membership(self, class_ids: List[int]) -> np.ndarray:
+        """Element x class bool matrix restricted to `class_ids` (columns in that order)."""
+        column = np.full(len(self.names), -1, dtype=np.int64)
+        column[class_ids] = np.arange(len(class_ids))
+        ids = np.frombuffer(self.element_ids, dtype=np.int64)
+        rows = np.repeat(np.arange(self.elements), np.diff(np.frombuffer(self.offsets, dtype=np.int64)))
+        keep = column[ids] >= 0
+        matrix = np.zeros((self.elements, len(class_ids)), dtype=bool)
+        matrix[rows[keep], column[ids[keep]]] = True
+        return matrix
+
+    def incidence(self, class_ids: List[int]) -> np.ndarray:
+        """Element x class 0/1 matrix restricted to `class_ids` (columns in that order)."""
+        return self.membership(class_ids).astype(np.float32)
+
+    def cooccurrence(self, top_n: int = DEFAULT_TOP_N,
+                     classes: int = DEFAULT_COOCCURRENCE_CLASSES) -> List[Tuple[str, str, int]]:
+        """Most frequent class pairs on one element, among the `classes` most used classes."""
+        if not self.elements:
+            return []
+        frequent = np.argsort(-self.counts(), kind="stable")[:classes].tolist()
+        matrix = self.incidence(frequent)
+        pairs = matrix.T @ matrix
+        upper = np.triu_indices(len(frequent), k=1)
+        counts = pairs[upper]
+        best = np.argsort(-counts, kind="stable")[:top_n]
+        return [(self.names[frequent[upper[0][index]]], self.names[frequent[upper[1][index]]], int(counts[index]))
+                for index in best if counts[index] > 1]
+
+
+def analyze_markup(text: str, source: str = "<input>", usage: Optional[ClassUsage] = None) -> ClassUsage:
+    """ClassUsage for one markup string (added to `usage` when given)."""
+    usage = usage if usage is not None else ClassUsage()
+    usage.add_text(text, source)
+    return usage
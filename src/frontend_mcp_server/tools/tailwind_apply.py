@@ -0,0 +1,170 @@
+"""
+Frequent class combinations for @apply extraction.
+
+Elements are transactions over interned class ids; identical transactions
+collapse into one weighted row. Closed itemsets are enumerated depth-first
+in the LCM style: the supports of every extension of a prefix come from one
+weighted sum over the prefix's own transactions (occurrence deliver), so
+deep itemsets touch only the few elements that carry them; classes that
+occur on exactly the same elements are folded into the itemset instead of
+branching; and an extension is followed only when its closure keeps the
+prefix, so each closed itemset is produced once and ten always-together
+utilities do not explode into 2^10 subsets. Candidates are ranked by the
+markup bytes a component class would save.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .tailwind_analysis import DEFAULT_TOP_N, ClassUsage
+from .tailwind_catalog import CATALOG, split_variants
+
+DEFAULT_MIN_SUPPORT = 3  # elements a combination must appear on before a component pays off
+MIN_SUPPORT_RATIO = 0.001  # ...and at least this share of all elements, so one-off noise does not flood the search
+DEFAULT_MIN_SIZE = 2
+MAX_ITEMS = 256  # most frequent eligible classes considered
+MAX_NODES = 20000  # closed itemsets enumerated before the search stops
+
+# (component name, classes hinting at it) - first match names the rule
+COMPONENT_HINTS = (
+    ("btn", ("px-", "py-", "rounded")),
+    ("badge", ("px-", "rounded-full", "text-xs")),
+    ("card", ("rounded", "shadow")),
+    ("input", ("border", "rounded", "px-")),
+    ("heading", ("text-", "font-bold")),
+    ("grid-layout", ("grid", "gap-")),
+    ("row", ("flex", "items-center")),
+    ("stack", ("flex", "flex-col")),
+    ("text", ("text-",)),
+)
+
+
+class ApplyCandidate:
+    """A class combination worth extracting into an @apply component."""
+
+    __slots__ = ("classes", "support", "bytes_saved", "name", "rule")
+
+    def __init__(self, classes: List[str], support: int, bytes_saved: int, name: str, rule: str):
+        self.classes = classes
+        self.support = support
+        self.bytes_saved = bytes_saved
+        self.name = name
+        self.rule = rule
+
+
+class ClosedItemsetMiner:
+    """Closed frequent itemsets (LCM) over weighted transactions."""
+
+    __slots__ = ("members", "weights", "min_support", "max_nodes", "itemsets")
+
+    def __init__(self, members: np.ndarray, weights: np.ndarray, min_support: int, max_nodes: int = MAX_NODES):
+        """`members` is a transaction x item bool matrix; `weights` the multiplicity of each transaction."""
+        self.members = members.astype(np.float32)
+        self.weights = weights.astype(np.float32)
+        self.min_support = min_support
+        self.max_nodes = max_nodes
+        self.itemsets: List[Tuple[Tuple[int, ...], int]] = []
+
+    def frequencies(self, transactions: np.ndarray) -> np.ndarray:
+        """Weighted support of every item within a set of transactions."""
+        return self.weights[transactions] @ self.members[transactions]
+
+    def mine(self) -> List[Tuple[Tuple[int, ...], int]]:
+        """(item indices, support) of every closed itemset with at least min_support, most supported first."""
+        self.itemsets = []
+        transactions = np.arange(len(self.weights))
+        frequencies = self.frequencies(transactions)
+        support = float(self.weights.sum())
+        if support >= self.min_support:
+            self._extend(transactions, frequencies, frequencies == support, support, -1)
+        self.itemsets.sort(key=lambda itemset: (-itemset[1], len(itemset[0])))
+        return self.itemsets
+
+    def _extend(self, transactions: np.ndarray, frequencies: np.ndarray, closure: np.ndarray,
+                support: float, core: int) -> None:
+        if closure.any():
+            self.itemsets.append((tuple(np.flatnonzero(closure).tolist()), int(support)))
+        candidates = np.flatnonzero((frequencies >= self.min_support) & ~closure)
+        for item in candidates[candidates > core].tolist():
+            if len(self.itemsets) >= self.max_nodes:
+                return
+            # occurrence deliver: the child only ever looks at the transactions that contain `item`
+            child = transactions[self.members[transactions, item] > 0]
+            child_frequencies = self.frequencies(child)
+            child_closure = child_frequencies == frequencies[item]
+            # prefix-preserving test: a closure that adds an item below `item` is reached from another prefix
+            if np.array_equal(child_closure[:item], closure[:item]):
+                self._extend(child, child_frequencies, child_closure, frequencies[item], item)
+
+
+def component_name(classes: List[str]) -> str:
+    """Readable component class name for a combination."""
+    bases = [split_variants(cls)[1] for cls in classes]
+    for name, hints in COMPONENT_HINTS:
+        if all(any(base.startswith(hint) for base in bases) for hint in hints):
+            return name
+    return "group"
+
+
+def apply_rule(name: str, classes: List[str]) -> str:
+    """The component rule for a combination, ready for the components layer."""
+    return f".{name} {{\n  @apply {' '.join(classes)};\n}}"
+
+
+def markup_bytes_saved(classes: List[str], support: int, name: str) -> int:
+    """Bytes saved when `support` elements swap the classes for `name`, less the rule written once."""
+    return support * (sum(len(cls) + 1 for cls in classes) - len(name) - 1) - len(apply_rule(name, classes))
+
+
+def mine_apply_candidates(usage: ClassUsage, top_n: int = DEFAULT_TOP_N, min_support: int = DEFAULT_MIN_SUPPORT,
+                          min_size: int = DEFAULT_MIN_SIZE, max_nodes: int = MAX_NODES) -> List[ApplyCandidate]:
+    """Class combinations shared by at least `min_support` elements, ranked by markup bytes saved."""
+    min_support = max(min_support, math.ceil(usage.elements * MIN_SUPPORT_RATIO))
+    counts = usage.counts()
+    frequent = np.flatnonzero(counts >= min_support)
+    frequent = frequent[np.argsort(-counts[frequent], kind="stable")].tolist()
+    eligible = [class_id for class_id in frequent if CATALOG.describe(usage.names[class_id])][:MAX_ITEMS]
+    if len(eligible) < min_size:
+        return []
+
+    # Transactions restricted to eligible classes; identical ones collapse into a weighted row
+    members = usage.membership(eligible)
+    members = members[members.sum(axis=1) >= min_size]
+    if not len(members):
+        return []
+    distinct, weights = np.unique(members, axis=0, return_counts=True)
+    itemsets = ClosedItemsetMiner(distinct, weights, min_support, max_nodes).mine()
+
+    # Rank on the markup the classes take up; only the leaders are named and scored exactly
+    class_bytes = np.array([len(usage.names[class_id]) + 1 for class_id in eligible])
+    markup = sorted(((support * int(class_bytes[list(items)].sum()), items, support)
+                     for items, support in itemsets if len(items) >= min_size), key=lambda entry: -entry[0])
+    scored: List[Tuple[int, List[str], int]] = []
+    for _, items, support in markup[:top_n * 20]:
+        ids = sorted(eligible[item] for item in items)  # interned ids follow first use, i.e. authored order
+        classes = [usage.names[class_id] for class_id in ids]
+        bytes_saved = markup_bytes_saved(classes, support, component_name(classes))
+        if bytes_saved > 0:
+            scored.append((bytes_saved, classes, support))
+    scored.sort(key=lambda entry: -entry[0])
+
+    candidates: List[ApplyCandidate] = []
+    chosen: List[set] = []
+    taken: Dict[str, int] = {}
+    for bytes_saved, classes, support in scored:
+        if len(candidates) == top_n:
+            break
+        class_set = set(classes)
+        if any(class_set <= other or class_set >= other for other in chosen):
+            continue  # a nested combination is an alternative to one already listed, not a second component
+        chosen.append(class_set)
+        name = component_name(classes)
+        taken[name] = taken.get(name, 0) + 1
+        if taken[name] > 1:
+            name = f"{name}-{taken[name]}"
+        candidates.append(ApplyCandidate(classes, support, markup_bytes_saved(classes, support, name), name,
+                                         apply_rule(name, classes)))
+    candidates.sort(key=lambda candidate: -candidate.bytes_saved)  # numbered names cost a few bytes more
+    return candidates
@@ -0,0 +1,242 @@
+"""
+Packed Tailwind CSS class catalog with ranked prefix and abbreviation lookup.
+
+The catalog is generated from the theme tables in tailwind_theme - every
+utility prefix crossed with its scale, negated values, and the keyword
+utilities - and shipped as a gzipped, rank-ordered `class<TAB>css` file.
+It is read lazily on the first lookup, then queried with bisect over the
+sorted class names:
+
+- prefix lookup takes the contiguous sorted range and picks the best ranks
+  with a numpy partition, so its cost does not depend on the range size;
+- abbreviation lookup (`it-ce` -> `items-center`, `bg-bl-5` -> `bg-blue-500`)
+  matches each dash segment as a prefix, jumping between distinct segments
+  with bisect instead of scanning the names below them;
+- a root typo (`itmes-center`) falls back to difflib over the ~200 roots.
+
+Variant prefixes (`md:hover:`) and `!` are split off before the lookup and
+put back on the results. Regenerate the data file after editing the theme:
+
+    python -m src.frontend_mcp_server.tools.tailwind_catalog
+"""
+
+import difflib
+import gzip
+import os
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .tailwind_theme import NEGATABLE, SCALES, STATIC_UTILITIES, UTILITIES, VARIANTS
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "data", "tailwind_catalog.tsv.gz")
+DEFAULT_LIMIT = 10
+_END = "\uffff"  # sorts after every character used in class names
+
+# Ranking heuristics: how often a prefix or a scale key shows up in real markup
+COMMON_PREFIXES = {
+    "p": 4, "px": 4, "py": 4, "m": 3, "mx": 3, "my": 3, "mt": 3, "mb": 3, "w": 4, "h": 4, "gap": 4,
+    "bg": 4, "text": 4, "border": 4, "rounded": 4, "shadow": 3, "font": 4, "space-y": 3, "space-x": 3,
+    "max-w": 3, "min-h": 2, "leading": 2, "tracking": 2, "grid-cols": 3, "col-span": 2, "z": 2,
+    "opacity": 2, "ring": 2, "top": 2, "left": 2, "right": 2, "bottom": 2, "inset": 2, "duration": 2,
+    "pt": 2, "pb": 2, "pl": 2, "pr": 2, "ml": 2, "mr": 2, "flex": 2, "size": 2, "divide-y": 1, "outline": 1,
+}
+COMMON_STATIC = {
+    "flex", "hidden", "block", "inline-flex", "grid", "relative", "absolute", "fixed", "sticky",
+    "items-center", "items-start", "justify-center", "justify-between", "justify-end", "flex-col",
+    "flex-wrap", "text-center", "truncate", "overflow-hidden", "overflow-auto", "uppercase",
+    "underline", "transition", "cursor-pointer", "pointer-events-none", "sr-only", "container",
+    "inline-block", "whitespace-nowrap", "outline-none", "italic", "antialiased",
+}
+COMMON_KEYS = {
+    "0": 1, "1": 2, "2": 2, "3": 1, "4": 2, "6": 1, "8": 1, "px": 1, "DEFAULT": 2, "full": 1, "auto": 1,
+    "sm": 2, "md": 2, "lg": 2, "xl": 1, "base": 1, "bold": 2, "medium": 2, "semibold": 2,
+    "white": 2, "black": 1, "transparent": 1, "500": 2, "600": 2, "100": 1, "200": 1, "700": 1, "800": 1,
+}
+COMMON_COLOR_FAMILIES = {"gray", "slate", "blue", "red", "green", "indigo"}
+
+
+def _declarations(properties: Tuple[str, ...], value) -> str:
+    """`padding-left: 1rem; padding-right: 1rem` for a scale value."""
+    values = value if isinstance(value, tuple) else (value,) * len(properties)
+    return "; ".join(f"{prop}: {val}" for prop, val in zip(properties, values))
+
+
+def _negate(value) -> Optional[str]:
+    """Negated scale value, or None when the value has no negative form."""
+    if isinstance(value, tuple) or not value[:1].isdigit() or value in ("0", "0px"):
+        return None
+    return "-" + value
+
+
+def _score(name: str, prefix: str, key: str) -> float:
+    """Higher for classes people write often; ties break on the shorter name."""
+    score = float(COMMON_PREFIXES.get(prefix, 0))
+    score += COMMON_KEYS.get(key, 0)
+    family, _, shade = key.partition("-")
+    if shade:
+        score += COMMON_KEYS.get(shade, 0) + (1 if family in COMMON_COLOR_FAMILIES else 0)
+    return score - len(name) / 16
+
+
+def generate_entries() -> List[Tuple[str, str]]:
+    """Every catalog class with its CSS, best-ranked first."""
+    entries: Dict[str, Tuple[float, str]] = {}
+    for name, declarations in STATIC_UTILITIES.items():
+        score = (7.0 if name in COMMON_STATIC else 1.0) - len(name) / 16
+        entries[name] = (score, "; ".join(f"{prop}: {value}" for prop, value in declarations))
+    for prefix, scale, properties in UTILITIES:
+        for key, value in SCALES[scale].items():
+            name = prefix if key == "DEFAULT" else f"{prefix}-{key}"
+            if name not in entries:
+                entries[name] = (_score(name, prefix, key), _declarations(properties, value))
+            negated = _negate(value) if prefix in NEGATABLE and key != "DEFAULT" else None
+            if negated and "-" + name not in entries:
+                entries["-" + name] = (_score(name, prefix, key) - 4, _declarations(properties, negated))
+    ranked = sorted(entries.items(), key=lambda item: (-item[1][0], item[0]))
+    return [(name, css) for name, (_, css) in ranked]
+
+
+def write_catalog(path: str = DATA_PATH) -> int:
+    """Write the packed catalog; returns the number of classes."""
+    entries = generate_entries()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = "".join(f"{name}\t{css}\n" for name, css in entries).encode("utf-8")
+    with open(path, "wb") as handle:
+        handle.write(gzip.compress(payload, compresslevel=9, mtime=0))
+    return len(entries)
+
+
+def split_variants(token: str) -> Tuple[List[str], str]:
+    """`md:hover:bg-[#fff]` -> (["md", "hover"], "bg-[#fff]"); colons inside brackets stay put."""
+    variants, depth, start = [], 0, 0
+    for index, char in enumerate(token):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth = max(depth - 1, 0)
+        elif char == ":" and depth == 0:
+            variants.append(token[start:index])
+            start = index + 1
+    return variants, token[start:]
+
+
+class TailwindCatalog:
+    """Lazily loaded class catalog. Class ids are ranks: 0 is the most common class."""
+
+    __slots__ = ("path", "names", "details", "sorted_names", "sorted_ids", "roots")
+
+    def __init__(self, path: str = DATA_PATH):
+        self.path = path
+        self.names: Optional[List[str]] = None
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            rows = [line.rstrip("\n").split("\t", 1) for line in handle]
+        names = [row[0] for row in rows]
+        order = sorted(range(len(names)), key=names.__getitem__)
+        self.details = [row[1] for row in rows]
+        self.sorted_names = [names[index] for index in order]
+        self.sorted_ids = np.array(order, dtype=np.int32)
+        self.names = names
+        self.roots = [root for root in self._next_segments("", "") if root]
+
+    def _loaded(self) -> List[str]:
+        if self.names is None:
+            self._load()
+        return self.names  # type: ignore[return-value]
+
+    def __len__(self) -> int:
+        return len(self._loaded())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaded())
+
+    def __contains__(self, name: str) -> bool:
+        self._loaded()
+        index = bisect_left(self.sorted_names, name)
+        return index < len(self.sorted_names) and self.sorted_names[index] == name
+
+    def detail(self, name: str) -> Optional[str]:
+        """CSS declarations of a catalog class (no variants)."""
+        if name not in self:
+            return None
+        return self.details[int(self.sorted_ids[bisect_left(self.sorted_names, name)])]
+
+    def describe(self, token: str) -> Optional[str]:
+        """CSS of a class as written in markup, variants and `!` included; None if unknown."""
+        variants, utility = split_variants(token)
+        if any(variant not in VARIANTS for variant in variants):
+            return None
+        css = self.detail(utility.lstrip("!"))
+        if css is None or not variants:
+            return css
+        return f"{css} ({', '.join(variants)})"
+
+    def _top(self, ranges: List[Tuple[int, int]], limit: int) -> List[int]:
+        """Best `limit` class ids across sorted-name ranges."""
+        slices = [self.sorted_ids[lo:hi] for lo, hi in ranges if hi > lo]
+        if not slices:
+            return []
+        ids = np.concatenate(slices) if len(slices) > 1 else slices[0]
+        if len(ids) > limit:
+            ids = np.partition(ids, limit - 1)[:limit]
+        return sorted(ids.tolist())
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        lo = bisect_left(self.sorted_names, prefix)
+        return lo, bisect_left(self.sorted_names, prefix + _END, lo)
+
+    def _next_segments(self, path: str, partial: str) -> List[str]:
+        """Distinct dash segments following `path` that start with `partial`."""
+        names = self.sorted_names
+        index, end = self._range(path + partial)
+        segments = []
+        while index < end:
+            segment = names[index][len(path):].split("-", 1)[0]
+            segments.append(segment)
+            # skip the rest of this segment's block: `path+segment` and `path+segment-...`
+            index = bisect_left(names, path + segment + "-" + _END, index + 1)
+        return segments
+
+    def _abbreviation(self, utility: str, limit: int) -> List[int]:
+        """Ids whose dash segments start with the query's segments, in order."""
+        lead = "-" if utility.startswith("-") else ""
+        parts = utility[len(lead):].split("-")
+        paths = [lead]
+        for part in parts[:-1]:
+            paths = [path + segment + "-" for path in paths for segment in self._next_segments(path, part)]
+            if not paths:
+                return []
+        return self._top([self._range(path + parts[-1]) for path in paths], limit)
+
+    def complete(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Tuple[str, str]]:
+        """Ranked (class, css) completions; prefix matches first, then abbreviations, then typo fixes."""
+        self._loaded()
+        variants, utility = split_variants(query.strip())
+        important = "!" if utility.startswith("!") else ""
+        utility = utility[len(important):]
+        ids = self._top([self._range(utility)], limit)
+        if len(ids) < limit and "-" in utility.lstrip("-"):
+            ids += [index for index in self._abbreviation(utility, limit) if index not in ids][:limit - len(ids)]
+        if not ids and utility:
+            lead = "-" if utility.startswith("-") else ""
+            root, dash, rest = utility[len(lead):].partition("-")
+            for fixed in difflib.get_close_matches(root, self.roots, n=3, cutoff=0.7):
+                ids += [index for index in self._abbreviation(lead + fixed + dash + rest, limit) if index not in ids]
+            ids = sorted(ids)[:limit]
+
+        prefix = "".join(variant + ":" for variant in variants) + important
+        results = [(prefix + self.names[index], self.details[index]) for index in ids]  # type: ignore[index]
+        if not variants and not important and len(results) < limit:
+            results += [(variant + ":", css) for variant, (_, css) in VARIANTS.items()
+                        if variant.startswith(utility) and utility][:limit - len(results)]
+        return results
+
+
+CATALOG = TailwindCatalog()
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_catalog()} classes to {DATA_PATH}")
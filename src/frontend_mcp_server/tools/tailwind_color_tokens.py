@@ -0,0 +1,244 @@
+"""
+Design-token consolidation: cluster a project's ad-hoc colors and map
+each cluster to a Tailwind palette token or a proposed custom token.
+
+Colors are collected from arbitrary-value classes (`bg-[#3b82f7]`,
+`text-[rgb(59_130_246)]`) and from inline values in the source text
+(`#3b82f7` in style props, CSS-in-JS and stylesheets). Each file is read
+on its own, so extraction fans out over the project scanner's process
+pool. Distinct colors are clustered in OKLab, weighted by how often they
+occur, with k-means:
+- k comes from a perceptual tolerance. The most used colors seed the
+  centers, and a color becomes a new center when it is farther than the
+  tolerance from every existing center.
+- Lloyd iterations then move each center to the weighted mean of its
+  members, as one vectorized distance matrix per step.
+A center within the match distance of a default palette color maps to
+that token. Otherwise it gets a custom token, named after the nearest
+family and its lightness on the shade ladder (`sky-450`); a name another
+cluster already holds moves to the next free shade step. Byte savings
+are estimated from the JIT's rules: one rule per distinct replacement
+class instead of one per arbitrary class.
+"""
+
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .tailwind_colors import (css_color_to_srgb, hex_to_srgb, linear_to_srgb, oklab_to_linear, shade_profile,
+                              srgb_to_hex, srgb_to_oklab)
+from .tailwind_jit import compile_class, escape_class
+from .tailwind_project import (MAX_FILE_BYTES, SOURCE_EXTENSIONS, ProjectScanError, run_jobs,
+                               walk_sources)
+from .tailwind_theme import COLOR_SHADES, COLORS, PALETTE
+
+COLOR_EXTENSIONS = SOURCE_EXTENSIONS + (".css", ".scss", ".less")
+DEFAULT_TOLERANCE = 0.03  # OKLab distance under which two colors are one token (about two just-noticeable steps)
+TOKEN_MATCH = 0.02  # a cluster this close to a palette color becomes that token
+KMEANS_ITERATIONS = 20
+
+_ARBITRARY_COLOR = re.compile(
+    r"(?<![\w\-\[])((?:[\w\-]+:)*!?)([a-z][\w\-]*?)-\[(#[0-9a-fA-F]{3,8}|(?:rgba?|hsla?|oklch)\([^\]\s()]*\))\]")
+_INLINE_COLOR = re.compile(r"(?<![\w&#/\-])#(?:[0-9a-fA-F]{8}|[0-9a-fA-F]{6}|[0-9a-fA-F]{3,4})(?![\w\-])"
+                           r"|\b(?:rgba?|hsla?|oklch)\([^()]*\)")
+
+# (color as written, arbitrary class or "" when inline)
+ColorUse = Tuple[str, str]
+
+
+def extract_colors(text: str) -> List[ColorUse]:
+    """Every color in a source text: arbitrary-value classes first, then inline values outside them."""
+    uses: List[ColorUse] = []
+    taken: List[Tuple[int, int]] = []
+    for match in _ARBITRARY_COLOR.finditer(text):
+        uses.append((match.group(3), match.group(0)))
+        taken.append(match.span())
+    spans = iter(taken)
+    span = next(spans, None)
+    for match in _INLINE_COLOR.finditer(text):
+        while span is not None and span[1] <= match.start():
+            span = next(spans, None)
+        if span is None or match.end() <= span[0]:
+            uses.append((match.group(0), ""))
+    return uses
+
+
+def _color_job(path: str) -> Optional[List[ColorUse]]:
+    """Pool worker: the colors of one file, None when it cannot be read."""
+    try:
+        with open(path, "rb") as handle:
+            return extract_colors(handle.read().decode("utf-8", errors="replace"))
+    except OSError:
+        return None
+
+
+class ColorCluster:
+    """Colors close enough to be one token, and the token they map to."""
+
+    __slots__ = ("center", "token", "custom", "distance", "colors", "uses", "classes", "bytes_saved")
+
+    def __init__(self, center: str, token: str, custom: bool, distance: float):
+        self.center = center  # hex of the weighted OKLab mean
+        self.token = token  # `blue-500`, or a proposed custom name
+        self.custom = custom
+        self.distance = distance  # OKLab distance from the center to the nearest palette color
+        self.colors: Counter = Counter()  # member hex -> uses
+        self.uses = 0
+        self.classes: Dict[str, str] = {}  # arbitrary class -> replacement class
+        self.bytes_saved = 0
+
+
+class ColorReport:
+    """Every clustered color of a project."""
+
+    __slots__ = ("root", "files", "uses", "inline", "skipped", "clusters", "workers", "bytes_saved")
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files = 0
+        self.uses = 0
+        self.inline = 0  # uses outside arbitrary classes (style props, CSS-in-JS, stylesheets)
+        self.skipped: Counter = Counter()  # translucent or unparseable colors, as written
+        self.clusters: List[ColorCluster] = []
+        self.workers = 1
+        self.bytes_saved = 0
+
+
+def cluster_colors(lab: np.ndarray, weights: np.ndarray, tolerance: float = DEFAULT_TOLERANCE
+                   ) -> Tuple[np.ndarray, np.ndarray]:
+    """(cluster of each color, cluster centers) by weighted k-means in OKLab, k set by the tolerance."""
+    order = np.argsort(-weights, kind="stable")
+    centers = [lab[order[0]]]
+    for index in order[1:]:
+        if np.min(np.linalg.norm(np.asarray(centers) - lab[index], axis=1)) > tolerance:
+            centers.append(lab[index])
+    centers_array = np.asarray(centers)
+    labels = np.zeros(len(lab), dtype=np.int64)
+    for _ in range(KMEANS_ITERATIONS):
+        distances = np.linalg.norm(lab[:, None, :] - centers_array[None, :, :], axis=2)
+        new_labels = distances.argmin(axis=1)
+        totals = np.bincount(new_labels, weights=weights, minlength=len(centers_array))
+        kept = totals > 0
+        sums = np.stack([np.bincount(new_labels, weights=weights * lab[:, axis], minlength=len(centers_array))
+                         for axis in range(3)], axis=1)
+        centers_array = sums[kept] / totals[kept, None]
+        new_labels = np.cumsum(kept)[new_labels] - 1  # renumber past emptied clusters
+        if np.array_equal(new_labels, labels) and kept.all():
+            break
+        labels = new_labels
+    return labels, centers_array
+
+
+def _palette() -> Tuple[List[str], np.ndarray]:
+    names = [name for name, value in COLORS.items() if value.startswith("#")]
+    return names, srgb_to_oklab(hex_to_srgb([COLORS[name] for name in names]))
+
+
+def _custom_token(family: str, shade: int) -> str:
+    name = f"{family}-{shade}"
+    return f"custom-{name}" if family in PALETTE and str(shade) in PALETTE[family] else name
+
+
+def token_for(center: np.ndarray, names: List[str], palette: np.ndarray, taken: Optional[Set[str]] = None
+              ) -> Tuple[str, bool, float]:
+    """(token, is custom, distance to the nearest palette color) for a cluster center in OKLab.
+
+    Tokens in `taken` belong to other clusters: a custom name moves to the nearest free shade step, and a
+    palette color already claimed gives a custom name too.
+    """
+    taken = taken or set()
+    distances = np.linalg.norm(palette - center, axis=1)
+    nearest = int(distances.argmin())
+    if distances[nearest] <= TOKEN_MATCH and names[nearest] not in taken:
+        return names[nearest], False, float(distances[nearest])
+    family = names[nearest].rsplit("-", 1)[0] if "-" in names[nearest] else "gray"
+    lightness, _ = shade_profile()
+    steps = [int(shade) for shade in COLOR_SHADES]
+    shade = int(round(np.interp(-center[0], -lightness, steps) / 50) * 50)  # the ladder falls as shades rise
+    for step in sorted(range(steps[0], steps[-1] + 1, 50), key=lambda step: (abs(step - shade), step)):
+        if _custom_token(family, step) not in taken:
+            return _custom_token(family, step), True, float(distances[nearest])
+    suffix = 2
+    while f"{_custom_token(family, shade)}-{suffix}" in taken:
+        suffix += 1
+    return f"{_custom_token(family, shade)}-{suffix}", True, float(distances[nearest])
+
+
+def _rule_bytes(cls: str) -> int:
+    compiled = compile_class(cls)
+    return len(compiled[2].encode("utf-8")) if compiled else 0
+
+
+def replacement_bytes(cls: str, replacement: str) -> int:
+    """Rule bytes of a replacement class; custom tokens are not in the catalog, so estimate from the old rule."""
+    return _rule_bytes(replacement) or _rule_bytes(cls) - len(escape_class(cls)) + len(escape_class(replacement))
+
+
+def consolidate_colors(root: str, tolerance: float = DEFAULT_TOLERANCE, workers: Optional[int] = None,
+                       extensions: Tuple[str, ...] = COLOR_EXTENSIONS) -> ColorReport:
+    """Scan a project's colors and cluster them into tokens."""
+    resolved = os.path.abspath(os.path.expanduser(root))
+    if not os.path.isdir(resolved):
+        raise ProjectScanError(f"Project directory not found: {root}")
+    report = ColorReport(resolved)
+    paths = []
+    for entry in walk_sources(resolved, extensions):
+        try:
+            if entry.stat(follow_symlinks=False).st_size <= MAX_FILE_BYTES:
+                paths.append(entry.path)
+        except OSError:
+            continue  # vanished or unreadable, as in ProjectScanner.scan
+    outcomes, report.workers = run_jobs(_color_job, paths, workers)
+
+    by_color: Dict[str, Counter] = {}  # hex -> Counter of arbitrary classes ("" for inline uses)
+    for uses in outcomes:
+        if uses is None:
+            continue
+        report.files += 1
+        for written, cls in uses:
+            rgb = css_color_to_srgb(written)
+            if rgb is None:
+                report.skipped[written] += 1
+                continue
+            report.uses += 1
+            if not cls:
+                report.inline += 1
+            by_color.setdefault(srgb_to_hex(rgb[None, :])[0], Counter())[cls] += 1
+    if not by_color:
+        return report
+
+    hexes = list(by_color)
+    weights = np.array([sum(by_color[value].values()) for value in hexes], dtype=float)
+    lab = srgb_to_oklab(hex_to_srgb(hexes))
+    labels, centers = cluster_colors(lab, weights, tolerance)
+    names, palette = _palette()
+    center_hexes = srgb_to_hex(linear_to_srgb(oklab_to_linear(centers)))
+    clusters: List[ColorCluster] = [None] * len(centers)
+    taken: Set[str] = set()
+    # the most used clusters pick first, so they keep the palette token or shade they are closest to
+    for index in np.argsort(-np.bincount(labels, weights=weights, minlength=len(centers)), kind="stable").tolist():
+        token, custom, distance = token_for(centers[index], names, palette, taken)
+        taken.add(token)
+        clusters[index] = ColorCluster(center_hexes[index], token, custom, distance)
+    for value, label in zip(hexes, labels.tolist()):
+        cluster = clusters[label]
+        for cls, count in by_color[value].items():
+            cluster.colors[value] += count
+            cluster.uses += count
+            if cls:
+                match = _ARBITRARY_COLOR.fullmatch(cls)
+                cluster.classes[cls] = f"{match.group(1)}{match.group(2)}-{cluster.token}"
+
+    for cluster in clusters:
+        # every arbitrary class is a rule of its own; the replacements share one rule per class
+        before = sum(_rule_bytes(cls) for cls in cluster.classes)
+        replacements = {replacement: cls for cls, replacement in cluster.classes.items()}
+        after = sum(replacement_bytes(cls, replacement) for replacement, cls in replacements.items())
+        cluster.bytes_saved = before - after
+        report.bytes_saved += cluster.bytes_saved
+    report.clusters = sorted(clusters, key=lambda cluster: (-cluster.uses, cluster.token))
+    return report
+
@@ -0,0 +1,263 @@
+"""
+Color science for Tailwind palettes, vectorized over NumPy arrays.
+
+Colors are held as (..., 3) arrays and converted between sRGB, linear
+sRGB, OKLab and OKLCH with Björn Ottosson's matrices, so a whole scale
+or palette converts in one call. Scales follow the default palette: the
+lightness of each shade (50-950) and its chroma relative to the 500
+shade are averaged from the chromatic Tailwind families. A new scale
+keeps the input's hue, places the input on the shade with the closest
+lightness, and pulls out-of-gamut shades back into sRGB by bisecting on
+chroma at constant lightness and hue. The WCAG contrast of every pair
+of palette entries is one broadcast over relative luminances.
+"""
+
+import colorsys
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .tailwind_theme import COLOR_SHADES, COLORS, PALETTE
+
+NEUTRAL_FAMILIES = frozenset({"slate", "gray", "zinc", "neutral", "stone"})
+ANCHOR_SHADE = "500"
+GAMUT_STEPS = 24  # chroma bisection steps; 0.4 / 2^24 is far below one 8-bit sRGB step
+# palette type -> (scale name, hue rotation in degrees) added to the primary scale
+PALETTE_ROTATIONS: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "monochromatic": (),
+    "complementary": (("secondary", 180.0),),
+    "analogous": (("secondary", -30.0), ("tertiary", 30.0)),
+    "triadic": (("secondary", 120.0), ("tertiary", 240.0)),
+}
+WCAG_AAA = 7.0
+WCAG_AA = 4.5
+WCAG_AA_LARGE = 3.0
+
+_LMS_FROM_LINEAR = np.array([[0.4122214708, 0.5363325363, 0.0514459929],
+                             [0.2119034982, 0.6806995451, 0.1073969566],
+                             [0.0883024619, 0.2817188376, 0.6299787005]])
+_OKLAB_FROM_LMS = np.array([[0.2104542553, 0.7936177850, -0.0040720468],
+                            [1.9779984951, -2.4285922050, 0.4505937099],
+                            [0.0259040371, 0.7827717662, -0.8086757660]])
+_LMS_FROM_OKLAB = np.array([[1.0, 0.3963377774, 0.2158037573],
+                            [1.0, -0.1055613458, -0.0638541728],
+                            [1.0, -0.0894841775, -1.2914855480]])
+_LINEAR_FROM_LMS = np.array([[4.0767416621, -3.3077115913, 0.2309699292],
+                             [-1.2684380046, 2.6097574011, -0.3413193965],
+                             [-0.0041960863, -0.7034186147, 1.7076147010]])
+_LUMINANCE = np.array([0.2126, 0.7152, 0.0722])
+_HEX = re.compile(r"^#?([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+_OKLCH = re.compile(r"^oklch\(\s*([\d.]+)(%?)\s*[\s,]\s*([\d.]+)\s*[\s,]\s*(-?[\d.]+)(?:deg)?\s*(?:/\s*[\d.]+%?\s*)?\)$",
+                    re.IGNORECASE)
+
+
+_CSS_FUNCTION = re.compile(r"^(rgba?|hsla?)\(\s*([^)]*)\)$", re.IGNORECASE)
+
+
+class ColorError(ValueError):
+    """Raised for a color that is not a hex code, an oklch() value or a Tailwind color name."""
+
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Undo the sRGB transfer curve."""
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(linear: np.ndarray) -> np.ndarray:
+    """Apply the sRGB transfer curve, clipping to the gamut."""
+    linear = np.clip(linear, 0.0, 1.0)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+
+
+def srgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """sRGB in [0, 1] -> OKLab, where Euclidean distance approximates perceived difference."""
+    return np.cbrt(srgb_to_linear(rgb) @ _LMS_FROM_LINEAR.T) @ _OKLAB_FROM_LMS.T
+
+
+def srgb_to_oklch(rgb: np.ndarray) -> np.ndarray:
+    """sRGB in [0, 1] -> OKLCH (lightness 0-1, chroma, hue in degrees)."""
+    lab = srgb_to_oklab(rgb)
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360
+    return np.stack([lab[..., 0], chroma, np.where(chroma < 1e-6, 0.0, hue)], axis=-1)
+
+
+def oklab_to_linear(lab: np.ndarray) -> np.ndarray:
+    """OKLab -> linear sRGB, unclipped (components outside [0, 1] are out of gamut)."""
+    return ((lab @ _LMS_FROM_OKLAB.T) ** 3) @ _LINEAR_FROM_LMS.T
+
+
+def oklch_to_linear(lch: np.ndarray) -> np.ndarray:
+    """OKLCH -> linear sRGB, unclipped."""
+    hue = np.radians(lch[..., 2])
+    return oklab_to_linear(np.stack([lch[..., 0], lch[..., 1] * np.cos(hue), lch[..., 1] * np.sin(hue)], axis=-1))
+
+
+def _in_gamut(lch: np.ndarray) -> np.ndarray:
+    linear = oklch_to_linear(lch)
+    return np.all((linear >= -1e-6) & (linear <= 1 + 1e-6), axis=-1)
+
+
+def gamut_map(lch: np.ndarray) -> np.ndarray:
+    """Reduce the chroma of out-of-gamut colors until they fit sRGB, keeping lightness and hue."""
+    lch = np.array(lch, dtype=float)
+    outside = ~_in_gamut(lch)
+    if not outside.any():
+        return lch
+    low = np.zeros(lch.shape[:-1])
+    high = lch[..., 1].copy()
+    for _ in range(GAMUT_STEPS):
+        middle = (low + high) / 2
+        fits = _in_gamut(np.stack([lch[..., 0], middle, lch[..., 2]], axis=-1))
+        low = np.where(fits, middle, low)
+        high = np.where(fits, high, middle)
+    lch[..., 1] = np.where(outside, low, lch[..., 1])
+    return lch
+
+
+def oklch_to_srgb(lch: np.ndarray) -> np.ndarray:
+    """OKLCH -> sRGB in [0, 1], gamut mapped."""
+    return linear_to_srgb(oklch_to_linear(gamut_map(lch)))
+
+
+def hex_to_srgb(values: List[str]) -> np.ndarray:
+    """`#1da1f2` strings -> (N, 3) sRGB in [0, 1]."""
+    return np.array([[int(value.lstrip("#")[i:i + 2], 16) for i in (0, 2, 4)] for value in values]) / 255.0
+
+
+def srgb_to_hex(rgb: np.ndarray) -> List[str]:
+    """(N, 3) sRGB -> `#rrggbb` strings."""
+    return ["#%02x%02x%02x" % tuple(row) for row in np.rint(np.clip(rgb, 0, 1) * 255).astype(int).tolist()]
+
+
+def format_oklch(lch: np.ndarray) -> str:
+    """`oklch(63.7% 0.237 25.3)`."""
+    return f"oklch({lch[0] * 100:.1f}% {lch[1]:.3f} {lch[2]:.1f})"
+
+
+def parse_color(text: str) -> np.ndarray:
+    """OKLCH of a hex code, an `oklch(L C H)` value or a Tailwind color (`blue`, `blue-600`, `white`)."""
+    value = text.strip()
+    match = _HEX.match(value)
+    if match:
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = "".join(char * 2 for char in digits)
+        return srgb_to_oklch(hex_to_srgb([digits])[0])
+    match = _OKLCH.match(value)
+    if match:
+        lightness = float(match.group(1)) / (100 if match.group(2) else 1)
+        return np.array([min(max(lightness, 0.0), 1.0), float(match.group(3)), float(match.group(4)) % 360])
+    name = value.lower()
+    if name in PALETTE:
+        name = f"{name}-{ANCHOR_SHADE}"
+    if COLORS.get(name, "").startswith("#"):
+        return srgb_to_oklch(hex_to_srgb([COLORS[name]])[0])
+    raise ColorError(f"Unrecognized color: {text} (use a hex code, oklch(L C H) or a Tailwind color name)")
+
+
+def css_color_to_srgb(text: str) -> Optional[np.ndarray]:
+    """sRGB of an opaque CSS color (hex, rgb(), hsl(), oklch(); `_` as in arbitrary values); None otherwise."""
+    value = text.strip().replace("_", " ")
+    digits = value.lstrip("#")
+    if value.startswith("#") and len(digits) in (4, 8):  # with alpha: only fully opaque colors are tokens
+        if digits[len(digits) // 4 * 3:].lower() not in ("f", "ff"):
+            return None
+        digits = digits[:len(digits) // 4 * 3]
+    if value.startswith("#") and len(digits) in (3, 6) and _HEX.match(digits):
+        return hex_to_srgb(["".join(char * 2 for char in digits) if len(digits) == 3 else digits])[0]
+    match = _CSS_FUNCTION.match(value)
+    if match is None:
+        return oklch_to_srgb(parse_color(value)) if _OKLCH.match(value) else None
+    parts = re.split(r"[\s,/]+", match.group(2).strip())
+    if len(parts) not in (3, 4) or len(parts) == 4 and parts[3] not in ("1", "100%", "1.0"):
+        return None
+    try:
+        numbers = [float(part.rstrip("%").rstrip("deg")) for part in parts[:3]]
+    except ValueError:
+        return None
+    if match.group(1).lower().startswith("rgb"):
+        return np.clip([number / (100 if part.endswith("%") else 255) for number, part in zip(numbers, parts)], 0, 1)
+    hue, saturation, lightness = numbers[0] / 360 % 1, numbers[1] / 100, numbers[2] / 100
+    return np.array(colorsys.hls_to_rgb(hue, min(max(lightness, 0), 1), min(max(saturation, 0), 1)))
+
+
+@lru_cache(maxsize=1)
+def shade_profile() -> Tuple[np.ndarray, np.ndarray]:
+    """(lightness, chroma relative to 500) per shade, averaged over the chromatic default families."""
+    families = [family for family in PALETTE if family not in NEUTRAL_FAMILIES]
+    lch = srgb_to_oklch(hex_to_srgb([PALETTE[family][shade] for family in families for shade in COLOR_SHADES]))
+    lch = lch.reshape(len(families), len(COLOR_SHADES), 3)
+    anchor = COLOR_SHADES.index(ANCHOR_SHADE)
+    return lch[..., 0].mean(axis=0), (lch[..., 1] / lch[:, anchor:anchor + 1, 1]).mean(axis=0)
+
+
+class ColorScale:
+    """A 50-950 scale: shade names with their OKLCH and sRGB values."""
+
+    __slots__ = ("name", "shades", "oklch", "rgb", "hex", "native")
+
+    def __init__(self, name: str, oklch: np.ndarray, native: bool = False):
+        self.name = name
+        self.shades = COLOR_SHADES
+        self.oklch = gamut_map(oklch)
+        self.rgb = linear_to_srgb(oklch_to_linear(self.oklch))
+        self.hex = srgb_to_hex(self.rgb)
+        self.native = native  # a default Tailwind family, usable without config
+
+    def classes(self) -> List[str]:
+        """`blue-50` ... `blue-950`."""
+        return [f"{self.name}-{shade}" for shade in self.shades]
+
+
+def generate_scale(name: str, color: np.ndarray) -> ColorScale:
+    """An 11-shade scale through `color` at its hue, shaped like the default palette."""
+    lightness, relative_chroma = shade_profile()
+    anchor = int(np.argmin(np.abs(lightness - color[0])))
+    lch = np.empty((len(COLOR_SHADES), 3))
+    lch[:, 0] = lightness
+    lch[:, 1] = color[1] * relative_chroma / relative_chroma[anchor]
+    lch[:, 2] = color[2]
+    lch[anchor] = color  # the input itself sits on its nearest shade
+    return ColorScale(name, lch)
+
+
+def family_scale(family: str) -> ColorScale:
+    """A default Tailwind family as a scale."""
+    rgb = hex_to_srgb([PALETTE[family][shade] for shade in COLOR_SHADES])
+    return ColorScale(family, srgb_to_oklch(rgb), native=True)
+
+
+def palette_scales(primary: str, palette_type: str) -> List[ColorScale]:
+    """The primary scale and the hue-rotated scales of a palette type."""
+    color = parse_color(primary)
+    name = primary.strip().lower()
+    scales = [family_scale(name) if name in PALETTE else generate_scale("primary", color)]
+    for scale_name, rotation in PALETTE_ROTATIONS.get(palette_type, ()):
+        scales.append(generate_scale(scale_name, np.array([color[0], color[1], (color[2] + rotation) % 360])))
+    return scales
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """WCAG relative luminance of sRGB colors."""
+    return srgb_to_linear(rgb) @ _LUMINANCE
+
+
+def contrast_matrix(rgb: np.ndarray, other: Optional[np.ndarray] = None) -> np.ndarray:
+    """WCAG contrast ratio of every color in `rgb` against every color in `other` (default: `rgb`)."""
+    first = relative_luminance(rgb)[:, None]
+    second = relative_luminance(rgb if other is None else other)[None, :]
+    return (np.maximum(first, second) + 0.05) / (np.minimum(first, second) + 0.05)
+
+
+def wcag_rating(ratio: float) -> str:
+    """AAA / AA / AA large / fail for text at a contrast ratio."""
+    if ratio >= WCAG_AAA:
+        return "AAA"
+    if ratio >= WCAG_AA:
+        return "AA"
+    if ratio >= WCAG_AA_LARGE:
+        return "AA large"
+    return "fail"
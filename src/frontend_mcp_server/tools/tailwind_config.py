@@ -0,0 +1,310 @@
+"""
+Static reader for `tailwind.config.js` / `.ts`.
+
+Config files are programs, but the parts that matter for purging - the
+content globs, the safelist and the theme - are almost always plain
+object literals. The reader tokenizes the file (comments, strings,
+template literals, regex literals), finds the exported object
+(`module.exports = {...}`, `export default {...}`, or
+`export default config` with `const config = {...}`) and parses the
+JSON-like subset of JavaScript: unquoted keys, single quotes, trailing
+commas, regex literals. Anything else - a `require()`, a spread, a
+function, `colors.blue` - is skipped over, and its key path is recorded
+as dynamic so reports can say what was not analysed.
+"""
+
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+MAX_CONFIG_BYTES = 512 * 1024
+CONFIG_NAMES = ("tailwind.config.js", "tailwind.config.cjs", "tailwind.config.mjs", "tailwind.config.ts")
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>\.\.\.|=>|[{}\[\](),:;=.?!<>|&+*%-])
+  | (?P<slash>/)
+""", re.VERBOSE | re.DOTALL)
+_REGEX_LITERAL = re.compile(r"/((?:\\.|\[(?:\\.|[^\]\\])*\]|[^/\\\n\[])+)/([dgimsuy]*)")
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "0": "\0"}
+_KEYWORDS = {"true": True, "false": False, "null": None, "undefined": None}
+_DYNAMIC = object()  # marker for a value the static reader cannot evaluate
+
+
+class ConfigError(Exception):
+    """Raised when a Tailwind config cannot be read or holds no static config object."""
+
+
+class SafelistPattern:
+    """A `{ pattern: /.../, variants: [...] }` safelist entry."""
+
+    __slots__ = ("source", "regex", "variants")
+
+    def __init__(self, source: str, flags: str = "", variants: Optional[List[str]] = None):
+        self.source = source
+        self.regex = re.compile(source, re.IGNORECASE if "i" in flags else 0)
+        self.variants = variants or []
+
+
+class Token:
+    """One lexical token and its offset in the file."""
+
+    __slots__ = ("kind", "text", "position")
+
+    def __init__(self, kind: str, text: str, position: int):
+        self.kind = kind
+        self.text = text
+        self.position = position
+
+
+def tokenize(text: str) -> List[Token]:
+    """Tokens of a JavaScript/TypeScript file; a `/` where a value may start begins a regex literal."""
+    tokens: List[Token] = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:  # a character the subset has no use for (`@`, `#`, `^`, `~`...)
+            tokens.append(Token("punct", text[position], position))
+            position += 1
+            continue
+        kind = match.lastgroup
+        if kind == "slash":
+            previous = tokens[-1] if tokens else None
+            literal = _REGEX_LITERAL.match(text, position)
+            if literal and (previous is None or previous.kind == "punct" and previous.text in "([{,:=!&|?;"):
+                tokens.append(Token("regex", literal.group(0), position))
+                position = literal.end()
+                continue
+            kind = "punct"
+        if kind != "space":
+            tokens.append(Token(kind, match.group(0), position))
+        position = match.end()
+    return tokens
+
+
+def _unquote(literal: str) -> str:
+    body = literal[1:-1]
+    return re.sub(r"\\(.)", lambda match: _ESCAPES.get(match.group(1), match.group(1)), body, flags=re.DOTALL)
+
+
+class _Parser:
+    """Recursive descent over the JSON-like subset; other expressions are skipped and noted."""
+
+    __slots__ = ("tokens", "index", "dynamic")
+
+    def __init__(self, tokens: List[Token], index: int):
+        self.tokens = tokens
+        self.index = index
+        self.dynamic: List[str] = []
+
+    def peek(self, offset: int = 0) -> Optional[Token]:
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def at(self, text: str) -> bool:
+        token = self.peek()
+        return token is not None and token.kind == "punct" and token.text == text
+
+    def advanced(self, start: int) -> None:
+        """Fail on a token the subset cannot step over (a stray `)`), rather than loop on it."""
+        if self.index == start:
+            token = self.tokens[start]
+            raise ConfigError(f"Unexpected `{token.text}` at offset {token.position} of config")
+
+    def skip_expression(self) -> None:
+        """Skip to the `,` or closing bracket that ends the current expression."""
+        depth = 0
+        while self.index < len(self.tokens):
+            token = self.tokens[self.index]
+            if token.kind == "punct":
+                if token.text in "([{":
+                    depth += 1
+                elif token.text in ")]}":
+                    if depth == 0:
+                        return
+                    depth -= 1
+                elif token.text in ",;" and depth == 0:
+                    return
+            self.index += 1
+
+    def value(self, path: str) -> Any:
+        start = self.index
+        token = self.peek()
+        result: Any = _DYNAMIC
+        if token is None:
+            raise ConfigError("Unexpected end of config")
+        if token.kind == "punct" and token.text == "{":
+            result = self.object(path)
+        elif token.kind == "punct" and token.text == "[":
+            result = self.array(path)
+        elif token.kind == "string" and not (token.text[0] == "`" and "${" in token.text):
+            self.index += 1
+            result = _unquote(token.text)
+        elif token.kind == "number":
+            self.index += 1
+            result = token.text
+        elif token.kind == "regex":
+            self.index += 1
+            body, _, flags = token.text[1:].rpartition("/")
+            result = (body, flags)
+        elif token.kind == "name" and token.text in _KEYWORDS:
+            self.index += 1
+            result = _KEYWORDS[token.text]
+        if result is not _DYNAMIC and (self.peek() is None or any(self.at(end) for end in ",;}])")):
+            return result
+        # A call, a member access, an arrow function, an operator... - not static
+        self.index = start
+        self.skip_expression()
+        self.dynamic.append(path or "(config)")
+        return _DYNAMIC
+
+    def object(self, path: str) -> Dict[str, Any]:
+        self.index += 1  # {
+        result: Dict[str, Any] = {}
+        while not self.at("}"):
+            start = self.index
+            token = self.peek()
+            if token is None:
+                raise ConfigError("Unclosed object in config")
+            key: Optional[str] = None
+            if token.kind in ("name", "number"):
+                key = token.text
+            elif token.kind == "string":
+                key = _unquote(token.text)
+            if key is not None and (self.peek(1) is not None and self.peek(1).text in (":", ",", "}")):
+                self.index += 1
+                member = f"{path}.{key}" if path else key
+                if self.at(":"):
+                    self.index += 1
+                    value = self.value(member)
+                else:  # shorthand `{ colors }` names a variable
+                    value = _DYNAMIC
+                    self.dynamic.append(member)
+                if value is not _DYNAMIC:
+                    result[key] = value
+            else:  # `...spread`, `[computed]: value`, `method() {}`
+                self.skip_expression()
+                self.dynamic.append(f"{path or '(config)'} (spread)" if token.text == "..." else
+                                    f"{path}.{token.text}" if path else token.text)
+            if self.at(","):
+                self.index += 1
+            self.advanced(start)
+        self.index += 1  # }
+        return result
+
+    def array(self, path: str) -> List[Any]:
+        self.index += 1  # [
+        result: List[Any] = []
+        position = 0
+        while not self.at("]"):
+            start = self.index
+            if self.peek() is None:
+                raise ConfigError("Unclosed array in config")
+            value = self.value(f"{path}[{position}]")
+            if value is not _DYNAMIC:
+                result.append(value)
+            if self.at(","):
+                self.index += 1
+            self.advanced(start)
+            position += 1
+        self.index += 1  # ]
+        return result
+
+
+def _export_start(tokens: List[Token]) -> int:
+    """Index of the `{` that opens the exported config object."""
+    texts = [token.text for token in tokens]
+    for index, token in enumerate(tokens):
+        if token.text == "module" and texts[index + 1:index + 4] == [".", "exports", "="]:
+            start = index + 4
+        elif token.text == "export" and index + 1 < len(tokens) and texts[index + 1] == "default":
+            start = index + 2
+        else:
+            continue
+        while start < len(tokens) and tokens[start].kind == "name" and texts[start + 1:start + 2] == ["("]:
+            start += 2  # defineConfig({...}) and friends
+        if start < len(tokens) and texts[start] == "{":
+            return start
+        if start < len(tokens) and tokens[start].kind == "name":
+            name = texts[start]
+            for other in range(len(tokens) - 1):
+                if texts[other] in ("const", "let", "var") and texts[other + 1] == name and "=" in texts[other:]:
+                    equals = texts.index("=", other)  # past a `: Config` annotation
+                    if equals + 1 < len(tokens) and texts[equals + 1] == "{":
+                        return equals + 1
+    raise ConfigError("No static config object exported (expected module.exports = {...} or export default {...})")
+
+
+class TailwindConfig:
+    """The statically readable part of a Tailwind config."""
+
+    __slots__ = ("path", "content", "safelist", "theme", "extend", "dynamic")
+
+    def __init__(self, values: Dict[str, Any], dynamic: List[str], path: str = ""):
+        self.path = path
+        content = values.get("content", [])
+        if isinstance(content, dict):
+            content = content.get("files", [])
+        if not isinstance(content, list):
+            content = []
+        self.content: List[str] = [glob for glob in content if isinstance(glob, str)]
+        safelist = values.get("safelist", [])
+        if not isinstance(safelist, list):
+            dynamic.append("safelist (not a list)")
+            safelist = []
+        self.safelist: List[Union[str, SafelistPattern]] = []
+        for entry in safelist:
+            if isinstance(entry, str):
+                self.safelist.append(entry)
+            elif isinstance(entry, dict) and isinstance(entry.get("pattern"), tuple):
+                body, flags = entry["pattern"]
+                try:
+                    self.safelist.append(SafelistPattern(body, flags, [v for v in entry.get("variants", [])
+                                                                         if isinstance(v, str)]))
+                except re.error:
+                    dynamic.append(f"safelist pattern /{body}/")
+        theme = values.get("theme", {})
+        if not isinstance(theme, dict):
+            dynamic.append("theme (not an object)")
+            theme = {}
+        self.theme: Dict[str, Any] = {key: value for key, value in theme.items() if key != "extend"}
+        self.extend: Dict[str, Any] = theme.get("extend", {}) if isinstance(theme.get("extend"), dict) else {}
+        self.dynamic = dynamic
+
+
+def parse_config(text: str, path: str = "") -> TailwindConfig:
+    """Parse the config object exported by a config file's text."""
+    tokens = tokenize(text)
+    parser = _Parser(tokens, _export_start(tokens))
+    return TailwindConfig(parser.object(""), parser.dynamic, path)
+
+
+def load_config(path: str) -> TailwindConfig:
+    """Read and parse a config file, or the first `tailwind.config.*` in a directory."""
+    resolved = os.path.abspath(os.path.expanduser(path))
+    if os.path.isdir(resolved):
+        found = [os.path.join(resolved, name) for name in CONFIG_NAMES if os.path.isfile(os.path.join(resolved, name))]
+        if not found:
+            raise ConfigError(f"No tailwind.config.* in {path}")
+        resolved = found[0]
+    try:
+        if os.path.getsize(resolved) > MAX_CONFIG_BYTES:
+            raise ConfigError(f"Config file too large: {path}")
+        with open(resolved, encoding="utf-8", errors="replace") as handle:
+            text = handle.read()
+    except OSError as e:
+        raise ConfigError(f"Cannot read config {path}: {e.strerror or e}")
+    return parse_config(text, resolved)
+
+
+def flatten_theme(values: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """(`brand-500`, value) for every leaf of a nested theme section; `DEFAULT` names its parent."""
+    for key, value in values.items():
+        name = prefix if key == "DEFAULT" else f"{prefix}-{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from flatten_theme(value, name)
+        else:
+            yield name, value
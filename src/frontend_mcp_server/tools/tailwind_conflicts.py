@@ -0,0 +1,206 @@
+"""
+Conflicting Tailwind utilities on one element.
+
+Two classes conflict when they set the same CSS property under the same
+variants: `p-2 p-4`, `text-sm text-lg`, `p-4 px-2` (padding-left and
+padding-right), `md:flex md:hidden`. Which one applies is decided by the
+order of the rules in the generated stylesheet, not by the order of the
+classes in the markup, so the losing class is at best noise and at worst a
+surprise. A class whose every property is taken by another class is dead.
+
+The property index maps every theme utility to the longhand properties it
+sets plus its position in the stylesheet, built once from the same theme
+tables as the catalog (plugin order, then scale order). Shorthands expand to
+longhands so `p-4` and `px-2` overlap only on the horizontal sides,
+composed utilities (`blur-sm`, `brightness-50`) own their `--tw-*` variable
+instead of the shared `filter`, and child-selector utilities (`space-x-4`,
+`divide-y`) are scoped so they do not collide with the element's own
+margins and borders. Arbitrary values (`p-[13px]`, `bg-[#1da1f2]`) resolve
+through their prefix.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .tailwind_analysis import ClassUsage
+from .tailwind_catalog import split_variants
+from .tailwind_theme import NEGATABLE, SCALES, STATIC_UTILITIES, UTILITIES
+
+LONGHANDS: Dict[str, Tuple[str, ...]] = {
+    "padding": ("padding-top", "padding-right", "padding-bottom", "padding-left"),
+    "margin": ("margin-top", "margin-right", "margin-bottom", "margin-left"),
+    "inset": ("top", "right", "bottom", "left"),
+    "border-width": ("border-top-width", "border-right-width", "border-bottom-width", "border-left-width"),
+    "border-color": ("border-top-color", "border-right-color", "border-bottom-color", "border-left-color"),
+    "border-radius": ("border-top-left-radius", "border-top-right-radius", "border-bottom-right-radius",
+                      "border-bottom-left-radius"),
+    "gap": ("row-gap", "column-gap"),
+    "overflow": ("overflow-x", "overflow-y"),
+    "flex": ("flex-grow", "flex-shrink", "flex-basis"),
+    "grid-column": ("grid-column-start", "grid-column-end"),
+    "grid-row": ("grid-row-start", "grid-row-end"),
+    "place-content": ("align-content", "justify-content"),
+    "place-items": ("align-items", "justify-items"),
+    "place-self": ("align-self", "justify-self"),
+    "outline": ("outline-style", "outline-width", "outline-color"),
+}
+COMPOSED_PROPERTIES = frozenset({"filter", "backdrop-filter"})  # each utility owns a --tw-<prefix> variable
+CHILD_SCOPES = {  # utilities that style other elements than the one carrying the class
+    "space-x": "> * + *", "space-y": "> * + *", "divide": "> * + *", "divide-x": "> * + *",
+    "divide-y": "> * + *", "divide-solid": "> * + *", "divide-dashed": "> * + *", "placeholder": "::placeholder",
+}
+_ARBITRARY = re.compile(r"^(-?)(.+?)-\[(.+)\]$")
+_COLOR_VALUE = re.compile(r"^(#[0-9a-fA-F]{3,8}|(rgb|hsl|oklch|color)a?\(|color:|var\(--color)")
+
+Order = Tuple[int, str]  # (rule position, arbitrary value) in the generated stylesheet
+
+
+def _longhands(properties, scope: str = "") -> FrozenSet[str]:
+    expanded = [longhand for prop in properties for longhand in LONGHANDS.get(prop, (prop,))]
+    return frozenset(f"{scope} {prop}" if scope else prop for prop in expanded)
+
+
+def shorthand_names(properties: List[str]) -> Tuple[str, ...]:
+    """Sorted properties with complete longhand sets written as their shorthand (`padding`)."""
+    remaining = set(properties)
+    names = []
+    for shorthand, longhands in LONGHANDS.items():
+        if remaining.issuperset(longhands):
+            remaining.difference_update(longhands)
+            names.append(shorthand)
+    return tuple(sorted(names + list(remaining)))
+
+
+class PropertyIndex:
+    """Theme utility -> (longhand properties, stylesheet order), built once from the theme tables."""
+
+    __slots__ = ("classes", "prefixes")
+
+    def __init__(self):
+        self.classes: Dict[str, Tuple[FrozenSet[str], Order]] = {}
+        # prefix -> (scale, declared properties, longhands, position after its theme values)
+        self.prefixes: Dict[str, List[Tuple[str, Tuple[str, ...], FrozenSet[str], int]]] = {}
+        position = 0
+        for name, declarations in STATIC_UTILITIES.items():
+            self.classes[name] = (_longhands([prop for prop, _ in declarations], CHILD_SCOPES.get(name, "")),
+                                  (position, ""))
+            position += 1
+        for prefix, scale, declared in UTILITIES:
+            properties = declared
+            if COMPOSED_PROPERTIES.intersection(properties):
+                properties = tuple(f"--tw-{prefix}" if prop in COMPOSED_PROPERTIES else prop for prop in properties)
+            longhands = _longhands(properties, CHILD_SCOPES.get(prefix, ""))
+            for key in SCALES[scale]:
+                name = prefix if key == "DEFAULT" else f"{prefix}-{key}"
+                for candidate in (name, "-" + name) if prefix in NEGATABLE and key != "DEFAULT" else (name,):
+                    if candidate not in self.classes:
+                        self.classes[candidate] = (longhands, (position, ""))
+                position += 1
+            self.prefixes.setdefault(prefix, []).append((scale, declared, longhands, position))
+
+    def lookup(self, utility: str) -> Optional[Tuple[FrozenSet[str], Order]]:
+        """Properties and stylesheet order of a utility (no variants or `!`); None if it is not Tailwind's."""
+        found = self.classes.get(utility)
+        if found is not None:
+            return found
+        arbitrary = self.arbitrary(utility)
+        if arbitrary is None:
+            return None
+        _, _, longhands, end, value = arbitrary
+        return longhands, (end, value)  # arbitrary values follow the theme values of their utility
+
+    def arbitrary(self, utility: str) -> Optional[Tuple[str, Tuple[str, ...], FrozenSet[str], int, str]]:
+        """(scale, declared properties, longhands, position, value) of `p-[13px]`-style utilities; `-` negates."""
+        match = _ARBITRARY.match(utility)
+        if match is None or match.group(2) not in self.prefixes:
+            return None
+        value = match.group(3)
+        options = self.prefixes[match.group(2)]
+        if len(options) > 1:  # `text-[...]` is a color or a size, like Tailwind decides it: by the value
+            wanted = _COLOR_VALUE.match(value) is not None
+            options = [option for option in options if (option[0] == "colors") == wanted] or options
+        if match.group(1):
+            value = f"calc({value} * -1)"
+        return (*options[0], value)
+
+
+_INDEX: Optional[PropertyIndex] = None
+
+
+def property_index() -> PropertyIndex:
+    """The shared property index, built on first use."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = PropertyIndex()
+    return _INDEX
+
+
+class Conflict:
+    """One class overridden by another on the same element, aggregated over every such element."""
+
+    __slots__ = ("loser", "winner", "properties", "dead", "elements", "first")
+
+    def __init__(self, loser: str, winner: str, properties: Tuple[str, ...], dead: bool, first: int):
+        self.loser = loser
+        self.winner = winner
+        self.properties = properties
+        self.dead = dead
+        self.elements = 0
+        self.first = first  # element index of the first occurrence
+
+
+def element_conflicts(classes: List[str], index: Optional[PropertyIndex] = None
+                      ) -> List[Tuple[str, str, Tuple[str, ...], bool]]:
+    """(overridden class, winning class, properties, overridden class is dead) for one element's classes."""
+    index = index or property_index()
+    contexts: Dict[Tuple[str, ...], List[Tuple[Tuple[bool, Order], str, FrozenSet[str]]]] = {}
+    for name in classes:
+        variants, utility = split_variants(name)
+        found = index.lookup(utility.lstrip("!"))
+        if found is not None:
+            # `!important` beats stylesheet order, so it ranks above every plain rule in the same context
+            rank = (utility.startswith("!"), found[1])
+            contexts.setdefault(tuple(sorted(variants)), []).append((rank, name, found[0]))
+
+    conflicts = []
+    for members in contexts.values():
+        if len(members) < 2:
+            continue
+        owner: Dict[str, Tuple[Tuple[bool, Order], str]] = {}  # property -> (rank, class) of the rule that applies
+        for rank, name, properties in members:
+            for prop in properties:
+                if prop not in owner or rank > owner[prop][0]:
+                    owner[prop] = (rank, name)
+        for _, name, properties in members:
+            lost: Dict[str, List[str]] = {}
+            for prop in sorted(properties):
+                winner = owner[prop][1]
+                if winner != name:
+                    lost.setdefault(winner, []).append(prop)
+            dead = sum(len(props) for props in lost.values()) == len(properties)
+            conflicts.extend((name, winner, shorthand_names(props), dead) for winner, props in lost.items())
+    return conflicts
+
+
+def detect_conflicts(usage: ClassUsage) -> Tuple[List[Conflict], Counter]:
+    """Conflicts across every element, most frequent first, and dead class -> elements where nothing of it applies.
+
+    Elements with identical class sets are checked once.
+    """
+    index = property_index()
+    checked: Dict[Tuple[int, ...], List[Tuple[str, str, Tuple[str, ...], bool]]] = {}
+    found: Dict[Tuple[str, str, Tuple[str, ...], bool], Conflict] = {}
+    dead: Counter = Counter()
+    for element in range(usage.elements):
+        ids = tuple(usage.element_ids[usage.offsets[element]:usage.offsets[element + 1]])
+        conflicts = checked.get(ids)
+        if conflicts is None:
+            conflicts = checked[ids] = element_conflicts([usage.names[class_id] for class_id in ids], index)
+        for key in conflicts:
+            conflict = found.get(key)
+            if conflict is None:
+                conflict = found[key] = Conflict(*key, first=element)
+            conflict.elements += 1
+        dead.update({loser for loser, _, _, is_dead in conflicts if is_dead})
+    return sorted(found.values(), key=lambda conflict: (-conflict.elements, conflict.first)), dead
@@ -0,0 +1,413 @@
+"""
+Design-intent matching for Tailwind class suggestions.
+
+Free-text design descriptions ("a centered card with a soft shadow and
+navy heading") are matched against a synonym table of design terms in one
+pass of an Aho-Corasick automaton, so matching cost depends on the length
+of the description and the number of hits, not on the vocabulary size.
+Each term points at an intent with a strength, each intent at a weighted
+class group, and matched classes are scored by strength x weight.
+
+Terms match on word boundaries (with an optional plural `s`), overlapping
+hits keep the longest term ("dark blue" over "blue"), and a term directly
+after "no", "not", "without" or "non" is reported as negated, not scored.
+"""
+
+import re
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from .tailwind_theme import PALETTE
+
+# Intent -> weighted class group
+INTENT_CLASSES: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+
+
+def _group(intent: str, classes: str, weights: Tuple[float, ...] = ()) -> None:
+    """Register `classes` (space separated) for an intent; weights default to 1.0 each."""
+    names = classes.split()
+    INTENT_CLASSES[intent] = tuple(zip(names, weights + (1.0,) * (len(names) - len(weights))))
+
+
+# Layout
+_group("center", "flex items-center justify-center")
+_group("center_text", "text-center")
+_group("row", "flex flex-row items-center gap-4")
+_group("column", "flex flex-col gap-4")
+_group("wrap", "flex flex-wrap gap-2")
+_group("space_between", "flex items-center justify-between")
+_group("grid", "grid grid-cols-1 md:grid-cols-3 gap-4", (1.0, 0.8, 0.8, 0.9))
+_group("two_columns", "grid grid-cols-2 gap-4")
+_group("three_columns", "grid grid-cols-3 gap-4")
+_group("four_columns", "grid grid-cols-4 gap-4")
+_group("full_width", "w-full")
+_group("full_height", "h-full min-h-screen", (1.0, 0.7))
+_group("fullscreen", "fixed inset-0")
+_group("narrow", "max-w-md mx-auto")
+_group("contained", "container mx-auto max-w-7xl px-4", (1.0, 1.0, 0.8, 0.8))
+_group("sidebar", "w-64 shrink-0 border-r border-gray-200", (1.0, 0.8, 0.6, 0.6))
+_group("sticky", "sticky top-0 z-10")
+_group("fixed", "fixed z-50")
+_group("floating", "fixed bottom-4 right-4 z-50 shadow-lg")
+_group("overlay", "fixed inset-0 z-40 bg-gray-900 opacity-75")
+_group("stacked", "space-y-4")
+_group("scrollable", "overflow-y-auto")
+_group("clipped", "overflow-hidden")
+_group("square", "aspect-square")
+_group("video", "aspect-video")
+_group("hidden_mobile", "hidden md:block")
+_group("mobile_only", "md:hidden")
+_group("left_aligned", "text-left justify-start", (1.0, 0.6))
+_group("right_aligned", "text-right justify-end", (1.0, 0.6))
+_group("justified", "text-justify")
+# Spacing and size
+_group("spacious", "p-8 gap-6 space-y-6", (1.0, 0.7, 0.7))
+_group("compact", "p-2 gap-2 space-y-2", (1.0, 0.7, 0.7))
+_group("padded", "p-4")
+_group("large", "text-lg p-6")
+_group("extra_large", "text-xl p-8")
+_group("huge", "text-4xl p-10")
+_group("small", "text-sm p-2")
+_group("tiny", "text-xs p-1")
+# Typography
+_group("bold", "font-bold")
+_group("semibold", "font-semibold")
+_group("light", "font-light")
+_group("italic", "italic")
+_group("uppercase", "uppercase tracking-wide", (1.0, 0.6))
+_group("underline", "underline underline-offset-4", (1.0, 0.5))
+_group("truncate", "truncate")
+_group("monospace", "font-mono")
+_group("serif", "font-serif")
+_group("heading", "text-2xl font-bold tracking-tight text-gray-900", (1.0, 1.0, 0.6, 0.6))
+_group("subheading", "text-lg font-semibold text-gray-700", (1.0, 1.0, 0.6))
+_group("muted", "text-gray-500")
+_group("caption", "text-xs text-gray-500")
+_group("readable", "leading-relaxed max-w-prose", (1.0, 0.7))
+_group("tight_text", "leading-tight tracking-tight")
+# Borders and shape
+_group("rounded", "rounded-lg rounded", (1.0, 0.5))
+_group("pill", "rounded-full px-4")
+_group("circle", "rounded-full aspect-square")
+_group("sharp", "rounded-none")
+_group("bordered", "border border-gray-200")
+_group("thick_border", "border-2")
+_group("dashed", "border-dashed border-2", (1.0, 0.6))
+_group("dotted", "border-dotted border-2", (1.0, 0.6))
+_group("divided", "divide-y divide-gray-200")
+_group("outlined", "border border-gray-300 bg-transparent", (1.0, 1.0, 0.7))
+_group("ring", "ring-2 ring-offset-2", (1.0, 0.6))
+# Elevation and effects
+_group("shadow", "shadow-md shadow-lg", (1.0, 0.6))
+_group("soft_shadow", "shadow-sm")
+_group("heavy_shadow", "shadow-xl shadow-2xl", (1.0, 0.6))
+_group("flat", "shadow-none")
+_group("glass", "backdrop-blur-md bg-white border border-gray-100", (1.0, 0.7, 0.5, 0.5))
+_group("blurred", "blur-sm")
+_group("faded", "opacity-50")
+_group("transparent", "bg-transparent")
+_group("gradient", "bg-gradient-to-r from-blue-500 to-purple-600", (1.0, 0.8, 0.8))
+_group("grayscale", "grayscale")
+# Interaction and motion
+_group("hover", "hover:bg-gray-100 transition-colors", (1.0, 0.8))
+_group("clickable", "cursor-pointer hover:opacity-90 transition", (1.0, 0.7, 0.7))
+_group("animated", "transition duration-200 ease-in-out")
+_group("spinner", "animate-spin")
+_group("skeleton", "animate-pulse bg-gray-200 rounded", (1.0, 1.0, 0.6))
+_group("bounce", "animate-bounce")
+_group("scale_hover", "transition-transform hover:scale-105")
+_group("disabled", "disabled:opacity-50 disabled:cursor-not-allowed")
+_group("accessible", "focus:outline-none focus-visible:ring-2 focus-visible:ring-blue-500")
+_group("dark_mode", "dark:bg-gray-900 dark:text-gray-100")
+_group("selectable", "select-none", (0.5,))
+# Semantic color roles
+_group("primary", "bg-indigo-600 text-white hover:bg-indigo-700")
+_group("secondary", "bg-gray-100 text-gray-900 hover:bg-gray-200")
+_group("danger", "bg-red-600 text-white hover:bg-red-700")
+_group("success", "bg-green-600 text-white")
+_group("warning", "bg-amber-100 text-amber-800 border border-amber-300", (1.0, 1.0, 0.6, 0.6))
+_group("info", "bg-sky-50 text-sky-800 border border-sky-200", (1.0, 1.0, 0.6, 0.6))
+_group("dark_surface", "bg-gray-900 text-white")
+_group("light_surface", "bg-white text-gray-900")
+_group("muted_surface", "bg-gray-50")
+# Components
+_group("card", "bg-white rounded-lg shadow p-6")
+_group("badge", "inline-flex items-center rounded-full px-2.5 py-0.5 text-xs font-medium")
+_group("avatar", "h-10 w-10 rounded-full object-cover")
+_group("image_cover", "w-full h-48 object-cover")
+_group("modal", "fixed inset-0 z-50 flex items-center justify-center")
+_group("tooltip", "absolute z-10 rounded bg-gray-900 px-2 py-1 text-xs text-white")
+_group("navbar", "flex h-16 items-center justify-between px-4")
+_group("footer", "border-t border-gray-200 py-8 text-sm text-gray-500", (1.0, 0.6, 1.0, 0.8, 0.8))
+_group("input", "block w-full rounded-md border border-gray-300 px-3 py-2 focus:ring-2")
+_group("list", "space-y-2")
+_group("table", "w-full table-auto text-left text-sm")
+_group("link", "text-blue-600 hover:underline")
+_group("hero", "py-24 text-center text-5xl font-extrabold", (1.0, 0.8, 0.7, 0.7))
+_group("divider", "border-t border-gray-200 my-4")
+
+# Design term -> (intent, strength)
+DESIGN_TERMS: Dict[str, Tuple[str, float]] = {}
+
+
+def _terms(intent: str, *terms: str, strength: float = 1.0) -> None:
+    for term in terms:
+        DESIGN_TERMS[term] = (intent, strength)
+
+
+_terms("center", "center", "centered", "centre", "centred", "middle", "in the middle", "vertically centered",
+       "horizontally centered")
+_terms("center_text", "centered text", "text centered", "center aligned", "center-aligned text")
+_terms("row", "row", "horizontal", "side by side", "inline", "next to each other", "in a row")
+_terms("column", "column layout", "vertical", "stacked vertically", "one above the other", "top to bottom")
+_terms("wrap", "wrap", "wrapping", "tags list", "chips")
+_terms("space_between", "space between", "spread out", "spaced apart", "opposite ends", "split")
+_terms("grid", "grid", "gallery", "masonry", "tiles", "dashboard")
+_terms("two_columns", "two column", "two columns", "2 column", "2 columns", "split view", "halves")
+_terms("three_columns", "three column", "three columns", "3 column", "3 columns", "thirds")
+_terms("four_columns", "four column", "four columns", "4 column", "4 columns", "quarters")
+_terms("full_width", "full width", "full-width", "edge to edge", "stretched", "wide", "span the page")
+_terms("full_height", "full height", "full-height", "tall", "whole screen height", "viewport height")
+_terms("fullscreen", "fullscreen", "full screen", "cover the screen", "takeover")
+_terms("narrow", "narrow", "slim container", "reading width", "constrained")
+_terms("contained", "container", "contained", "max width", "boxed", "page wrapper")
+_terms("sidebar", "sidebar", "side bar", "side panel", "drawer", "rail")
+_terms("sticky", "sticky", "pinned", "stays on top", "sticky header", "stick to top")
+_terms("fixed", "fixed", "fixed position", "always visible")
+_terms("floating", "floating", "floats", "fab", "floating action button", "corner button")
+_terms("overlay", "overlay", "backdrop", "scrim", "dimmed background", "lightbox")
+_terms("stacked", "stacked", "stack", "vertical list", "spaced items")
+_terms("scrollable", "scrollable", "scrolling", "scroll", "overflow scroll")
+_terms("clipped", "clipped", "cropped", "clip", "overflow hidden")
+_terms("square", "square", "1:1")
+_terms("video", "video", "16:9", "widescreen", "embed")
+_terms("hidden_mobile", "desktop only", "hide on mobile", "hidden on mobile")
+_terms("mobile_only", "mobile only", "hide on desktop", "phone only")
+_terms("left_aligned", "left aligned", "left-aligned", "align left", "flush left")
+_terms("right_aligned", "right aligned", "right-aligned", "align right", "flush right")
+_terms("justified", "justified", "justify text")
+_terms("spacious", "spacious", "airy", "roomy", "generous spacing", "breathing room", "lots of whitespace",
+       strength=0.9)
+_terms("compact", "compact", "dense", "tight", "condensed", "cramped", "snug")
+_terms("padded", "padded", "padding", "inset", "some space")
+_terms("large", "large", "big", "prominent", "bigger", "larger", "oversized")
+_terms("extra_large", "extra large", "very large", "xl", "really big", "very big")
+_terms("huge", "huge", "giant", "massive", "enormous", "jumbo", "display text")
+_terms("small", "small", "smaller", "little", "mini")
+_terms("tiny", "tiny", "very small", "extra small", "micro", "fine print")
+_terms("bold", "bold", "strong", "heavy text", "emphasized", "emphasis", "thick text")
+_terms("semibold", "semibold", "semi bold", "medium weight")
+_terms("light", "light weight", "thin text", "delicate", "lightweight text", "hairline")
+_terms("italic", "italic", "italics", "slanted", "oblique")
+_terms("uppercase", "uppercase", "all caps", "capitals", "caps", "eyebrow")
+_terms("underline", "underline", "underlined")
+_terms("truncate", "truncate", "truncated", "ellipsis", "single line", "one line", "clamp")
+_terms("monospace", "monospace", "mono", "code", "code block", "terminal", "typewriter")
+_terms("serif", "serif", "editorial", "classic type", "elegant")
+_terms("heading", "heading", "headline", "title", "header text", "h1", "h2")
+_terms("subheading", "subheading", "subtitle", "section title", "h3", "tagline")
+_terms("muted", "muted", "subdued", "secondary text", "soft text", "quiet", "low contrast text", "dim")
+_terms("caption", "caption", "footnote", "helper text", "hint", "label text", "metadata", "timestamp")
+_terms("readable", "readable", "article", "prose", "blog post", "long text", "body copy")
+_terms("tight_text", "tight tracking", "tight leading", "condensed text")
+_terms("rounded", "rounded", "rounded corners", "round corners", "soft corners", "curved", "smooth corners")
+_terms("pill", "pill", "pill shaped", "capsule", "lozenge")
+_terms("circle", "circle", "circular", "round", "dot", "orb")
+_terms("sharp", "sharp", "sharp corners", "square corners", "boxy", "angular", "brutalist")
+_terms("bordered", "bordered", "border", "outline", "framed", "stroke", "hairline border", "keyline")
+_terms("thick_border", "thick border", "heavy border", "chunky border")
+_terms("dashed", "dashed", "dashed border", "drop zone", "dropzone", "placeholder box")
+_terms("dotted", "dotted", "dotted border")
+_terms("divided", "divided", "dividers", "separated", "separators", "striped list")
+_terms("outlined", "outlined", "ghost", "hollow", "wireframe")
+_terms("ring", "ring", "halo", "focus ring", "selected state")
+_terms("shadow", "shadow", "elevated", "raised", "lifted", "depth", "floating card", "drop shadow")
+_terms("soft_shadow", "soft shadow", "subtle shadow", "light shadow", "gentle shadow", "slight shadow")
+_terms("heavy_shadow", "heavy shadow", "strong shadow", "deep shadow", "dramatic shadow", "big shadow")
+_terms("flat", "flat", "no elevation", "material flat", "shadowless")
+_terms("glass", "glass", "glassy", "glassmorphism", "frosted", "frosted glass", "translucent")
+_terms("blurred", "blurred", "blurry", "out of focus")
+_terms("faded", "faded", "washed out", "semi transparent", "semi-transparent", "ghosted")
+_terms("transparent", "transparent", "see through", "clear background")
+_terms("gradient", "gradient", "ombre", "color fade", "vibrant background", "aurora")
+_terms("grayscale", "grayscale", "greyscale", "black and white", "monochrome image", "desaturated")
+_terms("hover", "hover", "hover effect", "hover state", "highlight on hover", "rollover")
+_terms("clickable", "clickable", "interactive", "tappable", "pressable", "actionable")
+_terms("animated", "animated", "animation", "smooth", "transition", "fade", "motion", "slide")
+_terms("spinner", "spinner", "spinning", "loading", "loader", "busy indicator", "rotating")
+_terms("skeleton", "skeleton", "shimmer", "placeholder", "pulse", "pulsing", "loading state")
+_terms("bounce", "bounce", "bouncing", "bouncy", "playful")
+_terms("scale_hover", "grow on hover", "zoom on hover", "scale up")
+_terms("disabled", "disabled", "inactive", "greyed out", "grayed out", "unavailable", "read only")
+_terms("accessible", "accessible", "accessibility", "a11y", "keyboard", "focus visible", "focusable")
+_terms("dark_mode", "dark mode", "night mode", "dark theme", "theme aware", "supports dark")
+_terms("selectable", "not selectable", "no select")
+_terms("primary", "primary", "main action", "call to action", "cta", "brand", "brand color", "accent")
+_terms("secondary", "secondary", "neutral button", "alternative action", "tertiary")
+_terms("danger", "danger", "destructive", "delete", "error", "remove", "critical", "alert", "warning red")
+_terms("success", "success", "confirmed", "approved", "positive", "completed", "done", "valid")
+_terms("warning", "warning", "caution", "attention", "pending", "notice")
+_terms("info", "info", "information", "informational", "tip", "note", "callout")
+_terms("dark_surface", "dark", "dark background", "inverted", "night", "moody", "black background")
+_terms("light_surface", "light", "light background", "white background", "clean", "minimal", "minimalist",
+       "simple", strength=0.8)
+_terms("muted_surface", "muted background", "subtle background", "off white", "gray background", "section band")
+_terms("card", "card", "panel", "tile", "box", "container card", "widget")
+_terms("badge", "badge", "tag", "chip", "label", "pill badge", "status", "counter")
+_terms("avatar", "avatar", "profile picture", "profile photo", "user icon", "headshot")
+_terms("image_cover", "image", "photo", "picture", "thumbnail", "banner image", "cover image")
+_terms("modal", "modal", "dialog", "popup", "pop up", "lightbox dialog", "sheet")
+_terms("tooltip", "tooltip", "popover", "hint bubble", "hover card")
+_terms("navbar", "navbar", "nav bar", "navigation bar", "header", "top bar", "toolbar", "app bar", "menu bar")
+_terms("footer", "footer", "bottom bar", "page footer")
+_terms("input", "input", "text field", "form field", "search box", "textbox", "text box", "search bar")
+_terms("list", "list", "items", "feed", "menu items")
+_terms("table", "table", "data table", "spreadsheet", "grid of data", "tabular")
+_terms("link", "link", "hyperlink", "anchor", "text link")
+_terms("hero", "hero", "hero section", "landing", "splash", "jumbotron", "banner")
+_terms("divider", "divider", "separator", "horizontal rule", "hr")
+
+# Named colors -> palette shade; every palette family also gets plain, light and dark terms
+NAMED_COLORS = {
+    "navy": "blue-900", "crimson": "red-600", "scarlet": "red-500", "maroon": "red-900", "burgundy": "rose-900",
+    "coral": "orange-400", "salmon": "red-300", "gold": "yellow-500", "golden": "amber-400",
+    "mustard": "yellow-600", "olive": "lime-700", "mint": "emerald-200", "turquoise": "teal-400",
+    "aqua": "cyan-300", "azure": "sky-500", "cobalt": "blue-700", "royal blue": "blue-700",
+    "baby blue": "sky-200", "lavender": "violet-200", "lilac": "purple-300", "magenta": "fuchsia-500",
+    "plum": "purple-800", "beige": "stone-200", "cream": "amber-50", "ivory": "stone-50",
+    "charcoal": "gray-800", "silver": "gray-300", "grey": "gray-500", "brown": "amber-800", "tan": "orange-200",
+    "peach": "orange-200", "khaki": "yellow-200", "forest green": "green-800", "sage": "green-300",
+    "jade": "emerald-600", "ruby": "rose-600", "cherry": "red-700", "lemon": "yellow-300", "sand": "amber-100",
+    "ocean": "cyan-700", "midnight": "slate-900", "wine": "rose-800", "brick": "red-800", "rust": "orange-700",
+    "copper": "orange-600", "bronze": "amber-700", "pastel pink": "pink-200", "hot pink": "pink-500",
+    "neon green": "lime-400", "electric blue": "blue-500", "steel": "slate-500", "graphite": "zinc-700",
+}
+for _name, _shade in NAMED_COLORS.items():
+    _family, _, _step = _shade.partition("-")
+    _group(f"color:{_name}", f"bg-{_shade} text-{_family}-{'900' if int(_step) < 500 else '50'} border-{_shade}",
+           (1.0, 0.6, 0.5))
+    _terms(f"color:{_name}", _name)
+for _family in PALETTE:
+    _group(f"color:{_family}", f"bg-{_family}-500 text-{_family}-600 border-{_family}-500", (1.0, 0.8, 0.6))
+    _group(f"color:light {_family}", f"bg-{_family}-100 text-{_family}-800 border-{_family}-200", (1.0, 0.8, 0.6))
+    _group(f"color:dark {_family}", f"bg-{_family}-800 text-{_family}-50 border-{_family}-900", (1.0, 0.8, 0.6))
+    _terms(f"color:{_family}", _family)
+    _terms(f"color:light {_family}", f"light {_family}", f"pale {_family}", f"pastel {_family}", f"soft {_family}")
+    _terms(f"color:dark {_family}", f"dark {_family}", f"deep {_family}", f"rich {_family}")
+_group("color:white", "bg-white text-gray-900")
+_group("color:black", "bg-black text-white")
+_terms("color:white", "white")
+_terms("color:black", "black")
+
+NEGATIONS = frozenset({"no", "not", "without", "non"})
+
+
+def normalize(text: str) -> str:
+    """Lowercase, punctuation and hyphens to single spaces, padded so every word has a space on each side."""
+    return " " + re.sub(r"[^a-z0-9:]+", " ", text.lower()).strip() + " "
+
+
+class IntentMatcher:
+    """Aho-Corasick automaton over normalized terms; states are list indices, 0 is the root."""
+
+    __slots__ = ("terms", "goto", "fail", "out", "steps")
+
+    def __init__(self, terms: List[str]):
+        self.terms = [normalize(term).strip() for term in terms]
+        self.goto: List[Dict[str, int]] = [{}]
+        self.out: List[List[int]] = [[]]
+        for term_id, term in enumerate(self.terms):
+            state = 0
+            for char in term:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.out.append([])
+                state = next_state
+            self.out[state].append(term_id)
+
+        # Breadth-first failure links; outputs are merged along them so matching never walks the chain
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+                queue.append(child)
+        self.steps = 0  # transitions the last scan followed, goto and failure links alike
+
+    def scan(self, text: str) -> List[Tuple[int, int, int]]:
+        """All (start, end, term id) hits in already normalized text, one pass."""
+        goto, fail, out, terms = self.goto, self.fail, self.out, self.terms
+        hits = []
+        state = steps = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+                steps += 1
+            state = goto[state].get(char, 0)
+            steps += 1
+            for term_id in out[state]:
+                hits.append((end - len(terms[term_id]), end, term_id))
+        self.steps = steps
+        return hits
+
+    def matches(self, text: str) -> List[Tuple[int, int, int]]:
+        """Word-bounded, non-overlapping hits, longest first where terms overlap."""
+        bounded = []
+        for start, end, term_id in self.scan(text):
+            if text[start - 1] != " ":
+                continue
+            if text[end] == " ":
+                bounded.append((start, end, term_id))
+            elif text[end] == "s" and text[end + 1] == " ":  # plural
+                bounded.append((start, end + 1, term_id))
+        bounded.sort(key=lambda hit: (hit[0], hit[0] - hit[1]))
+        chosen: List[Tuple[int, int, int]] = []
+        for hit in bounded:
+            if chosen and hit[0] < chosen[-1][1]:
+                if hit[1] - hit[0] > chosen[-1][1] - chosen[-1][0]:
+                    chosen[-1] = hit  # a longer term starting inside the previous one wins
+                continue
+            chosen.append(hit)
+        return chosen
+
+
+_MATCHER: Optional[IntentMatcher] = None
+_MATCHER_TERMS: List[str] = []
+
+
+def intent_matcher() -> IntentMatcher:
+    """The automaton over DESIGN_TERMS, built on first use."""
+    global _MATCHER, _MATCHER_TERMS
+    if _MATCHER is None:
+        _MATCHER_TERMS = list(DESIGN_TERMS)
+        _MATCHER = IntentMatcher(_MATCHER_TERMS)
+    return _MATCHER
+
+
+def match_intents(description: str
+                  ) -> Tuple[List[Tuple[str, float]], List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """Score classes for a description: ([(class, score)] best first, [(matched text, intent)], [negated ones])."""
+    matcher = intent_matcher()
+    text = normalize(description)
+    scores: Dict[str, float] = {}
+    matched = []
+    negated = []
+    for start, end, term_id in matcher.matches(text):
+        previous = text[:start - 1].rsplit(" ", 1)[-1]
+        intent, strength = DESIGN_TERMS[_MATCHER_TERMS[term_id]]
+        if previous in NEGATIONS:
+            negated.append((text[start:end], intent))
+            continue
+        matched.append((text[start:end], intent))
+        for cls, weight in INTENT_CLASSES[intent]:
+            scores[cls] = scores.get(cls, 0.0) + strength * weight
+    ranked = sorted(scores.items(), key=lambda item: -item[1])  # stable: first mention wins ties
+    return ranked, matched, negated
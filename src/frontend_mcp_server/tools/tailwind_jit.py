@@ -0,0 +1,131 @@
+"""
+A small Tailwind JIT: the utilities layer a set of classes generates.
+
+Each class compiles on its own, like Tailwind's JIT does it. The variants
+are split off, the utility's declarations come from the catalog, or from
+the property index for arbitrary values (`p-[13px]`, `-mt-[3px]`,
+`grid-cols-[1fr_auto]`), and `!` marks every declaration `!important`.
+Pseudo-class and pseudo-element variants extend the escaped selector,
+`group-`/`peer-` variants prefix it, and media variants wrap the rule in
+`@media` blocks. Rules are emitted minified and in stylesheet order:
+plain rules first, then one block per media chain. Classes that Tailwind
+would not generate (unknown utilities, unknown variants) are left out and
+listed.
+
+The sizes cover the utilities layer only. Preflight and `@apply`
+components are not included, and the theme tables describe values rather
+than the exact plugin output (`--tw-*` helper variables are skipped), so
+the byte counts are estimates. They are meant for comparing builds and
+enforcing budgets, not for matching a real build to the byte.
+"""
+
+import gzip
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .tailwind_catalog import CATALOG, split_variants
+from .tailwind_conflicts import Order, property_index
+from .tailwind_theme import SCALES, VARIANTS
+
+GZIP_LEVEL = 9
+CHILD_SELECTORS = {  # utility roots that style the children, not the element carrying the class
+    "space": ">:not([hidden])~:not([hidden])", "divide": ">:not([hidden])~:not([hidden])",
+    "placeholder": "::placeholder",
+}
+_MEDIA_ORDER = {value.replace(": ", ":"): position
+                for position, (kind, value) in enumerate(VARIANTS.values()) if kind == "media"}
+_ESCAPE = re.compile(r"[^a-zA-Z0-9_-]")
+
+# (stylesheet order, media queries, rule)
+CompiledRule = Tuple[Order, Tuple[str, ...], str]
+
+
+def escape_class(name: str) -> str:
+    """The class name as a CSS selector: `md:w-1/2` -> `.md\\:w-1\\/2`, a leading digit as a code point."""
+    escaped = _ESCAPE.sub(lambda match: "\\" + match.group(0), name)
+    if name[:1].isdigit():
+        escaped = f"\\{ord(name[0]):x} {escaped[1:]}"
+    return "." + escaped
+
+
+def utility_declarations(utility: str) -> Optional[List[Tuple[str, str]]]:
+    """(property, value) pairs of a utility without variants or `!`; None if Tailwind would not generate it."""
+    css = CATALOG.detail(utility)
+    if css is not None:
+        return [tuple(declaration.split(": ", 1)) for declaration in css.split("; ")]  # type: ignore[misc]
+    arbitrary = property_index().arbitrary(utility)
+    if arbitrary is None:
+        return None
+    scale, properties, _, _, value = arbitrary
+    if any(isinstance(theme_value, tuple) for theme_value in SCALES[scale].values()):
+        properties = properties[:1]  # `text-[14px]` sets the size alone, not the paired line height
+    value = value.replace("_", " ")  # Tailwind's stand-in for spaces inside brackets
+    return [(prop, value) for prop in properties]
+
+
+@lru_cache(maxsize=16384)
+def compile_class(name: str) -> Optional[CompiledRule]:
+    """The minified rule a class generates, with its stylesheet order and media chain; None if none."""
+    variants, utility = split_variants(name)
+    important = utility.startswith("!")
+    utility = utility.lstrip("!")
+    declarations = utility_declarations(utility)
+    found = property_index().lookup(utility)
+    if declarations is None or found is None or any(variant not in VARIANTS for variant in variants):
+        return None
+
+    selector = escape_class(name) + CHILD_SELECTORS.get(utility.lstrip("-").split("-", 1)[0], "")
+    media: List[str] = []
+    for variant in reversed(variants):  # the innermost variant sits next to the utility
+        kind, value = VARIANTS[variant]
+        if kind == "media":
+            media.append(value.replace(": ", ":"))
+        elif kind == "parent":
+            selector = value + selector
+        else:
+            selector += value
+    suffix = "!important" if important else ""
+    body = ";".join(f"{prop}:{value}{suffix}" for prop, value in declarations)
+    return found[1], tuple(reversed(media)), f"{selector}{{{body}}}"
+
+
+class CssBuild:
+    """The generated utilities layer for a class set."""
+
+    __slots__ = ("css", "bytes", "gzip_bytes", "class_bytes", "skipped")
+
+    def __init__(self, css: str, class_bytes: Dict[str, int], skipped: List[str]):
+        self.css = css
+        self.bytes = len(css.encode("utf-8"))
+        self.gzip_bytes = len(gzip.compress(css.encode("utf-8"), compresslevel=GZIP_LEVEL, mtime=0)) if css else 0
+        self.class_bytes = class_bytes  # class -> bytes of its own rule; shared @media wrappers are not split
+        self.skipped = skipped  # classes that generate no CSS
+
+    def costliest(self, top_n: int) -> List[Tuple[str, int]]:
+        """The classes with the largest rules."""
+        return sorted(self.class_bytes.items(), key=lambda item: (-item[1], item[0]))[:top_n]
+
+
+def generate_css(classes: Iterable[str]) -> CssBuild:
+    """Compile a class set (duplicates ignored) into the minified utilities layer."""
+    groups: Dict[Tuple[str, ...], List[Tuple[Order, str]]] = {}
+    class_bytes: Dict[str, int] = {}
+    skipped: List[str] = []
+    for name in dict.fromkeys(classes):
+        compiled = compile_class(name)
+        if compiled is None:
+            skipped.append(name)
+            continue
+        order, media, rule = compiled
+        groups.setdefault(media, []).append((order, rule))
+        class_bytes[name] = len(rule.encode("utf-8"))
+
+    parts = []
+    for media in sorted(groups, key=lambda chain: (len(chain), [_MEDIA_ORDER[query] for query in chain])):
+        block = "".join(rule for _, rule in sorted(groups[media]))
+        for query in reversed(media):
+            block = f"@media {query}{{{block}}}"
+        parts.append(block)
+    return CssBuild("".join(parts), class_bytes, skipped)
+
@@ -0,0 +1,277 @@
+"""
+Project-wide Tailwind usage index.
+
+The source tree is walked with `os.scandir` (entries carry their stat, so
+unchanged files cost one directory read and no `open`). Every file keeps a
+cache entry of (mtime, size, content hash, extracted class lists): a rescan
+re-reads only files whose mtime or size moved, skips re-extraction when the
+hash shows the content did not actually change, and fans the remaining
+extraction out over a process pool once there are enough files to pay for
+it. The usage index is rebuilt from the cached class lists, which is cheap -
+identical class strings are parsed once by ClassUsage.
+
+Scans run on worker threads of the server's event loop, so pool workers
+are started with forkserver (spawn where there is none), never by forking
+a process that has other threads running.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .tailwind_analysis import ClassUsage, class_lists_with_lines
+
+SOURCE_EXTENSIONS = (".tsx", ".jsx", ".ts", ".js", ".html", ".vue", ".svelte", ".astro", ".mdx")
+SKIP_DIRECTORIES = frozenset({"node_modules", "dist", "build", "out", "coverage", "vendor", "__pycache__"})
+PARALLEL_MIN_FILES = 32  # below this, extraction runs in-process - spawning workers costs more than it saves
+FILES_PER_WORKER = 8
+MAX_FILE_BYTES = 2 * 1024 * 1024  # larger files are bundles or generated output, not sources
+SCANNER_CACHE_SIZE = 8  # project roots (per file selection) whose file caches stay in memory
+
+ClassLists = Tuple[Tuple[int, str], ...]
+
+
+class ProjectScanError(Exception):
+    """Raised when the project root cannot be scanned."""
+
+
+def glob_regex(pattern: str) -> str:
+    """Regex for a content glob (`src/**/*.{js,tsx}`) matched against root-relative `/` paths."""
+    parts, depth, index = [], 0, 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "{":
+            depth += 1
+            parts.append("(?:")
+        elif char == "}" and depth:
+            depth -= 1
+            parts.append(")")
+        elif char == "," and depth:
+            parts.append("|")
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+def content_matcher(root: str, globs: Sequence[str]) -> Callable[[str], bool]:
+    """Predicate over root-relative paths for Tailwind `content` globs; `!glob` excludes, globs outside root are ignored."""
+    included, excluded = [], []
+    for glob in globs:
+        negated = glob.startswith("!")
+        glob = glob[1:] if negated else glob
+        relative = os.path.relpath(os.path.join(root, glob), root).replace(os.sep, "/")
+        if relative.startswith(".."):
+            continue
+        (excluded if negated else included).append(glob_regex(relative))
+    include = re.compile("|".join(f"(?:{regex})" for regex in included)) if included else None
+    exclude = re.compile("|".join(f"(?:{regex})" for regex in excluded)) if excluded else None
+    return lambda path: (include is not None and include.fullmatch(path) is not None
+                         and (exclude is None or exclude.fullmatch(path) is None))
+
+
+def walk_sources(root: str, extensions: Optional[Tuple[str, ...]] = SOURCE_EXTENSIONS) -> Iterator[os.DirEntry]:
+    """Source file entries below root (any file when `extensions` is None), skipping hidden, dependency and build directories."""
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                children = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in children:
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRECTORIES:
+                    subdirectories.append(entry.path)
+            elif (extensions is None or entry.name.endswith(extensions)) and entry.is_file(follow_symlinks=False):
+                yield entry
+        pending.extend(reversed(subdirectories))
+
+
+def extract_file(path: str, known_digest: Optional[str] = None) -> Tuple[str, Optional[ClassLists]]:
+    """(content hash, class lists) of one file; lists are None when the hash equals `known_digest`."""
+    with open(path, "rb") as handle:
+        data = handle.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if digest == known_digest:
+        return digest, None
+    return digest, tuple(class_lists_with_lines(data.decode("utf-8", errors="replace")))
+
+
+def _extract_job(job: Tuple[str, Optional[str]]) -> Optional[Tuple[str, Optional[ClassLists]]]:
+    """Pool worker: extract_file, with None for a file that vanished or cannot be read."""
+    try:
+        return extract_file(*job)
+    except OSError:
+        return None
+
+
+def pool_context() -> Any:
+    """Multiprocessing context for worker pools: forkserver, or spawn where there is none."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def run_jobs(function: Callable[[Any], Any], jobs: List[Any], workers: Optional[int] = None) -> Tuple[List[Any], int]:
+    """(results in job order, processes used): over a process pool when there are enough jobs to pay for it.
+
+    `function` must be a module-level function so the pool can pickle it.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) >= PARALLEL_MIN_FILES:
+        workers = min(workers, len(jobs) // FILES_PER_WORKER)
+        chunksize = max(1, len(jobs) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as pool:
+                return list(pool.map(function, jobs, chunksize=chunksize)), workers
+        except (OSError, BrokenProcessPool):
+            pass  # no process support here (or a worker died) - fall back to running in-process
+    return [function(job) for job in jobs], 1
+
+
+class FileEntry:
+    """Cached extraction of one source file."""
+
+    __slots__ = ("mtime_ns", "size", "digest", "lists")
+
+    def __init__(self, mtime_ns: int, size: int, digest: str, lists: ClassLists):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.lists = lists
+
+
+class ProjectScan:
+    """Result of one scan: the usage index plus what the cache saved."""
+
+    __slots__ = ("root", "usage", "files", "extensions", "reused", "rehashed", "extracted", "removed",
+                 "skipped", "workers", "seconds")
+
+    def __init__(self, root: str):
+        self.root = root
+        self.usage = ClassUsage()
+        self.files = 0
+        self.extensions: Counter = Counter()
+        self.reused = 0  # mtime and size unchanged - not opened
+        self.rehashed = 0  # touched, but the content hash matched - not re-extracted
+        self.extracted = 0
+        self.removed = 0
+        self.skipped: List[str] = []  # unreadable or oversized
+        self.workers = 0
+        self.seconds = 0.0
+
+
+class ProjectScanner:
+    """Incremental scanner for one project root."""
+
+    __slots__ = ("root", "files", "lock")
+
+    def __init__(self, root: str):
+        self.root = root
+        self.files: Dict[str, FileEntry] = {}  # relative path -> cache entry
+        self.lock = threading.Lock()  # one scan at a time updates the cache
+
+    def scan(self, workers: Optional[int] = None, extensions: Tuple[str, ...] = SOURCE_EXTENSIONS,
+             content: Optional[Sequence[str]] = None) -> ProjectScan:
+        """Rescan the tree, extracting only changed files; `workers=1` keeps extraction in-process.
+
+        `content` globs, when given, select the files instead of `extensions`.
+        """
+        start = time.perf_counter()
+        result = ProjectScan(self.root)
+        present = set()
+        changed: List[Tuple[str, os.stat_result]] = []
+        jobs: List[Tuple[str, Optional[str]]] = []
+        selected = content_matcher(self.root, content) if content is not None else None
+        for entry in walk_sources(self.root, None if selected else extensions):
+            relative = os.path.relpath(entry.path, self.root).replace(os.sep, "/")
+            if selected is not None and not selected(relative):
+                continue
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                result.skipped.append(relative)
+                continue
+            if stat.st_size > MAX_FILE_BYTES:
+                result.skipped.append(relative)
+                continue
+            present.add(relative)
+            cached = self.files.get(relative)
+            if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                result.reused += 1
+            else:
+                changed.append((relative, stat))
+                jobs.append((entry.path, cached.digest if cached is not None else None))
+
+        outcomes, result.workers = run_jobs(_extract_job, jobs, workers)
+        for (relative, stat), outcome in zip(changed, outcomes):
+            if outcome is None:
+                result.skipped.append(relative)
+                self.files.pop(relative, None)
+                continue
+            digest, lists = outcome
+            cached = self.files.get(relative)
+            if lists is None:
+                result.rehashed += 1
+                lists = cached.lists
+            else:
+                result.extracted += 1
+            self.files[relative] = FileEntry(stat.st_mtime_ns, stat.st_size, digest, lists)
+
+        for relative in [relative for relative in self.files if relative not in present]:
+            del self.files[relative]
+            result.removed += 1
+
+        for relative in sorted(self.files):
+            result.usage.add_lists(self.files[relative].lists, relative)
+            result.extensions[os.path.splitext(relative)[1]] += 1
+        result.files = len(self.files)
+        result.seconds = time.perf_counter() - start
+        return result
+
+
+# Scanners keep their file caches between calls, so rescans only touch changed files. They are keyed by
+# root and file selection: a content-glob scan drops the entries an extension scan of the same root keeps.
+_SCANNERS: "OrderedDict[Tuple[str, str, Tuple[str, ...]], ProjectScanner]" = OrderedDict()
+_SCANNERS_LOCK = threading.Lock()
+
+
+def scan_project(root: str, workers: Optional[int] = None, extensions: Tuple[str, ...] = SOURCE_EXTENSIONS,
+                 content: Optional[Sequence[str]] = None) -> ProjectScan:
+    """Scan a project root, reusing the cache of the previous scan of the same root and file selection."""
+    resolved = os.path.abspath(os.path.expanduser(root))
+    if not os.path.isdir(resolved):
+        raise ProjectScanError(f"Project directory not found: {root}")
+    key = (resolved, "content", tuple(content)) if content is not None else (resolved, "extensions", tuple(extensions))
+    with _SCANNERS_LOCK:
+        scanner = _SCANNERS.get(key)
+        if scanner is None:
+            scanner = _SCANNERS[key] = ProjectScanner(resolved)
+        _SCANNERS.move_to_end(key)
+        while len(_SCANNERS) > SCANNER_CACHE_SIZE:
+            _SCANNERS.popitem(last=False)
+    with scanner.lock:
+        return scanner.scan(workers, extensions, content)
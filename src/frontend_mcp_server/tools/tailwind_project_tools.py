@@ -0,0 +1,389 @@
+"""
+Tailwind Project Tools - a project-wide class usage index built from the
+source tree on disk, so the optimizer advice can cover a whole frontend
+instead of one pasted snippet, a purge check of the Tailwind config
+against that index, and a consolidation of the project's ad-hoc colors
+into design tokens.
+"""
+
+import asyncio
+import json
+import os
+from typing import Any, Dict, List
+
+import numpy as np
+from mcp import types
+
+from .tailwind_analysis import CLASS_HELPERS, DEFAULT_TOP_N
+from .tailwind_color_tokens import COLOR_EXTENSIONS, DEFAULT_TOLERANCE, ColorReport, consolidate_colors
+from .tailwind_config import ConfigError, load_config
+from .tailwind_jit import generate_css
+from .tailwind_project import SOURCE_EXTENSIONS, ProjectScan, ProjectScanError, scan_project
+from .tailwind_purge import MAX_CSS_BYTES, PurgeReport, analyze_purge
+
+
+def get_tools() -> List[types.Tool]:
+    """Get Tailwind project tools."""
+    return [
+        types.Tool(
+            name="tailwind_project_scanner",
+            description=f"Scan a frontend directory ({', '.join(SOURCE_EXTENSIONS)}) and index Tailwind class usage from class/className attributes, template literals, Vue :class bindings and {'/'.join(CLASS_HELPERS[:2])}-style helper calls; rescans only re-read changed files",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_path": {
+                        "type": "string",
+                        "description": "Local path of the project (or its src directory); node_modules, build output and hidden directories are skipped"
+                    },
+                    "extensions": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "File extensions to scan",
+                        "default": list(SOURCE_EXTENSIONS)
+                    },
+                    "workers": {
+                        "type": "integer",
+                        "description": "Extraction processes (0 = one per CPU, 1 = in-process)",
+                        "default": 0
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "description": "Entries listed per ranking",
+                        "default": DEFAULT_TOP_N
+                    },
+                    "css_budget": {
+                        "type": "integer",
+                        "description": "Gzipped bytes the generated utilities CSS may take (0 = no budget); the report says by how much it is exceeded",
+                        "default": 0
+                    },
+                    "include_index": {
+                        "type": "boolean",
+                        "description": "Append the class -> files index as JSON",
+                        "default": False
+                    }
+                },
+                "required": ["project_path"]
+            }
+        ),
+        types.Tool(
+            name="tailwind_purge_analyzer",
+            description="Check a tailwind.config.js/.ts against the project sources: safelist entries never used, theme values never referenced, and classes in a built CSS file that no source uses",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "config_path": {
+                        "type": "string",
+                        "description": "Path of tailwind.config.js/.ts, or the directory holding it; globs resolve from its directory"
+                    },
+                    "content": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Content globs to scan instead of the config's `content` (e.g. ./src/**/*.{js,tsx})"
+                    },
+                    "css_path": {
+                        "type": "string",
+                        "description": "Built CSS file to compare against the sources"
+                    },
+                    "workers": {
+                        "type": "integer",
+                        "description": "Extraction processes (0 = one per CPU, 1 = in-process)",
+                        "default": 0
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "description": "Entries listed per section",
+                        "default": DEFAULT_TOP_N
+                    }
+                },
+                "required": ["config_path"]
+            }
+        ),
+        types.Tool(
+            name="tailwind_color_tokens",
+            description="Collect the colors a project hard-codes (arbitrary classes like bg-[#3b82f7], inline hex/rgb()/hsl()/oklch() values), cluster near-duplicates in OKLab and map each cluster to a default palette token or a proposed custom token, with the CSS bytes the replacements save",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "project_path": {
+                        "type": "string",
+                        "description": "Local path of the project (or its src directory)"
+                    },
+                    "extensions": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "File extensions to scan",
+                        "default": list(COLOR_EXTENSIONS)
+                    },
+                    "tolerance": {
+                        "type": "number",
+                        "description": "OKLab distance under which colors merge into one token (0.02 = barely visible, 0.05 = clearly different)",
+                        "default": DEFAULT_TOLERANCE
+                    },
+                    "workers": {
+                        "type": "integer",
+                        "description": "Extraction processes (0 = one per CPU, 1 = in-process)",
+                        "default": 0
+                    },
+                    "top_n": {
+                        "type": "integer",
+                        "description": "Clusters listed",
+                        "default": DEFAULT_TOP_N
+                    }
+                },
+                "required": ["project_path"]
+            }
+        )
+    ]
+
+
+def usage_index(scan: ProjectScan) -> Dict[str, Dict[str, Any]]:
+    """Class -> {elements, files} for every class in the project, most used first."""
+    usage = scan.usage
+    files: Dict[str, List[str]] = {name: [] for name in usage.names}
+    for element in range(usage.elements):
+        source = usage.sources[usage.element_sources[element]]
+        for name in usage.element(element):
+            if not files[name] or files[name][-1] != source:
+                files[name].append(source)
+    return {name: {"elements": count, "files": files[name]} for name, count in usage.frequencies().most_common()}
+
+
+def format_project_scan(scan: ProjectScan, top_n: int, include_index: bool, css_budget: int = 0) -> str:
+    """Markdown report of a project scan."""
+    usage = scan.usage
+    css = generate_css(usage.names)
+    budget = ""
+    if css_budget:
+        over = css.gzip_bytes - css_budget
+        budget = f" - **over the {css_budget} byte budget by {over}**" if over > 0 else f" - within the {css_budget} byte budget"
+    frequencies = usage.frequencies()
+    file_counts = dict(zip(usage.names, usage.files_per_class().tolist()))
+    unknown = usage.unknown_classes()
+    top_rows = "\n".join(f"| `{cls}` | {count} | {file_counts[cls]} |" for cls, count in frequencies.most_common(top_n))
+    unknown_rows = "\n".join(f"| `{cls}` | {count} | {usage.first_location(cls)} |" for cls, count in unknown[:top_n])
+    variant_rows = "\n".join(f"| {chain} | {uses} | {distinct} |"
+                             for chain, (uses, distinct) in list(usage.variant_breakdown().items())[:top_n])
+    per_source = np.bincount(np.frombuffer(usage.element_sources, dtype=np.int64), minlength=len(usage.sources))
+    per_file = sorted(zip(usage.sources, per_source.tolist()), key=lambda item: -item[1])[:top_n]
+    file_rows = "\n".join(f"| {source} | {count} |" for source, count in per_file if count)
+    extensions = ", ".join(f"{extension} ({count})" for extension, count in scan.extensions.most_common())
+
+    result = f"""# Tailwind Project Usage
+
+## Summary
+- **Project**: {scan.root}
+- **Files scanned**: {scan.files}{f" - {extensions}" if extensions else ""}
+- **Elements with classes**: {usage.elements}
+- **Total classes found**: {usage.total}
+- **Unique classes**: {len(frequencies)}
+- **Outside the default theme**: {len(unknown)}
+- **Generated CSS**: {css.bytes} bytes minified, {css.gzip_bytes} bytes gzipped{budget}
+
+## Scan
+- **Unchanged (cached)**: {scan.reused}
+- **Touched but identical (hash match)**: {scan.rehashed}
+- **Extracted**: {scan.extracted}{f" across {scan.workers} worker processes" if scan.workers > 1 else ""}
+- **Removed since last scan**: {scan.removed}
+- **Skipped (unreadable or oversized)**: {len(scan.skipped)}
+- **Time**: {scan.seconds * 1000:.0f} ms
+
+## Most Used Classes
+| Class | Elements | Files |
+|---|---:|---:|
+{top_rows or "| (none) | 0 | 0 |"}
+
+## Outside the Default Theme
+{f"| Class | Elements | First use |{chr(10)}|---|---:|---|{chr(10)}{unknown_rows}" if unknown_rows else "Every class is generated by the default theme."}
+
+## Variants
+| Variant | Uses | Distinct classes |
+|---|---:|---:|
+{variant_rows or "| (none) | 0 | 0 |"}
+
+## Files With the Most Styled Elements
+{f"| File | Elements |{chr(10)}|---|---:|{chr(10)}{file_rows}" if file_rows else "No class lists found."}
+"""
+    if include_index:
+        result += f"""
+## Index
+```json
+{json.dumps(usage_index(scan), indent=2)}
+```
+"""
+    return result
+
+
+def tailwind_project_scanner(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Scan a project directory for Tailwind class usage."""
+    try:
+        top_n = int(arguments.get("top_n", DEFAULT_TOP_N))
+        css_budget = int(arguments.get("css_budget", 0))
+        extensions = tuple(
+            extension if extension.startswith(".") else f".{extension}"
+            for extension in arguments.get("extensions") or SOURCE_EXTENSIONS
+        )
+        scan = scan_project(str(arguments.get("project_path", "")), int(arguments.get("workers", 0)) or None,
+                            extensions)
+    except (ProjectScanError, ValueError, TypeError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+    text = format_project_scan(scan, top_n, bool(arguments.get("include_index")), css_budget)
+    return [types.TextContent(type="text", text=text)]
+
+
+def format_purge_report(report: PurgeReport, top_n: int) -> str:
+    """Markdown report of a purge analysis."""
+    config = report.config
+    safelist_rows = "\n".join(f"| `{entry.entry}` | {entry.classes} | {entry.used} |"
+                               for entry in sorted(report.safelist, key=lambda entry: entry.used - entry.classes)[:top_n])
+    theme_rows = "\n".join(f"| {theme.section} | `{theme.name}` | {theme.value} | `{theme.example}` |"
+                            for theme in report.unused_theme[:top_n])
+    css_rows = "\n".join(f"- `{cls}`" for cls in report.css_unused[:top_n])
+    bloat = report.bloat
+    css_section = f"""
+## Built CSS
+- **Classes in the CSS**: {report.css_classes}
+- **Kept only by the safelist**: {report.css_safelisted}
+- **In no source and no safelist**: {len(report.css_unused)}
+{chr(10) + css_rows + chr(10) if css_rows else ""}""" if report.css_classes else ""
+
+    result = f"""# Tailwind Purge Analysis
+
+## Summary
+- **Config**: {config.path}
+- **Content**: {", ".join(config.content) or "(none - every source file)"}
+- **Files scanned**: {report.scan.files}
+- **Classes in sources**: {len(report.scan.usage.names)}
+- **Safelisted classes never used**: {len(report.unused_safelist)}{f" - about {bloat.bytes} bytes of CSS ({bloat.gzip_bytes} gzipped)" if bloat else ""}
+- **Theme values never referenced**: {len(report.unused_theme)}
+
+## Safelist
+{f"| Entry | Classes generated | Used in sources |{chr(10)}|---|---:|---:|{chr(10)}{safelist_rows}" if safelist_rows else "The config has no safelist."}
+{f"{chr(10)}Unused: {', '.join(f'`{cls}`' for cls in report.unused_safelist[:top_n])}{' ...' if len(report.unused_safelist) > top_n else ''}{chr(10)}" if report.unused_safelist else ""}
+## Unreferenced Theme Values
+{f"| Section | Name | Value | e.g. |{chr(10)}|---|---|---|---|{chr(10)}{theme_rows}" if theme_rows else "Every theme value in the config is used."}
+{css_section}"""
+    notes = [f"- {section}: no utility known to map to it, not checked" for section in report.unchecked_theme]
+    notes += [f"- `{path}`: not a static value, not read" for path in config.dynamic]
+    if notes:
+        result += f"""
+## Not Analysed
+{chr(10).join(notes)}
+"""
+    return result
+
+
+def tailwind_purge_analyzer(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Compare a Tailwind config's safelist and theme, and optionally a built CSS file, with the sources."""
+    try:
+        top_n = int(arguments.get("top_n", DEFAULT_TOP_N))
+        config = load_config(str(arguments.get("config_path", "")))
+        root = os.path.dirname(config.path)
+        content = arguments.get("content") or config.content or None
+        scan = scan_project(root, int(arguments.get("workers", 0)) or None, content=content)
+        css = None
+        if arguments.get("css_path"):
+            css_path = os.path.join(root, os.path.expanduser(str(arguments["css_path"])))
+            if os.path.getsize(css_path) > MAX_CSS_BYTES:
+                raise ConfigError(f"CSS file too large: {arguments['css_path']}")
+            with open(css_path, encoding="utf-8", errors="replace") as handle:
+                css = handle.read()
+        report = analyze_purge(config, scan, css)
+    except (ConfigError, ProjectScanError, ValueError, TypeError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+    except OSError as e:
+        return [types.TextContent(type="text", text=f"Error: Cannot read {e.filename}: {e.strerror}")]
+    text = format_purge_report(report, top_n)
+    return [types.TextContent(type="text", text=text)]
+
+
+def format_color_report(report: ColorReport, top_n: int) -> str:
+    """Markdown report of a color consolidation."""
+    members = sum(len(cluster.colors) for cluster in report.clusters)
+    cluster_rows = "\n".join(
+        f"| `{cluster.token}`{' (custom)' if cluster.custom else ''} | {cluster.center} | {cluster.uses} | "
+        f"{', '.join(value for value, _ in cluster.colors.most_common(4))}{' ...' if len(cluster.colors) > 4 else ''} | "
+        f"{cluster.bytes_saved} |"
+        for cluster in report.clusters[:top_n])
+    replacements = [(cls, replacement) for cluster in report.clusters for cls, replacement in cluster.classes.items()]
+    replacement_rows = "\n".join(f"| `{cls}` | `{replacement}` |" for cls, replacement in replacements[:top_n])
+    custom = {cluster.token: cluster.center for cluster in report.clusters if cluster.custom}
+    skipped = ", ".join(f"`{value}`" for value, _ in report.skipped.most_common(top_n))
+
+    result = f"""# Tailwind Color Tokens
+
+## Summary
+- **Project**: {report.root}
+- **Files scanned**: {report.files}{f" across {report.workers} worker processes" if report.workers > 1 else ""}
+- **Color uses**: {report.uses} ({report.uses - report.inline} in arbitrary classes, {report.inline} inline)
+- **Distinct colors**: {members}
+- **Tokens after consolidation**: {len(report.clusters)} ({len(report.clusters) - len(custom)} from the default palette, {len(custom)} custom)
+- **Estimated CSS saved**: {report.bytes_saved} bytes (arbitrary-class rules only; inline values move into the theme)
+
+## Clusters
+{f"| Token | Center | Uses | Colors | Bytes saved |{chr(10)}|---|---|---:|---|---:|{chr(10)}{cluster_rows}" if cluster_rows else "No colors found."}
+"""
+    if replacement_rows:
+        result += f"""
+## Class Replacements
+| Arbitrary class | Token class |
+|---|---|
+{replacement_rows}
+"""
+    if custom:
+        entries = "\n".join(f"        '{token}': '{center}'," for token, center in custom.items())
+        result += f"""
+## Tailwind Config
+```js
+module.exports = {{
+  theme: {{
+    extend: {{
+      colors: {{
+{entries}
+      }},
+    }},
+  }},
+}}
+```
+"""
+    if skipped:
+        result += f"""
+## Not Clustered
+Translucent or unparseable: {skipped}
+"""
+    return result
+
+
+def tailwind_color_tokens(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Cluster a project's hard-coded colors into palette or custom tokens."""
+    try:
+        top_n = int(arguments.get("top_n", DEFAULT_TOP_N))
+        extensions = tuple(
+            extension if extension.startswith(".") else f".{extension}"
+            for extension in arguments.get("extensions") or COLOR_EXTENSIONS
+        )
+        report = consolidate_colors(str(arguments.get("project_path", "")),
+                                    float(arguments.get("tolerance", DEFAULT_TOLERANCE)),
+                                    int(arguments.get("workers", 0)) or None, extensions)
+    except (ProjectScanError, ValueError, TypeError) as e:
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+    text = format_color_report(report, top_n)
+    return [types.TextContent(type="text", text=text)]
+
+
+# Tool execution handlers
+TAILWIND_PROJECT_HANDLERS = {
+    "tailwind_project_scanner": tailwind_project_scanner,
+    "tailwind_purge_analyzer": tailwind_purge_analyzer,
+    "tailwind_color_tokens": tailwind_color_tokens
+}
+
+
+async def handle_call(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Handle Tailwind project tool calls; scans run on a worker thread so the event loop keeps serving."""
+    if name in TAILWIND_PROJECT_HANDLERS:
+        return await asyncio.to_thread(TAILWIND_PROJECT_HANDLERS[name], arguments)
+
+    return [types.TextContent(
+        type="text",
+        text=f"Tool {name} not found in Tailwind project tools"
+    )]
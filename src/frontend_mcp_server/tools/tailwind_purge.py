@@ -0,0 +1,208 @@
+"""
+Safelist and purge analysis for a Tailwind config.
+
+Sources are scanned with the project scanner, so extraction runs over
+the process pool and rescans reuse the per-file cache. Every class the
+report talks about is interned into one id space, seeded with the source
+usage so source classes keep their ids:
+- the source classes themselves;
+- safelist entries;
+- the classes each safelist pattern expands to (matched against the
+  catalog plus the config's own theme names);
+- the class selectors of the built CSS;
+- the utilities that theme extensions generate.
+Each question in the report is then a numpy set operation over id arrays.
+Examples are safelist entries missing from the sources and CSS classes
+that no source and no safelist explains.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .tailwind_catalog import CATALOG, split_variants
+from .tailwind_config import SafelistPattern, TailwindConfig, flatten_theme
+from .tailwind_jit import CssBuild, generate_css
+from .tailwind_project import ProjectScan
+from .tailwind_theme import SCALES, SPACING, UTILITIES
+
+MAX_CSS_BYTES = 16 * 1024 * 1024
+
+# Config keys that set one utility's values rather than a whole scale
+THEME_KEY_PREFIXES: Dict[str, Tuple[str, ...]] = {
+    "backgroundColor": ("bg",), "textColor": ("text",), "borderColor": ("border",), "ringColor": ("ring",),
+    "gridTemplateColumns": ("grid-cols",), "gridTemplateRows": ("grid-rows",), "gridColumn": ("col-span",),
+    "gridRow": ("row-span",), "fill": ("fill",), "stroke": ("stroke",),
+}
+# Config keys whose scale has another name in the theme tables
+THEME_KEY_SCALES = {
+    "aspectRatio": "aspect", "transitionDuration": "duration", "transitionTimingFunction": "ease",
+    "ringOffsetWidth": "offset_width", "textDecorationThickness": "decoration_thickness",
+    "flexGrow": "flex_factor", "flexShrink": "flex_factor", "strokeWidth": "stroke_width",
+}
+SPACING_SCALES = tuple(scale for scale, values in SCALES.items() if all(key in values for key in SPACING))
+
+_CSS_PRELUDE = re.compile(r"([^{};]*)\{")
+_CSS_CLASS = re.compile(r"\.((?:\\[0-9a-fA-F]{1,6} ?|\\.|[\w-])+)")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_ESCAPE = re.compile(r"\\([0-9a-fA-F]{1,6}) ?|\\(.)")
+
+
+def theme_prefixes(key: str) -> Tuple[str, ...]:
+    """Utility prefixes whose values a theme key (`colors`, `spacing`, `borderRadius`) supplies."""
+    if key in THEME_KEY_PREFIXES:
+        return THEME_KEY_PREFIXES[key]
+    scale = THEME_KEY_SCALES.get(key) or re.sub(r"(?<!^)([A-Z])", r"_\1", key).lower()
+    scales = SPACING_SCALES if scale == "spacing" else (scale,)
+    return tuple(dict.fromkeys(prefix for prefix, utility_scale, _ in UTILITIES if utility_scale in scales))
+
+
+def css_classes(css: str) -> List[str]:
+    """Unescaped class names in the selectors of a stylesheet (`.md\\:p-4` -> `md:p-4`)."""
+    css = _CSS_COMMENT.sub("", css)
+    names: Dict[str, None] = {}
+    for prelude in _CSS_PRELUDE.findall(css):
+        if prelude.lstrip().startswith("@"):
+            continue
+        for escaped in _CSS_CLASS.findall(prelude):
+            names[_CSS_ESCAPE.sub(lambda match: chr(int(match.group(1), 16)) if match.group(1) else match.group(2),
+                                  escaped)] = None
+    return list(names)
+
+
+class ClassInterner:
+    """Class name <-> dense id, shared by every class set in one analysis."""
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.intern(names)
+
+    def intern(self, names: Iterable[str]) -> np.ndarray:
+        """Sorted unique ids of the names, assigning new ids as needed."""
+        ids = []
+        for name in names:
+            class_id = self.ids.get(name)
+            if class_id is None:
+                class_id = self.ids[name] = len(self.names)
+                self.names.append(name)
+            ids.append(class_id)
+        return np.unique(np.array(ids, dtype=np.int64))
+
+    def lookup(self, ids: np.ndarray) -> List[str]:
+        """Names of the ids, in id order."""
+        return [self.names[class_id] for class_id in ids.tolist()]
+
+
+class SafelistReport:
+    """One safelist entry: the classes it forces into the build and how many the sources use."""
+
+    __slots__ = ("entry", "classes", "used")
+
+    def __init__(self, entry: str, classes: int, used: int):
+        self.entry = entry  # the class, or `/pattern/` with its variants
+        self.classes = classes
+        self.used = used
+
+
+class ThemeReport:
+    """A theme value from the config that no source class uses."""
+
+    __slots__ = ("section", "name", "value", "example")
+
+    def __init__(self, section: str, name: str, value: str, example: str):
+        self.section = section  # `theme.extend.colors`
+        self.name = name  # `brand-500`
+        self.value = value
+        self.example = example  # a class it would generate, `bg-brand-500`
+
+
+class PurgeReport:
+    """What the config makes Tailwind build beyond what the sources use."""
+
+    __slots__ = ("config", "scan", "safelist", "unused_safelist", "unused_theme", "unchecked_theme",
+                 "css_classes", "css_unused", "css_safelisted", "bloat")
+
+    def __init__(self, config: TailwindConfig, scan: ProjectScan):
+        self.config = config
+        self.scan = scan
+        self.safelist: List[SafelistReport] = []
+        self.unused_safelist: List[str] = []  # safelisted classes (patterns expanded) the sources never use
+        self.unused_theme: List[ThemeReport] = []
+        self.unchecked_theme: List[str] = []  # theme sections that map to no known utility
+        self.css_classes = 0  # class selectors in the built CSS; 0 without one
+        self.css_unused: List[str] = []  # in the built CSS, in no source and no safelist
+        self.css_safelisted = 0  # in the built CSS only because of the safelist
+        self.bloat: Optional[CssBuild] = None  # the CSS the unused safelisted classes generate
+
+
+def _theme_sections(config: TailwindConfig) -> Iterable[Tuple[str, str, Dict]]:
+    for key, values in config.extend.items():
+        yield f"theme.extend.{key}", key, values
+    for key, values in config.theme.items():
+        yield f"theme.{key}", key, values
+
+
+def _pattern_classes(pattern: SafelistPattern, universe: Sequence[str]) -> List[str]:
+    utilities = [name for name in universe if pattern.regex.search(name)]
+    return utilities + [f"{variant}:{name}" for variant in pattern.variants for name in utilities]
+
+
+def analyze_purge(config: TailwindConfig, scan: ProjectScan, css: Optional[str] = None) -> PurgeReport:
+    """Unused safelist entries, unreferenced theme values and built CSS the sources do not explain."""
+    report = PurgeReport(config, scan)
+    usage = scan.usage
+    interner = ClassInterner(usage.names)  # source classes keep their usage ids
+    sources = np.arange(len(usage.names), dtype=np.int64)
+    utilities = interner.intern(split_variants(name)[1].lstrip("!").lstrip("-") for name in usage.names)
+    screens = {variant.replace("max-", "", 1) for name in usage.names for variant in split_variants(name)[0]}
+
+    # Theme values, and the class names they add to the universe safelist patterns match against
+    theme_names: List[str] = []
+    for section, key, values in _theme_sections(config):
+        if not isinstance(values, dict):
+            continue
+        if key == "screens":  # screens are used as variants, not utilities
+            report.unused_theme.extend(ThemeReport(section, name, str(value), f"{name}:flex")
+                                       for name, value in flatten_theme(values) if name not in screens)
+            continue
+        prefixes = theme_prefixes(key)
+        if not prefixes:
+            report.unchecked_theme.append(section)
+            continue
+        for name, value in flatten_theme(values):
+            generated = [f"{prefix}-{name}" if name else prefix for prefix in prefixes]
+            theme_names.extend(generated)
+            if not np.isin(interner.intern(generated), utilities).any():
+                report.unused_theme.append(ThemeReport(section, name or "DEFAULT", str(value), generated[0]))
+
+    # Safelist entries and pattern expansions against the sources
+    universe = list(dict.fromkeys([*CATALOG, *theme_names])) if any(
+        isinstance(entry, SafelistPattern) for entry in config.safelist) else []
+    safelisted = np.empty(0, dtype=np.int64)
+    for entry in config.safelist:
+        if isinstance(entry, SafelistPattern):
+            ids = interner.intern(_pattern_classes(entry, universe))
+            label = f"/{entry.source}/" + (f" ({', '.join(entry.variants)})" if entry.variants else "")
+        else:
+            ids = interner.intern([entry])
+            label = entry
+        used = np.intersect1d(ids, sources, assume_unique=True)
+        report.safelist.append(SafelistReport(label, len(ids), len(used)))
+        safelisted = np.union1d(safelisted, ids)
+    unused = np.setdiff1d(safelisted, sources, assume_unique=True)
+    report.unused_safelist = sorted(interner.lookup(unused))
+    if report.unused_safelist:
+        report.bloat = generate_css(report.unused_safelist)
+
+    # Built CSS against sources and safelist
+    if css is not None:
+        built = interner.intern(css_classes(css))
+        unexplained = np.setdiff1d(built, sources, assume_unique=True)
+        report.css_classes = len(built)
+        report.css_safelisted = len(np.intersect1d(unexplained, safelisted, assume_unique=True))
+        report.css_unused = interner.lookup(np.setdiff1d(unexplained, safelisted, assume_unique=True))
+    return report
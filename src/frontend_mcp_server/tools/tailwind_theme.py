@@ -0,0 +1,519 @@
+"""
+Tailwind CSS v3 default theme and utility definitions.
+
+The tables here describe how utility classes are formed - a prefix, the
+theme scale it draws values from and the CSS properties it sets - so the
+full class set can be generated instead of hand-listed. tailwind_catalog
+expands them into the packed class catalog; nothing at runtime should
+enumerate them per lookup.
+"""
+
+from typing import Dict, Tuple, Union
+
+# Default palette, shades 50-950 in order
+COLOR_SHADES = ("50", "100", "200", "300", "400", "500", "600", "700", "800", "900", "950")
+_PALETTE = {
+    "slate": "f8fafc f1f5f9 e2e8f0 cbd5e1 94a3b8 64748b 475569 334155 1e293b 0f172a 020617",
+    "gray": "f9fafb f3f4f6 e5e7eb d1d5db 9ca3af 6b7280 4b5563 374151 1f2937 111827 030712",
+    "zinc": "fafafa f4f4f5 e4e4e7 d4d4d8 a1a1aa 71717a 52525b 3f3f46 27272a 18181b 09090b",
+    "neutral": "fafafa f5f5f5 e5e5e5 d4d4d4 a3a3a3 737373 525252 404040 262626 171717 0a0a0a",
+    "stone": "fafaf9 f5f5f4 e7e5e4 d6d3d1 a8a29e 78716c 57534e 44403c 292524 1c1917 0c0a09",
+    "red": "fef2f2 fee2e2 fecaca fca5a5 f87171 ef4444 dc2626 b91c1c 991b1b 7f1d1d 450a0a",
+    "orange": "fff7ed ffedd5 fed7aa fdba74 fb923c f97316 ea580c c2410c 9a3412 7c2d12 431407",
+    "amber": "fffbeb fef3c7 fde68a fcd34d fbbf24 f59e0b d97706 b45309 92400e 78350f 451a03",
+    "yellow": "fefce8 fef9c3 fef08a fde047 facc15 eab308 ca8a04 a16207 854d0e 713f12 422006",
+    "lime": "f7fee7 ecfccb d9f99d bef264 a3e635 84cc16 65a30d 4d7c0f 3f6212 365314 1a2e05",
+    "green": "f0fdf4 dcfce7 bbf7d0 86efac 4ade80 22c55e 16a34a 15803d 166534 14532d 052e16",
+    "emerald": "ecfdf5 d1fae5 a7f3d0 6ee7b7 34d399 10b981 059669 047857 065f46 064e3b 022c22",
+    "teal": "f0fdfa ccfbf1 99f6e4 5eead4 2dd4bf 14b8a6 0d9488 0f766e 115e59 134e4a 042f2e",
+    "cyan": "ecfeff cffafe a5f3fc 67e8f9 22d3ee 06b6d4 0891b2 0e7490 155e75 164e63 083344",
+    "sky": "f0f9ff e0f2fe bae6fd 7dd3fc 38bdf8 0ea5e9 0284c7 0369a1 075985 0c4a6e 082f49",
+    "blue": "eff6ff dbeafe bfdbfe 93c5fd 60a5fa 3b82f6 2563eb 1d4ed8 1e40af 1e3a8a 172554",
+    "indigo": "eef2ff e0e7ff c7d2fe a5b4fc 818cf8 6366f1 4f46e5 4338ca 3730a3 312e81 1e1b4b",
+    "violet": "f5f3ff ede9fe ddd6fe c4b5fd a78bfa 8b5cf6 7c3aed 6d28d9 5b21b6 4c1d95 2e1065",
+    "purple": "faf5ff f3e8ff e9d5ff d8b4fe c084fc a855f7 9333ea 7e22ce 6b21a8 581c87 3b0764",
+    "fuchsia": "fdf4ff fae8ff f5d0fe f0abfc e879f9 d946ef c026d3 a21caf 86198f 701a75 4a044e",
+    "pink": "fdf2f8 fce7f3 fbcfe8 f9a8d4 f472b6 ec4899 db2777 be185d 9d174d 831843 500724",
+    "rose": "fff1f2 ffe4e6 fecdd3 fda4af fb7185 f43f5e e11d48 be123c 9f1239 881337 4c0519",
+}
+PALETTE: Dict[str, Dict[str, str]] = {
+    family: {shade: "#" + value for shade, value in zip(COLOR_SHADES, values.split())}
+    for family, values in _PALETTE.items()
+}
+COLORS: Dict[str, str] = {
+    "inherit": "inherit", "current": "currentColor", "transparent": "transparent",
+    "black": "#000000", "white": "#ffffff",
+}
+COLORS.update({f"{family}-{shade}": value for family, shades in PALETTE.items() for shade, value in shades.items()})
+
+
+def _rem(steps: float) -> str:
+    """Spacing steps are quarter rems: 4 -> 1rem."""
+    return f"{steps / 4:g}rem"
+
+
+SPACING: Dict[str, str] = {"0": "0px", "px": "1px"}
+SPACING.update({f"{step:g}": _rem(step) for step in (0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 5, 6, 7, 8, 9, 10, 11, 12,
+                                                    14, 16, 20, 24, 28, 32, 36, 40, 44, 48, 52, 56, 60, 64, 72, 80, 96)})
+FRACTIONS: Dict[str, str] = {
+    f"{numerator}/{denominator}": f"{numerator / denominator * 100:.6g}%"
+    for denominator in (2, 3, 4, 5, 6, 12) for numerator in range(1, denominator)
+}
+OPACITY: Dict[str, str] = {str(step): f"{step / 100:g}" for step in range(0, 101, 5)}
+
+# Scales keyed by name; a value is either one CSS value or one per property of the utility
+ScaleValue = Union[str, Tuple[str, ...]]
+SCALES: Dict[str, Dict[str, ScaleValue]] = {
+    "spacing": SPACING,
+    "margin": {**SPACING, "auto": "auto"},
+    "inset": {**SPACING, **FRACTIONS, "auto": "auto", "full": "100%"},
+    "translate": {**SPACING, **FRACTIONS, "full": "100%"},
+    "width": {**SPACING, **FRACTIONS, "auto": "auto", "full": "100%", "screen": "100vw", "svw": "100svw",
+              "lvw": "100lvw", "dvw": "100dvw", "min": "min-content", "max": "max-content", "fit": "fit-content"},
+    "height": {**SPACING, **FRACTIONS, "auto": "auto", "full": "100%", "screen": "100vh", "svh": "100svh",
+               "lvh": "100lvh", "dvh": "100dvh", "min": "min-content", "max": "max-content", "fit": "fit-content"},
+    "size": {**SPACING, **FRACTIONS, "auto": "auto", "full": "100%", "min": "min-content", "max": "max-content",
+             "fit": "fit-content"},
+    "min_width": {**SPACING, "full": "100%", "min": "min-content", "max": "max-content", "fit": "fit-content"},
+    "min_height": {**SPACING, "full": "100%", "screen": "100vh", "svh": "100svh", "lvh": "100lvh",
+                   "dvh": "100dvh", "min": "min-content", "max": "max-content", "fit": "fit-content"},
+    "max_width": {**SPACING, "none": "none", "xs": "20rem", "sm": "24rem", "md": "28rem", "lg": "32rem",
+                  "xl": "36rem", "2xl": "42rem", "3xl": "48rem", "4xl": "56rem", "5xl": "64rem", "6xl": "72rem",
+                  "7xl": "80rem", "full": "100%", "min": "min-content", "max": "max-content",
+                  "fit": "fit-content", "prose": "65ch", "screen-sm": "640px", "screen-md": "768px",
+                  "screen-lg": "1024px", "screen-xl": "1280px", "screen-2xl": "1536px"},
+    "max_height": {**SPACING, "none": "none", "full": "100%", "screen": "100vh", "svh": "100svh",
+                   "lvh": "100lvh", "dvh": "100dvh", "min": "min-content", "max": "max-content",
+                   "fit": "fit-content"},
+    "basis": {**SPACING, **FRACTIONS, "auto": "auto", "full": "100%"},
+    "colors": COLORS,
+    "opacity": OPACITY,
+    "font_size": {"xs": ("0.75rem", "1rem"), "sm": ("0.875rem", "1.25rem"), "base": ("1rem", "1.5rem"),
+                  "lg": ("1.125rem", "1.75rem"), "xl": ("1.25rem", "1.75rem"), "2xl": ("1.5rem", "2rem"),
+                  "3xl": ("1.875rem", "2.25rem"), "4xl": ("2.25rem", "2.5rem"), "5xl": ("3rem", "1"),
+                  "6xl": ("3.75rem", "1"), "7xl": ("4.5rem", "1"), "8xl": ("6rem", "1"), "9xl": ("8rem", "1")},
+    "font_weight": {"thin": "100", "extralight": "200", "light": "300", "normal": "400", "medium": "500",
+                    "semibold": "600", "bold": "700", "extrabold": "800", "black": "900"},
+    "font_family": {"sans": "ui-sans-serif, system-ui, sans-serif", "serif": "ui-serif, Georgia, serif",
+                    "mono": "ui-monospace, SFMono-Regular, monospace"},
+    "line_height": {**{str(step): _rem(step) for step in range(3, 11)}, "none": "1", "tight": "1.25",
+                    "snug": "1.375", "normal": "1.5", "relaxed": "1.625", "loose": "2"},
+    "letter_spacing": {"tighter": "-0.05em", "tight": "-0.025em", "normal": "0em", "wide": "0.025em",
+                       "wider": "0.05em", "widest": "0.1em"},
+    "border_radius": {"none": "0px", "sm": "0.125rem", "DEFAULT": "0.25rem", "md": "0.375rem", "lg": "0.5rem",
+                      "xl": "0.75rem", "2xl": "1rem", "3xl": "1.5rem", "full": "9999px"},
+    "border_width": {"DEFAULT": "1px", "0": "0px", "2": "2px", "4": "4px", "8": "8px"},
+    "ring_width": {"DEFAULT": "3px", "0": "0px", "1": "1px", "2": "2px", "4": "4px", "8": "8px"},
+    "offset_width": {"0": "0px", "1": "1px", "2": "2px", "4": "4px", "8": "8px"},
+    "decoration_thickness": {"auto": "auto", "from-font": "from-font", "0": "0px", "1": "1px", "2": "2px",
+                             "4": "4px", "8": "8px"},
+    "box_shadow": {"sm": "0 1px 2px 0 rgb(0 0 0 / 0.05)",
+                   "DEFAULT": "0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1)",
+                   "md": "0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1)",
+                   "lg": "0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1)",
+                   "xl": "0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1)",
+                   "2xl": "0 25px 50px -12px rgb(0 0 0 / 0.25)",
+                   "inner": "inset 0 2px 4px 0 rgb(0 0 0 / 0.05)", "none": "0 0 #0000"},
+    "drop_shadow": {"sm": "drop-shadow(0 1px 1px rgb(0 0 0 / 0.05))",
+                    "DEFAULT": "drop-shadow(0 1px 2px rgb(0 0 0 / 0.1)) drop-shadow(0 1px 1px rgb(0 0 0 / 0.06))",
+                    "md": "drop-shadow(0 4px 3px rgb(0 0 0 / 0.07)) drop-shadow(0 2px 2px rgb(0 0 0 / 0.06))",
+                    "lg": "drop-shadow(0 10px 8px rgb(0 0 0 / 0.04)) drop-shadow(0 4px 3px rgb(0 0 0 / 0.1))",
+                    "xl": "drop-shadow(0 20px 13px rgb(0 0 0 / 0.03)) drop-shadow(0 8px 5px rgb(0 0 0 / 0.08))",
+                    "2xl": "drop-shadow(0 25px 25px rgb(0 0 0 / 0.15))", "none": "drop-shadow(0 0 #0000)"},
+    "blur": {"none": "blur(0)", "sm": "blur(4px)", "DEFAULT": "blur(8px)", "md": "blur(12px)", "lg": "blur(16px)",
+             "xl": "blur(24px)", "2xl": "blur(40px)", "3xl": "blur(64px)"},
+    "z_index": {"0": "0", "10": "10", "20": "20", "30": "30", "40": "40", "50": "50", "auto": "auto"},
+    "order": {**{str(step): str(step) for step in range(1, 13)}, "first": "-9999", "last": "9999", "none": "0"},
+    "grid_template": {**{str(step): f"repeat({step}, minmax(0, 1fr))" for step in range(1, 13)},
+                      "none": "none", "subgrid": "subgrid"},
+    "grid_span": {**{str(step): f"span {step} / span {step}" for step in range(1, 13)},
+                  "full": "1 / -1"},
+    "grid_line": {**{str(step): str(step) for step in range(1, 14)}, "auto": "auto"},
+    "flex": {"1": "1 1 0%", "auto": "1 1 auto", "initial": "0 1 auto", "none": "none"},
+    "flex_factor": {"DEFAULT": "1", "0": "0"},
+    "aspect": {"auto": "auto", "square": "1 / 1", "video": "16 / 9"},
+    "columns": {**{str(step): str(step) for step in range(1, 13)}, "auto": "auto", "3xs": "16rem",
+                "2xs": "18rem", "xs": "20rem", "sm": "24rem", "md": "28rem", "lg": "32rem", "xl": "36rem",
+                "2xl": "42rem", "3xl": "48rem", "4xl": "56rem", "5xl": "64rem", "6xl": "72rem", "7xl": "80rem"},
+    "duration": {str(ms): f"{ms}ms" for ms in (0, 75, 100, 150, 200, 300, 500, 700, 1000)},
+    "ease": {"linear": "linear", "in": "cubic-bezier(0.4, 0, 1, 1)", "out": "cubic-bezier(0, 0, 0.2, 1)",
+             "in-out": "cubic-bezier(0.4, 0, 0.2, 1)"},
+    "rotate": {str(degrees): f"{degrees}deg" for degrees in (0, 1, 2, 3, 6, 12, 45, 90, 180)},
+    "scale": {str(percent): f"{percent / 100:g}" for percent in (0, 50, 75, 90, 95, 100, 105, 110, 125, 150)},
+    "skew": {str(degrees): f"{degrees}deg" for degrees in (0, 1, 2, 3, 6, 12)},
+    "stroke_width": {"0": "0", "1": "1", "2": "2"},
+    "line_clamp": {**{str(lines): str(lines) for lines in range(1, 7)}, "none": "none"},
+    "brightness": {str(percent): f"brightness({percent / 100:g})"
+                   for percent in (0, 50, 75, 90, 95, 100, 105, 110, 125, 150, 200)},
+    "contrast": {str(percent): f"contrast({percent / 100:g})" for percent in (0, 50, 75, 100, 125, 150, 200)},
+    "grayscale": {"DEFAULT": "grayscale(100%)", "0": "grayscale(0)"},
+    "invert": {"DEFAULT": "invert(100%)", "0": "invert(0)"},
+}
+
+# (prefix, scale, properties); DEFAULT scale keys produce the bare prefix
+UTILITIES: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    # Spacing
+    ("p", "spacing", ("padding",)),
+    ("px", "spacing", ("padding-left", "padding-right")),
+    ("py", "spacing", ("padding-top", "padding-bottom")),
+    ("pt", "spacing", ("padding-top",)),
+    ("pr", "spacing", ("padding-right",)),
+    ("pb", "spacing", ("padding-bottom",)),
+    ("pl", "spacing", ("padding-left",)),
+    ("ps", "spacing", ("padding-inline-start",)),
+    ("pe", "spacing", ("padding-inline-end",)),
+    ("m", "margin", ("margin",)),
+    ("mx", "margin", ("margin-left", "margin-right")),
+    ("my", "margin", ("margin-top", "margin-bottom")),
+    ("mt", "margin", ("margin-top",)),
+    ("mr", "margin", ("margin-right",)),
+    ("mb", "margin", ("margin-bottom",)),
+    ("ml", "margin", ("margin-left",)),
+    ("ms", "margin", ("margin-inline-start",)),
+    ("me", "margin", ("margin-inline-end",)),
+    ("space-x", "spacing", ("margin-left",)),
+    ("space-y", "spacing", ("margin-top",)),
+    ("gap", "spacing", ("gap",)),
+    ("gap-x", "spacing", ("column-gap",)),
+    ("gap-y", "spacing", ("row-gap",)),
+    ("scroll-m", "spacing", ("scroll-margin",)),
+    ("scroll-p", "spacing", ("scroll-padding",)),
+    # Sizing
+    ("w", "width", ("width",)),
+    ("min-w", "min_width", ("min-width",)),
+    ("max-w", "max_width", ("max-width",)),
+    ("h", "height", ("height",)),
+    ("min-h", "min_height", ("min-height",)),
+    ("max-h", "max_height", ("max-height",)),
+    ("size", "size", ("width", "height")),
+    # Position
+    ("inset", "inset", ("inset",)),
+    ("inset-x", "inset", ("left", "right")),
+    ("inset-y", "inset", ("top", "bottom")),
+    ("top", "inset", ("top",)),
+    ("right", "inset", ("right",)),
+    ("bottom", "inset", ("bottom",)),
+    ("left", "inset", ("left",)),
+    ("start", "inset", ("inset-inline-start",)),
+    ("end", "inset", ("inset-inline-end",)),
+    ("z", "z_index", ("z-index",)),
+    # Flexbox and grid
+    ("basis", "basis", ("flex-basis",)),
+    ("flex", "flex", ("flex",)),
+    ("grow", "flex_factor", ("flex-grow",)),
+    ("shrink", "flex_factor", ("flex-shrink",)),
+    ("order", "order", ("order",)),
+    ("grid-cols", "grid_template", ("grid-template-columns",)),
+    ("grid-rows", "grid_template", ("grid-template-rows",)),
+    ("col-span", "grid_span", ("grid-column",)),
+    ("row-span", "grid_span", ("grid-row",)),
+    ("col-start", "grid_line", ("grid-column-start",)),
+    ("col-end", "grid_line", ("grid-column-end",)),
+    ("row-start", "grid_line", ("grid-row-start",)),
+    ("row-end", "grid_line", ("grid-row-end",)),
+    ("aspect", "aspect", ("aspect-ratio",)),
+    ("columns", "columns", ("columns",)),
+    # Typography
+    ("text", "font_size", ("font-size", "line-height")),
+    ("font", "font_weight", ("font-weight",)),
+    ("font", "font_family", ("font-family",)),
+    ("leading", "line_height", ("line-height",)),
+    ("tracking", "letter_spacing", ("letter-spacing",)),
+    ("line-clamp", "line_clamp", ("-webkit-line-clamp",)),
+    ("indent", "spacing", ("text-indent",)),
+    ("decoration", "decoration_thickness", ("text-decoration-thickness",)),
+    ("underline-offset", "decoration_thickness", ("text-underline-offset",)),
+    # Colors
+    ("text", "colors", ("color",)),
+    ("bg", "colors", ("background-color",)),
+    ("border", "colors", ("border-color",)),
+    ("border-x", "colors", ("border-left-color", "border-right-color")),
+    ("border-y", "colors", ("border-top-color", "border-bottom-color")),
+    ("border-t", "colors", ("border-top-color",)),
+    ("border-r", "colors", ("border-right-color",)),
+    ("border-b", "colors", ("border-bottom-color",)),
+    ("border-l", "colors", ("border-left-color",)),
+    ("divide", "colors", ("border-color",)),
+    ("outline", "colors", ("outline-color",)),
+    ("ring", "colors", ("--tw-ring-color",)),
+    ("ring-offset", "colors", ("--tw-ring-offset-color",)),
+    ("shadow", "colors", ("--tw-shadow-color",)),
+    ("from", "colors", ("--tw-gradient-from",)),
+    ("via", "colors", ("--tw-gradient-via",)),
+    ("to", "colors", ("--tw-gradient-to",)),
+    ("placeholder", "colors", ("color",)),
+    ("decoration", "colors", ("text-decoration-color",)),
+    ("accent", "colors", ("accent-color",)),
+    ("caret", "colors", ("caret-color",)),
+    ("fill", "colors", ("fill",)),
+    ("stroke", "colors", ("stroke",)),
+    # Borders and effects
+    ("rounded", "border_radius", ("border-radius",)),
+    ("rounded-t", "border_radius", ("border-top-left-radius", "border-top-right-radius")),
+    ("rounded-r", "border_radius", ("border-top-right-radius", "border-bottom-right-radius")),
+    ("rounded-b", "border_radius", ("border-bottom-right-radius", "border-bottom-left-radius")),
+    ("rounded-l", "border_radius", ("border-top-left-radius", "border-bottom-left-radius")),
+    ("rounded-tl", "border_radius", ("border-top-left-radius",)),
+    ("rounded-tr", "border_radius", ("border-top-right-radius",)),
+    ("rounded-br", "border_radius", ("border-bottom-right-radius",)),
+    ("rounded-bl", "border_radius", ("border-bottom-left-radius",)),
+    ("border", "border_width", ("border-width",)),
+    ("border-x", "border_width", ("border-left-width", "border-right-width")),
+    ("border-y", "border_width", ("border-top-width", "border-bottom-width")),
+    ("border-t", "border_width", ("border-top-width",)),
+    ("border-r", "border_width", ("border-right-width",)),
+    ("border-b", "border_width", ("border-bottom-width",)),
+    ("border-l", "border_width", ("border-left-width",)),
+    ("divide-x", "border_width", ("border-left-width",)),
+    ("divide-y", "border_width", ("border-top-width",)),
+    ("outline", "offset_width", ("outline-width",)),
+    ("outline-offset", "offset_width", ("outline-offset",)),
+    ("ring", "ring_width", ("--tw-ring-shadow",)),
+    ("ring-offset", "offset_width", ("--tw-ring-offset-width",)),
+    ("shadow", "box_shadow", ("box-shadow",)),
+    ("opacity", "opacity", ("opacity",)),
+    ("drop-shadow", "drop_shadow", ("filter",)),
+    ("blur", "blur", ("filter",)),
+    ("brightness", "brightness", ("filter",)),
+    ("contrast", "contrast", ("filter",)),
+    ("grayscale", "grayscale", ("filter",)),
+    ("invert", "invert", ("filter",)),
+    ("backdrop-blur", "blur", ("backdrop-filter",)),
+    ("stroke", "stroke_width", ("stroke-width",)),
+    # Transforms and transitions
+    ("translate-x", "translate", ("--tw-translate-x",)),
+    ("translate-y", "translate", ("--tw-translate-y",)),
+    ("rotate", "rotate", ("--tw-rotate",)),
+    ("scale", "scale", ("--tw-scale-x", "--tw-scale-y")),
+    ("scale-x", "scale", ("--tw-scale-x",)),
+    ("scale-y", "scale", ("--tw-scale-y",)),
+    ("skew-x", "skew", ("--tw-skew-x",)),
+    ("skew-y", "skew", ("--tw-skew-y",)),
+    ("duration", "duration", ("transition-duration",)),
+    ("delay", "duration", ("transition-delay",)),
+    ("ease", "ease", ("transition-timing-function",)),
+)
+
+# Prefixes that also accept a leading `-` for negated values (`-mt-4`, `-translate-x-1/2`)
+NEGATABLE = frozenset({
+    "m", "mx", "my", "mt", "mr", "mb", "ml", "ms", "me", "space-x", "space-y", "scroll-m",
+    "inset", "inset-x", "inset-y", "top", "right", "bottom", "left", "start", "end", "z", "order",
+    "indent", "tracking", "translate-x", "translate-y", "rotate", "skew-x", "skew-y", "col-start",
+    "col-end", "row-start", "row-end",
+})
+
+
+def _static(*declarations: str) -> Tuple[Tuple[str, str], ...]:
+    """`"display: flex"` strings as (property, value) pairs."""
+    pairs = (declaration.partition(": ") for declaration in declarations)
+    return tuple((prop, value) for prop, _, value in pairs)
+
+
+# Keyword utilities with fixed declarations
+STATIC_UTILITIES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    **{name: _static(f"display: {name}") for name in (
+        "block", "inline-block", "inline", "flex", "inline-flex", "table", "inline-table", "table-caption",
+        "table-cell", "table-column", "table-column-group", "table-footer-group", "table-header-group",
+        "table-row-group", "table-row", "flow-root", "grid", "inline-grid", "contents", "list-item")},
+    "hidden": _static("display: none"),
+    **{name: _static(f"position: {name}") for name in ("static", "fixed", "absolute", "relative", "sticky")},
+    "visible": _static("visibility: visible"),
+    "invisible": _static("visibility: hidden"),
+    "collapse": _static("visibility: collapse"),
+    "container": _static("width: 100%"),
+    "sr-only": _static("position: absolute", "width: 1px", "height: 1px", "padding: 0", "margin: -1px",
+                       "overflow: hidden", "clip: rect(0, 0, 0, 0)", "white-space: nowrap", "border-width: 0"),
+    "not-sr-only": _static("position: static", "width: auto", "height: auto", "padding: 0", "margin: 0",
+                           "overflow: visible", "clip: auto", "white-space: normal"),
+    "flex-row": _static("flex-direction: row"),
+    "flex-row-reverse": _static("flex-direction: row-reverse"),
+    "flex-col": _static("flex-direction: column"),
+    "flex-col-reverse": _static("flex-direction: column-reverse"),
+    "flex-wrap": _static("flex-wrap: wrap"),
+    "flex-wrap-reverse": _static("flex-wrap: wrap-reverse"),
+    "flex-nowrap": _static("flex-wrap: nowrap"),
+    **{f"items-{name}": _static(f"align-items: {value}") for name, value in (
+        ("start", "flex-start"), ("end", "flex-end"), ("center", "center"), ("baseline", "baseline"),
+        ("stretch", "stretch"))},
+    **{f"justify-{name}": _static(f"justify-content: {value}") for name, value in (
+        ("normal", "normal"), ("start", "flex-start"), ("end", "flex-end"), ("center", "center"),
+        ("between", "space-between"), ("around", "space-around"), ("evenly", "space-evenly"),
+        ("stretch", "stretch"))},
+    **{f"justify-items-{name}": _static(f"justify-items: {name}") for name in ("start", "end", "center", "stretch")},
+    **{f"justify-self-{name}": _static(f"justify-self: {name}") for name in ("auto", "start", "end", "center", "stretch")},
+    **{f"content-{name}": _static(f"align-content: {value}") for name, value in (
+        ("normal", "normal"), ("center", "center"), ("start", "flex-start"), ("end", "flex-end"),
+        ("between", "space-between"), ("around", "space-around"), ("evenly", "space-evenly"),
+        ("stretch", "stretch"))},
+    **{f"self-{name}": _static(f"align-self: {value}") for name, value in (
+        ("auto", "auto"), ("start", "flex-start"), ("end", "flex-end"), ("center", "center"),
+        ("stretch", "stretch"), ("baseline", "baseline"))},
+    **{f"place-content-{name}": _static(f"place-content: {name}") for name in (
+        "center", "start", "end", "between", "around", "evenly", "stretch")},
+    **{f"place-items-{name}": _static(f"place-items: {name}") for name in ("start", "end", "center", "stretch")},
+    **{f"place-self-{name}": _static(f"place-self: {name}") for name in ("auto", "start", "end", "center", "stretch")},
+    **{f"grid-flow-{name}": _static(f"grid-auto-flow: {name.replace('-', ' ')}") for name in (
+        "row", "col", "dense", "row-dense", "col-dense")},
+    "col-auto": _static("grid-column: auto"),
+    "row-auto": _static("grid-row: auto"),
+    **{f"text-{name}": _static(f"text-align: {name}") for name in ("left", "center", "right", "justify", "start", "end")},
+    "italic": _static("font-style: italic"),
+    "not-italic": _static("font-style: normal"),
+    "uppercase": _static("text-transform: uppercase"),
+    "lowercase": _static("text-transform: lowercase"),
+    "capitalize": _static("text-transform: capitalize"),
+    "normal-case": _static("text-transform: none"),
+    "underline": _static("text-decoration-line: underline"),
+    "overline": _static("text-decoration-line: overline"),
+    "line-through": _static("text-decoration-line: line-through"),
+    "no-underline": _static("text-decoration-line: none"),
+    "truncate": _static("overflow: hidden", "text-overflow: ellipsis", "white-space: nowrap"),
+    "text-ellipsis": _static("text-overflow: ellipsis"),
+    "text-clip": _static("text-overflow: clip"),
+    **{f"text-{name}": _static(f"text-wrap: {name}") for name in ("wrap", "nowrap", "balance", "pretty")},
+    **{f"whitespace-{name}": _static(f"white-space: {name}") for name in (
+        "normal", "nowrap", "pre", "pre-line", "pre-wrap", "break-spaces")},
+    "break-normal": _static("overflow-wrap: normal", "word-break: normal"),
+    "break-words": _static("overflow-wrap: break-word"),
+    "break-all": _static("word-break: break-all"),
+    "break-keep": _static("word-break: keep-all"),
+    "antialiased": _static("-webkit-font-smoothing: antialiased"),
+    "subpixel-antialiased": _static("-webkit-font-smoothing: auto"),
+    "list-none": _static("list-style-type: none"),
+    "list-disc": _static("list-style-type: disc"),
+    "list-decimal": _static("list-style-type: decimal"),
+    "list-inside": _static("list-style-position: inside"),
+    "list-outside": _static("list-style-position: outside"),
+    **{f"align-{name}": _static(f"vertical-align: {name}") for name in (
+        "baseline", "top", "middle", "bottom", "text-top", "text-bottom", "sub", "super")},
+    **{f"overflow-{name}": _static(f"overflow: {name}") for name in ("auto", "hidden", "clip", "visible", "scroll")},
+    **{f"overflow-{axis}-{name}": _static(f"overflow-{axis}: {name}") for axis in ("x", "y")
+       for name in ("auto", "hidden", "clip", "visible", "scroll")},
+    **{f"overscroll-{name}": _static(f"overscroll-behavior: {name}") for name in ("auto", "contain", "none")},
+    **{f"object-{name}": _static(f"object-fit: {name}") for name in ("contain", "cover", "fill", "none", "scale-down")},
+    **{f"object-{name}": _static(f"object-position: {name.replace('-', ' ')}") for name in (
+        "bottom", "center", "left", "left-bottom", "left-top", "right", "right-bottom", "right-top", "top")},
+    "box-border": _static("box-sizing: border-box"),
+    "box-content": _static("box-sizing: content-box"),
+    **{f"float-{name}": _static(f"float: {name}") for name in ("right", "left", "none")},
+    **{f"clear-{name}": _static(f"clear: {name}") for name in ("left", "right", "both", "none")},
+    "isolate": _static("isolation: isolate"),
+    "isolation-auto": _static("isolation: auto"),
+    **{f"bg-{name}": _static(f"background-attachment: {name}") for name in ("fixed", "local", "scroll")},
+    **{f"bg-clip-{name}": _static(f"background-clip: {name}-box" if name != "text" else "background-clip: text")
+       for name in ("border", "padding", "content", "text")},
+    **{f"bg-{name}": _static(f"background-repeat: {name}") for name in ("repeat", "no-repeat", "repeat-x", "repeat-y")},
+    **{f"bg-{name}": _static(f"background-size: {name}") for name in ("auto", "cover", "contain")},
+    **{f"bg-{name}": _static(f"background-position: {name.replace('-', ' ')}") for name in (
+        "bottom", "center", "left", "left-bottom", "left-top", "right", "right-bottom", "right-top", "top")},
+    "bg-none": _static("background-image: none"),
+    **{f"bg-gradient-to-{name}": _static(f"background-image: linear-gradient(to {side}, var(--tw-gradient-stops))")
+       for name, side in (("t", "top"), ("tr", "top right"), ("r", "right"), ("br", "bottom right"),
+                          ("b", "bottom"), ("bl", "bottom left"), ("l", "left"), ("tl", "top left"))},
+    **{f"border-{name}": _static(f"border-style: {name}") for name in ("solid", "dashed", "dotted", "double", "hidden", "none")},
+    "border-collapse": _static("border-collapse: collapse"),
+    "border-separate": _static("border-collapse: separate"),
+    "table-auto": _static("table-layout: auto"),
+    "table-fixed": _static("table-layout: fixed"),
+    "outline-none": _static("outline: 2px solid transparent", "outline-offset: 2px"),
+    **{f"outline-{name}": _static(f"outline-style: {name}") for name in ("dashed", "dotted", "double")},
+    "ring-inset": _static("--tw-ring-inset: inset"),
+    **{f"mix-blend-{name}": _static(f"mix-blend-mode: {name}") for name in (
+        "normal", "multiply", "screen", "overlay", "darken", "lighten", "difference", "exclusion")},
+    "transition": _static("transition-property: color, background-color, border-color, text-decoration-color, "
+                          "fill, stroke, opacity, box-shadow, transform, filter, backdrop-filter",
+                          "transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)", "transition-duration: 150ms"),
+    "transition-none": _static("transition-property: none"),
+    "transition-all": _static("transition-property: all", "transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)",
+                              "transition-duration: 150ms"),
+    "transition-colors": _static("transition-property: color, background-color, border-color, "
+                                 "text-decoration-color, fill, stroke",
+                                 "transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)",
+                                 "transition-duration: 150ms"),
+    "transition-opacity": _static("transition-property: opacity",
+                                  "transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)",
+                                  "transition-duration: 150ms"),
+    "transition-shadow": _static("transition-property: box-shadow",
+                                 "transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)",
+                                 "transition-duration: 150ms"),
+    "transition-transform": _static("transition-property: transform",
+                                    "transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1)",
+                                    "transition-duration: 150ms"),
+    "animate-none": _static("animation: none"),
+    "animate-spin": _static("animation: spin 1s linear infinite"),
+    "animate-ping": _static("animation: ping 1s cubic-bezier(0, 0, 0.2, 1) infinite"),
+    "animate-pulse": _static("animation: pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite"),
+    "animate-bounce": _static("animation: bounce 1s infinite"),
+    "transform": _static("transform: translate(var(--tw-translate-x), var(--tw-translate-y)) rotate(var(--tw-rotate))"),
+    "transform-gpu": _static("transform: translate3d(var(--tw-translate-x), var(--tw-translate-y), 0) rotate(var(--tw-rotate))"),
+    "transform-none": _static("transform: none"),
+    **{f"origin-{name}": _static(f"transform-origin: {name.replace('-', ' ')}") for name in (
+        "center", "top", "top-right", "right", "bottom-right", "bottom", "bottom-left", "left", "top-left")},
+    **{f"cursor-{name}": _static(f"cursor: {name}") for name in (
+        "auto", "default", "pointer", "wait", "text", "move", "help", "not-allowed", "none", "context-menu",
+        "progress", "cell", "crosshair", "grab", "grabbing", "zoom-in", "zoom-out", "col-resize", "row-resize")},
+    "pointer-events-none": _static("pointer-events: none"),
+    "pointer-events-auto": _static("pointer-events: auto"),
+    **{f"select-{name}": _static(f"user-select: {name}") for name in ("none", "text", "all", "auto")},
+    **{f"resize{'-' + name if name != 'both' else ''}": _static(f"resize: {name}")
+       for name in ("none", "y", "x", "both")},
+    "appearance-none": _static("appearance: none"),
+    **{f"touch-{name}": _static(f"touch-action: {name}") for name in (
+        "auto", "none", "pan-x", "pan-y", "pinch-zoom", "manipulation")},
+    **{f"will-change-{name}": _static(f"will-change: {value}") for name, value in (
+        ("auto", "auto"), ("scroll", "scroll-position"), ("contents", "contents"), ("transform", "transform"))},
+    "scroll-auto": _static("scroll-behavior: auto"),
+    "scroll-smooth": _static("scroll-behavior: smooth"),
+    **{f"snap-{name}": _static(f"scroll-snap-align: {name}") for name in ("start", "end", "center")},
+    "snap-none": _static("scroll-snap-type: none"),
+    "snap-x": _static("scroll-snap-type: x var(--tw-scroll-snap-strictness)"),
+    "snap-y": _static("scroll-snap-type: y var(--tw-scroll-snap-strictness)"),
+    "snap-mandatory": _static("--tw-scroll-snap-strictness: mandatory"),
+    "divide-solid": _static("border-style: solid"),
+    "divide-dashed": _static("border-style: dashed"),
+    "filter": _static("filter: var(--tw-blur) var(--tw-brightness) var(--tw-contrast) var(--tw-drop-shadow)"),
+    "filter-none": _static("filter: none"),
+}
+
+# Variant prefixes: (kind, CSS) where kind is media, pseudo, element or parent
+VARIANTS: Dict[str, Tuple[str, str]] = {
+    "sm": ("media", "(min-width: 640px)"),
+    "md": ("media", "(min-width: 768px)"),
+    "lg": ("media", "(min-width: 1024px)"),
+    "xl": ("media", "(min-width: 1280px)"),
+    "2xl": ("media", "(min-width: 1536px)"),
+    "max-sm": ("media", "not all and (min-width: 640px)"),
+    "max-md": ("media", "not all and (min-width: 768px)"),
+    "max-lg": ("media", "not all and (min-width: 1024px)"),
+    "max-xl": ("media", "not all and (min-width: 1280px)"),
+    "max-2xl": ("media", "not all and (min-width: 1536px)"),
+    "dark": ("media", "(prefers-color-scheme: dark)"),
+    "motion-safe": ("media", "(prefers-reduced-motion: no-preference)"),
+    "motion-reduce": ("media", "(prefers-reduced-motion: reduce)"),
+    "contrast-more": ("media", "(prefers-contrast: more)"),
+    "print": ("media", "print"),
+    "portrait": ("media", "(orientation: portrait)"),
+    "landscape": ("media", "(orientation: landscape)"),
+    **{name: ("pseudo", f":{name}") for name in (
+        "hover", "focus", "focus-within", "focus-visible", "active", "visited", "target", "empty", "disabled",
+        "enabled", "checked", "indeterminate", "default", "required", "valid", "invalid", "in-range",
+        "out-of-range", "placeholder-shown", "autofill", "read-only")},
+    "first": ("pseudo", ":first-child"),
+    "last": ("pseudo", ":last-child"),
+    "only": ("pseudo", ":only-child"),
+    "odd": ("pseudo", ":nth-child(odd)"),
+    "even": ("pseudo", ":nth-child(even)"),
+    "first-of-type": ("pseudo", ":first-of-type"),
+    "last-of-type": ("pseudo", ":last-of-type"),
+    "open": ("pseudo", "[open]"),
+    **{name: ("element", f"::{name}") for name in (
+        "before", "after", "placeholder", "file", "marker", "selection", "first-line", "first-letter", "backdrop")},
+    **{f"group-{name}": ("parent", f".group:{name} ") for name in (
+        "hover", "focus", "focus-within", "focus-visible", "active", "disabled", "checked")},
+    **{f"peer-{name}": ("parent", f".peer:{name} ~ ") for name in (
+        "hover", "focus", "focus-visible", "checked", "disabled", "invalid", "required", "placeholder-shown")},
+    **{f"aria-{name}": ("pseudo", f'[aria-{name}="true"]') for name in (
+        "busy", "checked", "disabled", "expanded", "hidden", "pressed", "readonly", "required", "selected")},
+    "rtl": ("parent", '[dir="rtl"] '),
+    "ltr": ("parent", '[dir="ltr"] '),
+}
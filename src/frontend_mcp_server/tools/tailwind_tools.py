@@ -3,39 +3,19 @@ Tailwind CSS tools for the MCP server.
 """
 
 import json
-import re
 from typing import Any, Dict, List
 
+import numpy as np
 from mcp.types import Tool, TextContent
 
-
-# Comprehensive Tailwind CSS class mappings
-TAILWIND_CLASSES = {
-    "spacing": {
-        "p": ["p-0", "p-1", "p-2", "p-3", "p-4", "p-5", "p-6", "p-8", "p-10", "p-12", "p-16", "p-20", "p-24"],
-        "m": ["m-0", "m-1", "m-2", "m-3", "m-4", "m-5", "m-6", "m-8", "m-10", "m-12", "m-16", "m-20", "m-24"],
-        "px": ["px-0", "px-1", "px-2", "px-3", "px-4", "px-5", "px-6", "px-8"],
-        "py": ["py-0", "py-1", "py-2", "py-3", "py-4", "py-5", "py-6", "py-8"],
-    },
-    "colors": {
-        "bg": ["bg-white", "bg-black", "bg-gray-100", "bg-gray-200", "bg-gray-300", "bg-blue-500", "bg-green-500", "bg-red-500"],
-        "text": ["text-white", "text-black", "text-gray-600", "text-gray-800", "text-blue-600", "text-green-600", "text-red-600"],
-        "border": ["border-gray-200", "border-gray-300", "border-blue-500", "border-green-500", "border-red-500"],
-    },
-    "layout": {
-        "flex": ["flex", "flex-col", "flex-row", "flex-wrap", "flex-nowrap"],
-        "grid": ["grid", "grid-cols-1", "grid-cols-2", "grid-cols-3", "grid-cols-4", "grid-cols-12"],
-        "position": ["relative", "absolute", "fixed", "sticky"],
-    },
-    "typography": {
-        "font": ["font-thin", "font-light", "font-normal", "font-medium", "font-semibold", "font-bold"],
-        "text": ["text-xs", "text-sm", "text-base", "text-lg", "text-xl", "text-2xl", "text-3xl"],
-        "align": ["text-left", "text-center", "text-right", "text-justify"],
-    },
-    "responsive": {
-        "breakpoints": ["sm:", "md:", "lg:", "xl:", "2xl:"],
-    }
-}
+from .tailwind_analysis import DEFAULT_TOP_N, RESPONSIVE_VARIANTS, analyze_markup
+from .tailwind_apply import DEFAULT_MIN_SUPPORT, mine_apply_candidates
+from .tailwind_catalog import CATALOG
+from .tailwind_colors import ColorError, WCAG_AA, contrast_matrix, format_oklch, hex_to_srgb, palette_scales, wcag_rating
+from .tailwind_conflicts import detect_conflicts, element_conflicts
+from .tailwind_intents import INTENT_CLASSES, match_intents
+from .tailwind_jit import generate_css
+from .tailwind_theme import PALETTE
 
 
 def get_tools() -> List[Tool]:
@@ -60,6 +40,10 @@ def get_tools() -> List[Tool]:
                         "type": "boolean",
                         "description": "Whether to include responsive variants",
                         "default": True
+                    },
+                    "query": {
+                        "type": "string",
+                        "description": "Partial class to complete from the full Tailwind catalog, e.g. `md:hover:bg-bl` or an abbreviation like `jus-be`"
                     }
                 },
                 "required": ["design_description", "element_type"]
@@ -134,13 +118,23 @@ def get_tools() -> List[Tool]:
                 "properties": {
                     "html_content": {
                         "type": "string",
-                        "description": "HTML content with Tailwind classes to optimize"
+                        "description": "HTML or JSX content with Tailwind classes to optimize (class, className and className={`...`} attributes)"
                     },
                     "optimization_type": {
                         "type": "string",
-                        "enum": ["duplicate_removal", "class_ordering", "responsive_optimization", "all"],
+                        "enum": ["duplicate_removal", "class_ordering", "responsive_optimization", "apply_extraction", "conflict_detection", "all"],
                         "description": "Type of optimization to perform",
                         "default": "all"
+                    },
+                    "min_support": {
+                        "type": "integer",
+                        "description": "Elements a class combination must appear on to be proposed as an @apply component",
+                        "default": DEFAULT_MIN_SUPPORT
+                    },
+                    "css_budget": {
+                        "type": "integer",
+                        "description": "Gzipped bytes the generated utilities CSS may take (0 = no budget)",
+                        "default": 0
                     }
                 },
                 "required": ["html_content"]
@@ -154,7 +148,7 @@ def get_tools() -> List[Tool]:
                 "properties": {
                     "primary_color": {
                         "type": "string",
-                        "description": "Primary color name or hex code"
+                        "description": "Primary color: a Tailwind color name (blue, blue-600), a hex code or oklch(L C H)"
                     },
                     "palette_type": {
                         "type": "string",
@@ -191,35 +185,28 @@ async def handle_call(name: str, arguments: Dict[str, Any]) -> List[TextContent]
         return [TextContent(type="text", text=f"Unknown Tailwind tool: {name}")]
 
 
+def _compatible_classes(suggestions: List[str], excluded: List[str], blocking: List[str]) -> List[str]:
+    """Suggestions in order, minus excluded ones, those sharing a property with a blocking class and those
+    overridden by an earlier suggestion."""
+    kept: List[str] = []
+    for cls in dict.fromkeys(suggestions):
+        if cls in excluded or any(cls in conflict[:2] for conflict in element_conflicts(blocking + [cls])):
+            continue
+        if any(cls in conflict[:2] for conflict in element_conflicts(kept + [cls])):
+            continue
+        kept.append(cls)
+    return kept
+
+
 async def suggest_classes(args: Dict[str, Any]) -> List[TextContent]:
     """Suggest Tailwind CSS classes based on design requirements."""
     description = args.get("design_description", "").lower()
     element_type = args.get("element_type", "general")
     responsive = args.get("responsive", True)
     
-    suggestions = []
-    
     # Analyze description for design intent
-    if "center" in description or "centered" in description:
-        suggestions.extend(["flex", "items-center", "justify-center"])
-    
-    if "shadow" in description or "elevated" in description:
-        suggestions.extend(["shadow-md", "shadow-lg", "drop-shadow"])
-    
-    if "rounded" in description or "circle" in description:
-        suggestions.extend(["rounded", "rounded-lg", "rounded-full"])
-    
-    if "blue" in description:
-        suggestions.extend(["bg-blue-500", "text-blue-600", "border-blue-500"])
-    elif "red" in description:
-        suggestions.extend(["bg-red-500", "text-red-600", "border-red-500"])
-    elif "green" in description:
-        suggestions.extend(["bg-green-500", "text-green-600", "border-green-500"])
-    
-    if "large" in description or "big" in description:
-        suggestions.extend(["text-lg", "text-xl", "p-6", "p-8"])
-    elif "small" in description:
-        suggestions.extend(["text-sm", "text-xs", "p-2", "p-3"])
+    scored, matched_terms, negated_terms = match_intents(description)
+    suggestions = [cls for cls, _ in scored]
     
     # Element-specific suggestions
     if element_type == "button":
@@ -238,6 +225,12 @@ async def suggest_classes(args: Dict[str, Any]) -> List[TextContent]:
             "space-y-4", "p-6", "bg-white", "rounded-lg",
             "shadow", "border", "border-gray-200"
         ])
+
+    # Intents win over element defaults; "no shadow" rules out every box-shadow, "not blue" only the blue classes
+    excluded = [cls for _, intent in negated_terms for cls, _ in INTENT_CLASSES[intent]]
+    blocking = [cls for _, intent in negated_terms if not intent.startswith("color:")
+                for cls, _ in INTENT_CLASSES[intent]]
+    suggestions = _compatible_classes(suggestions, excluded, blocking)
     
     # Add responsive variants if requested
     if responsive and suggestions:
@@ -253,12 +246,23 @@ async def suggest_classes(args: Dict[str, Any]) -> List[TextContent]:
     # Remove duplicates and format
     unique_suggestions = list(dict.fromkeys(suggestions))
     
+    query = str(args.get("query") or "").strip()
+    completions = ""
+    if query:
+        matches = CATALOG.complete(query)
+        rows = "\n".join(f"| `{cls}` | `{css}` |" for cls, css in matches)
+        completions = f"""
+## Completions for `{query}`
+{f"| Class | CSS |{chr(10)}|---|---|{chr(10)}{rows}" if matches else "No matching Tailwind classes."}
+"""
+    
     result = f"""
 # Tailwind CSS Class Suggestions
 
 **Design Description:** {description}
 **Element Type:** {element_type}
-
+**Matched Terms:** {", ".join(f"{term} ({intent})" for term, intent in matched_terms) or "none"}
+{completions}
 ## Recommended Classes
 
 ### Core Classes
@@ -267,7 +271,7 @@ async def suggest_classes(args: Dict[str, Any]) -> List[TextContent]:
 ```
 
 ### Complete Class List
-{chr(10).join(f"- `{cls}`" for cls in unique_suggestions)}
+{chr(10).join(f"- `{cls}` - {CATALOG.describe(cls) or 'not in the default theme'}" for cls in unique_suggestions)}
 
 ## Usage Example
 ```html
@@ -525,28 +529,37 @@ async def optimize_tailwind(args: Dict[str, Any]) -> List[TextContent]:
     """Optimize Tailwind CSS usage."""
     html_content = args.get("html_content", "")
     optimization_type = args.get("optimization_type", "all")
+    numbers = {}
+    for key, default in (("min_support", DEFAULT_MIN_SUPPORT), ("css_budget", 0)):
+        try:
+            numbers[key] = int(args.get(key, default))
+        except (ValueError, TypeError):
+            return [TextContent(type="text", text=f"Error: {key} must be an integer, got {args.get(key)!r}")]
+    min_support, css_budget = numbers["min_support"], numbers["css_budget"]
     
     optimizations = []
     
-    # Extract all Tailwind classes
-    class_pattern = r'class="([^"]*)"'
-    classes_found = re.findall(class_pattern, html_content)
-    all_classes = []
-    
-    for class_list in classes_found:
-        all_classes.extend(class_list.split())
-    
-    # Remove duplicates
-    unique_classes = list(dict.fromkeys(all_classes))
+    # Extract all Tailwind classes in one pass
+    usage = analyze_markup(html_content)
+    frequencies = usage.frequencies()
+    variants = usage.variant_breakdown()
+    unknown = usage.unknown_classes()
     
     if optimization_type in ["duplicate_removal", "all"]:
-        duplicates = [cls for cls in unique_classes if all_classes.count(cls) > 1]
+        duplicates = [(cls, count) for cls, count in frequencies.most_common() if count > 1]
         if duplicates:
             optimizations.append({
                 "type": "Duplicate Classes",
-                "issue": f"Found {len(duplicates)} duplicate classes",
+                "issue": f"Found {len(duplicates)} classes repeated across elements",
                 "suggestion": "Consider extracting common class combinations into CSS components",
-                "classes": duplicates[:10]  # Show first 10
+                "classes": [f"{cls} ({count})" for cls, count in duplicates[:10]]  # Show first 10
+            })
+        if usage.repeated:
+            optimizations.append({
+                "type": "Repeated Within an Element",
+                "issue": f"Found {len(usage.repeated)} classes written twice on the same element",
+                "suggestion": "Remove the repeats - they add bytes to the markup and nothing to the CSS",
+                "classes": [f"{cls} at {usage.location(element)}" for element, cls in usage.repeated[:10]]
             })
     
     if optimization_type in ["class_ordering", "all"]:
@@ -560,32 +573,115 @@ async def optimize_tailwind(args: Dict[str, Any]) -> List[TextContent]:
     
     if optimization_type in ["responsive_optimization", "all"]:
         # Check for responsive classes
-        responsive_classes = [cls for cls in unique_classes if any(bp in cls for bp in ["sm:", "md:", "lg:", "xl:", "2xl:"])]
-        if responsive_classes:
+        responsive = {chain: counts for chain, counts in variants.items()
+                      if chain.split(":")[0] in RESPONSIVE_VARIANTS}
+        if responsive:
             optimizations.append({
                 "type": "Responsive Classes",
-                "issue": f"Found {len(responsive_classes)} responsive classes",
+                "issue": f"Found {sum(distinct for _, distinct in responsive.values())} responsive classes",
                 "suggestion": "Ensure mobile-first approach and logical breakpoint progression",
-                "classes": responsive_classes[:5]
+                "classes": [f"{chain} ({uses} uses)" for chain, (uses, _) in list(responsive.items())[:5]]
+            })
+    
+    # Utilities fighting over the same property on one element
+    conflicts = []
+    if optimization_type in ["conflict_detection", "all"]:
+        conflicts, dead = detect_conflicts(usage)
+        if conflicts:
+            optimizations.append({
+                "type": "Conflicting Utilities",
+                "issue": f"Found {len(conflicts)} class pairs setting the same property on one element"
+                         + (f", leaving {len(dead)} classes dead" if dead else ""),
+                "suggestion": "Keep one class per property and variant - the stylesheet order decides which applies, not the order in the markup",
+                "classes": [f"{conflict.loser} → {conflict.winner} at {usage.location(conflict.first)}"
+                            for conflict in conflicts[:10]]
             })
     
+    # Frequent class combinations, mined across every element
+    candidates = []
+    if optimization_type in ["apply_extraction", "all"]:
+        candidates = mine_apply_candidates(usage, min_support=min_support)
+    
+    # CSS the classes generate, against the budget if one is set
+    css = generate_css(usage.names)
+    if css_budget and css.gzip_bytes > css_budget:
+        optimizations.append({
+            "type": "CSS Budget",
+            "issue": f"Generated utilities CSS is {css.gzip_bytes} bytes gzipped, {css.gzip_bytes - css_budget} over the {css_budget} byte budget",
+            "suggestion": "Drop one-off arbitrary values and rarely used variants, or share classes through components",
+            "classes": [f"{cls} ({size} B)" for cls, size in css.costliest(10)]
+        })
+    
     # Performance suggestions
-    if len(unique_classes) > 50:
+    if len(frequencies) > 50:
         optimizations.append({
             "type": "Performance",
-            "issue": f"High number of utility classes ({len(unique_classes)})",
-            "suggestion": "Consider using @apply directive for repeated patterns",
-            "example": "@apply flex items-center px-4 py-2 text-white bg-blue-600 rounded;"
+            "issue": f"High number of utility classes ({len(frequencies)})",
+            "suggestion": "Consider using @apply directive for repeated patterns" + (
+                f" - `{' '.join(candidates[0].classes)}` appears on {candidates[0].support} elements" if candidates else ""),
+            "example": candidates[0].rule if candidates else "@apply flex items-center px-4 py-2 text-white bg-blue-600 rounded;"
         })
     
+    top_rows = "\n".join(f"| `{cls}` | {count} |" for cls, count in frequencies.most_common(DEFAULT_TOP_N))
+    variant_rows = "\n".join(f"| {chain} | {uses} | {distinct} |"
+                             for chain, (uses, distinct) in list(variants.items())[:DEFAULT_TOP_N])
+    pair_rows = "\n".join(f"| `{first}` + `{second}` | {count} |" for first, second, count in usage.cooccurrence())
+    apply_rows = "\n".join(f"| `.{candidate.name}` | {' '.join(candidate.classes)} | {candidate.support} | {candidate.bytes_saved} |"
+                           for candidate in candidates)
+    cost_rows = "\n".join(f"| `{cls}` | {size} |" for cls, size in css.costliest(DEFAULT_TOP_N))
+    conflict_rows = "\n".join(
+        f"| `{conflict.loser}` | `{conflict.winner}` | {', '.join(conflict.properties)} | {'yes' if conflict.dead else 'no'} | {conflict.elements} | {usage.location(conflict.first)} |"
+        for conflict in conflicts[:DEFAULT_TOP_N])
+    conflict_section = f"""
+## Conflicting Utilities
+| Overridden | Applies | Properties | Dead | Elements | First at |
+|---|---|---|---|---:|---|
+{conflict_rows}
+""" if conflicts else ""
+    apply_section = f"""
+## @apply Candidates
+| Component | Classes | Elements | Bytes saved |
+|---|---|---:|---:|
+{apply_rows}
+
+```css
+@layer components {{
+{chr(10).join("  " + line for candidate in candidates for line in candidate.rule.splitlines())}
+}}
+```
+""" if candidates else ""
+    
     result = f"""
 # Tailwind CSS Optimization Report
 
 ## Summary
-- **Total classes found**: {len(all_classes)}
-- **Unique classes**: {len(unique_classes)}
+- **Elements with classes**: {usage.elements}
+- **Total classes found**: {usage.total + len(usage.repeated)}
+- **Unique classes**: {len(frequencies)}
+- **Outside the default theme**: {len(unknown)}{f" ({', '.join(cls for cls, _ in unknown[:5])})" if unknown else ""}
 - **Potential optimizations**: {len(optimizations)}
 
+## Most Used Classes
+| Class | Elements |
+|---|---:|
+{top_rows or "| (none) | 0 |"}
+
+## Variants
+| Variant | Uses | Distinct classes |
+|---|---:|---:|
+{variant_rows or "| (none) | 0 | 0 |"}
+
+## Frequent Pairs
+{f"| Classes | Elements |{chr(10)}|---|---:|{chr(10)}{pair_rows}" if pair_rows else "No class pair appears on more than one element."}
+
+## Generated CSS
+- **Utilities layer**: {css.bytes} bytes minified, {css.gzip_bytes} bytes gzipped{f" (budget {css_budget})" if css_budget else ""}
+- **Classes generating CSS**: {len(css.class_bytes)}{f" - no CSS for {', '.join(css.skipped[:5])}" if css.skipped else ""}
+
+| Class | Rule bytes |
+|---|---:|
+{cost_rows or "| (none) | 0 |"}
+{conflict_section}{apply_section}
 ## Optimizations
 """
     
@@ -613,49 +709,73 @@ async def generate_color_palette(args: Dict[str, Any]) -> List[TextContent]:
     palette_type = args.get("palette_type", "monochromatic")
     include_usage = args.get("include_usage", True)
     
-    # Tailwind color scales
-    color_scales = {
-        "blue": ["blue-50", "blue-100", "blue-200", "blue-300", "blue-400", "blue-500", "blue-600", "blue-700", "blue-800", "blue-900"],
-        "red": ["red-50", "red-100", "red-200", "red-300", "red-400", "red-500", "red-600", "red-700", "red-800", "red-900"],
-        "green": ["green-50", "green-100", "green-200", "green-300", "green-400", "green-500", "green-600", "green-700", "green-800", "green-900"],
-        "purple": ["purple-50", "purple-100", "purple-200", "purple-300", "purple-400", "purple-500", "purple-600", "purple-700", "purple-800", "purple-900"],
-        "gray": ["gray-50", "gray-100", "gray-200", "gray-300", "gray-400", "gray-500", "gray-600", "gray-700", "gray-800", "gray-900"],
-    }
+    # 50-950 scales in OKLCH: the primary, then its hue rotations
+    try:
+        scales = palette_scales(primary_color, palette_type)
+    except ColorError as e:
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
+    name = scales[0].name
+    
+    # Contrast of every palette entry against every other, plus white and black
+    labels = [cls for scale in scales for cls in scale.classes()]
+    rgb = np.concatenate([scale.rgb for scale in scales])
+    matrix = contrast_matrix(rgb)
+    on_white, on_black = contrast_matrix(rgb, np.array([[1.0, 1.0, 1.0], [0.0, 0.0, 0.0]])).T
+    
+    scale_sections = []
+    offset = 0
+    for scale in scales:
+        rows = "\n".join(
+            f"| {shade} | `{hex_value}` | `{format_oklch(lch)}` | {on_white[offset + i]:.2f} | {on_black[offset + i]:.2f} |"
+            for i, (shade, hex_value, lch) in enumerate(zip(scale.shades, scale.hex, scale.oklch)))
+        offset += len(scale.shades)
+        source = "Tailwind default" if scale.native else f"generated at hue {scale.oklch[5][2]:.0f}°"
+        scale_sections.append(f"""### {scale.name} ({source})
+| Shade | Hex | OKLCH | vs white | vs black |
+|---|---|---|---:|---:|
+{rows}
+""")
+    
+    generated = [scale for scale in scales if not scale.native]
+    config_section = ""
+    if generated:
+        entries = "\n".join(
+            f"        {scale.name}: {{ " + ", ".join(f"{shade}: '{hex_value}'" for shade, hex_value in zip(scale.shades, scale.hex)) + " },"
+            for scale in generated)
+        config_section = f"""
+## Tailwind Config
+```js
+module.exports = {{
+  theme: {{
+    extend: {{
+      colors: {{
+{entries}
+      }},
+    }},
+  }},
+}}
+```
+"""
     
-    # Get base color scale
-    base_scale = color_scales.get(primary_color.lower(), color_scales["blue"])
-    
-    # Generate palette based on type
-    if palette_type == "monochromatic":
-        palette = {
-            "primary": base_scale,
-            "usage": {
-                "backgrounds": [base_scale[0], base_scale[1], base_scale[2]],  # Light shades
-                "text": [base_scale[6], base_scale[7], base_scale[8]],  # Dark shades
-                "accents": [base_scale[4], base_scale[5], base_scale[6]],  # Medium shades
-            }
-        }
-    elif palette_type == "complementary":
-        # Add complementary color
-        complementary_colors = {
-            "blue": "orange",
-            "red": "green", 
-            "green": "red",
-            "purple": "yellow",
-            "orange": "blue"
-        }
-        comp_color = complementary_colors.get(primary_color.lower(), "gray")
-        comp_scale = color_scales.get(comp_color, color_scales["gray"])
-        
-        palette = {
-            "primary": base_scale,
-            "complementary": comp_scale,
-            "usage": {
-                "primary_bg": [base_scale[4], base_scale[5], base_scale[6]],
-                "complementary_accent": [comp_scale[4], comp_scale[5], comp_scale[6]],
-                "neutral": color_scales["gray"][:6]
-            }
-        }
+    header = " | ".join(labels)
+    matrix_rows = "\n".join(f"| `{label}` | " + " | ".join(f"{ratio:.1f}" for ratio in row) + " |"
+                             for label, row in zip(labels, matrix.tolist()))
+    
+    # The pairs the recommendations below use, rated
+    position = {cls: index for index, cls in enumerate(labels)}
+    pairs = [(f"text-{name}-600", "bg-white", on_white[position[f"{name}-600"]]),
+             ("text-white", f"bg-{name}-600", on_white[position[f"{name}-600"]]),
+             (f"text-{name}-700", f"bg-{name}-100", matrix[position[f"{name}-700"], position[f"{name}-100"]]),
+             (f"text-{name}-800", f"bg-{name}-50", matrix[position[f"{name}-800"], position[f"{name}-50"]]),
+             (f"text-{name}-400", "bg-gray-900", contrast_matrix(rgb[[position[f"{name}-400"]]],
+                                                                 hex_to_srgb([PALETTE["gray"]["900"]]))[0, 0])]
+    pair_rows = "\n".join(f"| `{text}` on `{background}` | {ratio:.2f} | {wcag_rating(ratio)} |"
+                           for text, background, ratio in pairs)
+    lightest_text = []
+    for background in (f"{name}-50", f"{name}-100", f"{name}-200"):
+        readable = np.flatnonzero(matrix[position[background], :len(scales[0].shades)] >= WCAG_AA)
+        if readable.size:
+            lightest_text.append(f"- On `bg-{background}`, the lightest AA text shade is `text-{labels[readable[0]]}`")
     
     # Generate usage examples
     usage_examples = ""
@@ -666,22 +786,22 @@ async def generate_color_palette(args: Dict[str, Any]) -> List[TextContent]:
 ### Backgrounds
 ```css
 /* Light backgrounds */
-bg-{base_scale[0].split('-')[0]}-50  /* Very light */
-bg-{base_scale[0].split('-')[0]}-100 /* Light */
-bg-{base_scale[0].split('-')[0]}-200 /* Subtle */
+bg-{name}-50  /* Very light */
+bg-{name}-100 /* Light */
+bg-{name}-200 /* Subtle */
 
 /* Primary backgrounds */
-bg-{base_scale[0].split('-')[0]}-500 /* Main */
-bg-{base_scale[0].split('-')[0]}-600 /* Hover */
-bg-{base_scale[0].split('-')[0]}-700 /* Active */
+bg-{name}-500 /* Main */
+bg-{name}-600 /* Hover */
+bg-{name}-700 /* Active */
 ```
 
 ### Text Colors
 ```css
 /* Primary text */
-text-{base_scale[0].split('-')[0]}-600
-text-{base_scale[0].split('-')[0]}-700
-text-{base_scale[0].split('-')[0]}-800
+text-{name}-600
+text-{name}-700
+text-{name}-800
 
 /* Muted text */
 text-gray-500
@@ -691,58 +811,68 @@ text-gray-700
 
 ### Borders
 ```css
-border-{base_scale[0].split('-')[0]}-200 /* Subtle */
-border-{base_scale[0].split('-')[0]}-300 /* Visible */
-border-{base_scale[0].split('-')[0]}-500 /* Prominent */
+border-{name}-200 /* Subtle */
+border-{name}-300 /* Visible */
+border-{name}-500 /* Prominent */
 ```
 
 ### Component Examples
 ```html
 <!-- Primary Button -->
-<button class="bg-{base_scale[0].split('-')[0]}-600 hover:bg-{base_scale[0].split('-')[0]}-700 text-white px-4 py-2 rounded">
+<button class="bg-{name}-600 hover:bg-{name}-700 text-white px-4 py-2 rounded">
   Primary Action
 </button>
 
 <!-- Secondary Button -->
-<button class="bg-{base_scale[0].split('-')[0]}-100 hover:bg-{base_scale[0].split('-')[0]}-200 text-{base_scale[0].split('-')[0]}-700 px-4 py-2 rounded">
+<button class="bg-{name}-100 hover:bg-{name}-200 text-{name}-700 px-4 py-2 rounded">
   Secondary Action
 </button>
 
 <!-- Card -->
-<div class="bg-white border border-{base_scale[0].split('-')[0]}-200 rounded-lg p-6 shadow-sm">
-  <h3 class="text-{base_scale[0].split('-')[0]}-800 text-lg font-semibold">Card Title</h3>
+<div class="bg-white border border-{name}-200 rounded-lg p-6 shadow-sm">
+  <h3 class="text-{name}-800 text-lg font-semibold">Card Title</h3>
   <p class="text-gray-600 mt-2">Card content goes here.</p>
 </div>
 ```
 """
     
     result = f"""
-# {primary_color.title()} Color Palette - {palette_type.title()}
-
-## Color Scale
-{chr(10).join(f"- **{color}**: `{color}`" for color in base_scale)}
+# {primary_color if primary_color.startswith(("#", "oklch")) else primary_color.title()} Color Palette - {palette_type.title()}
 
+## Color Scales
+{chr(10).join(scale_sections)}{config_section}
 ## Recommended Usage
 
 ### Light Theme
-- **Background**: `bg-white`, `bg-{base_scale[0].split('-')[0]}-50`
-- **Surface**: `bg-{base_scale[0].split('-')[0]}-100`, `bg-{base_scale[0].split('-')[0]}-200`
-- **Primary**: `bg-{base_scale[0].split('-')[0]}-600`, `text-{base_scale[0].split('-')[0]}-600`
+- **Background**: `bg-white`, `bg-{name}-50`
+- **Surface**: `bg-{name}-100`, `bg-{name}-200`
+- **Primary**: `bg-{name}-600`, `text-{name}-600`
 - **Text**: `text-gray-900`, `text-gray-700`, `text-gray-500`
 
 ### Dark Theme
 - **Background**: `bg-gray-900`, `bg-gray-800`
 - **Surface**: `bg-gray-700`, `bg-gray-600`
-- **Primary**: `bg-{base_scale[0].split('-')[0]}-500`, `text-{base_scale[0].split('-')[0]}-400`
+- **Primary**: `bg-{name}-500`, `text-{name}-400`
 - **Text**: `text-white`, `text-gray-100`, `text-gray-300`
 
 {usage_examples}
 
 ## Accessibility Notes
-- Ensure sufficient contrast ratios (4.5:1 for normal text, 3:1 for large text)
+| Pair | Contrast | WCAG |
+|---|---:|---|
+{pair_rows}
+
+{chr(10).join(lightest_text)}
+- AA needs 4.5:1 for normal text and 3:1 for large text; AAA needs 7:1
 - Test with color blindness simulators
-- Use semantic color naming (primary, secondary, etc.)
 - Provide alternative indicators beyond color alone
+
+## Contrast Matrix
+WCAG contrast ratio between every pair of palette entries.
+
+| | {header} |
+|---|{"---:|" * len(labels)}
+{matrix_rows}
 """
     
     return [TextContent(type="text", text=result)]
\ No newline at end of file
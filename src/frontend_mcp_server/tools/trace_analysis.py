@@ -0,0 +1,286 @@
+"""
+Streaming analysis of Chrome DevTools performance traces.
+
+Traces saved from the Performance panel use the Trace Event Format - either
+a bare array of events or an object with a `traceEvents` array - and a few
+minutes of recording easily exceed 500 MB. Events are decoded one at a time
+with flow_loader's event parser and folded into fixed-size aggregates:
+per-thread task totals, bounded top-N heaps, call-site counters and
+100 ms time bins for frames and input. Nothing depends on the events
+being sorted, so memory stays bounded by the number of threads, call sites
+and bins rather than by the trace size.
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from .flow_loader import DEFAULT_CHUNK_SIZE, FlowLoadError, JsonEventParser
+
+DEFAULT_TOP_N = 10
+LONG_TASK_MS = 50.0  # the Long Tasks API threshold
+BIN_US = 100_000  # frame and input time bins (100 ms)
+MAX_CALL_SITES = 1000
+
+TASK_EVENTS = ("RunTask", "ThreadControllerImpl::RunTask")  # current and older Chrome names
+LAYOUT_EVENTS = {"Layout": "layout", "UpdateLayoutTree": "style recalc"}
+GC_EVENTS = {"MajorGC": "major", "MinorGC": "minor"}
+ZOOM_INPUT = frozenset(("wheel", "mousewheel"))
+PAN_INPUT = frozenset(("pointermove", "mousemove", "touchmove"))
+# React 18 scheduling-profiler marks: --<phase>-start-<lanes> / --<phase>-stop
+REACT_PHASES = ("render", "commit", "layout-effects", "passive-effects")
+
+
+class DurationStats:
+    """Count, total and maximum of a stream of durations (ms)."""
+
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> Dict[str, float]:
+        return {"count": self.count, "total_ms": self.total, "max_ms": self.max,
+                "mean_ms": self.total / self.count if self.count else 0.0}
+
+
+class ThreadTasks:
+    """Top-level task aggregates for one thread."""
+
+    __slots__ = ("tasks", "busy_ms", "long", "blocking_ms", "longest")
+
+    def __init__(self) -> None:
+        self.tasks = 0
+        self.busy_ms = 0.0
+        self.long = DurationStats()
+        self.blocking_ms = 0.0  # time beyond the 50 ms budget, as in Total Blocking Time
+        self.longest: List[Tuple[float, float]] = []  # min-heap of (ms, ts)
+
+
+class TraceAnalyzer:
+    """Folds trace events into bounded aggregates."""
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N):
+        self.top_n = max(int(top_n), 1)
+        self.events = 0
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+        self.thread_names: Dict[Tuple[Any, Any], str] = {}
+        self.threads: Dict[Tuple[Any, Any], ThreadTasks] = {}
+        self.layouts = {kind: DurationStats() for kind in LAYOUT_EVENTS.values()}
+        self.forced = {kind: DurationStats() for kind in LAYOUT_EVENTS.values()}
+        self.call_sites: Dict[str, List[float]] = {}  # site -> [count, ms]
+        self.gc = {kind: DurationStats() for kind in GC_EVENTS.values()}
+        self.gc_longest: List[Tuple[float, float, str]] = []
+        self.react = {phase: DurationStats() for phase in REACT_PHASES}
+        self.react_open: Dict[Tuple[Any, str], float] = {}
+        self.react_measures: Dict[str, DurationStats] = {}
+        self.open_measures: Dict[Tuple[Any, Any, str], float] = {}
+        self.bins: Dict[int, List[int]] = {}  # bin -> [presented, dropped, zoom inputs, pan inputs]
+
+    # Streaming
+    def consume(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> "TraceAnalyzer":
+        parser = JsonEventParser(stream, chunk_size)
+        depth = 0
+        for event, value in parser.events():
+            if depth == 0:
+                if event == "start_array":  # bare JSON array of events
+                    for item in parser.iter_array_items():
+                        self.add_event(item)
+                    break
+                if event != "start_map":
+                    raise FlowLoadError("Trace must be a JSON array of events or an object with `traceEvents`")
+            if event == "map_key" and depth == 1 and value == "traceEvents" and parser.begin_array():
+                for item in parser.iter_array_items():
+                    self.add_event(item)
+            elif event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+        if not self.events:
+            raise FlowLoadError("No trace events found (expected a `traceEvents` array)")
+        return self
+
+    def _top(self, heap: List[Tuple], entry: Tuple) -> None:
+        if len(heap) < self.top_n:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def _bin(self, ts: float) -> List[int]:
+        key = int(ts // BIN_US)
+        counts = self.bins.get(key)
+        if counts is None:
+            counts = self.bins[key] = [0, 0, 0, 0]
+        return counts
+
+    def add_event(self, item: Any) -> None:
+        if not isinstance(item, dict):
+            return
+        self.events += 1
+        name = item.get("name", "")
+        phase = item.get("ph", "")
+        args = item.get("args") or {}
+        thread = (item.get("pid"), item.get("tid"))
+
+        if phase == "M":
+            if name == "thread_name":
+                self.thread_names[thread] = str(args.get("name", ""))
+            return
+        ts = item.get("ts")
+        if not isinstance(ts, (int, float)):
+            return
+        dur = float(item.get("dur") or 0.0)
+        if self.start is None or ts < self.start:
+            self.start = ts
+        if self.end is None or ts + dur > self.end:
+            self.end = ts + dur
+        ms = dur / 1000
+
+        if name in TASK_EVENTS and phase == "X":
+            tasks = self.threads.get(thread)
+            if tasks is None:
+                tasks = self.threads[thread] = ThreadTasks()
+            tasks.tasks += 1
+            tasks.busy_ms += ms
+            if ms > LONG_TASK_MS:
+                tasks.long.add(ms)
+                tasks.blocking_ms += ms - LONG_TASK_MS
+                self._top(tasks.longest, (ms, ts))
+        elif name in LAYOUT_EVENTS and phase == "X":
+            kind = LAYOUT_EVENTS[name]
+            self.layouts[kind].add(ms)
+            stack = (args.get("beginData") or {}).get("stackTrace")
+            if stack:  # DevTools flags these as forced reflows
+                self.forced[kind].add(ms)
+                self._add_call_site(stack[0], ms)
+        elif name in GC_EVENTS and phase == "X":
+            self.gc[GC_EVENTS[name]].add(ms)
+            self._top(self.gc_longest, (ms, ts, GC_EVENTS[name]))
+        elif name == "EventDispatch":
+            kind = (args.get("data") or {}).get("type")
+            if kind in ZOOM_INPUT:
+                self._bin(ts)[2] += 1
+            elif kind in PAN_INPUT:
+                self._bin(ts)[3] += 1
+        elif name == "PipelineReporter" and phase == "b":
+            state = (args.get("chrome_frame_reporter") or {}).get("state", "")
+            if state == "STATE_DROPPED":
+                self._bin(ts)[1] += 1
+            elif state.startswith("STATE_PRESENTED"):
+                self._bin(ts)[0] += 1
+        elif name == "DroppedFrame":
+            self._bin(ts)[1] += 1
+        elif name.startswith("--"):
+            self._add_react_mark(item.get("pid"), name, ts)
+        elif "⚛" in name:
+            self._add_react_measure(item, name, phase, ts, ms)
+
+    def _add_call_site(self, frame: Dict[str, Any], ms: float) -> None:
+        site = f"{frame.get('functionName') or '(anonymous)'} {frame.get('url', '')}:{frame.get('lineNumber', '?')}"
+        counts = self.call_sites.get(site)
+        if counts is None:
+            if len(self.call_sites) >= MAX_CALL_SITES:
+                site = "(other call sites)"
+                counts = self.call_sites.setdefault(site, [0, 0.0])
+            else:
+                counts = self.call_sites[site] = [0, 0.0]
+        counts[0] += 1
+        counts[1] += ms
+
+    def _add_react_mark(self, pid: Any, name: str, ts: float) -> None:
+        for phase in REACT_PHASES:
+            if name.startswith(f"--{phase}-start"):
+                self.react_open[(pid, phase)] = ts
+                return
+            if name.startswith(f"--{phase}-stop"):
+                started = self.react_open.pop((pid, phase), None)
+                if started is not None and ts >= started:
+                    self.react[phase].add((ts - started) / 1000)
+                return
+
+    def _add_react_measure(self, item: Dict[str, Any], name: str, phase: str, ts: float, ms: float) -> None:
+        """React's User Timing measures (for example `⚛ (Committing Changes)`)."""
+        if phase == "X":
+            self.react_measures.setdefault(name, DurationStats()).add(ms)
+        elif phase == "b":
+            self.open_measures[(item.get("pid"), item.get("id"), name)] = ts
+        elif phase == "e":
+            started = self.open_measures.pop((item.get("pid"), item.get("id"), name), None)
+            if started is not None and ts >= started:
+                self.react_measures.setdefault(name, DurationStats()).add((ts - started) / 1000)
+
+    # Results
+    def main_threads(self) -> List[Tuple[Any, Any]]:
+        """Renderer main threads; the busiest task thread when the trace has no thread names."""
+        named = [thread for thread, name in self.thread_names.items()
+                 if name == "CrRendererMain" and thread in self.threads]
+        if named:
+            return sorted(named, key=lambda thread: -self.threads[thread].busy_ms)
+        if self.threads:
+            return [max(self.threads, key=lambda thread: self.threads[thread].busy_ms)]
+        return []
+
+    def frames(self) -> Dict[str, Any]:
+        totals = [0, 0]
+        during = [0, 0]
+        input_bins = 0
+        for presented, dropped, zoom, pan in self.bins.values():
+            totals[0] += presented
+            totals[1] += dropped
+            if zoom or pan:
+                input_bins += 1
+                during[0] += presented
+                during[1] += dropped
+        seconds = input_bins * BIN_US / 1e6
+        return {
+            "presented": totals[0],
+            "dropped": totals[1],
+            "interaction_seconds": seconds,
+            "interaction_presented": during[0],
+            "interaction_dropped": during[1],
+            "interaction_fps": during[0] / seconds if seconds else 0.0,
+            "zoom_inputs": sum(counts[2] for counts in self.bins.values()),
+            "pan_inputs": sum(counts[3] for counts in self.bins.values()),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        start = self.start or 0.0
+        threads = []
+        for thread in self.main_threads():
+            tasks = self.threads[thread]
+            threads.append({
+                "thread": f"{self.thread_names.get(thread, 'thread')} (pid {thread[0]}, tid {thread[1]})",
+                "tasks": tasks.tasks,
+                "busy_ms": tasks.busy_ms,
+                "long_tasks": tasks.long.as_dict(),
+                "blocking_ms": tasks.blocking_ms,
+                "longest": [{"ms": ms, "at_ms": (ts - start) / 1000} for ms, ts in sorted(tasks.longest, reverse=True)],
+            })
+        sites = sorted(self.call_sites.items(), key=lambda item: (-item[1][1], item[0]))[:self.top_n]
+        return {
+            "events": self.events,
+            "duration_ms": ((self.end or start) - start) / 1000,
+            "main_threads": threads,
+            "layouts": {kind: stats.as_dict() for kind, stats in self.layouts.items()},
+            "forced": {kind: stats.as_dict() for kind, stats in self.forced.items()},
+            "forced_call_sites": [{"site": site, "count": int(count), "ms": ms} for site, (count, ms) in sites],
+            "gc": {kind: stats.as_dict() for kind, stats in self.gc.items()},
+            "gc_longest": [{"ms": ms, "at_ms": (ts - start) / 1000, "kind": kind}
+                           for ms, ts, kind in sorted(self.gc_longest, reverse=True)],
+            "react_phases": {phase: stats.as_dict() for phase, stats in self.react.items() if stats.count},
+            "react_measures": {name: stats.as_dict() for name, stats in sorted(self.react_measures.items())},
+            "frames": self.frames(),
+        }
+
+
+def analyze_trace(stream: TextIO, top_n: int = DEFAULT_TOP_N, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+    """Aggregate a Chrome trace read from a text stream."""
+    return TraceAnalyzer(top_n).consume(stream, chunk_size).summary()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test the layout benchmark generators, baselines and runner.
+"""
+
+import random
+
+from src.frontend_mcp_server.benchmarks import generators, layouts, runner
+from src.frontend_mcp_server.tools.flow_loader import build_flow
+
+
+def test_generators_shapes():
+    print("🏭 Testing synthetic graph generators...")
+    for shape in generators.GENERATORS:
+        for size in (10, 100, 1000):
+            flow = generators.generate(shape, size, seed=4)
+            assert len(flow["nodes"]) == size
+            assert flow == generators.generate(shape, size, seed=4)
+            edges = [(int(edge["source"][1:]), int(edge["target"][1:])) for edge in flow["edges"]]
+            assert len(set(edges)) == len(edges) and all(a != b for a, b in edges)
+            if shape != "scale_free":
+                assert all(a < b for a, b in edges)  # DAGs in topological id order
+
+    tree = generators.generate("balanced_tree", 1000)
+    assert len(tree["edges"]) == 999
+    dense = generators.generate("dense_dag", 1000)
+    assert len(dense["edges"]) >= 4 * 1000
+    grid = generators.generate("grid", 100)
+    assert len(grid["edges"]) == 2 * 10 * 9
+    print("✅ All shapes generated deterministically")
+
+
+def brute_force_crossings(graph, positions):
+    segments, ends = runner.edge_segments(graph, positions)
+
+    def orientation(ax, ay, bx, by, cx, cy):
+        value = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        return (value > 0) - (value < 0)
+
+    crossings = 0
+    for i in range(len(segments)):
+        for j in range(i):
+            if set(ends[i].tolist()) & set(ends[j].tolist()):
+                continue
+            p, q = segments[i].tolist(), segments[j].tolist()
+            if (orientation(*p, *q[:2]) * orientation(*p, *q[2:]) < 0
+                    and orientation(*q, *p[:2]) * orientation(*q, *p[2:]) < 0):
+                crossings += 1
+    return crossings
+
+
+def test_crossing_counts():
+    print("✖️ Testing straight-line crossing counts...")
+    graph = build_flow(generators.generate("random_dag", 120, seed=2))
+    random.seed(2)
+    positions = ([random.uniform(0, 1000) for _ in range(120)], [random.uniform(0, 1000) for _ in range(120)])
+    crossings, estimated = runner.count_edge_crossings(graph, positions)
+    assert not estimated and crossings == brute_force_crossings(graph, positions)
+
+    # Sampled estimates land close to the exact count
+    graph = build_flow(generators.generate("random_dag", 2000, seed=2))
+    positions = layouts.force_layout(graph, seed=1, iterations=5)
+    exact, estimated = runner.count_edge_crossings(graph, positions)
+    assert not estimated
+    original = runner.EXACT_CROSSING_EDGES
+    runner.EXACT_CROSSING_EDGES = 1000
+    try:
+        approximate, estimated = runner.count_edge_crossings(graph, positions)
+    finally:
+        runner.EXACT_CROSSING_EDGES = original
+    assert estimated and abs(approximate - exact) < 0.15 * exact
+    print(f"✅ Exact {exact}, estimated {approximate}")
+
+
+def test_baselines_and_runner():
+    print("🏁 Testing baseline layouts and runner...")
+    tree = build_flow(generators.generate("balanced_tree", 100))
+    assert runner.count_edge_crossings(tree, layouts.tree_layout(tree)) == (0, False)
+    assert runner.count_edge_crossings(tree, layouts.layered_layout(tree)) == (0, False)
+    assert runner.count_edge_crossings(tree, layouts.reference_layered_layout(tree)) == (0, False)
+    dag = build_flow(generators.generate("random_dag", 300, seed=4))
+    xs, ys = layouts.reference_layered_layout(dag)
+    assert all(ys[source] < ys[target] for source, target in zip(dag.edges.source, dag.edges.target)
+               if source != target)  # every edge of a DAG points down a layer or more
+    xs, ys = layouts.tree_layout(tree)
+    assert ys[0] == 0 and xs[0] > xs[1]  # root centred above its first child
+
+    records = runner.run_benchmarks(sizes=(10, 100), seed=1, measure_memory=False)
+    assert len(records) == len(generators.GENERATORS) * 2 * len(layouts.LAYOUTS)
+    assert all(record["status"] == "ok" and record["seconds"] >= 0 for record in records)
+
+    limited = runner.run_benchmarks(["grid"], (10, 100), ["force"], time_limit=0, measure_memory=True)
+    assert [record["status"] for record in limited] == ["ok", "skipped"]
+    assert limited[0]["peak_bytes"] > 0
+
+    report = runner.format_report(records + limited)
+    assert "| grid | 100 | 180 | force | skipped |" in report
+    choices = runner.recommend(records)
+    assert choices["balanced_tree"][100] in ("tree", "layered")
+    print(f"✅ {len(records)} records; recommendations: {choices['grid']}")
+
+
+def main():
+    test_generators_shapes()
+    test_crossing_counts()
+    test_baselines_and_runner()
+    print("🎉 BENCHMARK TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
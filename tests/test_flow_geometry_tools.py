@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Test the flow geometry tools.
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+
+import numpy as np
+
+from src.frontend_mcp_server.tools.flow_loader import build_flow
+from src.frontend_mcp_server.tools import flow_geometry_tools
+
+
+def test_handle_sides_follow_geometry():
+    print("🧲 Testing handle side assignment...")
+    graph = build_flow({
+        "nodes": [
+            {"id": "hub", "position": {"x": 0, "y": 0}, "width": 100, "height": 100},
+            {"id": "r1", "position": {"x": 400, "y": -60}},
+            {"id": "r2", "position": {"x": 400, "y": 160}},
+            {"id": "r3", "position": {"x": 400, "y": 30}},
+            {"id": "below", "position": {"x": 0, "y": 500}},
+            {"id": "left", "position": {"x": -600, "y": 40}},
+        ],
+        "edges": [
+            {"id": "e1", "source": "hub", "target": "r1"},
+            {"id": "e2", "source": "hub", "target": "r2"},
+            {"id": "e3", "source": "hub", "target": "r3"},
+            {"id": "e4", "source": "hub", "target": "below"},
+            {"id": "e5", "source": "left", "target": "hub"},
+            {"id": "e6", "source": "hub", "target": "ghost"},
+            {"id": "loop", "source": "r1", "target": "r1"},
+        ],
+    })
+    assignment = flow_geometry_tools.assign_handles(graph)
+    updates, node_handles = flow_geometry_tools.format_handle_assignment(
+        graph, assignment, "{type}-{side}-{slot}")
+    by_id = {update["id"]: update for update in updates}
+
+    assert "e6" not in by_id
+    assert by_id["e4"]["sourceHandle"] == "source-bottom-0" and by_id["e4"]["targetHandle"] == "target-top-0"
+    assert by_id["e5"]["sourceHandle"] == "source-right-0" and by_id["e5"]["targetHandle"] == "target-left-0"
+    assert by_id["loop"]["sourceHandle"] == "source-right-0" and by_id["loop"]["targetHandle"] == "target-top-0"
+
+    # Three edges leave the hub's right side, ordered top to bottom by their targets
+    right = [by_id[edge]["sourceHandle"] for edge in ("e1", "e3", "e2")]
+    assert right == ["source-right-0", "source-right-1", "source-right-2"]
+    assert [by_id[edge]["sourceOffset"] for edge in ("e1", "e3", "e2")] == [0.25, 0.5, 0.75]
+    assert len(node_handles["hub"]) == 5
+
+    single = flow_geometry_tools.assign_handles(graph, axis="vertical", spread=False)
+    assert set(single["source_side"][:5].tolist()) <= {1, 3}  # the self-loop keeps its right exit
+    assert (single["source_offset"] == 0.5).all()
+    print("✅ Sides, slots and self-loops assigned")
+
+
+def test_handle_assigner_tool_bulk():
+    print("⏱️ Testing react_flow_handle_assigner on 100k edges...")
+    random.seed(3)
+    count = 50_000
+    flow = {
+        "nodes": [{"id": f"n{i}", "position": {"x": random.uniform(0, 50000), "y": random.uniform(0, 50000)}}
+                  for i in range(count)],
+        "edges": [{"id": f"e{i}", "source": f"n{random.randrange(count)}", "target": f"n{random.randrange(count)}"}
+                  for i in range(2 * count)],
+    }
+    started = time.perf_counter()
+    assignment = flow_geometry_tools.assign_handles(build_flow(flow))
+    elapsed = time.perf_counter() - started
+    assert assignment["valid"].all() and (assignment["source_offset"] < 1).all()
+    print(f"✅ Assigned {2 * count} edges in {elapsed * 1000:.0f} ms")
+
+    small = {"nodes": flow["nodes"][:20], "edges": [
+        {"id": "a", "source": "n0", "target": "n1"}, {"id": "b", "source": "n1", "target": "n2"}]}
+    text = asyncio.run(flow_geometry_tools.handle_call("react_flow_handle_assigner", {"flow": small}))[0].text
+    patch = json.loads(text.split("```json")[1].split("```")[0])
+    assert set(patch["edges"]["changed"]) == {"a", "b"}
+
+    text = asyncio.run(flow_geometry_tools.handle_call("react_flow_handle_assigner", {"flow": small, "axis": "diagonal"}))[0].text
+    assert text.startswith("Error")
+    for template in ("{0}", "{side.real}", "{slot[1]}", "{type"):
+        text = asyncio.run(flow_geometry_tools.handle_call("react_flow_handle_assigner",
+                                                           {"flow": small, "handle_id_format": template}))[0].text
+        assert text.startswith("Error: ") and "handle_id_format" in text
+    text = asyncio.run(flow_geometry_tools.handle_call("react_flow_handle_assigner",
+                                                       {"flow": small, "slot_mode": "singel"}))[0].text
+    assert text == "Error: Unknown slot_mode 'singel' (expected spread or single)"
+    text = asyncio.run(flow_geometry_tools.handle_call("react_flow_handle_assigner",
+                                                       {"flow": small, "handle_id_format": "{type}-{side}"}))[0].text
+    assert '"sourceHandle":"source-' in text and '-0"' not in text
+
+
+def overlapping_pairs(placements, sizes):
+    return [
+        (i, j) for i in range(len(sizes)) for j in range(i)
+        if placements[i][0] < placements[j][0] + sizes[j][0] - 1e-6
+        and placements[j][0] < placements[i][0] + sizes[i][0] - 1e-6
+        and placements[i][1] < placements[j][1] + sizes[j][1] - 1e-6
+        and placements[j][1] < placements[i][1] + sizes[i][1] - 1e-6
+    ]
+
+
+def test_rectangle_packers():
+    print("📦 Testing MaxRects and skyline packers...")
+    random.seed(9)
+    sizes = [(random.uniform(20, 240), random.uniform(20, 160)) for _ in range(150)]
+    for algorithm in ("maxrects", "skyline"):
+        placements, used = flow_geometry_tools.pack_rectangles(sizes, 1.5, algorithm)
+        assert used == algorithm and not overlapping_pairs(placements, sizes)
+        width = max(x + w for (x, _), (w, _) in zip(placements, sizes))
+        height = max(y + h for (_, y), (_, h) in zip(placements, sizes))
+        utilization = sum(w * h for w, h in sizes) / (width * height)
+        assert utilization > 0.75 and 1.0 < width / height < 2.2
+        print(f"✅ {algorithm}: {utilization * 100:.1f}% utilization")
+
+    assert flow_geometry_tools.pack_skyline([(50, 50), (60, 10)], 100, 55) is None
+    assert flow_geometry_tools.pack_maxrects([(101, 1)], 100, 100) is None
+
+
+def test_canvas_packer_keeps_clusters_together():
+    print("🧩 Testing react_flow_canvas_packer on sprawling clusters...")
+    nodes, edges = [], []
+    for cluster in range(12):
+        origin = cluster * 3000
+        for i in range(4):
+            nodes.append({"id": f"c{cluster}-{i}", "position": {"x": origin + i * 200, "y": origin + (i % 2) * 80}})
+            if i:
+                edges.append({"id": f"c{cluster}-e{i}", "source": f"c{cluster}-{i - 1}", "target": f"c{cluster}-{i}"})
+    nodes.append({"id": "group", "position": {"x": 0, "y": 300}, "width": 300, "height": 200})
+    nodes.append({"id": "child", "parentId": "group", "position": {"x": 20, "y": 20}})
+    edges.append({"id": "into-child", "source": "c0-0", "target": "child"})
+    flow = {"nodes": nodes, "edges": edges}
+
+    graph = build_flow(flow)
+    result = flow_geometry_tools.pack_flow(graph, 1600, 1200, spacing=40)
+    assert result["items"] == 12  # the edge into the child joins its group with cluster 0
+    assert "child" not in result["positions"]
+    assert result["packed"]["width"] * result["packed"]["height"] < 0.05 * (
+        result["original"]["width"] * result["original"]["height"])
+
+    # Clusters move rigidly
+    positions = result["positions"]
+    for cluster in range(1, 12):
+        first, last = positions[f"c{cluster}-0"], positions[f"c{cluster}-3"]
+        assert (last["x"] - first["x"], last["y"] - first["y"]) == (600, 80)
+    assert 0 < result["zoom"] <= 2 and 0 < result["utilization"] <= 1
+
+    nodes_mode = flow_geometry_tools.pack_flow(graph, 1600, 1200, mode="nodes", algorithm="skyline")
+    assert nodes_mode["items"] == 49 and nodes_mode["algorithm"] == "skyline"
+
+    text = asyncio.run(flow_geometry_tools.handle_call("react_flow_canvas_packer", {
+        "flow": flow, "whiteboard_size": "large_1600x1200", "content_type": "brainstorming"}))[0].text
+    patch = json.loads(text.split("```json")[1].split("```")[0])
+    assert len(patch["nodes"]["moved"]) == 49 and "Fitted zoom" in text
+    for bad in ({"content_type": ["brainstorming"]}, {"spacing": "wide"}, {"spacing": [40]}):
+        text = asyncio.run(flow_geometry_tools.handle_call("react_flow_canvas_packer", {"flow": flow, **bad}))[0].text
+        assert text.startswith("Error: "), bad
+    print(f"✅ Packed extent {result['packed']['width']:.0f}x{result['packed']['height']:.0f}, zoom {result['zoom']:.2f}")
+
+
+def reference_compatibility(p0, p1, q0, q1):
+    """Holten & van Wijk edge compatibility, one pair at a time."""
+    pv, qv = (p1[0] - p0[0], p1[1] - p0[1]), (q1[0] - q0[0], q1[1] - q0[1])
+    lp, lq = math.hypot(*pv), math.hypot(*qv)
+    average = (lp + lq) / 2
+    angle = abs(pv[0] * qv[0] + pv[1] * qv[1]) / (lp * lq)
+    scale = 2 / (average / min(lp, lq) + max(lp, lq) / average)
+    pm, qm = ((p0[0] + p1[0]) / 2, (p0[1] + p1[1]) / 2), ((q0[0] + q1[0]) / 2, (q0[1] + q1[1]) / 2)
+    position = average / (average + math.dist(pm, qm))
+
+    def visibility(a0, a1, b0, b1):
+        av = (a1[0] - a0[0], a1[1] - a0[1])
+        squared = av[0] ** 2 + av[1] ** 2
+        project = [((b[0] - a0[0]) * av[0] + (b[1] - a0[1]) * av[1]) / squared for b in (b0, b1)]
+        points = [(a0[0] + t * av[0], a0[1] + t * av[1]) for t in project]
+        middle = ((points[0][0] + points[1][0]) / 2, (points[0][1] + points[1][1]) / 2)
+        span = math.dist(*points)
+        am = ((a0[0] + a1[0]) / 2, (a0[1] + a1[1]) / 2)
+        return max(1 - 2 * math.dist(am, middle) / span, 0) if span else 0
+
+    return angle * scale * position * min(visibility(p0, p1, q0, q1), visibility(q0, q1, p0, p1))
+
+
+def test_edge_compatibility_matches_reference():
+    print("🧮 Testing vectorized edge compatibility...")
+    random.seed(4)
+    start = np.array([[random.uniform(0, 500), random.uniform(0, 500)] for _ in range(60)])
+    end = start + np.array([[random.uniform(100, 300), random.uniform(-60, 60)] for _ in range(60)])
+    edge, other, weight, flipped = flow_geometry_tools.edge_compatibility(start, end, threshold=0.3, max_neighbors=59)
+    found = {(a, b): w for a, b, w in zip(edge.tolist(), other.tolist(), weight.tolist())}
+    expected = {
+        (a, b): reference_compatibility(start[a], end[a], start[b], end[b])
+        for a in range(60) for b in range(60) if a != b
+    }
+    expected = {pair: value for pair, value in expected.items() if value >= 0.3}
+    assert found.keys() == expected.keys()
+    assert all(abs(found[pair] - expected[pair]) < 1e-9 for pair in found)
+    assert not flipped.any()
+
+    top = flow_geometry_tools.edge_compatibility(start, end, threshold=0.3, max_neighbors=3)
+    assert np.bincount(top[0]).max() <= 3
+    print(f"✅ {len(found)} compatible pairs match the scalar reference")
+
+
+def test_edge_bundler_merges_parallel_edges():
+    print("🪢 Testing react_flow_edge_bundler...")
+    random.seed(2)
+    nodes = ([{"id": f"l{i}", "position": {"x": 0, "y": i * 60}} for i in range(20)]
+             + [{"id": f"r{i}", "position": {"x": 1500, "y": i * 60}} for i in range(20)]
+             + [{"id": "top", "position": {"x": 700, "y": -2000}}, {"id": "bottom", "position": {"x": 700, "y": 3000}}])
+    edges = [{"id": f"e{k}", "source": f"l{random.randrange(20)}", "target": f"r{random.randrange(20)}"}
+             for k in range(150)]
+    edges.append({"id": "back", "source": "r3", "target": "l5"})
+    edges.append({"id": "cross", "source": "top", "target": "bottom"})
+    edges.append({"id": "loop", "source": "l0", "target": "l0"})
+    graph = build_flow({"nodes": nodes, "edges": edges})
+
+    rows, start, end = flow_geometry_tools.edge_anchor_points(graph, "center")
+    assert len(rows) == 152
+    pairs = flow_geometry_tools.edge_compatibility(start, end)
+    polylines = flow_geometry_tools.bundle_edges(start, end, pairs, cycles=3)
+    assert polylines.shape == (152, 9, 2)
+    assert np.allclose(polylines[:, 0], start) and np.allclose(polylines[:, -1], end)
+
+    bundles = flow_geometry_tools.merge_bundles(polylines, pairs)
+    result = flow_geometry_tools.bundle_paths(graph, rows, polylines, bundles)
+    by_edge = {edge_id: bundle for bundle in result["bundles"] for edge_id in bundle["edges"]}
+    assert by_edge["cross"]["edges"] == ["cross"]
+    assert by_edge["back"] is by_edge["e0"]  # opposite direction, same corridor
+    assert len(result["bundles"]) < 10 and result["segments"] < 152 * 8 / 3
+    back = result["edge_paths"]["back"]
+    assert back.startswith("M1586.0 198.0") and back.endswith("L86.0 318.0")  # r3's center to l5's
+    assert result["svg"].startswith("<svg")
+
+    line = np.array([[0.0, 0.0], [1.0, 0.1], [2.0, 0.0], [3.0, 5.0]])
+    assert flow_geometry_tools.simplify_polyline(line, 1.0).tolist() == [[0.0, 0.0], [2.0, 0.0], [3.0, 5.0]]
+
+    flow = {"nodes": nodes, "edges": edges}
+    text = asyncio.run(flow_geometry_tools.handle_call("react_flow_edge_bundler", {
+        "flow": flow, "outputs": ["bundles"]}))[0].text
+    payload = json.loads(text.split("```json")[1].split("```")[0])
+    assert set(payload) == {"bundles"}
+    assert sum(len(bundle["edges"]) for bundle in payload["bundles"]) == 152
+    print(f"✅ 152 edges in {len(result['bundles'])} bundles, {result['segments']} path segments")
+
+
+def main():
+    test_handle_sides_follow_geometry()
+    test_handle_assigner_tool_bulk()
+    test_rectangle_packers()
+    test_canvas_packer_keeps_clusters_together()
+    test_edge_compatibility_matches_reference()
+    test_edge_bundler_merges_parallel_edges()
+    print("🎉 FLOW GEOMETRY TOOLS TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
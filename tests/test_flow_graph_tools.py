@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test the flow graph analysis tools.
+"""
+
+import asyncio
+import copy
+import random
+import time
+
+from src.frontend_mcp_server.tools.flow_loader import build_flow
+from src.frontend_mcp_server.tools import flow_graph_tools
+
+
+BROKEN_FLOW = {
+    "nodes": [
+        {"id": "a", "handles": [{"id": "out", "type": "source"}, {"id": "in", "type": "target"}]},
+        {"id": "b", "parentId": "missing"},
+        {"id": "a"},
+        {"id": "c", "parentId": "d"},
+        {"id": "d", "parentId": "c"},
+    ],
+    "edges": [
+        {"id": "e1", "source": "a", "target": "b", "sourceHandle": "nope"},
+        {"id": "e1", "source": "b", "target": "a", "targetHandle": "in"},
+        {"id": "e3", "source": "a", "target": "a"},
+        {"id": "e4", "source": "ghost", "target": "a"},
+    ],
+}
+
+
+def test_validator_finds_every_category():
+    print("🔎 Testing react_flow_graph_validator issue categories...")
+    report = flow_graph_tools.validate_flow_graph(build_flow(BROKEN_FLOW))
+    expected = {
+        "duplicate_node_ids", "duplicate_edge_ids", "missing_source_nodes",
+        "missing_source_handles", "self_loops", "orphaned_children",
+        "children_before_parent", "parent_cycles", "cycles",
+    }
+    assert not report["valid"]
+    assert set(report["issues"]) == expected, report["issues"].keys()
+    assert report["issues"]["cycles"]["examples"] == [["a", "b"]]
+    print(f"✅ Found: {', '.join(sorted(report['issues']))}")
+
+
+def test_validator_is_linear_on_large_dags():
+    print("⏱️ Testing validator on a 500k-element DAG...")
+    random.seed(7)
+    count = 250_000
+    graph = build_flow({
+        "nodes": [{"id": f"n{i}"} for i in range(count)],
+        "edges": [
+            {"id": f"e{i}", "source": f"n{i}", "target": f"n{random.randrange(i + 1, count)}"}
+            for i in range(count - 1)
+        ],
+    })
+    started = time.perf_counter()
+    report = flow_graph_tools.validate_flow_graph(graph)
+    elapsed = time.perf_counter() - started
+    assert report["valid"], report["issues"]
+    print(f"✅ Valid DAG checked in {elapsed * 1000:.0f} ms")
+
+    # A long chain closed into a ring must not hit the recursion limit
+    back_edges, cycles = flow_graph_tools.find_cycles(
+        count, list(range(count)), [(i + 1) % count for i in range(count)], limit=1
+    )
+    assert back_edges == 1 and len(cycles[0]) == count
+
+
+def test_validator_tool_output():
+    print("📝 Testing validator tool output...")
+    result = asyncio.run(flow_graph_tools.handle_call("react_flow_graph_validator", {"flow": BROKEN_FLOW}))
+    assert "React Flow Graph Validation" in result[0].text
+    assert '"self_loops": 1' in result[0].text
+
+    result = asyncio.run(flow_graph_tools.handle_call("react_flow_graph_validator", {}))
+    assert result[0].text.startswith("Error loading flow")
+    result = asyncio.run(flow_graph_tools.handle_call("react_flow_graph_validator",
+                                                      {"flow": BROKEN_FLOW, "max_issues": "many"}))
+    assert result[0].text.startswith("Error: ")
+    print("✅ Tool output rendered")
+
+
+def make_versions():
+    random.seed(11)
+    base = {
+        "nodes": [
+            {"id": f"n{i}", "type": "default", "position": {"x": i, "y": 2 * i},
+             "data": {"label": str(i), "k": i % 3}, "className": "kept"}
+            for i in range(120)
+        ],
+        "edges": [{"id": f"e{i}", "source": f"n{i}", "target": f"n{(i + 1) % 120}"} for i in range(120)],
+    }
+
+    def mutate(document, tag):
+        document = copy.deepcopy(document)
+        document["nodes"] = [node for node in document["nodes"] if random.random() > 0.1]
+        for node in document["nodes"]:
+            roll = random.random()
+            if roll < 0.2:
+                node["position"] = {"x": node["position"]["x"] + 5, "y": 0}
+            elif roll < 0.3:
+                node["data"] = {"label": "changed", "extra": tag}
+            elif roll < 0.35:
+                node["type"] = "custom"
+        document["nodes"].append({"id": f"{tag}-new", "position": {"x": 1, "y": 1}, "data": {"a": 1}})
+        for edge in document["edges"]:
+            if random.random() < 0.1:
+                edge["target"] = "n0"
+                edge["sourceHandle"] = "right"
+        document["edges"] = [edge for edge in document["edges"] if random.random() > 0.1]
+        return document
+
+    first = mutate(base, "v1")
+    return base, first, mutate(first, "v2")
+
+
+def test_diff_apply_compose_round_trip():
+    print("🔁 Testing react_flow_graph_diff patches...")
+    base, first, second = make_versions()
+    patch_1 = flow_graph_tools.diff_flows(base, first)
+    patch_2 = flow_graph_tools.diff_flows(first, second)
+    assert {"added", "removed", "moved", "changed", "data"} <= set(patch_1["nodes"])
+    assert {"removed", "changed"} <= set(patch_1["edges"])
+
+    assert flow_graph_tools.apply_flow_patch(base, patch_1) == first
+    assert flow_graph_tools.apply_flow_patch(first, patch_2) == second
+    composed = flow_graph_tools.compose_flow_patches(patch_1, patch_2)
+    assert flow_graph_tools.apply_flow_patch(base, composed) == second
+    print(f"✅ Composed patch: {flow_graph_tools.patch_operation_count(flow_graph_tools.prune_patch(composed))} operations")
+
+    assert flow_graph_tools.diff_flows(base, base) == {}
+
+    result = asyncio.run(flow_graph_tools.handle_call("react_flow_graph_diff", {"base_flow": base, "flow": first}))
+    assert "## Sync Cost" in result[0].text
+    result = asyncio.run(flow_graph_tools.handle_call("react_flow_graph_diff", {
+        "operation": "apply", "base_flow": base, "patch": {"nodes": {"moved": {"ghost": {"x": 0, "y": 0}}}}
+    }))
+    assert "unknown node 'ghost'" in result[0].text
+
+
+def test_patches_keep_untracked_fields():
+    print("🧷 Testing that patches carry every element field...")
+    base = {
+        "nodes": [{"id": "a", "position": {"x": 0, "y": 0}, "data": {"label": "a"}},
+                  {"id": "b", "position": {"x": 9, "y": 0}, "data": "plain", "style": {"opacity": 1}}],
+        "edges": [{"id": "e", "source": "a", "target": "b", "label": "x"}],
+        "viewport": {"x": 0, "y": 0, "zoom": 1},
+    }
+    new = {
+        "nodes": [{"id": "a", "position": {"x": 0, "y": 0}, "data": {"label": "a"}, "hidden": True},
+                  {"id": "b", "position": {"x": 9, "y": 0}, "data": {"label": "b"}},
+                  {"id": "c", "position": {"x": 5, "y": 5}, "style": {"background": "red"}, "className": "note"}],
+        "edges": [{"id": "e", "source": "a", "target": "b", "label": "y", "animated": True, "type": "step"}],
+        "viewport": {"x": 0, "y": 0, "zoom": 1},
+    }
+    patch = flow_graph_tools.diff_flows(base, new)
+    assert patch["nodes"]["added"] == [new["nodes"][2]]  # verbatim, no invented width/height
+    assert patch["nodes"]["changed"] == {"a": {"set": {"hidden": True}},
+                                         "b": {"set": {"data": {"label": "b"}}, "unset": ["style"]}}
+    assert patch["edges"]["changed"] == {"e": {"set": {"label": "y", "animated": True, "type": "step"}}}
+    assert flow_graph_tools.apply_flow_patch(base, patch) == new
+
+    # Later changes fold into earlier ones, including into added elements
+    newer = {**new, "nodes": [dict(new["nodes"][0], data={"label": "a2"}),
+                              dict(new["nodes"][1], position={"x": 1, "y": 1}),
+                              dict(new["nodes"][2], className="pinned")]}
+    composed = flow_graph_tools.compose_flow_patches(patch, flow_graph_tools.diff_flows(new, newer))
+    assert flow_graph_tools.apply_flow_patch(base, composed) == newer
+    print("✅ Added elements, top-level fields and edge labels survive diff -> apply -> compose")
+
+
+def main():
+    test_validator_finds_every_category()
+    test_validator_is_linear_on_large_dags()
+    test_validator_tool_output()
+    test_diff_apply_compose_round_trip()
+    test_patches_keep_untracked_fields()
+    print("🎉 FLOW GRAPH TOOLS TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test the streaming flow loader used by graph-consuming tools.
+"""
+
+import io
+import json
+import os
+import tempfile
+
+from src.frontend_mcp_server.tools.flow_loader import (
+    DEFAULT_NODE_WIDTH,
+    FlowLoadError,
+    build_flow,
+    load_flow,
+    stream_flow,
+)
+
+
+def make_document(node_count=200):
+    nodes = [
+        {
+            "id": f"n{i}",
+            "type": "default",
+            "position": {"x": i * 12.5, "y": -i},
+            "data": {"label": f"Node \"{i}\" é", "tags": [1, 2, {"deep": None}]},
+            **({"measured": {"width": 100 + i, "height": 40}} if i % 3 else {}),
+            **({"parentId": "n0"} if i % 5 == 1 else {}),
+        }
+        for i in range(node_count)
+    ]
+    nodes.append({"id": "n3", "position": {"x": 1, "y": 2}})
+    edges = [
+        {"id": f"e{i}", "source": f"n{i}", "target": f"n{(i * 7) % (node_count + 10)}"}
+        for i in range(node_count)
+    ]
+    return {
+        "meta": {"nodes": [1, 2], "note": "not the node list"},
+        "edges": edges,
+        "nodes": nodes,
+        "viewport": {"x": 10, "y": -2.5, "zoom": 1.25},
+    }
+
+
+def test_streaming_matches_inline_build():
+    print("🌊 Testing streaming flow loader...")
+    document = make_document()
+    text = json.dumps(document, indent=1)
+    reference = build_flow(document)
+
+    # Tiny chunks force tokens to straddle buffer boundaries
+    for chunk_size in (16, 17, 64, 4096):
+        graph = stream_flow(io.StringIO(text), chunk_size=chunk_size)
+        assert graph.nodes.ids == reference.nodes.ids
+        assert list(graph.nodes.x) == list(reference.nodes.x)
+        assert list(graph.nodes.width) == list(reference.nodes.width)
+        assert list(graph.nodes.parent) == list(reference.nodes.parent)
+        assert list(graph.edges.target) == list(reference.edges.target)
+        assert graph.nodes.data == reference.nodes.data
+        assert graph.viewport == reference.viewport
+        print(f"✅ chunk_size={chunk_size}: {graph.summary()}")
+
+    assert reference.nodes.duplicate_rows == [len(document["nodes"]) - 1]
+    assert reference.nodes.width[0] == DEFAULT_NODE_WIDTH
+    assert -1 in reference.edges.target  # edges into ids that do not exist
+
+
+def test_load_flow_from_path():
+    print("📂 Testing load_flow with a file path...")
+    document = make_document(50)
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as handle:
+        json.dump(document, handle)
+        path = handle.name
+    try:
+        graph = load_flow({"flow_path": path}, keep_data=False)
+        assert len(graph.nodes) == 51 and len(graph.edges) == 50
+        assert all(data is None for data in graph.nodes.data)
+
+        graph = load_flow({"flow": json.dumps(document)})
+        assert graph.nodes.data[0]["label"] == 'Node "0" é'
+    finally:
+        os.unlink(path)
+
+    for bad in ({}, {"flow": "{not json"}, {"flow_path": "/does/not/exist.json"}):
+        try:
+            load_flow(bad)
+        except FlowLoadError as exc:
+            print(f"✅ Rejected {list(bad)}: {exc}")
+        else:
+            raise AssertionError(f"Expected FlowLoadError for {bad}")
+
+    try:
+        stream_flow(io.StringIO('{"nodes": [{"id": "a"}, {"id": '))
+    except FlowLoadError as exc:
+        print(f"✅ Truncated document rejected: {exc}")
+    else:
+        raise AssertionError("Expected FlowLoadError for truncated document")
+
+
+def main():
+    test_streaming_matches_inline_build()
+    test_load_flow_from_path()
+    print("🎉 FLOW LOADER TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
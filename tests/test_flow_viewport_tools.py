@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Test the viewport tile index and culling query.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from src.frontend_mcp_server.tools.flow_loader import build_flow
+from src.frontend_mcp_server.tools import flow_viewport_tools
+
+
+def make_grid_flow(count=4000, columns=80):
+    random.seed(5)
+    nodes = [
+        {"id": f"n{i}", "position": {"x": (i % columns) * 250, "y": (i // columns) * 120}, "data": {"i": i}}
+        for i in range(count)
+    ]
+    nodes.append({"id": "child", "parentId": "n0", "position": {"x": 10, "y": 10}})
+    edges = [
+        {"id": f"e{i}", "source": f"n{i}", "target": f"n{random.randrange(count) if i % 10 == 0 else (i + 1) % count}"}
+        for i in range(count)
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+def test_tile_index_matches_brute_force():
+    print("🧱 Testing tile index against a brute-force scan...")
+    index = flow_viewport_tools.TileIndex(build_flow(make_grid_flow()), tile_size=300)
+    nodes = index.graph.nodes
+    assert (index.x[-1], index.y[-1]) == (10.0, 10.0)  # child offset by its parent at the origin
+
+    for _ in range(25):
+        left, top = random.uniform(-500, 20000), random.uniform(-500, 6000)
+        right, bottom = left + random.uniform(10, 4000), top + random.uniform(10, 4000)
+        node_rows, edge_rows = index.query(left, top, right, bottom)
+        expected_nodes = [
+            row for row in range(len(nodes))
+            if index.x[row] <= right and index.x[row] + nodes.width[row] >= left
+            and index.y[row] <= bottom and index.y[row] + nodes.height[row] >= top
+        ]
+        expected_edges = [
+            row for row in range(len(index.graph.edges))
+            if index._segment_hits(row, left, top, right, bottom)
+        ]
+        assert node_rows == expected_nodes
+        assert edge_rows == expected_edges
+    print("✅ 25 random viewports match")
+
+    group = {"id": "group", "type": "group", "position": {"x": 0, "y": 0}, "style": {"width": 1e6, "height": 1e6}}
+    index = flow_viewport_tools.TileIndex(build_flow({"nodes": [group], "edges": []}), tile_size=1)
+    assert index.large_nodes == [0] and not index.node_tiles  # not a million tile entries
+    assert index.query(5e5, 5e5, 5e5 + 10, 5e5 + 10)[0] == [0] and index.query(-20, -20, -10, -10)[0] == []
+    assert index.query_tiles([(7, 7)])[0] == [0]
+
+
+def test_viewport_query_paging_and_cache():
+    print("📄 Testing react_flow_viewport_query paging and caching...")
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as handle:
+        json.dump(make_grid_flow(), handle)
+        path = handle.name
+    try:
+        arguments = {
+            "flow_path": path,
+            "viewport": {"x": -500, "y": -200, "zoom": 0.5},
+            "screen": {"width": 1600, "height": 900},
+            "page_size": 40,
+        }
+
+        def run(extra):
+            text = asyncio.run(flow_viewport_tools.handle_call(
+                "react_flow_viewport_query", {**arguments, **extra}))[0].text
+            return json.loads(text.split("```json")[1].split("```")[0])
+
+        first = run({})
+        assert first["visible_nodes"] > 40 and first["next_page"] == 1
+        assert first["index"]["cached"] is False
+
+        seen = {node["id"] for node in first["nodes"]}
+        page = first["next_page"]
+        while page is not None:
+            result = run({"page": page})
+            assert result["index"]["cached"] is True
+            seen.update(node["id"] for node in result["nodes"])
+            page = result["next_page"]
+        assert len(seen) == first["visible_nodes"]
+
+        tile_key = next(iter(first["tiles"]))
+        by_tile = run({"tiles": [tile_key], "page_size": 10000})
+        assert len(by_tile["nodes"]) == first["tiles"][tile_key]
+
+        for bad in ({"tile_size": "abc"}, {"page": "x"}, {"page_size": None}, {"min_node_screen_size": "big"}):
+            text = asyncio.run(flow_viewport_tools.handle_call("react_flow_viewport_query", {**arguments, **bad}))[0].text
+            assert text.startswith("Error: "), bad
+        print(f"✅ {first['pages']} pages, {len(seen)} visible nodes, tile {tile_key} fetched")
+    finally:
+        os.unlink(path)
+
+
+def test_minimap_decimation():
+    print("🗺️ Testing react_flow_minimap_generator decimation...")
+    overlapping = build_flow({"nodes": [
+        {"id": "a", "position": {"x": 0, "y": 0}, "width": 100, "height": 100},
+        {"id": "b", "position": {"x": 50, "y": 50}, "width": 100, "height": 100},
+    ]})
+    density, scale, offset = flow_viewport_tools.rasterize_density(
+        flow_viewport_tools.node_boxes(overlapping), 15, 15)
+    assert scale == 0.1 and list(offset) == [0.0, 0.0]
+    assert density.max() == 2 and int((density == 2).sum()) == 25 and int((density == 0).sum()) == 50
+
+    minimap = flow_viewport_tools.decimate_flow(overlapping, 15, 15, levels=4)
+    covered = np.zeros((15, 15), dtype=int)
+    for rectangle in minimap["rectangles"]:
+        covered[rectangle["y"]:rectangle["y"] + rectangle["height"],
+                rectangle["x"]:rectangle["x"] + rectangle["width"]] += 1
+    assert (covered == (density > 0)).all()  # rectangles tile the occupied pixels exactly once
+    assert len(minimap["rectangles"]) == 5 and minimap["svg"].startswith("<svg")
+
+    grid = minimap["density_grid"]
+    decoded = np.frombuffer(base64.b64decode(grid["data"]), dtype=np.uint8).reshape(grid["shape"])
+    assert (decoded == density).all()
+
+    result = asyncio.run(flow_viewport_tools.handle_call("react_flow_minimap_generator", {
+        "flow": make_grid_flow(), "resolution": {"width": 120, "height": 90}, "outputs": ["svg"]
+    }))
+    assert "Nodes decimated**: 4001" in result[0].text and '"rectangles"' not in result[0].text
+
+    small = {"nodes": [{"id": "a", "position": {"x": 0, "y": 0}}]}
+    for bad in ('"><script>alert(1)</script>', "red; x"):
+        result = asyncio.run(flow_viewport_tools.handle_call("react_flow_minimap_generator",
+                                                             {"flow": small, "node_color": bad}))
+        assert result[0].text.startswith("Error: node_color must be a CSS color")
+    for bad in ({"resolution": {"width": "wide"}}, {"resolution": {"height": None}}, {"resolution": [120, 90]},
+                {"density_levels": "many"}):
+        result = asyncio.run(flow_viewport_tools.handle_call("react_flow_minimap_generator", {"flow": small, **bad}))
+        assert result[0].text.startswith("Error: "), bad
+    with tempfile.TemporaryDirectory() as directory:
+        notes = os.path.join(directory, "notes.txt")
+        fake = os.path.join(directory, "fake.svg")
+        for path, text in ((notes, "keep me"), (fake, "not an image")):
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+        thumbnail = os.path.join(directory, "thumb.svg")
+        for path in (notes, fake, thumbnail, thumbnail):  # the second write replaces our own SVG
+            result = asyncio.run(flow_viewport_tools.handle_call("react_flow_minimap_generator", {
+                "flow": small, "node_color": "rgb(100 116 139)", "svg_path": path}))
+            assert result[0].text.startswith("Error") == (path != thumbnail)
+        with open(notes, encoding="utf-8") as handle:
+            assert handle.read() == "keep me"
+        with open(thumbnail, encoding="utf-8") as handle:
+            assert 'fill="rgb(100 116 139)"' in handle.read()
+    print(f"✅ {len(minimap['rectangles'])} merged rectangles, SVG {len(minimap['svg'])} bytes")
+
+
+def main():
+    test_tile_index_matches_brute_force()
+    test_viewport_query_paging_and_cache()
+    test_minimap_decimation()
+    print("🎉 FLOW VIEWPORT TOOLS TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
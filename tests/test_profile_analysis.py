@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test the streaming React DevTools Profiler export analyzer.
+"""
+
+import io
+import json
+import os
+import random
+import tempfile
+
+from src.frontend_mcp_server.tools import profile_analysis
+from src.frontend_mcp_server.tools.react_flow_learning_tools import REACT_FLOW_LEARNING_HANDLERS
+
+
+def encode_operations(root_id, added):
+    """DevTools `operations` array adding (fiber id, parent id, display name) elements."""
+    names = sorted({name for _, _, name in added})
+    table = []
+    for name in names:
+        table += [len(name)] + [ord(char) for char in name]
+    operations = [1, root_id, len(table)] + table
+    operations += [1, root_id, 11, 1, 1, 1, 1]  # the root itself
+    for fiber, parent, name in added:
+        operations += [1, fiber, 5, parent, 0, names.index(name) + 1, 0]
+    operations += [4, root_id, 12]  # an unrelated base-duration update
+    return operations
+
+
+def make_profile(commits=200, seed=3):
+    """Root > ReactFlow > NodeRenderer > 40 CustomNode fibers; edges mount mid-session."""
+    random.seed(seed)
+    node_ids = list(range(10, 50))
+    commit_data = []
+    for index in range(commits):
+        actual, own, descriptions = [], [], []
+        if index % 2 == 0:  # a drag: ReactFlow's store hook fires, NodeRenderer re-renders every node
+            actual += [[2, 9.0], [3, 8.0]]
+            own += [[2, 0.5], [3, 1.0]]
+            descriptions += [[2, {"didHooksChange": True, "hooks": [1], "isFirstMount": False, "props": [], "state": False, "context": False}],
+                             [3, {"didHooksChange": False, "isFirstMount": False, "props": ["nodes"], "state": False, "context": False}]]
+            for fiber in node_ids:
+                actual.append([fiber, 0.15])
+                own.append([fiber, 0.15])
+                descriptions.append([fiber, {"didHooksChange": False, "isFirstMount": False, "props": [], "state": False, "context": False}])
+        if index == 100:  # edges mount once
+            actual += [[60, 5.0], [61, 5.0]]
+            own += [[60, 5.0], [61, 5.0]]
+            descriptions += [[60, {"isFirstMount": True}], [61, {"isFirstMount": True}]]
+        duration = sum(value for _, value in own) + random.random()
+        commit_data.append({
+            "changeDescriptions": descriptions,
+            "duration": duration,
+            "effectDuration": 0.1,
+            "fiberActualDurations": actual,
+            "fiberSelfDurations": own,
+            "priorityLevel": "Normal",
+            "timestamp": 1000 + 16 * index,
+            "updaters": [],
+        })
+    return {
+        "version": 5,
+        "dataForRoots": [{
+            "commitData": commit_data,
+            "displayName": "App",
+            "initialTreeBaseDurations": [[1, 9.0]],
+            "operations": [encode_operations(1, [(60, 3, "BezierEdge"), (61, 3, "BezierEdge")])],
+            "rootID": 1,
+            "snapshots": [[1, {"displayName": None, "children": [2]}], [2, {"displayName": "ReactFlow", "children": [3]}],
+                          [3, {"displayName": "NodeRenderer", "children": node_ids}]]
+                         + [[fiber, {"displayName": "CustomNode", "children": []}] for fiber in node_ids],
+        }],
+        "timelineData": [{"batchUIDToMeasuresKeyValueArray": [], "componentMeasures": [{"type": "render"}]}],
+    }
+
+
+def test_profiler_export_aggregates():
+    print("🔬 Testing Profiler export aggregation...")
+    profile = make_profile()
+    text = json.dumps(profile)
+    analysis = profile_analysis.analyze_profiler_export(io.StringIO(text), top_n=5, chunk_size=97)
+    assert analysis == profile_analysis.analyze_profiler_export(io.StringIO(text), top_n=5)
+    assert analysis["version"] == 5 and analysis["roots"] == ["App"] and analysis["commits"] == 200
+
+    components = {entry["component"]: entry for entry in analysis["components"]}
+    custom = components["CustomNode"]
+    assert custom["instances"] == 40 and custom["commits"] == 100 and custom["renders"] == 4000
+    assert abs(custom["self_ms"] - 600) < 1e-6 and custom["causes"] == {"parent rendered": 4000}
+    assert components["ReactFlow"]["causes"] == {"hooks #1": 100}
+    assert components["NodeRenderer"]["causes"] == {"props.nodes": 100}
+    assert components["BezierEdge"]["instances"] == 2 and components["BezierEdge"]["commits"] == 1
+    assert components["BezierEdge"]["causes"] == {"mount": 2}
+    assert analysis["top_components"][0]["component"] == "CustomNode"
+    assert analysis["top_rerendered"][0]["commits"] == 100
+
+    slowest = analysis["slowest_commits"]
+    assert len(slowest) == 5 and slowest[0]["commit"] == 100
+    assert [item["component"] for item in slowest[0]["heaviest"]] == ["BezierEdge", "BezierEdge", "NodeRenderer"]
+    print(f"✅ {len(components)} components, slowest commit {slowest[0]['duration_ms']:.1f} ms")
+
+
+def test_operations_and_commit_runs():
+    print("🧮 Testing operations decoding and commit runs...")
+    names = profile_analysis.decode_operation_names(encode_operations(1, [(7, 1, "Handle"), (8, 7, "Edge")]))
+    assert names == {7: "Handle", 8: "Edge"}
+    assert profile_analysis.decode_operation_names([1, 1, 0, 99, 1]) == {}  # unknown op stops decoding
+
+    stats = profile_analysis.FiberStats()
+    for commit in (0, 1, 2, 5, 6, 9):
+        stats.add_commit(commit)
+    assert list(stats.runs()) == [(0, 2), (5, 6), (9, 9)]
+    other = profile_analysis.FiberStats()
+    for commit in (1, 2, 3, 4, 9):
+        other.add_commit(commit)
+    analyzer = profile_analysis.ProfilerExportAnalyzer()
+    analyzer.commits = 10
+    assert analyzer._commits_covered([stats, other]) == 8
+    assert profile_analysis.render_causes({"props": ["data", "selected"], "context": True}) == \
+        ["props.data", "props.selected", "context"]
+
+
+def test_devtools_mastery_reads_profile_file():
+    print("🛠️ Testing react_flow_devtools_mastery with a profile file...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "profile.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(make_profile(), handle)
+        text = REACT_FLOW_LEARNING_HANDLERS["react_flow_devtools_mastery"]({"profile_path": path, "top_n": 3})[0]["text"]
+    assert "## Profiler Export Analysis" in text and "- **Commits**: 200 across 1 root(s)" in text
+    assert "| CustomNode | 40 | 100 | 4000 | 600.0 |" in text
+    assert "**CustomNode** (parent rendered): Wrap the component in React.memo" in text
+    assert "### Browser DevTools Strategies" in text  # the guidance is still included
+
+    error = REACT_FLOW_LEARNING_HANDLERS["react_flow_devtools_mastery"]({"profile": "[1, 2]"})[0]["text"]
+    assert error.startswith("Error:")
+    missing = REACT_FLOW_LEARNING_HANDLERS["react_flow_devtools_mastery"]({"profile_path": "/nonexistent.json"})[0]["text"]
+    assert missing.startswith("Error: Profile file not found")
+    print("✅ Profile analysis rendered ahead of the guidance")
+
+
+def main():
+    test_profiler_export_aggregates()
+    test_operations_and_commit_runs()
+    test_devtools_mastery_reads_profile_file()
+    print("🎉 PROFILE ANALYSIS TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test single-pass Tailwind class extraction and the optimize_tailwind report.
+"""
+
+import asyncio
+import random
+
+from src.frontend_mcp_server import main as server
+from src.frontend_mcp_server.tools import tailwind_analysis, tailwind_tools
+
+MARKUP = """<div class="flex items-center p-4 p-4">
+  <button className="px-4 py-2 rounded md:px-6 hover:bg-blue-700" />
+  <span className='text-sm font-medium'>a</span>
+  <p className={"flex items-center text-sm"}>b</p>
+  <li className={`flex items-center ${active ? "bg-blue-500" : ""} md:hover:underline`}>c</li>
+  <i class="">empty</i>
+  <b class="brand-title flex">d</b>
+</div>
+"""
+
+
+def make_jsx(size, seed=2):
+    """Component-style JSX: a few hundred distinct class strings reused across many elements."""
+    random.seed(seed)
+    pool = ["flex", "items-center", "justify-between", "p-4", "px-4", "py-2", "text-sm", "font-medium",
+            "rounded-lg", "shadow", "bg-white", "text-gray-700", "hover:bg-gray-100", "md:flex-row", "gap-2",
+            "border", "border-gray-200", "w-full", "md:w-1/2", "lg:grid-cols-3", "grid", "truncate"]
+    strings = [" ".join(random.sample(pool, random.randint(3, 9))) for _ in range(300)]
+    parts, length, index = [], 0, 0
+    while length < size:
+        line = f'  <div key="{index}" className="{random.choice(strings)}">{{item.label}}</div>\n'
+        parts.append(line)
+        length += len(line)
+        index += 1
+    return "".join(parts)
+
+
+def test_single_pass_extraction():
+    print("🔍 Testing class extraction...")
+    usage = tailwind_analysis.analyze_markup(MARKUP, "App.tsx")
+    assert usage.elements == 6  # the empty class attribute is skipped
+    assert usage.element(1) == ["px-4", "py-2", "rounded", "md:px-6", "hover:bg-blue-700"]
+    assert usage.element(4) == ["flex", "items-center", "md:hover:underline"]  # template expression dropped
+    assert usage.repeated == [(0, "p-4")] and usage.location(0) == "App.tsx:1"
+    assert usage.location(5) == "App.tsx:7"
+
+    frequencies = usage.frequencies()
+    assert frequencies["flex"] == 4 and frequencies["items-center"] == 3 and frequencies["p-4"] == 1
+    variants = usage.variant_breakdown()
+    assert variants["(none)"] == (15, 9) and variants["md"] == (1, 1) and variants["md:hover"] == (1, 1)
+    assert usage.unknown_classes() == [("brand-title", 1)]
+    assert usage.cooccurrence(3) == [("flex", "items-center", 3)]  # pairs seen once are not reported
+    print(f"✅ {usage.elements} elements, {len(frequencies)} classes")
+
+
+def test_large_file_is_fully_extracted():
+    print("⚡ Testing a 5 MB JSX file...")
+    text = make_jsx(5 * 1024 * 1024)
+    usage = tailwind_analysis.analyze_markup(text)
+    assert usage.elements == text.count("className=") and len(usage.names) == 22
+    assert usage.total == sum(len(usage.element(index)) for index in range(usage.elements))
+    assert sum(usage.frequencies().values()) == usage.total
+    pairs = usage.cooccurrence(1)
+    assert pairs and pairs[0][2] > 1000
+    print(f"✅ {usage.elements} elements, {usage.total} classes")
+
+
+def test_optimizer_report():
+    print("🧹 Testing optimize_tailwind...")
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": MARKUP}))[0].text
+    assert "- **Elements with classes**: 6" in text and "- **Total classes found**: 19" in text
+    assert "- **Outside the default theme**: 1 (brand-title)" in text
+    assert "| `flex` | 4 |" in text and "| md:hover | 1 | 1 |" in text
+    assert "| `flex` + `items-center` | 3 |" in text
+    assert "**Classes**: flex (4), items-center (3), text-sm (2)" in text
+    assert "p-4 at <input>:1" in text and "md (1 uses), md:hover (1 uses)" in text
+
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": "<p>no classes</p>",
+                                                         "optimization_type": "duplicate_removal"}))[0].text
+    assert "No class pair appears on more than one element." in text and "No obvious optimizations" in text
+    print("✅ Report rendered")
+
+
+def test_server_routes_optimizer():
+    print("🔌 Testing the server registration...")
+    names = [getattr(tool, "name", None) for tool in asyncio.run(server.handle_list_tools())]
+    assert names.count("tailwind_optimizer") == 1
+    text = asyncio.run(server.handle_call_tool("tailwind_optimizer", {"html_content": MARKUP}))[0].text
+    assert "- **Elements with classes**: 6" in text
+    print("✅ tailwind_optimizer listed and routed")
+
+
+def main():
+    test_single_pass_extraction()
+    test_large_file_is_fully_extracted()
+    test_optimizer_report()
+    test_server_routes_optimizer()
+    print("🎉 TAILWIND ANALYSIS TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
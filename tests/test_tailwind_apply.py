@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test frequent class-combination mining for @apply extraction.
+"""
+
+import asyncio
+import itertools
+import random
+
+import numpy as np
+
+from src.frontend_mcp_server.tools import tailwind_analysis, tailwind_apply, tailwind_tools
+from src.frontend_mcp_server.tools.tailwind_catalog import CATALOG
+
+BUTTON = '<button class="px-4 py-2 rounded-md bg-blue-600 text-white hover:bg-blue-700 brand-button">Save</button>\n'
+ROW = '<div class="flex items-center gap-2">{}</div>\n'
+
+
+def brute_force_closed(members, min_support):
+    supports = {}
+    for size in range(1, members.shape[1] + 1):
+        for combo in itertools.combinations(range(members.shape[1]), size):
+            support = int(members[:, list(combo)].all(axis=1).sum())
+            if support >= min_support:
+                supports[combo] = support
+    return {combo: support for combo, support in supports.items()
+            if not any(set(combo) < set(other) and supports[other] == support for other in supports)}
+
+
+def test_closed_itemsets_match_brute_force():
+    print("⛏️ Testing closed itemset mining against brute force...")
+    random.seed(1)
+    pool = ["flex", "items-center", "p-4", "px-4", "py-2", "rounded", "shadow", "text-sm", "font-bold", "grid",
+            "gap-2", "border"]
+    markup = "".join(f'<a class="{" ".join(random.sample(pool, random.randint(2, 6)))}"/>' for _ in range(300))
+    usage = tailwind_analysis.analyze_markup(markup)
+    members = usage.membership(list(range(len(usage.names))))
+    distinct, weights = np.unique(members, axis=0, return_counts=True)
+    for min_support in (3, 10):
+        mined = tailwind_apply.ClosedItemsetMiner(distinct, weights, min_support).mine()
+        assert dict(mined) == brute_force_closed(members, min_support)
+        assert len({items for items, _ in mined}) == len(mined)  # every closed itemset exactly once
+    print(f"✅ {len(mined)} closed itemsets at support 10")
+
+
+def test_apply_candidates():
+    print("🧱 Testing @apply candidates...")
+    usage = tailwind_analysis.analyze_markup(BUTTON * 4 + ROW.format("") * 5 + '<p class="flex gap-2">x</p>')
+    candidates = tailwind_apply.mine_apply_candidates(usage)
+    assert [(candidate.name, candidate.classes, candidate.support) for candidate in candidates] == [
+        ("btn", ["px-4", "py-2", "rounded-md", "bg-blue-600", "text-white", "hover:bg-blue-700"], 4),
+        ("row", ["flex", "items-center", "gap-2"], 5),
+    ]  # brand-button is not a theme utility; flex+gap-2 (6 elements) nests inside .row
+    assert candidates[0].bytes_saved == 4 * (62 - 4) - len(candidates[0].rule) == 152
+    assert candidates[0].rule == ".btn {\n  @apply px-4 py-2 rounded-md bg-blue-600 text-white hover:bg-blue-700;\n}"
+    assert tailwind_apply.mine_apply_candidates(usage, min_support=6) == []  # flex gap-2 on six elements does not pay for its rule
+
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": BUTTON * 4 + ROW.format("") * 5,
+                                                         "optimization_type": "apply_extraction"}))[0].text
+    assert "| `.btn` | px-4 py-2 rounded-md bg-blue-600 text-white hover:bg-blue-700 | 4 | 152 |" in text
+    assert "@layer components {\n  .btn {\n    @apply px-4 py-2" in text
+    error = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": "", "min_support": "x"}))[0].text
+    assert error == "Error: min_support must be an integer, got 'x'"
+    print(f"✅ {len(candidates)} components, {sum(c.bytes_saved for c in candidates)} bytes saved")
+
+
+def test_mining_thousands_of_elements():
+    print("⏱️ Testing mining on noisy markup...")
+    random.seed(3)
+    pool = random.sample(list(CATALOG.names[:2000]), 120)
+    components = [random.sample(pool, random.randint(4, 10)) for _ in range(40)]
+    lines = []
+    for _ in range(20000):
+        classes = random.choice(components) + random.sample(pool, random.randint(0, 4))
+        lines.append(f'<div className="{" ".join(dict.fromkeys(classes))}"></div>')
+    usage = tailwind_analysis.analyze_markup("\n".join(lines))
+
+    mined = []
+    miner = tailwind_apply.ClosedItemsetMiner
+
+    class RecordingMiner(miner):
+        __slots__ = ()
+
+        def mine(self):
+            itemsets = super().mine()
+            mined.append((len(self.weights), len(itemsets)))
+            return itemsets
+
+    tailwind_apply.ClosedItemsetMiner = RecordingMiner
+    try:
+        candidates = tailwind_apply.mine_apply_candidates(usage)
+    finally:
+        tailwind_apply.ClosedItemsetMiner = miner
+    rows, nodes = mined[0]
+    assert rows <= usage.elements  # identical class strings collapse into weighted rows
+    assert nodes < tailwind_apply.MAX_NODES  # the search finished without hitting the node cap
+    assert len(candidates) == tailwind_apply.DEFAULT_TOP_N
+    assert all(set(candidate.classes) in map(set, components) for candidate in candidates[:5])
+    assert [c.bytes_saved for c in candidates] == sorted((c.bytes_saved for c in candidates), reverse=True)
+
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": "\n".join(lines[:3000])}))[0].text
+    performance = text.split("### Performance")[1]
+    assert "appears on" in performance and "@apply flex items-center px-4 py-2" not in performance  # mined, not canned
+    print(f"✅ {usage.elements} elements as {rows} rows, {nodes} closed itemsets")
+
+
+def main():
+    test_closed_itemsets_match_brute_force()
+    test_apply_candidates()
+    test_mining_thousands_of_elements()
+    print("🎉 TAILWIND APPLY TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test the packed Tailwind class catalog and its lookups.
+"""
+
+import asyncio
+import gzip
+
+from src.frontend_mcp_server.tools import tailwind_catalog, tailwind_tools
+from src.frontend_mcp_server.tools.tailwind_catalog import CATALOG
+
+
+def test_packed_catalog_matches_theme():
+    print("📦 Testing the packed catalog against the theme tables...")
+    with gzip.open(tailwind_catalog.DATA_PATH, "rt", encoding="utf-8") as handle:
+        packed = [tuple(line.rstrip("\n").split("\t", 1)) for line in handle]
+    assert packed == tailwind_catalog.generate_entries(), "regenerate with python -m src.frontend_mcp_server.tools.tailwind_catalog"
+
+    assert len(CATALOG) > 9000
+    for name in ("p-4", "-mt-2", "w-1/2", "bg-rose-950", "text-2xl", "rounded", "items-center", "sr-only",
+                 "ring-offset-2", "translate-x-full", "drop-shadow"):
+        assert name in CATALOG, name
+    assert "p-13" not in CATALOG and "bg-blue" not in CATALOG
+    assert CATALOG.detail("px-4") == "padding-left: 1rem; padding-right: 1rem"
+    assert CATALOG.detail("text-sm") == "font-size: 0.875rem; line-height: 1.25rem"
+    assert CATALOG.detail("-translate-x-1/2") == "--tw-translate-x: -50%"
+    assert CATALOG.describe("md:hover:bg-blue-500") == "background-color: #3b82f6 (md, hover)"
+    assert CATALOG.describe("wobble:p-4") is None
+    print(f"✅ {len(CATALOG)} classes")
+
+
+def test_ranked_lookups():
+    print("🔎 Testing prefix, abbreviation and typo lookups...")
+    assert tailwind_catalog.split_variants("md:hover:bg-[url(a:b)]") == (["md", "hover"], "bg-[url(a:b)]")
+
+    assert [name for name, _ in CATALOG.complete("rounded", 3)] == ["rounded", "rounded-lg", "rounded-md"]
+    assert CATALOG.complete("bg-bl", 2)[0][0] == "bg-blue-500"
+    assert CATALOG.complete("md:hover:bg-bl", 1) == [("md:hover:bg-blue-500", "background-color: #3b82f6")]
+    assert CATALOG.complete("it-ce", 1)[0][0] == "items-center"
+    assert CATALOG.complete("jus-be", 1)[0][0] == "justify-between"
+    assert CATALOG.complete("-tr-x-1/", 1)[0][0] == "-translate-x-1/2"
+    assert CATALOG.complete("itmes-center", 1)[0][0] == "items-center"
+    assert CATALOG.complete("!p-4", 1)[0][0] == "!p-4"
+    assert ("hover:", ":hover") in CATALOG.complete("hov")
+    assert CATALOG.complete("zzzz") == []
+    assert all(len(CATALOG.complete(query, 5)) <= 5 for query in ["b", "bg-bl-5", "md:it-ce", "text-", "w-1/"])
+    print("✅ Ranked lookups")
+
+
+def test_suggester_uses_catalog():
+    print("🎨 Testing tailwind_class_suggester with the catalog...")
+    text = asyncio.run(tailwind_tools.suggest_classes({
+        "design_description": "a teal card with rounded corners", "element_type": "card", "query": "sha-l"
+    }))[0].text
+    assert "bg-teal-500" in text and "- `bg-teal-500` - background-color: #14b8a6" in text
+    assert "## Completions for `sha-l`" in text and "| `shadow-lg` |" in text
+    assert "not in the default theme" not in text
+    text = asyncio.run(tailwind_tools.suggest_classes({"design_description": "a card", "query": None}))[0].text
+    assert "## Completions" not in text
+    print("✅ Suggestions annotated with CSS")
+
+
+def main():
+    test_packed_catalog_matches_theme()
+    test_ranked_lookups()
+    test_suggester_uses_catalog()
+    print("🎉 TAILWIND CATALOG TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test color extraction, OKLab clustering and the design-token consolidation tool.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from src.frontend_mcp_server.tools import tailwind_color_tokens, tailwind_colors, tailwind_project_tools
+
+
+def write(root, relative, text):
+    path = os.path.join(root, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    return path
+
+
+def test_color_extraction():
+    print("🔎 Testing color extraction...")
+    text = ('<div className="bg-[#3b82f7] md:hover:text-[rgb(59_130_246)] p-[3px]" style={{ color: "#3B82F6" }}>'
+            '&#123; <a href="#top"></a></div>\n.x { border-color: hsl(217 91% 60%); background: rgba(0, 0, 0, .5) }')
+    assert tailwind_color_tokens.extract_colors(text) == [
+        ("#3b82f7", "bg-[#3b82f7]"), ("rgb(59_130_246)", "md:hover:text-[rgb(59_130_246)]"), ("#3B82F6", ""),
+        ("hsl(217 91% 60%)", ""), ("rgba(0, 0, 0, .5)", "")]
+
+    css = tailwind_colors.css_color_to_srgb
+    assert tailwind_colors.srgb_to_hex(np.array([css("rgb(59_130_246)"), css("#fff"), css("hsl(0 100% 50%)")])) == [
+        "#3b82f6", "#ffffff", "#ff0000"]
+    assert css("rgba(0, 0, 0, .5)") is None and css("#12345") is None
+    print("✅ Arbitrary classes and inline values found, translucent colors left out")
+
+
+def test_clustering_and_tokens():
+    print("🎯 Testing OKLab clustering and token mapping...")
+    hexes = ["#3b82f6", "#3b82f7", "#3a81f6", "#ef4444", "#123456"]
+    lab = tailwind_colors.srgb_to_oklab(tailwind_colors.hex_to_srgb(hexes))
+    labels, centers = tailwind_color_tokens.cluster_colors(lab, np.array([5.0, 1.0, 1.0, 2.0, 1.0]))
+    assert labels.tolist() == [0, 0, 0, 1, 2] and len(centers) == 3
+    labels, _ = tailwind_color_tokens.cluster_colors(lab, np.ones(5), tolerance=0.0)
+    assert len(set(labels.tolist())) == 5
+
+    names, palette = tailwind_color_tokens._palette()
+    assert tailwind_color_tokens.token_for(centers[0], names, palette)[:2] == ("blue-500", False)
+    assert tailwind_color_tokens.token_for(centers[1], names, palette)[:2] == ("red-500", False)
+    token, custom, distance = tailwind_color_tokens.token_for(centers[2], names, palette)
+    assert custom and distance > tailwind_color_tokens.TOKEN_MATCH and token.startswith("custom-")  # x-950 exists
+    print(f"✅ 5 colors -> 3 tokens, #123456 -> {token}")
+
+
+def test_color_tokens_tool():
+    print("🎨 Testing the color token tool...")
+    with tempfile.TemporaryDirectory() as root:
+        write(root, "src/Card.tsx", '<div className="bg-[#3b82f7] hover:bg-[#3b82f5] border-[#123456]">'
+                                    '<p className="text-[#3a81f6]" style={{ color: "#3b82f6" }}>x</p></div>')
+        write(root, "src/theme.css", ".alert { color: #ff0000; background: rgba(0, 0, 0, .5) }")
+        write(root, "node_modules/lib/index.js", 'const c = "#00ff00"')
+
+        report = tailwind_color_tokens.consolidate_colors(root, workers=1)
+        assert (report.files, report.uses, report.inline) == (2, 6, 2)
+        assert list(report.skipped) == ["rgba(0, 0, 0, .5)"]
+        blue = report.clusters[0]
+        assert blue.token == "blue-500" and not blue.custom and blue.uses == 4
+        assert blue.classes == {"bg-[#3b82f7]": "bg-blue-500", "hover:bg-[#3b82f5]": "hover:bg-blue-500",
+                                "text-[#3a81f6]": "text-blue-500"}
+        assert blue.bytes_saved > 0 and report.bytes_saved == sum(cluster.bytes_saved for cluster in report.clusters)
+        assert [cluster.custom for cluster in report.clusters[1:]] == [True, True]
+
+        text = tailwind_project_tools.tailwind_color_tokens({"project_path": root, "workers": 1})[0].text
+        assert "- **Tokens after consolidation**: 3 (1 from the default palette, 2 custom)" in text
+        assert "| `hover:bg-[#3b82f5]` | `hover:bg-blue-500` |" in text
+        assert "## Tailwind Config" in text and "Translucent or unparseable: `rgba(0, 0, 0, .5)`" in text
+
+    error = tailwind_project_tools.tailwind_color_tokens({"project_path": "/no/such/dir"})[0].text
+    assert error.startswith("Error: ")
+    error = tailwind_project_tools.tailwind_color_tokens({"project_path": "/no/such/dir", "top_n": "ten"})[0].text
+    assert error.startswith("Error: ") and "not found" not in error  # rejected before the scan
+    print(f"✅ {report.uses} color uses -> {len(report.clusters)} tokens, {report.bytes_saved} bytes saved")
+
+
+def test_custom_tokens_are_distinct():
+    print("🏷️ Testing custom token names...")
+    names, palette = tailwind_color_tokens._palette()
+    lab = tailwind_colors.srgb_to_oklab(tailwind_colors.hex_to_srgb(["#2f6fe8", "#2467fe"]))
+    assert [tailwind_color_tokens.token_for(center, names, palette)[0] for center in lab] == ["blue-650", "blue-650"]
+    assert tailwind_color_tokens.token_for(lab[1], names, palette, {"blue-650"})[0] == "custom-blue-600"
+
+    with tempfile.TemporaryDirectory() as root:
+        write(root, "src/Hero.tsx", '<h1 className="bg-[#2f6fe8] border-[#2f6fe8] text-[#2467fe]">'
+                                    '<b className="text-[#3b82f7] bg-[#3b82f5] ring-[#3a81f6]" /></h1>')
+        report = tailwind_color_tokens.consolidate_colors(root, workers=1, tolerance=0.03)
+        tokens = [cluster.token for cluster in report.clusters]
+        assert len(tokens) == len(set(tokens)) == 3
+        assert tokens == ["blue-500", "blue-650", "custom-blue-600"]  # the more used cluster keeps its shade
+        assert report.clusters[2].classes == {"text-[#2467fe]": "text-custom-blue-600"}
+    print(f"✅ {', '.join(tokens)}")
+
+
+def main():
+    test_color_extraction()
+    test_clustering_and_tokens()
+    test_color_tokens_tool()
+    test_custom_tokens_are_distinct()
+    print("🎉 TAILWIND COLOR TOKEN TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
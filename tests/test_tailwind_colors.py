@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test the OKLCH color science behind generate_color_palette.
+"""
+
+import asyncio
+
+import numpy as np
+
+from src.frontend_mcp_server import main as server
+from src.frontend_mcp_server.tools import tailwind_colors, tailwind_tools
+from src.frontend_mcp_server.tools.tailwind_theme import COLOR_SHADES, PALETTE
+
+
+def test_conversions():
+    print("🎨 Testing sRGB <-> OKLCH...")
+    red = tailwind_colors.parse_color("#ff0000")
+    assert np.allclose(red, [0.6280, 0.2577, 29.234], atol=1e-3)
+    assert np.allclose(tailwind_colors.parse_color("#fff"), [1.0, 0.0, 0.0], atol=1e-4)
+    assert np.allclose(tailwind_colors.parse_color("oklch(62.8% 0.2577 29.234)"), red, atol=1e-3)
+    assert np.allclose(tailwind_colors.parse_color("blue"), tailwind_colors.parse_color(PALETTE["blue"]["500"]))
+    for unknown in ("#12", "chartreuse", "oklch(1 2)"):
+        try:
+            tailwind_colors.parse_color(unknown)
+            assert False, unknown
+        except tailwind_colors.ColorError:
+            pass
+
+    hexes = [PALETTE[family][shade] for family in PALETTE for shade in COLOR_SHADES]
+    lch = tailwind_colors.srgb_to_oklch(tailwind_colors.hex_to_srgb(hexes))
+    assert tailwind_colors.srgb_to_hex(tailwind_colors.oklch_to_srgb(lch)) == hexes  # 242 colors, one call each way
+
+    vivid = np.array([[0.7, 0.4, 150.0], [0.5, 0.05, 20.0]])  # the first is outside sRGB
+    mapped = tailwind_colors.gamut_map(vivid)
+    linear = tailwind_colors.oklch_to_linear(mapped)
+    assert np.all(linear > -1e-6) and np.all(linear < 1 + 1e-6)
+    assert np.allclose(mapped[:, [0, 2]], vivid[:, [0, 2]]) and mapped[0, 1] < 0.4 and mapped[1, 1] == 0.05
+    print("✅ Every default color round-trips")
+
+
+def test_scales_and_contrast():
+    print("🪜 Testing generated scales and the contrast matrix...")
+    scale = tailwind_colors.generate_scale("brand", tailwind_colors.parse_color("#1da1f2"))
+    assert scale.hex[COLOR_SHADES.index("500")] == "#1da1f2"
+    assert np.all(np.diff(scale.oklch[:, 0]) < 0)  # lighter to darker
+    assert np.allclose(scale.oklch[:, 2], scale.oklch[5, 2], atol=1e-6)
+
+    scales = tailwind_colors.palette_scales("red", "triadic")
+    assert [s.name for s in scales] == ["red", "secondary", "tertiary"] and scales[0].native
+    assert scales[0].hex == [PALETTE["red"][shade] for shade in COLOR_SHADES]
+    hues = [s.oklch[5, 2] for s in scales]
+    assert np.allclose([(hues[1] - hues[0]) % 360, (hues[2] - hues[0]) % 360], [120, 240], atol=0.5)
+
+    matrix = tailwind_colors.contrast_matrix(tailwind_colors.hex_to_srgb(["#ffffff", "#000000", "#767676"]))
+    assert np.allclose(matrix, matrix.T) and np.allclose(np.diag(matrix), 1)
+    assert round(matrix[0, 1], 2) == 21.0 and round(matrix[0, 2], 2) == 4.54
+    assert [tailwind_colors.wcag_rating(ratio) for ratio in (7.2, 4.5, 3.1, 2)] == ["AAA", "AA", "AA large", "fail"]
+    print("✅ Scales anchored, hues rotated, ratios match WCAG")
+
+
+def test_palette_report():
+    print("📋 Testing the palette report...")
+    text = asyncio.run(tailwind_tools.generate_color_palette({"primary_color": "oklch(60% 0.2 300)",
+                                                              "palette_type": "analogous"}))[0].text
+    assert "### primary (generated at hue 300°)" in text and "### tertiary (generated at hue 330°)" in text
+    assert "        secondary: { 50: '#" in text
+    assert "| `text-white` on `bg-primary-600` |" in text
+    matrix = text.split("## Contrast Matrix")[1]
+    assert matrix.count("\n| `") == 33 and "| `tertiary-950` | " in matrix
+
+    text = asyncio.run(tailwind_tools.generate_color_palette({"primary_color": "blue"}))[0].text
+    assert "### blue (Tailwind default)" in text and "## Tailwind Config" not in text
+    assert "| 600 | `#2563eb` |" in text and "| `text-blue-600` on `bg-white` | 5.17 | AA |" in text
+
+    error = asyncio.run(tailwind_tools.generate_color_palette({"primary_color": "not-a-color"}))[0].text
+    assert error.startswith("Error: Unrecognized color: not-a-color")
+    print("✅ Scales, config and contrast in the report")
+
+
+def test_server_routes_palette():
+    print("🔌 Testing the server registration...")
+    names = [getattr(tool, "name", None) for tool in asyncio.run(server.handle_list_tools())]
+    assert names.count("tailwind_color_palette") == 1
+    text = asyncio.run(server.handle_call_tool("tailwind_color_palette", {"primary_color": "blue"}))[0].text
+    assert "### blue (Tailwind default)" in text
+    print("✅ tailwind_color_palette listed and routed")
+
+
+def main():
+    test_conversions()
+    test_scales_and_contrast()
+    test_palette_report()
+    test_server_routes_palette()
+    print("🎉 TAILWIND COLOR TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
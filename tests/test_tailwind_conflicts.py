@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test conflicting utility detection.
+"""
+
+import asyncio
+
+from src.frontend_mcp_server.tools import tailwind_analysis, tailwind_conflicts, tailwind_tools
+from src.frontend_mcp_server.tools.tailwind_catalog import CATALOG
+
+
+def test_element_conflicts():
+    print("⚔️ Testing conflicts on one element...")
+    check = tailwind_conflicts.element_conflicts
+    assert check(["p-4", "p-2"]) == [("p-2", "p-4", ("padding",), True)]  # stylesheet order, not markup order
+    assert check(["text-lg", "text-sm"]) == [("text-sm", "text-lg", ("font-size", "line-height"), True)]
+    assert check(["md:flex", "md:hidden", "flex"]) == [("md:flex", "md:hidden", ("display",), True)]
+    assert check(["!p-2", "p-4"]) == [("p-4", "!p-2", ("padding",), True)]
+    assert check(["p-4", "px-2"]) == [("p-4", "px-2", ("padding-left", "padding-right"), False)]
+    assert check(["p-[13px]", "p-4"]) == [("p-4", "p-[13px]", ("padding",), True)]
+    assert check(["text-[#1da1f2]", "text-white", "text-[14px]"]) == [("text-white", "text-[#1da1f2]", ("color",), True)]
+    for compatible in (["blur-sm", "brightness-50"], ["space-x-4", "ml-2"], ["flex", "brand-card"], ["hover:p-2", "p-4"]):
+        assert check(compatible) == [], compatible
+
+    index = tailwind_conflicts.property_index()
+    assert len(CATALOG) > 9000
+    missing = [name for name in CATALOG.names if "[" not in name and index.lookup(name) is None]
+    assert missing == [], missing[:10]
+    print(f"✅ {len(index.classes)} utilities indexed")
+
+
+def test_detect_conflicts():
+    print("🔎 Testing conflicts across elements...")
+    markup = ('<div class="p-4 py-2">a</div>\n' * 3 + '<div class="p-4 py-2 px-4">b</div>\n'
+              '<div class="flex items-center">c</div>\n')
+    usage = tailwind_analysis.analyze_markup(markup)
+    conflicts, dead = tailwind_conflicts.detect_conflicts(usage)
+    assert [(c.loser, c.winner, c.properties, c.dead, c.elements, c.first) for c in conflicts] == [
+        ("p-4", "py-2", ("padding-bottom", "padding-top"), False, 3, 0),
+        ("p-4", "py-2", ("padding-bottom", "padding-top"), True, 1, 3),
+        ("p-4", "px-4", ("padding-left", "padding-right"), True, 1, 3),
+    ]
+    assert dead == {"p-4": 1}  # counted once per element, however many classes share its properties
+
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": markup,
+                                                         "optimization_type": "conflict_detection"}))[0].text
+    assert "## Conflicting Utilities" in text
+    assert "| `p-4` | `px-4` | padding-left, padding-right | yes | 1 | <input>:4 |" in text
+    assert "Found 3 class pairs setting the same property on one element, leaving 1 classes dead" in text
+    clean = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": '<a class="p-4 flex"></a>'}))[0].text
+    assert "Conflicting Utilities" not in clean
+    print(f"✅ {len(conflicts)} conflicts, {sum(dead.values())} dead")
+
+
+def main():
+    test_element_conflicts()
+    test_detect_conflicts()
+    print("🎉 TAILWIND CONFLICT TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
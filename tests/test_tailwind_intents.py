@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test the Aho-Corasick design-intent matcher behind tailwind_class_suggester.
+"""
+
+import asyncio
+import random
+
+from src.frontend_mcp_server.tools import tailwind_intents, tailwind_tools
+from src.frontend_mcp_server.tools.tailwind_catalog import CATALOG
+
+
+def brute_force(terms, text):
+    return sorted((start, start + len(term), term_id) for term_id, term in enumerate(terms)
+                  for start in range(len(text)) if text.startswith(term, start))
+
+
+def test_automaton_finds_every_occurrence():
+    print("🤖 Testing the automaton against brute force...")
+    random.seed(5)
+    terms = list({"".join(random.choice("abc ") for _ in range(random.randint(1, 5))).strip() or "a"
+                  for _ in range(300)})
+    matcher = tailwind_intents.IntentMatcher(terms)
+    for _ in range(50):
+        text = "".join(random.choice("abc ") for _ in range(80))
+        assert sorted(matcher.scan(text)) == brute_force(matcher.terms, text)
+    print(f"✅ {len(terms)} overlapping terms, {len(matcher.goto)} states")
+
+
+def test_matching_cost_is_flat_in_vocabulary():
+    print("📈 Testing matching cost against vocabulary size...")
+    description = tailwind_intents.normalize(
+        "a spacious centered card with rounded corners, soft shadow, navy heading and muted caption " * 20)
+    small = tailwind_intents.IntentMatcher(list(tailwind_intents.DESIGN_TERMS))
+    random.seed(9)
+    filler = ["".join(random.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(random.randint(4, 14)))
+              for _ in range(20000)]
+    large = tailwind_intents.IntentMatcher(list(tailwind_intents.DESIGN_TERMS) + filler)
+    assert len(large.goto) > 20 * len(small.goto) // 2
+
+    assert small.matches(description) == large.matches(description)
+    # every character follows one goto edge, and failure links never undo more depth than the goto edges added
+    assert small.steps <= 2 * len(description) and large.steps <= 2 * len(description)
+    print(f"✅ {len(large.terms)} terms take {large.steps} transitions, {len(small.terms)} terms take {small.steps}")
+
+
+def test_design_descriptions():
+    print("🎯 Testing intent scoring...")
+    assert len(tailwind_intents.DESIGN_TERMS) >= 500
+    for intent, classes in tailwind_intents.INTENT_CLASSES.items():
+        for cls, _ in classes:
+            assert CATALOG.describe(cls), (intent, cls)
+
+    ranked, matched, negated = tailwind_intents.match_intents(
+        "Centered cards with rounded corners, a soft shadow and a dark blue heading - no border")
+    assert matched == [("centered", "center"), ("cards", "card"), ("rounded corners", "rounded"),
+                       ("soft shadow", "soft_shadow"), ("dark blue", "color:dark blue"), ("heading", "heading")]
+    assert negated == [("border", "bordered")]
+    classes = [cls for cls, _ in ranked]
+    assert classes[0] == "rounded-lg"  # asked for twice: by the card and the corners
+    assert "bg-blue-800" in classes and "bg-blue-500" not in classes and "border-gray-200" not in classes
+    assert tailwind_intents.match_intents("bordered")[0][0][0] == "border"
+    assert tailwind_intents.match_intents("unbordered unrounded")[1] == []  # word boundaries
+    print(f"✅ {len(matched)} intents, top class {classes[0]}")
+
+
+def test_suggester_reports_matched_terms():
+    print("🎨 Testing tailwind_class_suggester with intents...")
+    text = asyncio.run(tailwind_tools.suggest_classes({
+        "design_description": "sticky navbar with a frosted glass look in emerald", "element_type": "navigation",
+        "responsive": False
+    }))[0].text
+    assert "**Matched Terms:** sticky (sticky), navbar (navbar), frosted glass (glass), emerald (color:emerald)" in text
+    assert "- `sticky` - position: sticky" in text and "- `backdrop-blur-md` - backdrop-filter: blur(12px)" in text
+    assert "bg-emerald-500" in text
+    print("✅ Matched terms listed")
+
+
+def test_suggester_drops_conflicting_defaults():
+    print("🧹 Testing conflicting and negated element defaults...")
+    text = asyncio.run(tailwind_tools.suggest_classes({
+        "design_description": "centered blue card with rounded corners, no shadow", "element_type": "card",
+        "responsive": False
+    }))[0].text
+    listed = [line.split("`")[1] for line in text.splitlines() if line.startswith("- `")]
+    assert "bg-blue-500" in listed and "bg-white" not in listed
+    assert "rounded-lg" in listed and "rounded" not in listed
+    assert not [cls for cls in listed if cls.startswith("shadow")]
+    assert "p-6" in listed and "overflow-hidden" in listed
+    print(f"✅ {len(listed)} classes, one per property")
+
+
+def main():
+    test_automaton_finds_every_occurrence()
+    test_matching_cost_is_flat_in_vocabulary()
+    test_design_descriptions()
+    test_suggester_reports_matched_terms()
+    test_suggester_drops_conflicting_defaults()
+    print("🎉 TAILWIND INTENT TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
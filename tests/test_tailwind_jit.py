@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the mini Tailwind JIT and the generated CSS size report.
+"""
+
+import asyncio
+import gzip
+import os
+import tempfile
+import time
+
+from src.frontend_mcp_server.tools import tailwind_jit, tailwind_project_tools, tailwind_tools
+from src.frontend_mcp_server.tools.tailwind_catalog import CATALOG
+
+
+def test_compile_classes():
+    print("🛠️ Testing rules for single classes...")
+    rule = lambda name: tailwind_jit.compile_class(name)[2]
+    assert rule("p-4") == ".p-4{padding:1rem}"
+    assert rule("text-sm") == ".text-sm{font-size:0.875rem;line-height:1.25rem}"
+    assert rule("!p-2") == ".\\!p-2{padding:0.5rem!important}"
+    assert rule("w-1/2") == ".w-1\\/2{width:50%}"
+    assert rule("p-[13px]") == ".p-\\[13px\\]{padding:13px}"
+    assert rule("-mt-[3px]") == ".-mt-\\[3px\\]{margin-top:calc(3px * -1)}"
+    assert rule("grid-cols-[1fr_auto]") == ".grid-cols-\\[1fr_auto\\]{grid-template-columns:1fr auto}"
+    assert rule("text-[14px]") == ".text-\\[14px\\]{font-size:14px}"
+    assert rule("bg-[#1da1f2]") == ".bg-\\[\\#1da1f2\\]{background-color:#1da1f2}"
+    assert rule("space-x-4") == ".space-x-4>:not([hidden])~:not([hidden]){margin-left:1rem}"
+    assert rule("group-hover:focus:underline").startswith(".group:hover .group-hover\\:focus\\:underline:focus{")
+    assert tailwind_jit.compile_class("md:dark:hidden")[1:] == (
+        ("(min-width:768px)", "(prefers-color-scheme:dark)"), ".md\\:dark\\:hidden{display:none}")
+    assert tailwind_jit.escape_class("2xl:flex") == ".\\32 xl\\:flex"
+    for unknown in ("brand-card", "wat:p-4", "p-[13px", "foo-[1px]"):
+        assert tailwind_jit.compile_class(unknown) is None, unknown
+    print("✅ Selectors, declarations and variants")
+
+
+def test_generate_css():
+    print("📦 Testing the generated stylesheet...")
+    classes = ["lg:p-2", "md:p-4", "p-4", "flex", "md:dark:hidden", "hover:bg-blue-500", "brand", "p-4"]
+    build = tailwind_jit.generate_css(classes)
+    assert build.css == (".flex{display:flex}.p-4{padding:1rem}.hover\\:bg-blue-500:hover{background-color:#3b82f6}"
+                         "@media (min-width:768px){.md\\:p-4{padding:1rem}}"
+                         "@media (min-width:1024px){.lg\\:p-2{padding:0.5rem}}"
+                         "@media (min-width:768px){@media (prefers-color-scheme:dark){.md\\:dark\\:hidden{display:none}}}")
+    assert build.bytes == len(build.css) and build.skipped == ["brand"]
+    assert build.gzip_bytes == len(gzip.compress(build.css.encode(), 9, mtime=0))
+    assert build.costliest(1) == [("hover:bg-blue-500", 51)]
+    assert sum(build.class_bytes.values()) == build.bytes - 4 * len("@media {}") - len("(min-width:768px)") * 2 \
+        - len("(min-width:1024px)") - len("(prefers-color-scheme:dark)")
+    assert tailwind_jit.generate_css([]).css == "" and tailwind_jit.generate_css([]).gzip_bytes == 0
+
+    assert len(CATALOG) > 9000
+    names = CATALOG.names
+    start = time.perf_counter()
+    full = tailwind_jit.generate_css(["md:" + name for name in names] + names)
+    elapsed = time.perf_counter() - start
+    assert full.skipped == [] and len(full.class_bytes) == 2 * len(names)
+    assert elapsed < 5.0, elapsed
+    print(f"✅ Whole catalog with md: variants - {full.bytes // 1024} KB, {full.gzip_bytes // 1024} KB gzipped in {elapsed:.2f} s")
+
+
+def test_css_budget_reports():
+    print("💸 Testing CSS budgets in the reports...")
+    markup = '<div class="p-4 md:p-[13px] flex brand"></div>'
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": markup, "css_budget": 50}))[0].text
+    assert "- **Utilities layer**: 92 bytes minified, " in text and "- no CSS for brand" in text
+    assert "| `md:p-[13px]` | 29 |" in text and "### CSS Budget" in text
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": markup, "css_budget": 10000}))[0].text
+    assert "### CSS Budget" not in text
+    text = asyncio.run(tailwind_tools.optimize_tailwind({"html_content": markup, "css_budget": "10kb"}))[0].text
+    assert text == "Error: css_budget must be an integer, got '10kb'"
+
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(root, "index.html"), "w", encoding="utf-8") as handle:
+            handle.write(markup)
+        report = lambda budget: tailwind_project_tools.tailwind_project_scanner(
+            {"project_path": root, "workers": 1, "css_budget": budget})[0].text
+        assert "bytes gzipped - **over the 50 byte budget by" in report(50)
+        assert "bytes gzipped - within the 10000 byte budget" in report(10000)
+    print("✅ Budgets enforced")
+
+
+def main():
+    test_compile_classes()
+    test_generate_css()
+    test_css_budget_reports()
+    print("🎉 TAILWIND JIT TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
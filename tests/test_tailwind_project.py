@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test the project-wide Tailwind usage scanner and its incremental cache.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+
+from src.frontend_mcp_server.tools import tailwind_analysis, tailwind_project, tailwind_project_tools
+
+BUTTON = """import { cn } from "@/lib/utils";
+
+export function Button({ active, className }) {
+  return (
+    <button className={cn("px-4 py-2 rounded-md", active && "bg-blue-600 text-white", { "opacity-50": !active }, className)}>
+      <span className="font-medium">Go</span>
+    </button>
+  );
+}
+"""
+
+CARD = """<template>
+  <div class="p-4 rounded-md shadow" :class="{ 'ring-2': selected, 'brand-card': true }">
+    <h2 class="text-lg font-medium">{{ title }}</h2>
+  </div>
+</template>
+"""
+
+
+def write(root, relative, text):
+    path = os.path.join(root, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    return path
+
+
+def test_helper_calls_and_bindings():
+    print("🧩 Testing clsx/cn calls and Vue bindings...")
+    lists = list(tailwind_analysis.class_lists_with_lines(BUTTON + CARD))
+    assert lists == [(5, "px-4 py-2 rounded-md bg-blue-600 text-white opacity-50"), (6, "font-medium"),
+                     (11, "p-4 rounded-md shadow"), (11, "ring-2 brand-card"), (12, "text-lg font-medium")]
+    text = 'const c = clsx("grid", twMerge(`gap-4 ${gap}`), { "sr-only": hidden }) + cn('  # unclosed call
+    assert [value.split() for _, value in tailwind_analysis.class_lists_with_lines(text)] == [
+        ["grid", "gap-4", "sr-only"], ["gap-4"], []]
+    print("✅ Helper arguments extracted")
+
+
+def test_incremental_rescan():
+    print("🔁 Testing cached rescans...")
+    with tempfile.TemporaryDirectory() as root:
+        button = write(root, "src/components/Button.tsx", BUTTON)
+        card = write(root, "src/components/Card.vue", CARD)
+        write(root, "src/pages/index.html", '<main class="flex min-h-screen p-4"></main>')
+        write(root, "node_modules/lib/index.js", 'cn("never-scanned")')
+        write(root, ".next/page.js", 'cn("never-scanned")')
+        write(root, "README.md", 'class="never-scanned"')
+
+        scan = tailwind_project.scan_project(root, workers=1)
+        assert (scan.files, scan.extracted, scan.reused) == (3, 3, 0)
+        usage = scan.usage
+        assert usage.sources == ["src/components/Button.tsx", "src/components/Card.vue", "src/pages/index.html"]
+        assert usage.frequencies()["font-medium"] == 2 and "never-scanned" not in usage.ids
+        assert dict(zip(usage.names, usage.files_per_class().tolist()))["rounded-md"] == 2
+        assert usage.first_location("brand-card") == "src/components/Card.vue:2"
+
+        scan = tailwind_project.scan_project(root, workers=1)
+        assert (scan.extracted, scan.reused, scan.rehashed) == (0, 3, 0)
+        assert scan.usage.frequencies() == usage.frequencies()
+
+        stat = os.stat(card)
+        os.utime(card, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))  # touched, content unchanged
+        write(root, "src/components/Button.tsx", BUTTON.replace("px-4", "px-6"))
+        os.remove(os.path.join(root, "src/pages/index.html"))
+        scan = tailwind_project.scan_project(root, workers=1)
+        assert (scan.reused, scan.rehashed, scan.extracted, scan.removed, scan.files) == (0, 1, 1, 1, 2)
+        assert "px-6" in scan.usage.ids and "px-4" not in scan.usage.ids and "min-h-screen" not in scan.usage.ids
+        assert button in [os.path.join(root, source) for source in scan.usage.sources]
+
+        # a content-glob scan of the same root keeps its own cache
+        scan = tailwind_project.scan_project(root, workers=1, content=["src/**/*.tsx"])
+        assert (scan.files, scan.extracted) == (1, 1)
+        scan = tailwind_project.scan_project(root, workers=1)
+        assert (scan.reused, scan.extracted, scan.removed, scan.files) == (2, 0, 0, 2)
+        scan = tailwind_project.scan_project(root, workers=1, content=["src/**/*.tsx"])
+        assert (scan.reused, scan.extracted, scan.removed) == (1, 0, 0)
+    print("✅ Only changed files re-extracted")
+
+
+def test_parallel_scan_and_report():
+    print("🚀 Testing the process pool and the report...")
+    with tempfile.TemporaryDirectory() as root:
+        for index in range(tailwind_project.PARALLEL_MIN_FILES * 2):
+            write(root, f"src/c{index:03}.jsx", BUTTON.replace("px-4", f"px-{index % 5}"))
+        serial = tailwind_project.ProjectScanner(root).scan(workers=1)
+        parallel = tailwind_project.ProjectScanner(root).scan(workers=2)
+        assert parallel.workers in (1, 2) and parallel.extracted == serial.extracted == 64
+        assert tailwind_project.pool_context().get_start_method() != "fork"  # scans run beside the event loop
+        assert parallel.usage.frequencies() == serial.usage.frequencies()
+        assert list(parallel.usage.element_lines) == list(serial.usage.element_lines)
+
+        result = tailwind_project_tools.tailwind_project_scanner({"project_path": root, "workers": 1,
+                                                                  "include_index": True})
+        text = result[0].text
+        assert "- **Files scanned**: 64 - .jsx (64)" in text and "| `font-medium` | 64 | 64 |" in text
+        assert '"px-0": {' in text and "Every class is generated by the default theme." in text
+
+    error = tailwind_project_tools.tailwind_project_scanner({"project_path": "/no/such/project"})[0].text
+    assert error == "Error: Project directory not found: /no/such/project"
+    for bad in ({"top_n": "ten"}, {"css_budget": "10kb"}, {"workers": None}):
+        text = tailwind_project_tools.tailwind_project_scanner({"project_path": "/no/such/project", **bad})[0].text
+        assert text.startswith("Error: ") and "not found" not in text, bad  # rejected before the scan
+    print(f"✅ {parallel.workers} worker(s), identical index")
+
+
+def test_handler_scans_off_the_event_loop():
+    print("🧵 Testing the async handler...")
+    threads = []
+    scanner = tailwind_project_tools.TAILWIND_PROJECT_HANDLERS["tailwind_project_scanner"]
+
+    def recording(arguments):
+        threads.append(threading.current_thread())
+        return scanner(arguments)
+
+    tailwind_project_tools.TAILWIND_PROJECT_HANDLERS["tailwind_project_scanner"] = recording
+    try:
+        with tempfile.TemporaryDirectory() as root:
+            write(root, "src/Button.jsx", BUTTON)
+            text = asyncio.run(tailwind_project_tools.handle_call("tailwind_project_scanner",
+                                                                  {"project_path": root, "workers": 1}))[0].text
+    finally:
+        tailwind_project_tools.TAILWIND_PROJECT_HANDLERS["tailwind_project_scanner"] = scanner
+    assert "- **Files scanned**: 1 - .jsx (1)" in text
+    assert threads and threads[0] is not threading.main_thread()
+    print("✅ Scanned on a worker thread")
+
+
+def main():
+    test_helper_calls_and_bindings()
+    test_incremental_rescan()
+    test_parallel_scan_and_report()
+    test_handler_scans_off_the_event_loop()
+    print("🎉 TAILWIND PROJECT TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test the static Tailwind config reader and the safelist/purge analysis.
+"""
+
+import os
+import tempfile
+
+from src.frontend_mcp_server.tools import tailwind_config, tailwind_project, tailwind_project_tools, tailwind_purge
+
+CONFIG = """import type { Config } from 'tailwindcss'
+import defaultTheme from "tailwindcss/defaultTheme";
+// a comment with { braces } and 'quotes'
+const config: Config = {
+  content: ['./src/**/*.{js,ts,jsx,tsx}', "./index.html", '!./src/legacy/**'],
+  darkMode: 'class',
+  safelist: [
+    'bg-red-500', "text-3xl",
+    { pattern: /bg-(red|green)-(100|200)/, variants: ['hover'] },
+  ],
+  theme: {
+    fontFamily: { sans: ['Inter', ...defaultTheme.fontFamily.sans] },
+    extend: {
+      colors: { brand: { DEFAULT: '#1da1f2', 500: '#0e7ac4', }, accent: `#ff6600` },
+      spacing: { '128': '32rem', 144: "36rem" },
+      screens: { '3xl': '1920px' },
+      animation: { wiggle: 'wiggle 1s ease-in-out infinite' },
+    },
+  },
+  plugins: [require('@tailwindcss/forms')],
+} satisfies Config
+
+export default config
+"""
+
+
+def write(root, relative, text):
+    path = os.path.join(root, relative)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    return path
+
+
+def test_config_reader():
+    print("📜 Testing the static config reader...")
+    config = tailwind_config.parse_config(CONFIG)
+    assert config.content == ["./src/**/*.{js,ts,jsx,tsx}", "./index.html", "!./src/legacy/**"]
+    assert config.safelist[:2] == ["bg-red-500", "text-3xl"]
+    pattern = config.safelist[2]
+    assert pattern.source == "bg-(red|green)-(100|200)" and pattern.variants == ["hover"]
+    assert config.extend["colors"] == {"brand": {"DEFAULT": "#1da1f2", "500": "#0e7ac4"}, "accent": "#ff6600"}
+    assert config.extend["spacing"] == {"128": "32rem", "144": "36rem"}
+    assert config.theme == {"fontFamily": {"sans": ["Inter"]}}
+    assert config.dynamic == ["theme.fontFamily.sans[1]", "plugins[0]"]
+    assert list(tailwind_config.flatten_theme(config.extend["colors"])) == [
+        ("brand", "#1da1f2"), ("brand-500", "#0e7ac4"), ("accent", "#ff6600")]
+
+    commonjs = tailwind_config.parse_config("module.exports = { content: { files: ['./app/**/*.vue'] }, }")
+    assert commonjs.content == ["./app/**/*.vue"] and commonjs.safelist == []
+    loose = tailwind_config.parse_config("export default { content: null, safelist: null, theme: [] }")
+    assert (loose.content, loose.safelist, loose.theme, loose.extend) == ([], [], {}, {})
+    assert loose.dynamic == ["safelist (not a list)", "theme (not an object)"]
+    for broken in ("const x = 1", "module.exports = { a: [1, )] }", "export default {"):
+        try:
+            tailwind_config.parse_config(broken)
+            assert False, broken
+        except tailwind_config.ConfigError:
+            pass
+    print("✅ Static subset parsed, dynamic parts noted")
+
+
+def test_content_globs_and_css_classes():
+    print("🌐 Testing content globs and CSS selectors...")
+    selected = tailwind_project.content_matcher("/p", ["./src/**/*.{js,tsx}", "index.html", "!src/legacy/**",
+                                                       "../shared/**"])
+    assert [path for path in ("src/a.js", "src/x/y/b.tsx", "src/a.css", "index.html", "src/legacy/a.js",
+                              "shared/a.js") if selected(path)] == ["src/a.js", "src/x/y/b.tsx", "index.html"]
+    css = ('.flex{display:flex}/* .ghost{} */.\\32 xl\\:p-4{padding:1rem}.w-1\\/2{width:50%}'
+           '@media (min-width:768px){.group:hover .group-hover\\:p-\\[3px\\]{padding:.5rem}}')
+    assert tailwind_purge.css_classes(css) == ["flex", "2xl:p-4", "w-1/2", "group", "group-hover:p-[3px]"]
+    assert tailwind_purge.theme_prefixes("borderRadius")[:2] == ("rounded", "rounded-t")
+    assert "mt" in tailwind_purge.theme_prefixes("spacing") and "w" in tailwind_purge.theme_prefixes("spacing")
+    print("✅ Globs and selectors")
+
+
+def test_purge_analysis():
+    print("🧹 Testing the purge analysis...")
+    with tempfile.TemporaryDirectory() as root:
+        write(root, "tailwind.config.ts", CONFIG)
+        write(root, "src/App.tsx", 'export const App = () => <div className="bg-brand p-128 hover:bg-green-200 '
+                                   '3xl:text-3xl">x</div>\n')
+        write(root, "src/legacy/Old.jsx", '<p className="bg-accent">old</p>')  # excluded by the content globs
+        write(root, "index.html", '<main class="flex"></main>')
+        write(root, "dist/out.css", ".flex{display:flex}.bg-brand{background:#1da1f2}.bg-red-500{color:red}"
+                                    ".stale{color:red}.p-128{padding:32rem}")
+
+        config = tailwind_config.load_config(root)
+        scan = tailwind_project.scan_project(root, workers=1, content=config.content)
+        assert scan.usage.sources == ["index.html", "src/App.tsx"]
+        with open(os.path.join(root, "dist/out.css"), encoding="utf-8") as handle:
+            report = tailwind_purge.analyze_purge(config, scan, handle.read())
+
+        assert [(entry.entry, entry.classes, entry.used) for entry in report.safelist] == [
+            ("bg-red-500", 1, 0), ("text-3xl", 1, 0), ("/bg-(red|green)-(100|200)/ (hover)", 8, 1)]
+        assert report.unused_safelist == ["bg-green-100", "bg-green-200", "bg-red-100", "bg-red-200", "bg-red-500",
+                                          "hover:bg-green-100", "hover:bg-red-100", "hover:bg-red-200", "text-3xl"]
+        assert report.bloat is not None and report.bloat.bytes > 0
+        assert [(theme.section, theme.name) for theme in report.unused_theme] == [
+            ("theme.extend.colors", "brand-500"), ("theme.extend.colors", "accent"),
+            ("theme.extend.spacing", "144"), ("theme.fontFamily", "sans")]  # 3xl is used as a variant
+        assert report.unchecked_theme == ["theme.extend.animation"]
+        assert (report.css_classes, report.css_safelisted, report.css_unused) == (5, 1, ["stale"])
+
+        text = tailwind_project_tools.tailwind_purge_analyzer({"config_path": os.path.join(root, "tailwind.config.ts"),
+                                                               "css_path": "dist/out.css", "workers": 1})[0].text
+        assert "- **Safelisted classes never used**: 9 - about" in text
+        assert "| `/bg-(red|green)-(100|200)/ (hover)` | 8 | 1 |" in text
+        assert "| theme.extend.spacing | `144` | 36rem | `p-144` |" in text
+        assert "- **In no source and no safelist**: 1" in text and "- `stale`" in text
+        assert "- `plugins[0]`: not a static value, not read" in text
+
+    error = tailwind_project_tools.tailwind_purge_analyzer({"config_path": "/no/such/dir"})[0].text
+    assert error.startswith("Error: ")
+    error = tailwind_project_tools.tailwind_purge_analyzer({"config_path": "/no/such/dir", "top_n": "ten"})[0].text
+    assert error.startswith("Error: ") and "tailwind.config" not in error  # rejected before the config is read
+    print(f"✅ {len(report.unused_safelist)} unused safelisted classes, {len(report.unused_theme)} unused theme values")
+
+
+def main():
+    test_config_reader()
+    test_content_globs_and_css_classes()
+    test_purge_analysis()
+    print("🎉 TAILWIND PURGE TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()
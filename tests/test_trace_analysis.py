@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test the streaming Chrome performance trace analyzer.
+"""
+
+import asyncio
+import io
+import json
+import os
+import tempfile
+
+from src.frontend_mcp_server.tools import performance_trace_tools, trace_analysis
+
+MAIN = {"pid": 10, "tid": 1}
+COMPOSITOR = {"pid": 10, "tid": 2}
+
+
+def make_trace(seconds=2):
+    """A 60 Hz session: the first second idle, then pan/zoom with a dropped frame every third vsync."""
+    events = [
+        {"name": "thread_name", "ph": "M", "args": {"name": "CrRendererMain"}, **MAIN},
+        {"name": "thread_name", "ph": "M", "args": {"name": "Compositor"}, **COMPOSITOR},
+    ]
+    frame_us = 1_000_000 / 60
+    for frame in range(60 * seconds):
+        ts = 1_000_000 + frame * frame_us
+        interacting = frame >= 60
+        state = "STATE_DROPPED" if interacting and frame % 3 == 0 else "STATE_PRESENTED_ALL"
+        events.append({"name": "PipelineReporter", "ph": "b", "ts": ts, "id2": {"local": hex(frame)},
+                       "args": {"chrome_frame_reporter": {"state": state}}, **COMPOSITOR})
+        events.append({"name": "RunTask", "ph": "X", "ts": ts, "dur": 4000, **MAIN})
+        if interacting:
+            kind = "wheel" if frame % 2 else "pointermove"
+            events.append({"name": "EventDispatch", "ph": "X", "ts": ts + 100, "dur": 900,
+                           "args": {"data": {"type": kind}}, **MAIN})
+    events.reverse()  # frame and task aggregates must not rely on event order; React marks pair in order below
+    events += [
+        {"name": "RunTask", "ph": "X", "ts": 2_100_000, "dur": 120_000, **MAIN},  # long: 70 ms blocking
+        {"name": "RunTask", "ph": "X", "ts": 2_400_000, "dur": 80_000, **MAIN},  # long: 30 ms blocking
+        {"name": "RunTask", "ph": "X", "ts": 2_500_000, "dur": 90_000, **COMPOSITOR},  # not the main thread
+        {"name": "Layout", "ph": "X", "ts": 2_110_000, "dur": 6000, **MAIN,
+         "args": {"beginData": {"stackTrace": [{"functionName": "measureNode", "url": "app.js", "lineNumber": 42}]}}},
+        {"name": "Layout", "ph": "X", "ts": 2_120_000, "dur": 4000, **MAIN,
+         "args": {"beginData": {"stackTrace": [{"functionName": "measureNode", "url": "app.js", "lineNumber": 42}]}}},
+        {"name": "Layout", "ph": "X", "ts": 2_130_000, "dur": 2000, **MAIN, "args": {"beginData": {}}},
+        {"name": "UpdateLayoutTree", "ph": "X", "ts": 2_140_000, "dur": 1000, **MAIN,
+         "args": {"beginData": {"stackTrace": [{"functionName": "", "url": "flow.js", "lineNumber": 7}]}}},
+        {"name": "MajorGC", "ph": "X", "ts": 2_200_000, "dur": 25_000, **MAIN},
+        {"name": "MinorGC", "ph": "X", "ts": 2_300_000, "dur": 1500, **MAIN},
+        {"name": "--render-start-16", "ph": "R", "ts": 2_150_000, "cat": "blink.user_timing", **MAIN},
+        {"name": "--render-stop", "ph": "R", "ts": 2_162_000, "cat": "blink.user_timing", **MAIN},
+        {"name": "--commit-start-16", "ph": "R", "ts": 2_162_000, "cat": "blink.user_timing", **MAIN},
+        {"name": "--commit-stop", "ph": "R", "ts": 2_182_000, "cat": "blink.user_timing", **MAIN},
+        {"name": "⚛ (Committing Changes)", "ph": "b", "id": "0x1", "ts": 2_162_000, "cat": "blink.user_timing", **MAIN},
+        {"name": "⚛ (Committing Changes)", "ph": "e", "id": "0x1", "ts": 2_180_000, "cat": "blink.user_timing", **MAIN},
+    ]
+    return events
+
+
+def test_trace_aggregates():
+    print("🧵 Testing trace aggregation...")
+    events = make_trace()
+    analysis = trace_analysis.analyze_trace(io.StringIO(json.dumps({"traceEvents": events, "metadata": {}})), chunk_size=113)
+    assert analysis == trace_analysis.analyze_trace(io.StringIO(json.dumps(events)))  # bare array form
+    assert analysis["events"] == len(events)
+
+    main = analysis["main_threads"]
+    assert len(main) == 1 and main[0]["thread"].startswith("CrRendererMain (pid 10, tid 1)")
+    assert main[0]["tasks"] == 122 and main[0]["long_tasks"]["count"] == 2
+    assert abs(main[0]["blocking_ms"] - 100) < 1e-9
+    assert [task["ms"] for task in main[0]["longest"]] == [120, 80]
+
+    assert analysis["layouts"]["layout"]["count"] == 3 and analysis["forced"]["layout"]["count"] == 2
+    assert analysis["forced"]["style recalc"]["count"] == 1
+    assert analysis["forced_call_sites"][0] == {"site": "measureNode app.js:42", "count": 2, "ms": 10.0}
+    assert analysis["gc"]["major"]["max_ms"] == 25 and analysis["gc"]["minor"]["count"] == 1
+    assert analysis["react_phases"]["render"]["total_ms"] == 12 and analysis["react_phases"]["commit"]["max_ms"] == 20
+    assert analysis["react_measures"]["⚛ (Committing Changes)"]["total_ms"] == 18
+
+    frames = analysis["frames"]
+    assert frames["presented"] + frames["dropped"] == 120 and frames["dropped"] == 20
+    assert frames["interaction_dropped"] == 20 and frames["zoom_inputs"] == 30 and frames["pan_inputs"] == 30
+    assert 0.9 <= frames["interaction_seconds"] <= 1.1 and frames["interaction_fps"] < 50
+    print(f"✅ {frames['interaction_fps']:.0f} fps during input, {main[0]['blocking_ms']:.0f} ms blocking")
+
+
+def test_trace_analyzer_tool():
+    print("🛠️ Testing react_flow_trace_analyzer...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "trace.json")
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": make_trace()}, handle)
+        text = asyncio.run(performance_trace_tools.handle_call("react_flow_trace_analyzer", {"trace_path": path}))[0].text
+    assert "| CrRendererMain (pid 10, tid 1) | 122 |" in text
+    assert "| `measureNode app.js:42` | 2 | 10.0 |" in text
+    assert "| commit | 1 | 20.0 |" in text
+    assert "enable onlyRenderVisibleElements" in text and "forced reflows" in text
+    assert "Major GC pauses up to 25.0 ms" in text and "React commits up to 20.0 ms" in text
+
+    idle = [{"name": "RunTask", "ph": "X", "ts": 0, "dur": 1000, "pid": 1, "tid": 1}]
+    text = asyncio.run(performance_trace_tools.handle_call("react_flow_trace_analyzer", {"trace": idle}))[0].text
+    assert "Nothing above the thresholds" in text and "No forced reflows." in text
+    error = asyncio.run(performance_trace_tools.handle_call("react_flow_trace_analyzer", {"trace": {"metadata": {}}}))
+    assert error[0].text.startswith("Error: No trace events")
+    missing = asyncio.run(performance_trace_tools.handle_call("react_flow_trace_analyzer", {"trace_path": "/nonexistent.json"}))
+    assert missing[0].text.startswith("Error: Trace file not found")
+    print("✅ Findings rendered")
+
+
+def main():
+    test_trace_aggregates()
+    test_trace_analyzer_tool()
+    print("🎉 TRACE ANALYSIS TESTS PASSED!")
+
+
+if __name__ == "__main__":
+    main()